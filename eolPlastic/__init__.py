@@ -0,0 +1,2 @@
+#End-of-life plastic chemical additive release model. engine holds the model without any Tk, service serves it over
+#HTTP on the local machine
@@ -0,0 +1,194 @@
+#Data tables of the model: the assumed constants, categories, 2018 data and additive lists, plus the chemical
+#additives, material data and assumptions tables of the SQLite file. Importing it reads no files
+import os
+import sqlite3
+
+#Folder holding the data files (databases, scenario library), next to the GUI script
+dataFolder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+#Create dictionaries of constant values that are from assumptions and will be used in calculations
+assumedValues={"Plastic waste lost to littering":0.02, "Plastic waste leak after landfill":0.1, "Plastic content in compost":0.01, 
+               "Total compost stream mass multiplier":1.01, "Total mass of plastic in compost stream(Tons):":426_000, 
+               "Additive migration Fraction":0.02, "Incineration Efficiency Fraction":0.9999}
+
+#Creates dictionary of low additive Fractions. key = type of additive F6:F21; value = low value for bulk mass proportion G6:G21
+lowAdditiveFractions = {"Plasticizer":0.1, "Flame Retardant":0.007, "UV Stabilizer": 0.005, "Heat Stabilizer":0.005, "Antioxidant":0.005, "Slip Agent":0.001, "Lubricant":0.001, 
+                        "Antistatic":0.001, "Curing Agent":0.001, "Blowing Agent":0.005, "Biocide":0.00001, "Colorant": 0.0025, "Organic Pigment":0.00001, 
+                        "Clarifier/Toner": 0.00015, "Inorganic Pigment": 0.0001, "Filler": 0.00001, "Reinforcement": 0.15}
+
+#Create lists of categories to be paired with data for each year
+conditionsCategories = ["Total MSW (Tons):", "Total Plastic waste (Tons):", "Plastic Recycled (Total, domestic and export)", 
+                        "Plastic Domestically Recycled Fraction", "Efficiency of Domestic Recycling", "Plastic Export Fraction", 
+                        "Plastic Re-Export Fraction", "Plastic Incinerated Fraction", "Plastic Landfilled Fraction", "Waste Facility Emissions"]
+
+typesOfWastes = ["Misc. Inorganic Waste", "Other", "Yard Trimmings", "Food", "Rubber, Leather and Textiles", "Wood", "Metals", "Glass", 
+                 "Paper and Paperboard", "Plastics"]
+
+typesOfWastesForCalculations = ["Misc. Inorganic Waste", "Other", "Yard Trimmings", "Food", "Rubber, Leather and Textiles", "Wood", "Metals", "Glass", 
+                 "Paper and Paperboard"] #Note: This is the same as the one above without a plastics string
+
+#Creates list of strings of types of plastics in domestic calculations
+typesOfPlasticDomestic = ["PET", "HDPE", "PVC", "LDPE", "PLA", "PP", "PS", "Other Resin"]
+
+#Creates list of strings of types of plastics in international calculations
+typesOfPlasticsInternational = ["Ethylene", "Vinyl Chloride", "Styrene", "Other"]
+
+#Shares of each reported international category that streams 21, 22 and 27 put on each resin. Key = type of plastic, value = dict of category shares
+internationalResinSplits = {"PET": {"Other":0.4}, "HDPE": {"Ethylene":0.5}, "PVC": {"Vinyl Chloride":1}, "LDPE": {"Ethylene":0.5}, "PLA": {}, "PP": {},
+                            "PS": {"Styrene":1}, "Other Resin": {"Other":0.6}}
+
+#Trade flows of plastic waste and the streams they are: import (21), export (27) and re-export (22)
+tradeFlows = ["Import", "Export", "Re-Export"]
+
+#Categories for life cycle inventory (formerly known as material flow analysis)
+matFlowAnalSumCategories = ["PET", "HDPE", "PVC", "LDPE", "PLA", "PP", "PS", "Other Resin", "Chemical Additives"]
+
+#Column headings of the LCI tables
+matFlowColumnHeadings = ('Materials', 'Input (ton/total ton input)', 'Output (ton/total ton input)', 'Releases/Littering (ton/total ton input)', 'Inhalation Exposure (Tons/total ton input)', 'Dermal Exposure (Tons/total ton input)', 'Greenhouse Gas Emissions (Tons CO2-eq/ton input)')
+
+#Title of each stream, in the order of the stream summary columns
+streamTitleRows = ['Stream Title', 'Monomer/Raw Materials', 'Additives', 'Manufacture GHG Releases', 'Manufacture to Use', 'Additives Migration', 'Use to Collection', 'Collection GHG Emissions', 'Other Waste into Collection', 
+                   'Plastic Litter', 'Collection to Sort', 'Nonrecyclable Incinerate: Sort to Incineration', 'Sort to Landfill', 'Sort to Compost', 'Sort to Recycle: Recyclable Nonplastic Waste', 'Sort GHG Emissions', 'Sort to Mechanical Recycling', 'Mechanical Recycling Net GHG Emissions', 
+                   'Mechanical Recycling Additive Migration', 'Mechanical Recycling Additive Contamination', 'Plastic: Mechanical Recycling to Manufacture', 'Plastic Import', 'Plastic Re-Export', 'Mechanical Recycling to Incineration', 'Plastic: Sort to Incineration', "Incineration GHG Emissions",
+                   'Plastic: Sort to Landfill', 'Plastic Export from Sort', 'Mechanical Recycling to Landfill', 'Landfill Plastic Leak', 'Landfill GHG Emissions', '', '']
+
+#Worker exposure of each stage: number of workers, workdays a year, and milligrams one worker takes in by inhalation and
+#through the skin on one workday. Stages left out have no exposure data. eolPlastic.exposure treats these as distributions
+milligramsPerTon = 9.072*10**8
+workerExposure = {"Mechanical Recycling": {"workers":21834, "workdays":250, "inhalation":105, "dermal":2170}}
+
+#Emission factors of the model, the set calculateStreams uses unless it is given another (eolPlastic.emissions keeps
+#versioned sets in the SQLite file). Tons CO2-eq per ton unless noted, factors by resin have a value per typesOfPlasticDomestic
+defaultEmissionFactorSet = "EoL 2018"
+defaultEmissionFactors = {"Resin Manufacture": {"PET":2.2, "HDPE":1.53, "PVC":1.9, "LDPE":1.76, "PLA":2.09, "PP":1.51, "PS":2.46, "Other Resin":1.92}, #stream 3
+                          "Manufacture Process": 0.0025, #per ton made, stream 3
+                          "Collection": 230, #kg CO2-eq per ton collected, stream 7
+                          "Recycling": {"PET":-1.13, "HDPE":-.88, "PVC":0, "LDPE":0, "PLA": 0, "PP":0, "PS":0, "Other Resin":-1.03}, #streams 16 and 20
+                          "Incineration": {"PET": 1.24, "HDPE":1.27, "PVC":0.67, "LDPE": 1.27, "PLA":1.25, "PP":1.27, "PS":1.64, "Other Resin":2.33}, #stream 24
+                          "MSW Incineration": 1.05, #per ton of other MSW incinerated, stream 25
+                          "Transport and Disposal": 0.04, #per ton of plastic in streams 21, 22, 23, 26, 27 and 29
+                          "Landfill MSW Share": 0.15} #fraction of the reported landfill emissions put on stream 30
+
+#Median molecular weight (g/mol) of the additives of each type in the chemicalAdditives table, for migration. Colorant and
+#Clarifier/Toner have no entries of their own: colorants are taken as organic pigments and clarifiers as the median of the
+#whole table, and Heat Stabilizer uses the 'Stabilizer' entries. None for particles (inorganic pigments, fillers and
+#reinforcements), which don't diffuse through the polymer
+additiveMolecularWeights = {"Plasticizer":354.4, "Antioxidant":358.5, "UV Stabilizer":354.65, "Colorant":477.5, "Flame Retardant":291.52, "Curing Agent":160.3,
+                            "Blowing Agent":150.92, "Biocide":364.9, "Clarifier/Toner":393.3, "Inorganic Pigment":None, "Heat Stabilizer":591.3,
+                            "Organic Pigment":477.5, "Filler":None, "Reinforcement":None, "Lubricant":348.1, "Slip Agent":337.6, "Antistatic":283.9}
+
+#Piringer constants (A'p, tau in K) of each resin for upper-bound additive diffusion coefficients (Begley et al. 2005).
+#PVC is taken as rigid PVC; PLA has none published and takes PET's, and Other Resin takes LDPE's, the fastest
+piringerConstants = {"PET":(6.4, 1577), "HDPE":(14.5, 1577), "PVC":(-1.0, 0), "LDPE":(11.5, 0), "PLA":(6.4, 1577), "PP":(13.1, 1577), "PS":(0.0, 0),
+                     "Other Resin":(11.5, 0)}
+
+#Constant additive migration fractions of streams 5 and 18, and the residence time (days) and temperature (deg C) they are
+#taken to stand for. eolPlastic.migration fits each stage's effective thickness so the diffusion model gives the fraction there
+migrationReference = {"Use": {"fraction":0.019945732, "days":365, "temperature":23},
+                      "Mechanical Recycling": {"fraction":assumedValues["Additive migration Fraction"], "days":30, "temperature":23}}
+
+#Dictionary of densities of plastics for later calculations
+polymerWasteDensity = {"PET":1.365, "HDPE":952.5, "PVC":1.455, "LDPE":0.925, "PLA":1.26, "PP":905, "PS":1.055, "Other Resin":1.29}
+
+
+
+#Create 2018 data which will be added to the lists above as input by user:
+
+
+conditions2018 = [292_360_000.0, 35_680_000.0, 0.084, (0.084-0.0456706), 0.6670, 0.0456706, 0.0002, 0.172271*(1-0.084), 1-0.084-0.172271*(1-0.084), 109_000_000, 630_000_000] #B2:B10
+
+mswCompProp2018 = [0.0139, 0.0156, 0.121, 0.2159, 0.0896, 0.0619, 0.0876, 0.0419, 0.2305, 0.122] #B21:B30
+
+mswRecyc2018 = [69_000_000.0, 0, 0.014, 0, 0, 0.0606, 0.0449, 0.1263, 0.0443, 0.666, 0.0438] #B32:B42
+
+mswIncin2018 = [34_560_000.0, 0.023, 0.019, 0.074, 0.218, 0.166, 0.082, 0.085, 0.047, 0.122, 0.163] #B44:B54
+
+mswLand2018 = [146_180_000.0, 0.022, 0.02, 0.072, 0.241, 0.111, 0.083, 0.095, 0.052, 0.118, 0.185] #B56:B66
+
+mswCompost2018 =[42_600_000.0, 0, 0, 0.523, 0.477, 0, 0, 0, 0, 0, 0] #B68:B78
+
+repRecPlastics2018 = [980000.0, 560000.0, 0, 370000.0, 0, 50000.0, 20000.0, 1110000.0] #F9:F16
+
+repPlasticImport2018 = [139791.0, 36647.0, 19841.0, 778806.0] #E22:#25
+
+repPlasticsExport2018 = [920477.0, 137493.0, 28071.0, 543487.0] #F22:F25
+
+repPlasticsReExport2018 = [7246.0, 34.0, 27.0, 1038.0] #G22:G25
+
+plasticLandFractionsList2018 = [0.13410900183711, 0.175750153092468, 0.0257195345988977, 0.251684017146356, 0.00275566442131047, 0.248009797917942, 0.0685854255970606, 0.0933864053888549]
+
+plasticRecycledFractionsList2018 = [0.148179271708683, 0.176470588235294, 0.0235294117647059, 0.240616246498599, 0.00252100840336134, 0.228291316526611, 0.0633053221288515, 0.116526610644258]
+
+plasticIncinFractionsList2018 = [0.13410900183711, 0.175750153092468, 0.0257195345988977, 0.251684017146356, 0.00275566442131047, 0.248009797917942, 0.0685854255970606, 0.0933864053888549]
+ 
+
+
+#Creates list of each kind of additive added to each type of plastic based on stream 6 additive categories
+PETadditiveTypes = ["UV Stabilizer", "Flame Retardant", "Antistatic", "Clarifier/Toner", "Organic Pigment"]
+
+HDPEadditiveTypes = ["Antioxidant", "UV Stabilizer", "Colorant", "Flame Retardant", "Heat Stabilizer", "Organic Pigment"]
+
+PVCadditiveTypes = ["Plasticizer", "Antioxidant", "Slip Agent", "Heat Stabilizer", "Lubricant", "Colorant", "Organic Pigment"]
+
+PPadditiveTypes = ["Antioxidant", "Slip Agent", "UV Stabilizer", "Flame Retardant", "Clarifier/Toner", "Organic Pigment"]
+
+PSadditiveTypes = ["Antioxidant", "Slip Agent", "UV Stabilizer", "Antistatic", "Colorant", "Organic Pigment"]
+
+LDPEadditiveTypes = ["Antioxidant", "Slip Agent", "UV Stabilizer", "Flame Retardant", "Heat Stabilizer", "Colorant", "Organic Pigment"]
+
+PLAadditiveTypes = ["Plasticizer", "Heat Stabilizer", "Filler", "Reinforcement", "Biocide", "Antioxidant", "Colorant"]
+
+otherResinAdditives = ["Plasticizer", "Antioxidant", "UV Stabilizer", "Colorant", "Flame Retardant", "Curing Agent", "Blowing Agent", "Biocide", "Clarifier/Toner", 
+                       "Inorganic Pigment", "Heat Stabilizer", "Organic Pigment", "Filler", "Reinforcement", "Lubricant", "Slip Agent", "Antistatic"]
+
+#Creates list of 8 preceding lists
+additivesListList = [PETadditiveTypes, HDPEadditiveTypes, PVCadditiveTypes, PPadditiveTypes, PSadditiveTypes, LDPEadditiveTypes, PLAadditiveTypes, otherResinAdditives]
+
+#Incineration of additives. Each additive category has the fraction of it destroyed and shares of what is left going to
+#bottom ash, fly ash and stack gas. Destruction is the Incineration Efficiency Fraction for every category until
+#measured values replace it. The shares are generic by class: particles stay mostly in the bottom ash, and organic
+#residues are mostly caught on fly ash by the flue gas cleaning, with a tenth going out the stack
+incinerationCompartments = ["Bottom Ash", "Fly Ash", "Stack Gas"]
+incinerationDestructionFractions = dict(zip(otherResinAdditives, [assumedValues["Incineration Efficiency Fraction"]]*len(otherResinAdditives)))
+incinerationResidueShares = dict(zip(otherResinAdditives, [(0.9, 0.1, 0.0) if i in ["Inorganic Pigment", "Filler", "Reinforcement"] else (0.2, 0.7, 0.1)
+                                                           for i in otherResinAdditives]))
+
+
+#The additives, material data and assumptions tables live in an SQLite file in dataFolder. The file is opened
+#by the first query, and name and type lookups go through its indexes
+databasePath = os.path.join(dataFolder, 'EoL Plastic Databases.sqlite')
+databaseConnection = None
+
+def queryDatabase(query, parameters = ()):
+    global databaseConnection
+    if databaseConnection is None:
+        databaseConnection = sqlite3.connect(databasePath)
+    return [list(row) for row in databaseConnection.execute(query, parameters)]
+
+def loadChemicalAdditives():
+    return queryDatabase('SELECT number, name, alternateName, type, molecularWeight, state FROM chemicalAdditives ORDER BY rowNumber')
+
+def loadMaterialData():
+    return queryDatabase('SELECT material, primaryValue, secondaryValue FROM materialData ORDER BY rowNumber')
+
+def loadAssumptions():
+    return queryDatabase('SELECT assumption, effect, justification FROM assumptions ORDER BY rowNumber')
+
+#Additives with exactly this name and/or type, ignoring case
+def lookupChemicalAdditives(name = None, additiveType = None):
+    conditions = []
+    parameters = []
+    if name is not None:
+        conditions.append('name = ? COLLATE NOCASE')
+        parameters.append(name)
+    if additiveType is not None:
+        conditions.append('type = ? COLLATE NOCASE')
+        parameters.append(additiveType)
+    where = ' WHERE ' + ' AND '.join(conditions) if conditions else ''
+    return queryDatabase('SELECT number, name, alternateName, type, molecularWeight, state FROM chemicalAdditives' + where + ' ORDER BY rowNumber', parameters)
+
+#Primary and secondary values of a material, None if it isn't in the table
+def lookupMaterial(name):
+    rows = queryDatabase('SELECT material, primaryValue, secondaryValue FROM materialData WHERE material = ? COLLATE NOCASE', (name,))
+    return rows[0] if rows else None
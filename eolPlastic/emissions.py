@@ -0,0 +1,107 @@
+#Versioned emission factor sets. The set calculateStreams uses by default is defaultEmissionFactors in eolPlastic.data,
+#version 1 of "EoL 2018". Other sets (EPA WARM versions, regional grids, ...) go in the emissionFactors table of the
+#SQLite file, one row per value:
+#    factorSet, version, factor, resin, value        resin is '' for factors that have no value per resin
+#The library is read once into a matrix with a row per set and a column per emissionFactorKeys entry. A set can be
+#given to calculateStreams as factorSet, and batchGHG applies any number of sets to any number of results in one product
+import sqlite3
+import numpy as np
+from eolPlastic.data import queryDatabase, defaultEmissionFactorSet, defaultEmissionFactors
+from eolPlastic.engine import emissionFactorKeys, emissionFactor, reportedEmissionsKey, nonPlasticEmissionFactors, streamColumnNames
+
+def factorVector(factorSet):
+    return np.array([emissionFactor(factorSet, key) for key in emissionFactorKeys], dtype = float)
+
+#Factor set laid out like defaultEmissionFactors, for calculateStreams
+def factorSetFromVector(vector):
+    factorSet = {}
+    for (name, resin), value in zip(emissionFactorKeys, vector.tolist()):
+        if resin:
+            factorSet.setdefault(name, {})[resin] = value
+        else:
+            factorSet[name] = value
+    return factorSet
+
+class EmissionFactorLibrary:
+    def __init__(self, sets = ()): #sets: (name, version, vector) for each set
+        self.sets = [(name, version) for name, version, vector in sets]
+        self.matrix = np.array([vector for name, version, vector in sets], dtype = float).reshape(len(self.sets), len(emissionFactorKeys))
+        self.index = {key: row for row, key in enumerate(self.sets)}
+
+    def __len__(self):
+        return len(self.sets)
+
+    def versions(self, name):
+        return sorted(version for setName, version in self.sets if setName == name)
+
+    #Row of a set in matrix, the latest version when version is None
+    def row(self, name, version = None):
+        versions = self.versions(name)
+        if not versions:
+            raise KeyError('No emission factor set called ' + repr(name))
+        if version is None:
+            version = versions[-1]
+        if (name, version) not in self.index:
+            raise KeyError(repr(name) + ' has versions ' + ', '.join(str(v) for v in versions) + ', not ' + str(version))
+        return self.index[(name, version)]
+
+    def factorSet(self, name, version = None):
+        return factorSetFromVector(self.matrix[self.row(name, version)])
+
+    #Matrix of the chosen sets, given as names or (name, version) pairs
+    def select(self, sets):
+        return self.matrix[[self.row(*item) if isinstance(item, tuple) else self.row(item) for item in sets]]
+
+    @classmethod
+    def load(cls):
+        rows = []
+        try:
+            rows = queryDatabase('SELECT factorSet, version, factor, resin, value FROM emissionFactors ORDER BY factorSet, version')
+        except sqlite3.Error: #no database file or an old one without the table: only the default set
+            pass
+
+        values = {}
+        for name, version, factor, resin, value in rows:
+            values.setdefault((name, int(version)), {})[(factor, resin or '')] = float(value)
+        sets = []
+        for (name, version), setValues in values.items():
+            missing = [key for key in emissionFactorKeys if key not in setValues]
+            if missing:
+                raise ValueError('Emission factor set ' + name + ' version ' + str(version) + ' has no value for ' +
+                                 ', '.join(factor + (' ' + resin if resin else '') for factor, resin in missing))
+            sets.append((name, version, [setValues[key] for key in emissionFactorKeys]))
+        if not any(name == defaultEmissionFactorSet for name, version, vector in sets):
+            sets.insert(0, (defaultEmissionFactorSet, 1, factorVector(defaultEmissionFactors)))
+        return cls(sets)
+
+#Library read from the SQLite file by the first call
+loadedLibrary = None
+
+def emissionFactorLibrary():
+    global loadedLibrary
+    if loadedLibrary is None:
+        loadedLibrary = EmissionFactorLibrary.load()
+    return loadedLibrary
+
+#(scenarios, keys, columns) masses each factor multiplies in each stream summary column, from the ghgActivities of
+#results. The last key is the reported emissions, which no factor scales
+def activityTensor(results):
+    keys = {key: number for number, key in enumerate(emissionFactorKeys + [reportedEmissionsKey])}
+    activities = np.zeros((len(results), len(keys), len(streamColumnNames)))
+    for scenario, result in enumerate(results):
+        for column, columnActivities in result['ghgActivities'].items():
+            for key, activity in columnActivities.items():
+                activities[scenario, keys[key], column - 1] = activity
+    return activities
+
+#Tons CO2-eq of every stream summary column for every result (one result or a list of them) under every row of
+#factorMatrix (a library's matrix or select()), shape (scenarios, sets, columns). Sums over the columns match
+#totalGHG. plasticOnly leaves out the other MSW, like the 'Emissions from plastic' row
+def batchGHG(results, factorMatrix, plasticOnly = False):
+    if isinstance(results, dict):
+        results = [results]
+    factorMatrix = np.atleast_2d(np.asarray(factorMatrix, dtype = float))
+    factors = np.concatenate([factorMatrix, np.ones((len(factorMatrix), 1))], axis = 1)
+    if plasticOnly:
+        factors[:, [name in nonPlasticEmissionFactors for name, resin in emissionFactorKeys] + [False]] = 0
+    return np.einsum('sk,nkc->nsc', factors, activityTensor(results))
@@ -0,0 +1,1756 @@
+#Calculations of the model, without any Tk. The GUI imports everything from here, and other programs
+#(eolPlastic.service, notebooks, worker processes) can import it at the cost of NumPy alone
+import numpy as np
+import types
+import functools
+import hashlib
+import os
+import sys
+import itertools
+import multiprocessing
+from collections import namedtuple, deque
+from concurrent.futures import ProcessPoolExecutor
+
+
+#The data tables are in eolPlastic.data
+from eolPlastic.data import *
+
+
+#Will calculate amount of each kind of additive in each kind of plastic based on low additive Fractions and bulk mass; key = types of additives, value = amount of each additive
+def additiveMassCalculator(additiveList, plasticType, massDict): #Takes argument of LIST of types of additives going into type of plastic, STRING of type of plastic, then DICT of bulk masses
+    newDict = dict(zip(additiveList, [massDict[plasticType]*lowAdditiveFractions[i] for i in additiveList])) #takes bulk mass and multiplies by low additive Fraction for each kind of additive
+    return newDict
+
+#Sums mass of additive type in specified stream
+def totalOfAdditiveType(typeOfAdditive, listOfAdditiveLists): #Takes argument for STRING of type of additive, and LIST of dicts of additives
+    additiveAmount = 0
+    for i in listOfAdditiveLists:
+        if typeOfAdditive in i: #Checks whether additive is in each list of additives, then adds to total of that additive
+            additiveAmount += i[typeOfAdditive]
+    return additiveAmount
+
+#Calculates total mass of plastic resin in specific stream
+def totalResinCalculator(plasticType, plasticMassDict, additiveMassList): #Takes argument for STRING of plastic type; DICT of bulk masses; DICT of additive masses for specific plastic
+    resinMass = plasticMassDict[plasticType]-sum(additiveMassList.values()) #sums additives in plastic's bulk mass, then subtracts to find resin mass
+    return resinMass
+
+#Calculates bulk plastic masses in reverse of total resin calculator, based on resin masses
+def backwardsLumpPlasticCalculator(resinMassList, typeOfResin, additiveList):
+    additiveFraction = sum([lowAdditiveFractions[i] for i in additiveList]) #Finds total Fraction of bulk mass that is resin
+    lumpSum = resinMassList[typeOfResin]/(1-additiveFraction) #Divides to find bulk mass
+    return lumpSum
+        
+
+def trvwListMaker(listOfDicts): #Creates lists that will be eventually added to LCI TRVW tables. Takes argument of list of dictionaries that are to be examined
+    newList = []
+    for i in matFlowAnalSumCategories: #iterates over list of categories in LCI tables
+        subList = []
+        q=0
+        subList.append(i)
+        for d in listOfDicts:
+            q = d[i] #Takes value from dict
+            try:
+                q= float(q) #if value is a number, will and round to three decimal places and add to the TRVW list
+                subList.append(round(q,3))
+            except ValueError:
+                subList.append(d[i]) #if value is not a number (if it is 'Unavaible'), it will be added 
+        for b in range(len(subList)):
+            if subList[b] == 0:
+                subList[b] = "Negligible" #Changes 0's to negligible
+        newList.append(subList)
+    return newList
+
+def streamSummaryTRVWLister(listOfDicts, category): #creates lists that will be added to stream summary TRVW tables. Takes argument of list of dictionaries that are to be examined, along with string for category that will make up the row of the table
+    trvwList = []
+    trvwList.append(category) #adds category/row name
+    for i in listOfDicts:
+        if category in i:
+            trvwList.append(i[category]) #adds values corresponding to category from dictionary to this list if there is one, otherwise adds 0
+        else: 
+            trvwList.append(0)
+    return trvwList
+#Will accomplish recycling scaling calculations (Sensitivty Facts G9:G16)
+def recycleScaler(reportedList, plasticTotal, recycledFraction): #takes input of types of plastics, total plastic mass, and Fraction of plastic that is recycled 
+    newScaledDict = dict(zip(typesOfPlasticDomestic,[plasticTotal*recycledFraction/sum(reportedList)*i for i in reportedList])) #creates dictionary from above list
+    return newScaledDict
+
+def trvwRounder(num): #rounds numbers in stream summary trvw based on its magnitude
+    value = 0
+    if isinstance(num, str):
+        value = num
+    elif num<1:
+        if num<0.5:
+            if num<0.1:
+                if num == 0:
+                    value = 0
+                else:
+                    value = '<0.1'
+            else:
+                value = '<0.5'
+        else: 
+            value = '<1'
+    else:
+        value = '{:,}'.format(round(num))
+    return value
+
+#Tons taken in a year by a stage's workers, from the dose of one worker on one workday in milligrams. Works on arrays
+def workerExposureMass(dose, workers, workdays):
+    return dose/milligramsPerTon*workers*workdays
+
+#Exposure column of a stage's LCI table: tons taken in by route ('inhalation' or 'dermal') per ton input, each category
+#weighted by its share of the input. Stages without workerExposure data get the unavailable dict instead
+def stageExposure(stage, route, stageInput, inputDivisor, unavailable):
+    if stage not in workerExposure:
+        return unavailable
+    parameters = workerExposure[stage]
+    exposedMass = workerExposureMass(parameters[route], parameters['workers'], parameters['workdays'])
+    return dict(zip(matFlowAnalSumCategories, [stageInput[i]*exposedMass/inputDivisor for i in matFlowAnalSumCategories]))
+
+#Emission factors as (name, resin) pairs, resin '' for factors without one. A factor set as an array has a value per key
+emissionFactorKeys = [(name, i) for name, value in defaultEmissionFactors.items() for i in (typesOfPlasticDomestic if isinstance(value, dict) else [''])]
+nonPlasticEmissionFactors = ["MSW Incineration", "Landfill MSW Share"]
+
+#Key of emissions taken as reported, which every factor set multiplies by 1
+reportedEmissionsKey = ("Reported", "")
+
+def emissionFactor(factorSet, key):
+    if key == reportedEmissionsKey:
+        return 1
+    name, resin = key
+    return factorSet[name][resin] if resin else factorSet[name]
+
+#Tons CO2-eq of one stream summary column from its ghgActivities. plasticOnly leaves out the other MSW
+def columnEmissions(activities, factorSet, plasticOnly = False):
+    return sum(emissionFactor(factorSet, key)*activity for key, activity in activities.items() if not (plasticOnly and key[0] in nonPlasticEmissionFactors))
+
+def checkEntry(check): #will be used to make sure all data has an input
+    if check == []:
+        return True
+
+#Names of the input lists, in the order calculateStreams takes them
+inputListNames = ['conditions', 'mswCompProp', 'mswRecyc', 'mswIncin', 'mswLand', 'mswCompost', 'repRecPlastics', 'repPlasticImport', 'repPlasticsExport',
+                  'repPlasticsReExport', 'plasticLandFractionsList', 'plasticRecycledFractionsList', 'plasticIncinFractionsList']
+
+#Describes each input list for validateInputs: the name of every field, which fields are masses (not negative)
+#and which are fractions (between 0 and 1), fields that can't be larger than another one, and groups of fields
+#that must add up to 1, or to another field, within 1%
+mswFateFields = ['Total Mass'] + typesOfWastes
+inputGroups = {'conditions': {'title': 'Conditions', 
+                              'fields': ['Total MSW', 'Total Plastic', 'Plastic Recycled', 'Plastic Recycled Domestically', 'Recycling Efficiency', 'Plastic Exported',
+                                         'Plastic Re-exported', 'Plastic Incinerated', 'Plastic Landfilled', 'Waste Facility Emissions', 'Landfill Emissions'],
+                              'masses': [0, 1, 9, 10], 'fractions': [2, 3, 4, 5, 6, 7, 8], 'notAbove': [(1, 0, 'Total plastic cannot be more than total MSW.')],
+                              'sums': [([2, 7, 8], None, 'Plastic recycled proportion, landfill proportion, and incineration proportion do not sum to 1.'),
+                                       ([3, 5, 6], 2, 'Domestic and exported recycling do not sum to total recycled Fraction.')]},
+               'mswCompProp': {'title': 'MSW Composition', 'fields': typesOfWastes, 'masses': [], 'fractions': list(range(10)), 'notAbove': [],
+                               'sums': [(list(range(10)), None, 'Proportions do not sum to 1.')]},
+               'repRecPlastics': {'title': 'Reported Recycling', 'fields': typesOfPlasticDomestic, 'masses': list(range(8)), 'fractions': [], 'notAbove': [], 'sums': []}}
+
+for group, title in [('mswRecyc', 'MSW Recycling'), ('mswIncin', 'MSW Incineration'), ('mswLand', 'MSW Landfill'), ('mswCompost', 'MSW Compost')]:
+    inputGroups[group] = {'title': title, 'fields': mswFateFields, 'masses': [0], 'fractions': list(range(1, 11)), 'notAbove': [],
+                          'sums': [(list(range(1, 11)), None, 'Proportions do not sum to 1.')]}
+for group, title in [('plasticRecycledFractionsList', 'Plastic Recycled'), ('plasticIncinFractionsList', 'Plastic Incinerated'), ('plasticLandFractionsList', 'Plastic Landfill')]:
+    inputGroups[group] = {'title': title, 'fields': typesOfPlasticDomestic, 'masses': [], 'fractions': list(range(8)), 'notAbove': [],
+                          'sums': [(list(range(8)), None, 'Proportions do not sum to 1.')]}
+for group, title in [('repPlasticImport', 'Import'), ('repPlasticsExport', 'Export'), ('repPlasticsReExport', 'Re-Export')]:
+    inputGroups[group] = {'title': title, 'fields': typesOfPlasticsInternational, 'masses': list(range(4)), 'fractions': [], 'notAbove': [], 'sums': []}
+
+#One problem found by validateInputs. scenario is the row of the batch, fields are the names of the fields involved
+FieldError = namedtuple('FieldError', ['scenario', 'group', 'fields', 'message'])
+
+#Runs every check of inputGroups on whole arrays. inputs maps input list names to one scenario (a list of values)
+#or a batch (one row per scenario). Yields the group, the fields checked and which scenarios failed
+def inputChecks(inputs):
+    for group, values in inputs.items():
+        spec = inputGroups[group]
+        fields = spec['fields']
+        values = np.asarray(values, dtype = float)
+        values = values.reshape(-1, values.shape[-1] if values.ndim else 1)
+        if values.shape[1] != len(fields):
+            yield group, tuple(fields), np.ones(len(values), dtype = bool), 'Expected ' + str(len(fields)) + ' values.'
+            continue
+        
+        #comparisons with NaN are False, so NaN fails every check
+        badMasses = ~(values[:, spec['masses']] >= 0)
+        for column, field in enumerate(spec['masses']):
+            yield group, (fields[field],), badMasses[:, column], fields[field] + ' cannot be negative.'
+        fractions = values[:, spec['fractions']]
+        badFractions = ~((fractions >= 0) & (fractions <= 1))
+        for column, field in enumerate(spec['fractions']):
+            yield group, (fields[field],), badFractions[:, column], fields[field] + ' must be between 0 and 1.'
+        for field, limit, message in spec['notAbove']:
+            yield group, (fields[field], fields[limit]), ~(values[:, field] <= values[:, limit]), message
+        for summed, target, message in spec['sums']:
+            total = values[:, summed].sum(axis = 1)
+            targetValues = 1 if target is None else values[:, target]
+            involved = [fields[field] for field in summed] + ([] if target is None else [fields[target]])
+            yield group, tuple(involved), ~(np.abs(total - targetValues) <= 0.01 * np.abs(targetValues)), message
+
+#Returns a list of FieldError for every failed check, ordered by scenario. Empty if everything is valid
+def validateInputs(inputs):
+    errors = []
+    for group, fields, failed, message in inputChecks(inputs):
+        for scenario in np.flatnonzero(failed).tolist():
+            errors.append(FieldError(scenario, group, fields, message))
+    errors.sort(key = lambda error: error.scenario)
+    return errors
+
+#Returns an array with True for each scenario of a batch that passes every check
+def validScenarios(inputs):
+    valid = True
+    for group, fields, failed, message in inputChecks(inputs):
+        valid = valid & ~failed
+    return np.atleast_1d(valid)
+
+#Scenarios are stored as one row of numbers per scenario, the input lists laid end to end in inputListNames order.
+#A library file is a compressed numpy archive holding the format version, the layout of a row, the scenario
+#names and the rows themselves, so a whole library is read with a single np.load
+scenarioFormatVersion = 1
+scenarioGroupLengths = [len(inputGroups[name]['fields']) for name in inputListNames]
+scenarioGroupOffsets = np.cumsum([0] + scenarioGroupLengths).tolist()
+
+def packScenario(inputs):
+    for name, length in zip(inputListNames, scenarioGroupLengths):
+        if len(inputs[name]) != length:
+            raise ValueError(name + ' should have ' + str(length) + ' values, not ' + str(len(inputs[name])))
+    return np.concatenate([np.asarray(inputs[name], dtype = float) for name in inputListNames])
+
+def unpackScenario(row):
+    return {name: row[start:stop].tolist() for name, start, stop in zip(inputListNames, scenarioGroupOffsets, scenarioGroupOffsets[1:])}
+
+#Hex digest of the packed inputs of a scenario, the same for equal inputs in any process or session
+def scenarioHash(inputs):
+    return hashlib.sha256(packScenario(inputs).tobytes()).hexdigest()
+
+#Named scenarios that can be saved to and loaded from one file. inputs(name) gives the keyword arguments for
+#calculateStreams, batch() gives every scenario at once in the form validateInputs takes
+class ScenarioLibrary:
+    def __init__(self, names = (), rows = ()):
+        self.names = list(names)
+        self.rows = list(rows)
+        self.index = {name: row for row, name in enumerate(self.names)}
+        
+    def __len__(self):
+        return len(self.names)
+    
+    def __contains__(self, name):
+        return name in self.index
+    
+    def add(self, name, inputs): #replaces a scenario with the same name
+        row = packScenario(inputs)
+        if name in self.index:
+            self.rows[self.index[name]] = row
+        else:
+            self.index[name] = len(self.names)
+            self.names.append(name)
+            self.rows.append(row)
+            
+    def remove(self, name):
+        row = self.index.pop(name)
+        del self.names[row]
+        del self.rows[row]
+        self.index = {name: row for row, name in enumerate(self.names)}
+        
+    def inputs(self, name):
+        return unpackScenario(self.rows[self.index[name]])
+    
+    def batch(self):
+        values = np.array(self.rows, dtype = float).reshape(len(self.rows), scenarioGroupOffsets[-1])
+        return {name: values[:, start:stop] for name, start, stop in zip(inputListNames, scenarioGroupOffsets, scenarioGroupOffsets[1:])}
+    
+    def save(self, path):
+        values = np.array(self.rows, dtype = float).reshape(len(self.rows), scenarioGroupOffsets[-1])
+        temporaryPath = path + '.tmp'
+        with open(temporaryPath, 'wb') as file: #written beside the old library first so a failed save can't corrupt it
+            np.savez_compressed(file, version = np.array(scenarioFormatVersion), groups = np.array(inputListNames),
+                                lengths = np.array(scenarioGroupLengths), names = np.array(self.names, dtype = str), values = values)
+        os.replace(temporaryPath, path)
+        
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle = False) as data:
+            version = int(data['version'])
+            if version > scenarioFormatVersion:
+                raise ValueError(path + ' was saved in scenario format ' + str(version) + ', this program reads up to format ' + str(scenarioFormatVersion))
+            if data['groups'].tolist() != inputListNames or data['lengths'].tolist() != scenarioGroupLengths:
+                raise ValueError(path + ' does not hold the inputs this program uses')
+            return cls(data['names'].tolist(), data['values'])
+
+#Raised by a progress callback to stop a calculation that is no longer needed
+class CalculationCancelled(Exception):
+    pass
+
+def noProgress(fraction): #default progress callback, does nothing
+    pass
+
+#Bulk mass of each type of plastic in a trade stream, from the reported masses of the international categories
+def internationalResinMasses(reportedDict):
+    return {resin: sum(reportedDict[category]*share for category, share in internationalResinSplits[resin].items()) for resin in typesOfPlasticDomestic}
+
+#Mass of each additive that migrates out of a stage, from its additive dicts in typesOfPlasticDomestic order and a
+#fraction for each resin and additive (see eolPlastic.migration)
+def migratedAdditives(fractions, listOfAdditiveDicts):
+    return dict(zip(otherResinAdditives, [sum(fractions[resin][i]*additives[i] for resin, additives in zip(typesOfPlasticDomestic, listOfAdditiveDicts) if i in additives)
+                                          for i in otherResinAdditives]))
+
+#Does every stream and LCI calculation from the input lists. Does not touch any widgets, so it can be run on a worker thread.
+#progress is called with the fraction of the calculation completed and may raise CalculationCancelled to stop it.
+#migrationFractions: {stage: {resin: {additive: fraction}}} for 'Use' (stream 5) and 'Mechanical Recycling' (stream 18),
+#from eolPlastic.migration. A stage left out keeps its constant migration fraction.
+#tradeResinMasses: {flow: {resin: bulk mass}} for 'Import', 'Export' and 'Re-Export', e.g. totals of a trade matrix
+#from eolPlastic.trade. A flow left out is split from the reported international categories
+def calculateStreams(conditions, mswCompProp, mswRecyc, mswIncin, mswLand, mswCompost, repRecPlastics, repPlasticImport, repPlasticsExport,
+                     repPlasticsReExport, plasticLandFractionsList, plasticRecycledFractionsList, plasticIncinFractionsList, progress = noProgress,
+                     factorSet = None, migrationFractions = None, tradeResinMasses = None):
+    #Emission factors, laid out like defaultEmissionFactors
+    if factorSet is None:
+        factorSet = defaultEmissionFactors
+    if migrationFractions is None:
+        migrationFractions = {}
+    if tradeResinMasses is None:
+        tradeResinMasses = {}
+    
+    #Creates dict of Fractions of total plastic landfilled are associated with each type of plastic
+    plasticLandFractions = dict(zip(typesOfPlasticDomestic, plasticLandFractionsList))
+
+    
+    #Creates dictionary of proportion of each type of plastic that has been recycled. key = type of plastic A5:A12; value = proportion of each type of plastic in MSW stream B5:B12
+    plasticFractionsRecycled = dict(zip(typesOfPlasticDomestic, plasticRecycledFractionsList))
+    
+    #Creates dict of incineration Fractions for each kind of plastic. Key = type of plastic, value = proportion of incineration make up
+    plasticIncinFractionsDict = dict(zip(typesOfPlasticDomestic, plasticIncinFractionsList))
+    
+    #Create dictionaries of data, associating category with value
+    mswGeneratedProps = dict(zip(typesOfWastes, mswCompProp)) #key = MSW waste, value = proportion of MSW 
+    
+    mswConditions = dict(zip(conditionsCategories, conditions)) #key = conditions (total MSW, total plastic, plastic recycled, etc.)
+    
+    
+    #Creates dictionary of international recycling values
+    repPlasticImportDict = dict(zip(typesOfPlasticsInternational, repPlasticImport))
+    
+    repPlasticsExportDict = dict(zip(typesOfPlasticsInternational, repPlasticsExport))
+    
+    repPlasticsReExportDict = dict(zip(typesOfPlasticsInternational, repPlasticsReExport))
+    
+    
+    
+    
+    
+    #Creates dictionary of scaled recycled masses (key = type of plastic, value = bulk mass of plastic and additives)
+    scaledRec = recycleScaler(repRecPlastics, conditions[1], conditions[2]) #G9:G16
+    
+    
+    
+    ##########################################################################################################
+    ##########################################################################################################
+    #Stream 6 Calculations
+    #Sheet = Stream 6 - PWaste Generated
+    #Creates dictionary with total mass of each total type of plastic generated (total mass of plastics generated * Fraction of each kind of plastic). key = type of plastic A5:A12; value = bulk mass including additives C5:C12
+    plasticsMassDict = dict(zip(typesOfPlasticDomestic, [plasticFractionsRecycled[i] * conditions[1] for i in typesOfPlasticDomestic]))
+    
+    
+    
+    #Creates dicts of additive masses in each kind of plastic in 
+    PETAdditiveMasses = additiveMassCalculator(PETadditiveTypes, "PET", plasticsMassDict)
+    HDPEAdditiveMasses = additiveMassCalculator(HDPEadditiveTypes, "HDPE", plasticsMassDict)
+    PVCAdditiveMasses = additiveMassCalculator(PVCadditiveTypes, "PVC", plasticsMassDict)
+    PPAdditiveMasses = additiveMassCalculator(PPadditiveTypes, "PP", plasticsMassDict)
+    PSAdditiveMasses = additiveMassCalculator(PSadditiveTypes, "PS", plasticsMassDict)
+    LDPEAdditiveMasses = additiveMassCalculator(LDPEadditiveTypes, "LDPE", plasticsMassDict)
+    PLAAdditiveMasses = additiveMassCalculator(PLAadditiveTypes, "PLA", plasticsMassDict)
+    otherResinAdditivesMasses = additiveMassCalculator(otherResinAdditives, "Other Resin", plasticsMassDict)
+    
+    #Creates list of preceding 8 dicts
+    listOfStream6Additives_ = [PETAdditiveMasses, HDPEAdditiveMasses, PVCAdditiveMasses, LDPEAdditiveMasses,   PLAAdditiveMasses,
+                                   PPAdditiveMasses, PSAdditiveMasses, otherResinAdditivesMasses]
+    
+    averageDensityCalculation = sum([polymerWasteDensity[i]*plasticFractionsRecycled[i] for i in typesOfPlasticDomestic])* 0.00000110231
+    progress(0.125)
+    
+    ##########################################################################################################################
+    #Stream 16 Calculations
+    #Sheet = Stream 16 - MechRecyc
+    
+    #Creates dictionary of bulk masses by multiplying scaled recycling values by the ratio of domestic recycled plastic to total recycled plastic
+    stream16PlasticCalcMasses = dict(zip(typesOfPlasticDomestic, [conditions[3]/conditions[2]*scaledRec[i] for i in typesOfPlasticDomestic]))
+    
+    #Creates dictionary of masses of each kind of additive in each kind of plastic
+    stream16PET = additiveMassCalculator(PETadditiveTypes, "PET", stream16PlasticCalcMasses)
+    stream16HDPE = additiveMassCalculator(HDPEadditiveTypes, "HDPE", stream16PlasticCalcMasses)
+    stream16PVC = additiveMassCalculator(PVCadditiveTypes, "PVC", stream16PlasticCalcMasses)
+    stream16PP = additiveMassCalculator(PPadditiveTypes, "PP", stream16PlasticCalcMasses)
+    stream16PS = additiveMassCalculator(PSadditiveTypes, "PS", stream16PlasticCalcMasses)   
+    stream16LDPE = additiveMassCalculator(LDPEadditiveTypes, "LDPE", stream16PlasticCalcMasses)
+    stream16PLA = additiveMassCalculator(PLAadditiveTypes, "PLA", stream16PlasticCalcMasses)
+    stream16Other = additiveMassCalculator(otherResinAdditives, "Other Resin", stream16PlasticCalcMasses)
+    
+    #Creates dict of emissions factors per M24:M31. Key = type of additive, value = emission factor
+    emissionFactors = factorSet["Recycling"]
+    
+    #Creates list of additive dicts in stream 16 
+    listOfstream16Additives = [stream16PET, stream16HDPE, stream16PVC, stream16LDPE, stream16PLA, stream16PP, stream16PS,  stream16Other]
+    
+    #Calculates total amount of each kind of additive in stream 16; key = type of additive, value = total mass of additive
+    totalAdditivesStream16_ = dict(zip(otherResinAdditives, [totalOfAdditiveType(i, listOfstream16Additives) for i in otherResinAdditives])) #Dict of additive in stream 16
+    
+    #Calculates Fraction of each additive of total mass of additives in stream 16; key = type of additive, value = Fraction of total 
+    additiveFractionsStream16_ = dict(zip(otherResinAdditives, [totalAdditivesStream16_[i]/sum(totalAdditivesStream16_.values()) for i in otherResinAdditives]))
+    
+    #Calculates total amount of each resin in stream 16; key = type of plastic, value = mass of resin
+    stream16ResinMasses_ = dict(zip(typesOfPlasticDomestic, [totalResinCalculator(typesOfPlasticDomestic[i], stream16PlasticCalcMasses, listOfstream16Additives[i]) for i in range(8)]))
+    
+    
+    
+    ############################################################################################
+    #Stream 17
+    
+    #Creates dict by calculating emissions from stream 16 per emissions factors and converts to Tons of CO2. 
+    #Multiplies bulk mass of each plastic by emission factor and then converts to Tons. Key = type of plastic, value = emissions in Tons of CO2
+    emissionStream16 = dict(zip(typesOfPlasticDomestic, [emissionFactors[i]*stream16PlasticCalcMasses[i]*1.10231 for i in typesOfPlasticDomestic]))
+    
+    
+    #############################################################################################
+    #Stream 19
+    #Sheet = Stream 19 - Contamination
+    #Creates dict of additive contaminations. Key = type of additive; value = contamination 
+    additiveContaminationConstant = 0.0415 #C11
+    
+    #Multiplies Fraction of each kind of additive by the total of plastic bulk masses in stream 16 and by the contamination constant
+    stream19AdditivesTotals = dict(zip(otherResinAdditives, [additiveFractionsStream16_[i]*sum(stream16PlasticCalcMasses.values())*(additiveContaminationConstant) for i in otherResinAdditives]))
+    
+    
+    #Calculates additives and degradation products in stream 19
+    stream19Contaminants = sum(stream16PlasticCalcMasses.values())*0.0065
+    stream19DegradationProducts = sum(stream16PlasticCalcMasses.values())*0.0515
+    
+    
+    
+    #################################################################################################
+    #Stream 4 Calculations
+    #Sheet = US Mat Flow Analysis 
+    #Creates dict of total resin in stream 4, based on stream 6 and bulk plastic manufacturing for . Key = type of plastic, value = mass of resin
+    stream4ResinMasses_ = dict(zip(typesOfPlasticDomestic, [totalResinCalculator(typesOfPlasticDomestic[i], plasticsMassDict, listOfStream6Additives_[i]) for i in range(8)]))
+    
+    #Creates dict of total additives in stream 4, based on stream 6 and bulk plastic manufacturing for . Key = type of additive, value = mass of additive
+    stream4AdditiveMasses_ = dict(zip(otherResinAdditives, [totalOfAdditiveType(i, listOfStream6Additives_) for i in otherResinAdditives]))
+    
+    
+    ##############################################################################################
+    #Stream 18 Calculations
+    #Sheet = US Mat Flow Analysis 
+    #Creates dict of additive migration occuring in stream 18 by multiplying the mass of each kind of additive in stream 16 by the additive migration fraction (0.02),
+    #or by the migration fraction of each resin and additive when given
+    if 'Mechanical Recycling' in migrationFractions:
+        stream18AdditiveMigration = migratedAdditives(migrationFractions['Mechanical Recycling'], listOfstream16Additives)
+    else:
+        stream18AdditiveMigration = dict(zip(otherResinAdditives, [assumedValues["Additive migration Fraction"]*totalAdditivesStream16_[i] for i in otherResinAdditives]))
+    
+    
+    progress(0.25)
+    
+    ###################################################################################################
+    #Stream 21 Calculations
+    #Sheet = Stream 21 - Import
+    
+    #Creates dict with key = type of plastic and value = amount of type of plastic imported based on reported Imported plastics in 
+    #internationalResinSplits, unless imports of each resin are given. Includes resin and additives lumped together
+    stream21PlasticMasses = dict(tradeResinMasses['Import']) if 'Import' in tradeResinMasses else internationalResinMasses(repPlasticImportDict)
+    
+    
+    #Creates dict of each kind of additive in each kind of plastic. Key = additive, value = mass of that additive
+    stream21PET = additiveMassCalculator(PETadditiveTypes, "PET", stream21PlasticMasses)
+    stream21HDPE = additiveMassCalculator(HDPEadditiveTypes, "HDPE", stream21PlasticMasses)
+    stream21PVC = additiveMassCalculator(PVCadditiveTypes, "PVC", stream21PlasticMasses)
+    stream21PP = additiveMassCalculator(PPadditiveTypes, "PP", stream21PlasticMasses)
+    stream21PS = additiveMassCalculator(PSadditiveTypes, "PS", stream21PlasticMasses)   
+    stream21LDPE = additiveMassCalculator(LDPEadditiveTypes, "LDPE", stream21PlasticMasses)
+    stream21PLA = additiveMassCalculator(PLAadditiveTypes, "PLA", stream21PlasticMasses)
+    stream21Other = additiveMassCalculator(otherResinAdditives, "Other Resin", stream21PlasticMasses)
+    
+    #Creates list of preceding dicts
+    listOfStream21Additives_ = [stream21PET, stream21HDPE, stream21PVC, stream21LDPE, stream21PLA, stream21PP, 
+                                    stream21PS,  stream21Other]
+    
+    #Totals each kind of additive in stream 21. Key = type of additive, value = amount of additive
+    stream21AdditivesTotals = dict(zip(otherResinAdditives, [totalOfAdditiveType(i, listOfStream21Additives_) for i in otherResinAdditives]))
+    
+    #Calculates total amount of each kind of resin in stream 21. Key = type of plastic, value = amount of resin
+    stream21ResinMasses_ = dict(zip(typesOfPlasticDomestic, [totalResinCalculator(typesOfPlasticDomestic[i], stream21PlasticMasses, listOfStream21Additives_[i]) for i in range(8)]))
+    
+    #Calculates emissions in this stream by multiplying bulk mass by 0.04 (the emissions factor) then converting into Tons of CO2
+    stream21Emissions = dict(zip(typesOfPlasticDomestic, [factorSet["Transport and Disposal"] * 1.10231* stream21PlasticMasses[i] for i in typesOfPlasticDomestic]))
+    
+    
+    ################################################################################
+    #Stream 22 Calculations
+    #Sheet = Stream 22- Re-Export
+    
+    #Creates dict with key = type of plastic and value = amount of type of plastic reexported based on reported reexported plastics in 
+    
+    stream22PlasticMasses = dict(tradeResinMasses['Re-Export']) if 'Re-Export' in tradeResinMasses else internationalResinMasses(repPlasticsReExportDict)
+    
+    
+    #Calculates amount of each additive in each type of plastic in stream 22. Key = type of additive, value = mass of that additive in stream 22
+    stream22PET = additiveMassCalculator(PETadditiveTypes, "PET", stream22PlasticMasses)
+    stream22HDPE = additiveMassCalculator(HDPEadditiveTypes, "HDPE", stream22PlasticMasses)
+    stream22PVC = additiveMassCalculator(PVCadditiveTypes, "PVC", stream22PlasticMasses)
+    stream22PP = additiveMassCalculator(PPadditiveTypes, "PP", stream22PlasticMasses)
+    stream22PS = additiveMassCalculator(PSadditiveTypes, "PS", stream22PlasticMasses)   
+    stream22LDPE = additiveMassCalculator(LDPEadditiveTypes, "LDPE", stream22PlasticMasses)
+    stream22PLA = additiveMassCalculator(PLAadditiveTypes, "PLA", stream22PlasticMasses)
+    stream22Other = additiveMassCalculator(otherResinAdditives, "Other Resin", stream22PlasticMasses)
+    
+    #Creates list of above dictionaries
+    listOfStream22Additives_ = [stream22PET, stream22HDPE, stream22PVC, stream22LDPE, stream22PLA, stream22PP, 
+                                    stream22PS,  stream22Other]
+    
+    
+    #Dict: Calculates total mass of each kind of resin in stream 22. Key = type of plastic, value = mass of resin
+    stream22ResinMasses_ = dict(zip(typesOfPlasticDomestic, [totalResinCalculator(typesOfPlasticDomestic[i], stream22PlasticMasses, listOfStream22Additives_[i]) for i in range(8)]))
+    
+    #Dict: Calculates total of each kind of additive in stream 22. Key = type of additive, value = mass of additive
+    stream22AdditivesTotals = dict(zip(otherResinAdditives, [totalOfAdditiveType(i, listOfStream22Additives_) for i in otherResinAdditives]))
+    
+    #Dict: Calculates emissions in stream 22. Emission factor 0.04*bulk mass of plastic in stream 22 and then converted into Tons of CO2
+    stream22Emissions = dict(zip(typesOfPlasticDomestic, [factorSet["Transport and Disposal"] * 1.10231* stream22PlasticMasses[i] for i in typesOfPlasticDomestic]))
+    
+    
+    
+    ###############################################################################################################
+    #Stream 23 Calculations
+    #Sheet = Stream 23MechRec-Incin
+    
+    #Dictionary of resin masses in stream 23, based on efficiency of domestic recycling (1-conditions208[4])/2, then multiplied by resin mass. key = type of plastic resin, value = mass of resin
+    stream23ResinMasses_ = dict(zip(typesOfPlasticDomestic, [(1-conditions[4])/2*stream16ResinMasses_[i] for i in typesOfPlasticDomestic])) #Resin alone
+    
+    #Dictionary of additive masses in stream 23, based on efficiency of domestic recycling (1-conditions208[4])/2, then multiplied by additive mass. key = type of plastic additive, value = mass of additive
+    stream23AdditiveMasses_ = dict(zip(otherResinAdditives, [totalAdditivesStream16_[i]*(1-conditions[4])/2 for i in otherResinAdditives]))
+    stream23PlasticMasses = dict(zip(typesOfPlasticDomestic, [backwardsLumpPlasticCalculator(stream23ResinMasses_, typesOfPlasticDomestic[i], additivesListList[i]) for i in range(8)]))
+    #stream 23 Emissions calculations dictionary. Bulk plastic weight in stream * 0.04 * conversion factor to make units Tons of CO2. Key = type of plastic, value = emissions associated with that type
+    stream23Emissions = dict(zip(typesOfPlasticDomestic, [factorSet["Transport and Disposal"]*1.10231*stream23PlasticMasses[i] for i in typesOfPlasticDomestic]))
+    
+    
+    ###########################################################################################################
+    
+    #Stream28 Calculations unnecessary because they are the same as stream 23- as per sheet US Mat Flow Analysis 
+    
+    
+    progress(0.375)
+    
+    ##########################################################################################################
+    #Stream 20 Calculations
+    #Sheet = Stream 20 Domestic Recyc
+    
+    
+    #Creates dictionary of stream 20 resin masses. Key = type of plastic resin, value = mass of resin: stream16+stream21-stream22-stream23-stream28 (but stream28=stream23, so stream23 is subtracted twice)
+    stream20ResinMasses = dict(zip(typesOfPlasticDomestic, [stream16ResinMasses_[i]+stream21ResinMasses_[i]-stream22ResinMasses_[i]-2*stream23ResinMasses_[i] for i in typesOfPlasticDomestic]))
+    
+    #Creates dictionary of stream 20 additive masses. Key = type of additive, value = mass of additive: stream16-stream18+stream19+stream21-stream22-stream23-stream28 (stream28=stream23, so stream23 is substracted twice)
+    stream20TotalAdditives = dict(zip(otherResinAdditives, [totalAdditivesStream16_[i]-stream18AdditiveMigration[i]+stream19AdditivesTotals[i]+stream21AdditivesTotals[i]-stream22AdditivesTotals[i]-2*stream23AdditiveMasses_[i] for i in otherResinAdditives]))
+    
+    #Not given bulk masses, so bulk masses calculated here. Key = type of plastic, value = bulk mass of each type of plastic
+    stream20PlasticCalcMasses = dict(zip(typesOfPlasticDomestic, [backwardsLumpPlasticCalculator(stream20ResinMasses, typesOfPlasticDomestic[i], additivesListList[i]) for i in range(8)]))
+    
+    stream20Emissions = dict(zip(typesOfPlasticDomestic, [stream20PlasticCalcMasses[i] * emissionFactors[i] for i in typesOfPlasticDomestic]))    
+
+    
+    ###################################################################################################################################
+    #Stream 1 Calculations
+    #Sheet =US Mat Flow Analysis 
+    #Dictionary of stream1 resin masses. Key = type of resin, value = mass of resin: stream4- stream 20
+    stream1PlasticMasses = dict(zip(typesOfPlasticDomestic, [stream4ResinMasses_[i] - stream20ResinMasses[i] for i in typesOfPlasticDomestic]))
+    
+    
+    ###########################################################################################################
+    #Stream 2 Calculations
+    #Sheet= US Mat Flow Analysis 
+    #Dictionary of additive masses. Key = type of additive, value = mass of additive
+    stream2AdditiveMasses = dict(zip(otherResinAdditives, [stream4AdditiveMasses_[i] - stream20TotalAdditives[i] for i in otherResinAdditives]))
+    
+    
+    ##################################################################################
+    #Stream 3 Calculations
+    #Sheet = Stream 3 - Emissions
+    
+    #Sum to create mass basis for stream 3
+    stream1_stream2_total = sum(stream1PlasticMasses.values())+sum(stream2AdditiveMasses.values())
+    
+    
+    #Creats dict of Fraction of each kind of plastic in stream 3 based on total resin. Key = type of plastic, value = Fraction of total 
+    stream3PlasticFractions = dict(zip(typesOfPlasticDomestic, [stream1PlasticMasses[i]/sum(stream1PlasticMasses.values()) for i in typesOfPlasticDomestic]))
+    
+    #Creates dict of bulk plastic masses of each kind of plastic based on Fraction determined above and mass basis. Key = type of plastic, value = bulk mass
+    stream3PlasticMasses = dict(zip(typesOfPlasticDomestic, [stream3PlasticFractions[i]*stream1_stream2_total for i in typesOfPlasticDomestic])) #Lump sum
+    
+    #Creates dictionary of additives for each type for each kind of plastic based on bulk mass
+    stream3PETAdditives = additiveMassCalculator(PETadditiveTypes, "PET", stream3PlasticMasses)
+    stream3HDPEAdditives = additiveMassCalculator(HDPEadditiveTypes, "HDPE", stream3PlasticMasses)
+    stream3PVCAdditives = additiveMassCalculator(PVCadditiveTypes, "PVC", stream3PlasticMasses)
+    stream3LDPEAdditives = additiveMassCalculator(LDPEadditiveTypes, "LDPE", stream3PlasticMasses)
+    stream3PLAAdditives = additiveMassCalculator(PLAadditiveTypes, "PLA", stream3PlasticMasses)
+    stream3PPAdditives = additiveMassCalculator(PPadditiveTypes, "PP", stream3PlasticMasses)
+    stream3PSAdditives = additiveMassCalculator(PSadditiveTypes, "PS", stream3PlasticMasses)
+    stream3OtherAdditives = additiveMassCalculator(otherResinAdditives, "Other Resin", stream3PlasticMasses)
+    
+    #Creates dictionary of emisions factors for each kind of plastic. Key = type of plastic, value = emission factor
+    stream3EmissionFactor = factorSet["Resin Manufacture"]
+    
+    #Creates dictionary of emissions for stream 3. Key = type of plastic, value = emissions for that (bulk mass*emission factor*conversion factor)
+    stream3Emissions = dict(zip(typesOfPlasticDomestic, [stream3EmissionFactor[i] * stream3PlasticMasses[i]*1.10231 for i in typesOfPlasticDomestic]))
+    
+    
+    #################################################################################################################
+    #Stream 5 Calculations
+    #Sheet = US Mat Flow Analysis 
+    polymerMigrationConstant = 4.71538E-06
+    additiveMigrationConstant = migrationReference["Use"]["fraction"]
+    
+    #Creates dict of resin masses in stream 5 by multiplying by polymer migration constant defined above. Key = type of resin, value = mass of migration
+    stream5ResinMasses = dict(zip(typesOfPlasticDomestic, [polymerMigrationConstant*stream4ResinMasses_[i] for i in typesOfPlasticDomestic]))
+    
+    #Creates dict of additive masses in stream 5 by multiplying by additive migration constant defined above, or by the migration fraction of each resin and
+    #additive when given. Key = type of additive, value = mass of migration
+    if 'Use' in migrationFractions:
+        stream5AdditiveMasses = migratedAdditives(migrationFractions['Use'], listOfStream6Additives_)
+    else:
+        stream5AdditiveMasses = dict(zip(otherResinAdditives, [additiveMigrationConstant*stream4AdditiveMasses_[i] for i in otherResinAdditives]))
+    
+    progress(0.5)
+    
+    #####################################################################################################################
+    #Stream 27 Calculations
+    #Sheet = Stream 27 - Export
+    
+    #Dictionary defining mass of each kind of plastic for this stream based on Export definitions in US  Sensitivity facts, unless exports of each resin are given.
+    #Key = type of plastic, value = bulk mass of that plastic
+    stream27PlasticMasses = dict(tradeResinMasses['Export']) if 'Export' in tradeResinMasses else internationalResinMasses(repPlasticsExportDict)
+    
+    #Dictionary defining mass of each kind of additive in each kind of plastic. Key = type of additive, value = mass of that additive
+    stream27PETAdditives = additiveMassCalculator(PETadditiveTypes, "PET", stream27PlasticMasses)
+    stream27HDPEAdditives = additiveMassCalculator(HDPEadditiveTypes, "HDPE", stream27PlasticMasses)
+    stream27PVCAdditives = additiveMassCalculator(PVCadditiveTypes, "PVC", stream27PlasticMasses)
+    stream27LDPEAdditives = additiveMassCalculator(LDPEadditiveTypes, "LDPE", stream27PlasticMasses)
+    stream27PLAAdditives = additiveMassCalculator(PLAadditiveTypes, "PLA", stream27PlasticMasses)
+    stream27PPAdditives = additiveMassCalculator(PPadditiveTypes, "PP", stream27PlasticMasses)
+    stream27PSAdditives = additiveMassCalculator(PSadditiveTypes, "PS", stream27PlasticMasses)
+    stream27OtherAdditives = additiveMassCalculator(otherResinAdditives, "Other Resin", stream27PlasticMasses)
+    
+    #List of above dictionaries
+    listOfstream27Additives = [stream27PETAdditives, stream27HDPEAdditives, stream27PVCAdditives, stream27LDPEAdditives, stream27PLAAdditives,
+                               stream27PPAdditives, stream27PSAdditives, stream27OtherAdditives]
+    
+    #Dictionary of resin masses in this stream. Key = type of resin, value = mass of resin
+    stream27ResinMasses = dict(zip(typesOfPlasticDomestic, [totalResinCalculator(typesOfPlasticDomestic[i], stream27PlasticMasses, listOfstream27Additives[i]) for i in range(8)]))
+    
+    
+    #Dictionary of additive masses in this stream. Key = type of additive, value = mass of additive
+    stream27TotalAdditivesMasses = dict(zip(otherResinAdditives, [totalOfAdditiveType(i, listOfstream27Additives) for i in otherResinAdditives]))
+    
+    #Dictionary of emissions in this stream, key = type of plastic, value = emissions associated with that plastic (bulk mass *0.04 * conversion factor to make units Tons CO2))
+    stream27Emissions = dict(zip(typesOfPlasticDomestic, [factorSet["Transport and Disposal"]*1.10231*stream27PlasticMasses[i] for i in typesOfPlasticDomestic]))
+    
+    ######################################################################################
+    #Stream 8 Calculations
+    #Note: stream8 plastic resins and additives are the same as stream 27 as per US Mat FLow Analysis 
+    #Creates dictionary of types of MSW waste (without plastic), takes total MSW and multiplies that by their respective proportions. Key = type of MSW, value = mass of that MSW
+    stream8MSWMasses_ = dict(zip(typesOfWastesForCalculations, [mswCompProp[i]*conditions[0] for i in range(len(typesOfWastesForCalculations))]))
+    
+    
+    ####################################################################################################
+    #Stream 9 Calculations
+    #Sheet = Stream 9 - Litter
+    #Determines total mass of stream 4, then multiplies it by littering constant to determine mass of littered plastic
+    stream4TotalMass_ = sum(stream4AdditiveMasses_.values())+sum(stream4ResinMasses_.values())
+    stream9TotalMass_ = 0.02*stream4TotalMass_
+    
+    #Creates dictionary of bulk plastic masses based on proportions of plastic generated and mass basis for stream. Key = type of plastic, value = bulk mass littered 
+    stream9PlasticMasses_ = dict(zip(typesOfPlasticDomestic, [stream9TotalMass_*plasticFractionsRecycled[i] for i in typesOfPlasticDomestic]))
+    
+    
+    #Creates dictionary of additives in littered plastic based on bulk masses determined above. Key = type of additive, value = mass of additive
+    stream9PETAdditives = additiveMassCalculator(PETadditiveTypes, "PET", stream9PlasticMasses_)
+    stream9HDPEAdditives = additiveMassCalculator(HDPEadditiveTypes, "HDPE", stream9PlasticMasses_)
+    stream9PVCAdditives = additiveMassCalculator(PVCadditiveTypes, "PVC", stream9PlasticMasses_)
+    stream9LDPEAdditives = additiveMassCalculator(LDPEadditiveTypes, "LDPE", stream9PlasticMasses_)
+    stream9PLAAdditives = additiveMassCalculator(PLAadditiveTypes, "PLA", stream9PlasticMasses_)
+    stream9PPAdditives = additiveMassCalculator(PPadditiveTypes, "PP", stream9PlasticMasses_)
+    stream9PSAdditives = additiveMassCalculator(PSadditiveTypes, "PS", stream9PlasticMasses_)
+    stream9OtherAdditives = additiveMassCalculator(otherResinAdditives, "Other Resin", stream9PlasticMasses_)
+    
+    #Creates list of above dicts
+    listOfstream9Additives = [stream9PETAdditives, stream9HDPEAdditives, stream9PVCAdditives, stream9LDPEAdditives, stream9PLAAdditives,
+                               stream9PPAdditives, stream9PSAdditives, stream9OtherAdditives]
+    
+    #Creates dictionary of total of each kind of additive in this stream. Key = type of additive, value = total mass of additive in this stream
+    stream9TotalAdditives = dict(zip(otherResinAdditives, [totalOfAdditiveType(i, listOfstream9Additives) for i in otherResinAdditives]))
+    
+    #Creates dict of total resin in this stream. Key= type of resin, value = mass of resin in this stream
+    stream9ResinTotals = dict(zip(typesOfPlasticDomestic, [totalResinCalculator(typesOfPlasticDomestic[i], stream9PlasticMasses_, listOfstream9Additives[i]) for i in range(8)]))
+    
+    ###############################################################################################################
+    #Stream 6 Pt. 2
+    
+    #Dict of resin values in this stream
+    stream6ResinTotals = dict(zip(typesOfPlasticDomestic, [stream4ResinMasses_[i] - stream5ResinMasses[i] for i in typesOfPlasticDomestic]))
+    
+    #Dict of additive values in this stream
+    stream6AdditiveTotals = dict(zip(otherResinAdditives, [stream4AdditiveMasses_[i] - stream5AdditiveMasses[i] for i in otherResinAdditives]))
+    
+    ########################################################################################
+    #Stream 10 Calculations
+    #Sheet = US Mat Flow Analysis 
+    
+    #Creates dict of resin totals in this stream. Key = type of resin, value = mass of resin (stream6-stream9+stream27)
+    stream10ResinTotals = dict(zip(typesOfPlasticDomestic, [stream6ResinTotals[i] - stream9ResinTotals[i] + stream27ResinMasses[i] for i in typesOfPlasticDomestic]))
+    
+    
+    #Creates dict of additive totals in this stream. Key = type of additive, value = mass of additive (stream6-stream9+stream27)
+    stream10AdditiveTotals = dict(zip(otherResinAdditives, [stream6AdditiveTotals[i] - stream9TotalAdditives[i]+stream27TotalAdditivesMasses[i] for i in otherResinAdditives]))
+    #Note: stream 10 MSW data (rows 27:35) is the same as stream 8 so will be omitted for concision purposes
+    totalStream10Waste = sum(stream10AdditiveTotals.values())+sum(stream10ResinTotals.values())+sum(stream8MSWMasses_.values()) #Cell K39
+    
+    
+    ############################################################################################################
+    #Stream 7 Calculations
+    #Sheet = US Mat Flow Analysis 
+    stream7EmissionFactor = factorSet["Collection"]
+    
+    #Calculates stream 7 emissions based on total stream 10 mass, emission factor, and conversion factor to Tons of CO2
+    stream7TotalEmissions = totalStream10Waste*stream7EmissionFactor*0.00110231
+    
+    
+    ############################################################################
+    #Stream 11 Calculations
+    #Sheet = US Mat Flow Analysis 
+    
+    #Creates dictionary of key = types of MSW (except plastic); value = mass of MSW incinerated (total mass incinerated*proportion incinerated)
+    stream11MSWValues = dict(zip(typesOfWastesForCalculations, [mswIncin[0]*mswIncin[i] for i in range(1,len(typesOfWastesForCalculations)+1)]))
+    
+    
+    ##############################################################################
+    #Stream 12 Calculations
+    #Sheet = US Mat FLow Analysis 
+    
+    #Creates dict of key = types of MSW (except plastic); value = mass of MSW landfilled (total mass landfilled*proportion landfilled)
+    stream12MSWValues = dict(zip(typesOfWastesForCalculations, [mswLand[0]*mswLand[i] for i in range(1, len(typesOfWastesForCalculations)+1)]))
+    
+    
+    ############################################################################
+    #Stream 13 Calculations
+    #Sheet = Stream 13-Plastic Compost
+    
+    #Creates dict of key = type of plastic, value = mass*0.01Fraction*Fraction of each kind of plastic. 
+    stream13PlasticMasses = dict(zip(typesOfPlasticDomestic, [mswCompost[0]*0.0001*plasticFractionsRecycled[i] for i in typesOfPlasticDomestic]))
+    
+    #Creates dict of key = type of additive, value = mass of additive in this stream
+    stream13PETAdditives = additiveMassCalculator(PETadditiveTypes, "PET", stream13PlasticMasses)
+    stream13HDPEAdditives = additiveMassCalculator(HDPEadditiveTypes, "HDPE", stream13PlasticMasses)
+    stream13PVCAdditives = additiveMassCalculator(PVCadditiveTypes, "PVC", stream13PlasticMasses)
+    stream13LDPEAdditives = additiveMassCalculator(LDPEadditiveTypes, "LDPE", stream13PlasticMasses)
+    stream13PLAAdditives = additiveMassCalculator(PLAadditiveTypes, "PLA", stream13PlasticMasses)
+    stream13PPAdditives = additiveMassCalculator(PPadditiveTypes, "PP", stream13PlasticMasses)
+    stream13PSAdditives = additiveMassCalculator(PSadditiveTypes, "PS", stream13PlasticMasses)
+    stream13OtherAdditives = additiveMassCalculator(otherResinAdditives, "Other Resin", stream13PlasticMasses)
+    
+    #List of above dicts
+    listOfStream13Additives = [stream13PETAdditives, stream13HDPEAdditives, stream13PVCAdditives, stream13LDPEAdditives, stream13PLAAdditives,
+                                   stream13PPAdditives, stream13PSAdditives, stream13OtherAdditives]
+    
+    #Totals additives and resins for this stream
+    stream13AdditiveTotals = dict(zip(otherResinAdditives, [totalOfAdditiveType(i, listOfStream13Additives) for i in otherResinAdditives]))
+    stream13ResinMasses = dict(zip(typesOfPlasticDomestic, [totalResinCalculator(typesOfPlasticDomestic[i], stream13PlasticMasses, listOfStream13Additives[i]) for i in range(8)]))
+    
+    #MSW for this stream
+    stream13MSW = dict(zip(typesOfWastesForCalculations, [mswCompost[i+1]*mswCompost[0] for i in range(10)]))
+    #######################################################################################################################
+    #Stream 14 Calculations
+    #Sheet = US Mat Flow Analysis 
+    #Creates dict of key = types of MSW except plastic, value = mass recycled(total mass recycled*proportion of each kind of plastic recycled)
+    stream14MSWValues = dict(zip(typesOfWastesForCalculations, [mswRecyc[0]*mswRecyc[i] for i in range(1, len(typesOfWastesForCalculations)+1)]))
+    
+    ######################################################################
+    #Stream 15 Input
+    #Sheet = US Mat Flow Analysis 
+    
+    wasteFacilityEmissions = conditions[9]*1.10231 #CellP43
+    
+    
+    progress(0.625)
+    
+    #########################################################################
+    #Stream 24 Calculations
+    #Sheet = Stream 24 - Incineration
+    
+    
+    
+    
+    #Calculates mass basis, total plastic*Fraction incinerated
+    stream24MassBasis = conditions[1]*conditions[7]
+    
+    #Creates dict of bulk masses of each kind of plastic based on mass basis and proportions of each plastic incinerated. Key = type of plastic, value = bulk mass
+    stream24PlasticMasses = dict(zip(typesOfPlasticDomestic, [stream24MassBasis*plasticIncinFractionsDict[i] for i in typesOfPlasticDomestic]))
+    
+    #Creates dict of additives based on bulk masses. Key= type of additive, value = mass of additive
+    stream24PETAdditives = additiveMassCalculator(PETadditiveTypes, "PET", stream24PlasticMasses)
+    stream24HDPEAdditives = additiveMassCalculator(HDPEadditiveTypes, "HDPE", stream24PlasticMasses)
+    stream24PVCAdditives = additiveMassCalculator(PVCadditiveTypes, "PVC", stream24PlasticMasses)
+    stream24LDPEAdditives = additiveMassCalculator(LDPEadditiveTypes, "LDPE", stream24PlasticMasses)
+    stream24PLAAdditives = additiveMassCalculator(PLAadditiveTypes, "PLA", stream24PlasticMasses)
+    stream24PPAdditives = additiveMassCalculator(PPadditiveTypes, "PP", stream24PlasticMasses)
+    stream24PSAdditives = additiveMassCalculator(PSadditiveTypes, "PS", stream24PlasticMasses)
+    stream24OtherAdditives = additiveMassCalculator(otherResinAdditives, "Other Resin", stream24PlasticMasses)
+    
+    #List of above dicts
+    listOfStream24Additives = [stream24PETAdditives, stream24HDPEAdditives, stream24PVCAdditives, stream24LDPEAdditives, stream24PLAAdditives,
+                                   stream24PPAdditives, stream24PSAdditives, stream24OtherAdditives]
+    
+    #Creates dict of total additives and resins in the straem
+    stream24AdditiveTotals = dict(zip(otherResinAdditives, [totalOfAdditiveType(i, listOfStream24Additives) for i in otherResinAdditives]))
+    stream24ResinMasses = dict(zip(typesOfPlasticDomestic, [totalResinCalculator(typesOfPlasticDomestic[i], stream24PlasticMasses, listOfStream24Additives[i]) for i in range(8)]))
+    
+    
+    #Creates dict of emissions factors, then creates dict of emissions associated with each type of plastic's bulk masses
+    stream24EmissionsFactors = factorSet["Incineration"]
+    stream24Emissions = dict(zip(typesOfPlasticDomestic, [stream24EmissionsFactors[i]*stream24PlasticMasses[i] *1.10231 for i in typesOfPlasticDomestic]))
+    
+    ##########################################################################################
+    #Stream 25 Calculations
+    #Sheet = US Mat Flow Analysis 
+    #Creates dict of amount of resin, additive, and non-plastic MSW not incincerated (value = type of resin/additive/MSW, value = mass not incinerated)
+    stream25ResinMasses = dict(zip(typesOfPlasticDomestic, [(stream24ResinMasses[i]+stream23ResinMasses_[i])*(1-assumedValues["Incineration Efficiency Fraction"]) for i in typesOfPlasticDomestic]))
+    stream25AdditiveMasses = dict(zip(otherResinAdditives, [(stream24AdditiveTotals[i]+stream23AdditiveMasses_[i])*(1-incinerationDestructionFractions[i]) for i in otherResinAdditives]))
+    
+    #Splits the additives not incinerated between bottom ash, fly ash and stack gas. Key = compartment, value = dict of additive masses
+    incinerationReleases = {compartment: dict(zip(otherResinAdditives, [stream25AdditiveMasses[i]*incinerationResidueShares[i][n] for i in otherResinAdditives]))
+                            for n, compartment in enumerate(incinerationCompartments)}
+    
+    stream25MSWValues = dict(zip(typesOfWastesForCalculations, [(stream11MSWValues[i])*(1-assumedValues["Incineration Efficiency Fraction"]) for i in typesOfWastesForCalculations]))
+    
+    stream25AshMass = (sum(stream24AdditiveTotals.values())+sum(stream24ResinMasses.values()))/averageDensityCalculation * 0.01 * 2.05*0.0000011023
+    #############################################################################################
+    #Stream 26 Calculations
+    #Sheet = Stream 26 Landfilled Plastic
+    
+    
+    #Creates dict of total plastic landfilled
+    stream26MassBasis = conditions[1]*conditions[8]
+    
+    #Creates dict of key = type of plastic, value = bulk mass of type of plastic (mass basis for stream *proportion for each kind of plastic)
+    stream26PlasticMasses = dict(zip(typesOfPlasticDomestic, [stream26MassBasis*plasticLandFractions[i] for i in typesOfPlasticDomestic]))
+    
+    
+    #Creates dict of additives for each kind of plastic. Key = type of additive, value = mass
+    stream26PETAdditives = additiveMassCalculator(PETadditiveTypes, "PET", stream26PlasticMasses)
+    stream26HDPEAdditives = additiveMassCalculator(HDPEadditiveTypes, "HDPE", stream26PlasticMasses)
+    stream26PVCAdditives = additiveMassCalculator(PVCadditiveTypes, "PVC", stream26PlasticMasses)
+    stream26LDPEAdditives = additiveMassCalculator(LDPEadditiveTypes, "LDPE", stream26PlasticMasses)
+    stream26PLAAdditives = additiveMassCalculator(PLAadditiveTypes, "PLA", stream26PlasticMasses)
+    stream26PPAdditives = additiveMassCalculator(PPadditiveTypes, "PP", stream26PlasticMasses)
+    stream26PSAdditives = additiveMassCalculator(PSadditiveTypes, "PS", stream26PlasticMasses)
+    stream26OtherAdditives = additiveMassCalculator(otherResinAdditives, "Other Resin", stream26PlasticMasses)
+    
+    #List of above created dicts
+    listOfStream26Additives = [stream26PETAdditives, stream26HDPEAdditives, stream26PVCAdditives, stream26LDPEAdditives, stream26PLAAdditives,
+                                   stream26PPAdditives, stream26PSAdditives, stream26OtherAdditives]
+    
+    #Creates dict of Sums of additives and resins in this stream
+    stream26AdditiveTotals = dict(zip(otherResinAdditives, [totalOfAdditiveType(i, listOfStream26Additives) for i in otherResinAdditives]))
+    stream26ResinMasses = dict(zip(typesOfPlasticDomestic, [totalResinCalculator(typesOfPlasticDomestic[i], stream26PlasticMasses, listOfStream26Additives[i]) for i in range(8)]))
+    
+    #Creates dict of emissions in this stream based on bulk masses in this stream
+    stream26Emissions = dict(zip(typesOfPlasticDomestic, [factorSet["Transport and Disposal"]*stream26PlasticMasses[i] *1.10231 for i in typesOfPlasticDomestic]))
+    
+    
+    #########################################################################
+    #Stream 29 Calculations
+    #Sheet = Stream 29 - Plastic Release
+    #Creates dict of resins and additives in this stream based on leak constant. key = type of resin or additive, value = mass
+    stream29ResinMasses = dict(zip(typesOfPlasticDomestic, [stream4ResinMasses_[i] * assumedValues["Plastic waste leak after landfill"] for i in typesOfPlasticDomestic]))
+    stream29AdditiveMasses = dict(zip(otherResinAdditives, [stream4AdditiveMasses_[i]*assumedValues["Plastic waste leak after landfill"]+(stream26AdditiveTotals[i]+stream23AdditiveMasses_[i])*0.00001 for i in otherResinAdditives]))
+    
+    #Creates dict of key = type of plastic, value = emissions associated with release (mass*0.04 for emission factor *conversion factor)
+    stream29Emissions = dict(zip(typesOfPlasticDomestic, [stream29ResinMasses[i]*factorSet["Transport and Disposal"]*1.10231 for i in typesOfPlasticDomestic]))
+    
+    ##########################################################################
+    #Stream 30 Calculations
+    #Sheet = US Mat Flow Analysis 
+    #Sums emissions in stream 26
+    stream26totalEmissions = sum(stream26Emissions.values())
+    
+    #Inputs landfill emissions in 
+    FractionOfMSWEmissionLandfill = factorSet["Landfill MSW Share"]
+    combinedLandfillEmissions = conditions[10]*FractionOfMSWEmissionLandfill
+    
+    #Sums stream 30 emissions
+    stream30Emissions = stream26totalEmissions+combinedLandfillEmissions
+    
+    ###########################################################################
+    #Total Incineration Calculations
+    #Sheet = US Mat Flow Analysis 
+    
+    #Creates dict of total incineration for each kind of plastic and additive (stream 23 +stream 24).
+    totalIncinerationPlasticResin = dict(zip(typesOfPlasticDomestic, [stream23ResinMasses_[i] + stream24ResinMasses[i] for i in typesOfPlasticDomestic]))
+    totalIncinerationAdditives = dict(zip(otherResinAdditives, [stream23AdditiveMasses_[i]+stream24AdditiveTotals[i] for i in otherResinAdditives]))
+    
+    #Creates dict of total incineration for each kind of MSW (stream 11).
+    totalIncinerationMSW = stream11MSWValues
+    
+    #Total Landfill Calculations: sums stream 9, 23, 26 and subtracts stream 29 resins, additive, MSW masses
+    totalLandfillPlasticResin = dict(zip(typesOfPlasticDomestic, [stream9ResinTotals[i]+stream23ResinMasses_[i]+stream26ResinMasses[i]-stream29ResinMasses[i] for i in typesOfPlasticDomestic]))
+    totalLandfillAdditives = dict(zip(otherResinAdditives, [stream9TotalAdditives[i]+stream23AdditiveMasses_[i]+stream26AdditiveTotals[i]-stream29AdditiveMasses[i] for i in otherResinAdditives]))
+    totalLandfilledOtherMSW = stream12MSWValues
+    
+    
+    
+    
+    
+    progress(0.75)
+    
+    ################################################################################
+    ################################################################################
+    #LCI Summary
+    #Sheet= Material Flow Analysis Summary
+    #Creates list of categories for following dicts
+    
+    #Manufacturing Phase
+    #Used as divisor in following input calculations:
+    matFlowManufactureDivisor = stream1_stream2_total+sum(stream20PlasticCalcMasses.values())
+    
+    #Sums each kind of resin from streams 1 and 20 and divides by total mass in streams1,2, and 20; then does same for total chemical additives in those same streams
+    matFlowManufactureInput = dict(zip(typesOfPlasticDomestic, [(stream1PlasticMasses[i]+stream20ResinMasses[i])/matFlowManufactureDivisor for i in typesOfPlasticDomestic]))
+    matFlowManufactureInput['Chemical Additives'] = (sum(stream2AdditiveMasses.values())+sum(stream20TotalAdditives.values()))/matFlowManufactureDivisor
+    
+    #Sums each kind of resin and additive (additives all grouped together) from stream4 and divides by total mass in stream 4
+    matFlowManufactureOutput = dict(zip(typesOfPlasticDomestic, [stream4ResinMasses_[i]/stream4TotalMass_ for i in typesOfPlasticDomestic]))
+    matFlowManufactureOutput['Chemical Additives'] = sum(stream4AdditiveMasses_.values())/stream4TotalMass_
+    
+    
+    #Littering, Inhalation, and derm expos unavailable
+    matFlowManufactureLitter = dict(zip(matFlowAnalSumCategories, ["Unavailable" for i in matFlowAnalSumCategories]))
+    matFlowManufactureInhal = matFlowManufactureLitter
+    matFlowManufactureDerm = matFlowManufactureLitter
+    
+    #Greenhouse gas emissions from manufacturing= stream3 Emission factor*conversion factor +0.0025: 
+    matFlowManufactureGHG = dict(zip(typesOfPlasticDomestic, [stream3EmissionFactor[i]*1.10231+factorSet["Manufacture Process"] for i in typesOfPlasticDomestic]))
+    matFlowManufactureGHG['Chemical Additives'] = matFlowManufactureGHG['Other Resin']
+    
+    
+    #TRVW (table) lists
+    manufactureDictList = []
+    manufactureDictList = [matFlowManufactureInput, matFlowManufactureOutput, matFlowManufactureLitter, matFlowManufactureInhal, 
+                               matFlowManufactureDerm, matFlowManufactureGHG]
+    
+    
+    
+    #####################################################
+    #Use Phase
+    
+    #Input same as output of manufacture
+    matFlowUseInput = matFlowManufactureOutput
+    
+    #Output determined based on stream 6 resins, total additives, and total mass
+    matFlowUseOutput = dict(zip(typesOfPlasticDomestic, [stream6ResinTotals[i]/(sum(plasticsMassDict.values())) for i in typesOfPlasticDomestic]))
+    matFlowUseOutput['Chemical Additives'] = sum(stream6AdditiveTotals.values())/(sum(plasticsMassDict.values()))
+    
+    
+    #Littering Calculations: stream 5/(total of stream 4)
+    matFlowUseLittering = dict(zip(typesOfPlasticDomestic, [(stream5ResinMasses[i]/stream4TotalMass_) for i in typesOfPlasticDomestic]))
+    matFlowUseLittering['Chemical Additives'] = sum(stream5AdditiveMasses.values())/stream4TotalMass_
+    
+    #Inhalation, dermal and GHG unavailable
+    matFlowUseInhal = matFlowManufactureDerm
+    matFlowUseDerm = matFlowManufactureDerm
+    matFlowUseGHG = matFlowManufactureDerm
+    
+    
+    useDictList = []
+    useDictList = [matFlowUseInput, matFlowUseOutput, matFlowUseLittering, matFlowUseInhal, matFlowUseDerm, 
+                       matFlowUseGHG]
+    
+    ############################################################
+    #Collection and Sorting Phase (CSP)
+    
+    #Input: divisor is total plastic and additive mass in stream 6, 27
+    #Creates dict, key = category, value = proportion of total mass. stream6+27
+    matFlowCSPInputDivisor = sum(stream6AdditiveTotals.values())+sum(stream6ResinTotals.values())+sum(stream27ResinMasses.values())+sum(stream27TotalAdditivesMasses.values())
+    matFlowCSPInput = dict(zip(typesOfPlasticDomestic, [(stream6ResinTotals[i]+stream27ResinMasses[i])/matFlowCSPInputDivisor for i in typesOfPlasticDomestic]))
+    matFlowCSPInput['Chemical Additives'] = (sum(stream6AdditiveTotals.values())+sum(stream27TotalAdditivesMasses.values()))/matFlowCSPInputDivisor
+    
+    
+    #Output: stream27+16+24+26
+    matFlowCSPOutput = dict(zip(typesOfPlasticDomestic, [(stream27ResinMasses[i]+stream16ResinMasses_[i]+stream24ResinMasses[i]+stream26ResinMasses[i])/matFlowCSPInputDivisor for i in typesOfPlasticDomestic]))
+    matFlowCSPOutput['Chemical Additives'] = (sum(stream27TotalAdditivesMasses.values())+sum(totalAdditivesStream16_.values())+sum(stream24AdditiveTotals.values())+sum(stream26AdditiveTotals.values()))/matFlowCSPInputDivisor
+    
+    #Littering: Input-Output
+    matFlowCSPLittering = dict(zip(matFlowCSPOutput.keys(), [matFlowCSPInput[i]-matFlowCSPOutput[i] for i in matFlowCSPOutput.keys()]))
+    
+    #Emissions: 
+    matFlowCSPGHG = dict(zip(matFlowAnalSumCategories, [wasteFacilityEmissions/totalStream10Waste for i in matFlowAnalSumCategories]))
+        
+    #Inhalation and dermal exposure unavailable unless workerExposure has collection and sorting workers
+    matFlowCSPInhal = stageExposure('Collection and Sorting', 'inhalation', matFlowCSPInput, matFlowCSPInputDivisor, matFlowUseInhal)
+    matFlowCSPDerm = stageExposure('Collection and Sorting', 'dermal', matFlowCSPInput, matFlowCSPInputDivisor, matFlowUseInhal)
+    
+    #creates list of above dicts
+    cspDictList = []
+    cspDictList = [matFlowCSPInput, matFlowCSPOutput, matFlowCSPLittering, matFlowCSPInhal, matFlowCSPDerm,
+                       matFlowCSPGHG]
+    
+    ############################################################
+    #Mechanical Recycling
+    
+    #Input: (stream16+19+21)/combined total of those streams
+    matFlowMechRecycInputDivisor = sum(stream16PlasticCalcMasses.values())+sum(stream19AdditivesTotals.values())+sum(stream21PlasticMasses.values())+stream19DegradationProducts+stream19Contaminants
+    matFlowMechRecycInput = dict(zip(typesOfPlasticDomestic, [(stream16ResinMasses_[i]+stream21ResinMasses_[i])/matFlowMechRecycInputDivisor for i in typesOfPlasticDomestic]))
+    matFlowMechRecycInput['Chemical Additives']=(sum(totalAdditivesStream16_.values())+sum(stream19AdditivesTotals.values())+sum(stream21AdditivesTotals.values())+stream19Contaminants+stream19DegradationProducts)/matFlowMechRecycInputDivisor
+    
+    #Output: (stream20+28+23+22)/sum of all three
+    matFlowMechRecycOutDivisor = 2*(sum(stream23AdditiveMasses_.values())+sum(stream23ResinMasses_.values()))+sum(stream22PlasticMasses.values())+sum(stream20ResinMasses.values())+sum(stream20TotalAdditives.values())
+    matFlowMechRecycOutput = dict(zip(typesOfPlasticDomestic, [(stream20ResinMasses[i]+2*stream23ResinMasses_[i]+stream22ResinMasses_[i])/matFlowMechRecycOutDivisor for i in typesOfPlasticDomestic]))
+    matFlowMechRecycOutput['Chemical Additives'] = (sum(stream20TotalAdditives.values())+2*sum(stream23AdditiveMasses_.values())+sum(stream22AdditivesTotals.values()))/matFlowMechRecycOutDivisor
+    
+    #Releases/littering (input*0.0001)
+    matFlowMechRecycLittering = dict(zip(matFlowAnalSumCategories, [matFlowMechRecycInput[i]*0.0001 for i in matFlowAnalSumCategories]))
+    
+    #Inhalation Exposure (105/(9.072*10^8)*21834*250)/matFlowInputDivisor*Input, with the doses in workerExposure
+    matFlowMechRecycInhal = stageExposure('Mechanical Recycling', 'inhalation', matFlowMechRecycInput, matFlowMechRecycInputDivisor, matFlowUseInhal)
+    
+    #Dermal Exposure (2170/(9.072*10^8))*21834*250*Input/matFlowInputDivisor
+    matFlowMechRecycDermExp = stageExposure('Mechanical Recycling', 'dermal', matFlowMechRecycInput, matFlowMechRecycInputDivisor, matFlowUseInhal)
+    
+    #GHG Emissions stream16 emissions factors
+    matFlowMechRecycGHG = dict(zip(typesOfPlasticDomestic, [emissionFactors[i]*1.10231 for i in typesOfPlasticDomestic]))
+    matFlowMechRecycGHG['Chemical Additives']=matFlowMechRecycGHG['Other Resin']
+    
+    #creates list of above dicts
+    mechRecycDictList = []
+    mechRecycDictList = [matFlowMechRecycInput, matFlowMechRecycOutput, matFlowMechRecycLittering, 
+                             matFlowMechRecycInhal, matFlowMechRecycDermExp, matFlowMechRecycGHG]
+   
+    
+    ###############################################################
+    #Incineration
+    #Input: (stream23+24)/sum of stream totals
+    matFlowIncinInputDivisor = sum(stream23AdditiveMasses_.values())+sum(stream23ResinMasses_.values())+sum(stream24PlasticMasses.values())
+    matFlowIncinInput = dict(zip(typesOfPlasticDomestic, [(stream23ResinMasses_[i]+stream24ResinMasses[i])/matFlowIncinInputDivisor for i in typesOfPlasticDomestic]))
+    matFlowIncinInput['Chemical Additives'] = (sum(stream23AdditiveMasses_.values())+sum(stream24AdditiveTotals.values()))/matFlowIncinInputDivisor
+    
+    #Output: 0
+    matFlowIncinOutput = dict(zip(matFlowAnalSumCategories, [0 for i in matFlowAnalSumCategories]))
+    
+    #Littering: stream25/sum of stream 23, 24
+    matFlowIncinLitter = dict(zip(typesOfPlasticDomestic, [stream25ResinMasses[i]/matFlowIncinInputDivisor for i in typesOfPlasticDomestic]))
+    matFlowIncinLitter['Chemical Additives']=sum(stream25AdditiveMasses.values())/matFlowIncinInputDivisor
+    
+    #Inhalataion and dermal exposure: 0 unless workerExposure has incineration workers
+    matFlowIncinInhal = stageExposure('Incineration', 'inhalation', matFlowIncinInput, matFlowIncinInputDivisor, matFlowIncinOutput)
+    matFlowIncinDerm = stageExposure('Incineration', 'dermal', matFlowIncinInput, matFlowIncinInputDivisor, matFlowIncinOutput)
+    
+    #GHG: stream24 emission factors
+    matFlowIncinGHG = dict(zip(typesOfPlasticDomestic, [stream24EmissionsFactors[i]*1.10231 for i in typesOfPlasticDomestic]))
+    matFlowIncinGHG['Chemical Additives'] = matFlowIncinGHG['Other Resin']
+    
+    
+    incinDictList = []
+    incinDictList = [matFlowIncinInput, matFlowIncinOutput, matFlowIncinLitter, matFlowIncinInhal, matFlowIncinDerm,
+                         matFlowIncinGHG]
+    
+    ################################################################
+    #Landfilling: 
+    
+    #Input: stream26+28/sum of the two
+    matFlowLandInputDivisor = sum(stream26PlasticMasses.values())+sum(stream23ResinMasses_.values())+sum(stream23AdditiveMasses_.values())
+    matFlowLandInput = dict(zip(typesOfPlasticDomestic, [(stream26ResinMasses[i]+stream23ResinMasses_[i])/matFlowLandInputDivisor for i in typesOfPlasticDomestic]))
+    matFlowLandInput['Chemical Additives'] = (sum(stream26AdditiveTotals.values())+sum(stream23AdditiveMasses_.values()))/matFlowLandInputDivisor 
+    
+    
+    #Output = 0
+    matFlowLandOutput = matFlowIncinOutput
+    
+    #Littering: stream29/sum of stream26,28
+    matFlowLandLitter = dict(zip(typesOfPlasticDomestic, [stream29ResinMasses[i]/matFlowLandInputDivisor for i in typesOfPlasticDomestic]))
+    matFlowLandLitter['Chemical Additives'] = (sum(stream29AdditiveMasses.values())/matFlowLandInputDivisor)
+    
+    
+    #Dermal and Inhalation Exposure = 0 unless workerExposure has landfill workers
+    matFlowLandInhal = stageExposure('Landfill', 'inhalation', matFlowLandInput, matFlowLandInputDivisor, matFlowIncinOutput)
+    matFlowLandDerm = stageExposure('Landfill', 'dermal', matFlowLandInput, matFlowLandInputDivisor, matFlowIncinOutput)
+    
+    #GHG: emission factor = 0.04*1.10231
+    matFlowLandGHG = dict(zip(matFlowAnalSumCategories, [factorSet["Transport and Disposal"]*1.10231 for i in matFlowAnalSumCategories]))
+    
+    #Creates list of above dicts
+    landDictList = []
+    landDictList = [matFlowLandInput, matFlowLandOutput, matFlowLandLitter, matFlowLandInhal, matFlowLandDerm,
+                        matFlowLandGHG]
+    
+    progress(0.875)
+    
+    #############################################################################
+    #Stream Summary TRVW shtuff
+    #creates dictionary that data will be extracted from to create stream summary trvw
+    dummyDictionary = {}  #to serve in place of streams where no data is (e.g. no additive data in resin lists) to make sure no inappropriate numbers are added to table
+    
+    #These dicts will be iterated over to look for data. (e.g. will be searched for "PET", "HDPE", etc.)
+    listOfStreamsForResinTRVW = [stream1PlasticMasses, dummyDictionary, dummyDictionary, stream4ResinMasses_, stream5ResinMasses,
+                                 stream6ResinTotals, dummyDictionary, stream27ResinMasses, stream9ResinTotals, stream10ResinTotals,
+                                 dummyDictionary, dummyDictionary, stream13ResinMasses, dummyDictionary, dummyDictionary, stream16ResinMasses_,
+                                 dummyDictionary, dummyDictionary, dummyDictionary, stream20ResinMasses, stream21ResinMasses_, stream22ResinMasses_,
+                                 stream23ResinMasses_, stream24ResinMasses, stream25ResinMasses, stream26ResinMasses, stream27ResinMasses,
+                                 stream23ResinMasses_, stream29ResinMasses, dummyDictionary, totalIncinerationPlasticResin, totalLandfillPlasticResin]
+    
+    listOfStreamforAdditivesTRVW = [dummyDictionary, stream2AdditiveMasses, dummyDictionary, stream4AdditiveMasses_, stream5AdditiveMasses, 
+                                    stream6AdditiveTotals, dummyDictionary, stream27TotalAdditivesMasses, stream9TotalAdditives, stream10AdditiveTotals,
+                                    dummyDictionary, dummyDictionary, stream13AdditiveTotals, dummyDictionary, dummyDictionary, totalAdditivesStream16_,
+                                    dummyDictionary, stream18AdditiveMigration, stream19AdditivesTotals, stream20TotalAdditives, stream21AdditivesTotals,
+                                    stream22AdditivesTotals, stream23AdditiveMasses_, stream24AdditiveTotals, stream25AdditiveMasses, stream26AdditiveTotals,
+                                    stream27TotalAdditivesMasses, stream23AdditiveMasses_, stream29AdditiveMasses, dummyDictionary, totalIncinerationAdditives,
+                                    totalLandfillAdditives]
+    
+    listOfStreamMSWTRVW = [dummyDictionary, dummyDictionary, dummyDictionary, dummyDictionary, dummyDictionary, dummyDictionary, dummyDictionary, 
+                           stream8MSWMasses_, dummyDictionary, stream8MSWMasses_, stream11MSWValues, stream12MSWValues, stream13MSW, stream14MSWValues,
+                           dummyDictionary, dummyDictionary, dummyDictionary, dummyDictionary, dummyDictionary, dummyDictionary, dummyDictionary, dummyDictionary,
+                           dummyDictionary, dummyDictionary, stream25MSWValues, dummyDictionary, dummyDictionary, dummyDictionary, dummyDictionary, dummyDictionary,
+                          totalIncinerationMSW, totalLandfilledOtherMSW]
+    
+    #creates single list to be iterated over for filling stream summary trvw
+    
+    streamTRVWLists = []
+    streamTRVWLists.clear() #clears to make sure that when new data is input, old data is erased
+    
+    #list comprehension that will create list of lists for addition to stream summary table. streamSummaryTRVWLister defined above
+    streamTRVWLists = [streamSummaryTRVWLister(listOfStreamsForResinTRVW, i) for i in typesOfPlasticDomestic]+[streamSummaryTRVWLister(listOfStreamforAdditivesTRVW, i) for i in otherResinAdditives]+[streamSummaryTRVWLister(listOfStreamMSWTRVW, i) for i in typesOfWastesForCalculations]
+   
+    #following list will be used to make other calculations easier later on by removing row title, which can then be added later on
+    listsWithoutTitles = [streamSummaryTRVWLister(listOfStreamsForResinTRVW, i) for i in typesOfPlasticDomestic]+[streamSummaryTRVWLister(listOfStreamforAdditivesTRVW, i) for i in otherResinAdditives]+[streamSummaryTRVWLister(listOfStreamMSWTRVW, i) for i in typesOfWastesForCalculations]
+    for i in listsWithoutTitles:
+        del i[0]
+    
+    #Creates ash row list for addition to TRVW
+    ashTRVWList = ['Ash', 0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,stream25AshMass, 0,0,0,0,0,0,0,]
+    
+    #Creates list for column sums at bottom of table, then Creates list of data lists that will be tacked on to the end of the stream summary TRVW
+    totalStreamMassesList = ['Total Mass excluding emissions']+[sum([i[b] for i in listsWithoutTitles]) for b in range(32)]
+    
+    listsToAdd =[ashTRVWList, totalStreamMassesList]
+    
+    totalPlasticsStreamSummaryList = ['Total Plastics'] + [sum(i.values()) for i in listOfStreamsForResinTRVW]
+    listsToAdd.append(totalPlasticsStreamSummaryList)
+    
+    totalAdditivesStreamSummaryList = ['Total Additives'] + [sum(i.values()) for i in listOfStreamforAdditivesTRVW]
+    listsToAdd.append(totalAdditivesStreamSummaryList)
+    
+    actualMassEmissionTotalTRVWList = ['Actual mass of emission (Tons):'] + [0, 0, '-', 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, stream25AshMass, 0, 0, 0, 0, 0, 0, 0]
+    listsToAdd.append(actualMassEmissionTotalTRVWList)
+    
+    #Masses each emission factor multiplies in each stream summary column, tons. Column 15 is the reported waste facility
+    #emissions, which no factor scales
+    ghgActivities = {3: dict([(("Manufacture Process", ""), sum(stream4AdditiveMasses_.values())+sum(stream4ResinMasses_.values()))] +
+                             [(("Resin Manufacture", i), stream3PlasticMasses[i]*1.10231) for i in typesOfPlasticDomestic]),
+                     7: {("Collection", ""): totalStream10Waste*0.00110231},
+                     15: {reportedEmissionsKey: conditions[9]*1.10231131},
+                     17: {("Recycling", i): stream16PlasticCalcMasses[i]*1.10231 for i in typesOfPlasticDomestic},
+                     20: {("Recycling", i): stream20PlasticCalcMasses[i] for i in typesOfPlasticDomestic},
+                     23: {("Transport and Disposal", ""): sum(stream23PlasticMasses.values())*1.10231},
+                     25: dict([(("Incineration", i), stream24PlasticMasses[i]*1.10231) for i in typesOfPlasticDomestic] +
+                              [(("MSW Incineration", ""), sum(stream11MSWValues.values()))]),
+                     27: {("Transport and Disposal", ""): sum(stream27PlasticMasses.values())*1.10231},
+                     28: {("Transport and Disposal", ""): sum(stream23PlasticMasses.values())*1.10231},
+                     29: {("Transport and Disposal", ""): sum(stream29ResinMasses.values())*1.10231},
+                     30: {("Transport and Disposal", ""): sum(stream26PlasticMasses.values())*1.10231, ("Landfill MSW Share", ""): conditions[10]}}
+    
+    totalEmissionsTRVWList = ['Total Emissions'] + [columnEmissions(ghgActivities.get(column, {}), factorSet) for column in range(1, 33)]
+    listsToAdd.append(totalEmissionsTRVWList)
+    
+    emissionsFromPlasticList = ['Emissions from plastic'] + [columnEmissions(ghgActivities.get(column, {}), factorSet, plasticOnly = True) for column in range(1, 33)]
+    listsToAdd.append(emissionsFromPlasticList)
+    
+    
+    streamTRVWLists = streamTRVWLists+listsToAdd
+    #streamSummaryTRVW.insert(parent ='', index ='end', iid = 0, text = '', values = tuple([streamTitleRows[b] for b in range(len(streamTitleRows))]))
+
+    
+    #Creates dictionary showing amount of each kind of plastic recycled, used for the bar chart
+    amountOfPlasticRecycled = dict(zip(typesOfPlasticDomestic, [stream16ResinMasses_[i]+stream27ResinMasses[i] for i in typesOfPlasticDomestic]))
+    
+    progress(1)
+    
+    #Total mass each LCI table's fractions are taken of, tons
+    stageInputMasses = {'Manufacture':matFlowManufactureDivisor, 'Use':stream4TotalMass_, 'Collection and Sorting':matFlowCSPInputDivisor,
+                        'Mechanical Recycling':matFlowMechRecycInputDivisor, 'Incineration':matFlowIncinInputDivisor, 'Landfill':matFlowLandInputDivisor}
+    
+    #Additives of each resin in the stages additives migrate from, {stage: {resin: {additive: mass}}}
+    migratingAdditives = {'Use':dict(zip(typesOfPlasticDomestic, listOfStream6Additives_)), 'Mechanical Recycling':dict(zip(typesOfPlasticDomestic, listOfstream16Additives))}
+    
+    #Additives fed to incineration (streams 23 and 24), Key = type of additive, value = mass
+    incineratedAdditives = dict(zip(otherResinAdditives, [stream23AdditiveMasses_[i]+stream24AdditiveTotals[i] for i in otherResinAdditives]))
+    
+    #Everything the GUI needs to show the results
+    return {'streamTRVWLists':streamTRVWLists, 'manufactureDictList':manufactureDictList, 'useDictList':useDictList, 'cspDictList':cspDictList,
+            'mechRecycDictList':mechRecycDictList, 'incinDictList':incinDictList, 'landDictList':landDictList, 'mswCompProp':list(mswCompProp),
+            'amountOfPlasticRecycled':amountOfPlasticRecycled, 'plasticsMassDict':plasticsMassDict, 'stageInputMasses':stageInputMasses,
+            'ghgActivities':ghgActivities, 'migratingAdditives':migratingAdditives, 'incineratedAdditives':incineratedAdditives,
+            'incinerationReleases':incinerationReleases}
+
+#LCI tables in the order of the Life Cycle Inventory tab, with the result holding each one
+lciStages = [('Manufacture', 'manufactureDictList'), ('Use', 'useDictList'), ('Collection and Sorting', 'cspDictList'),
+             ('Mechanical Recycling', 'mechRecycDictList'), ('Incineration', 'incinDictList'), ('Landfill', 'landDictList')]
+
+#Columns of the stream summary after the row name: streams 1 to 30, then the 2018 totals
+streamColumnNames = [str(i) for i in range(1, 31)] + ['Waste Incinerated 2018', 'Waste Accumulated in Landfill 2018']
+
+#Streams holding additive releases, highlighted when scenarios are compared
+additiveReleaseStreams = [5, 9, 18, 25, 29]
+
+#Turns stream summary rows into the species (row) names and an array with one row per species and one column per
+#entry of streamColumnNames. Cells that are missing or not numbers become NaN
+def streamMatrix(streamRows):
+    species = [row[0] for row in streamRows]
+    values = np.full((len(streamRows), len(streamColumnNames)), np.nan)
+    for r, row in enumerate(streamRows):
+        for c, value in enumerate(row[1:len(streamColumnNames)+1]):
+            if isinstance(value, (int, float, np.number)):
+                values[r, c] = value
+    return species, values
+
+#Result of diffScenarios. baseline is species x streams, variants, absolute and relative are variants x species x streams
+ScenarioDiff = namedtuple('ScenarioDiff', ['names', 'species', 'streams', 'baseline', 'variants', 'absolute', 'relative'])
+
+#Compares any number of variant runs with one baseline run. A run is the result of calculateStreams or its
+#streamTRVWLists. variants is a dict of name to run, or a list of runs. Rows are lined up by species name, a species
+#missing from a run counts as 0. Relative changes are NaN where the baseline is 0
+def diffScenarios(baseline, variants):
+    if isinstance(variants, dict):
+        names = list(variants)
+        variants = list(variants.values())
+    else:
+        names = ['Variant ' + str(i+1) for i in range(len(variants))]
+    matrices = [streamMatrix(run['streamTRVWLists'] if isinstance(run, dict) else run) for run in [baseline] + list(variants)]
+    
+    species = list(dict.fromkeys(name for runSpecies, values in matrices for name in runSpecies))
+    position = {name: i for i, name in enumerate(species)}
+    runs = np.zeros((len(matrices), len(species), len(streamColumnNames)))
+    for run, (runSpecies, values) in enumerate(matrices):
+        runs[run, [position[name] for name in runSpecies]] = values
+    
+    absolute = runs[1:] - runs[0]
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        relative = np.where(runs[0] != 0, absolute/np.abs(runs[0]), np.nan)
+    return ScenarioDiff(names, species, list(streamColumnNames), runs[0], runs[1:], absolute, relative)
+
+#One entry of largestAdditiveChanges
+AdditiveChange = namedtuple('AdditiveChange', ['name', 'additive', 'stream', 'absolute', 'relative'])
+
+#The count largest changes (by size of the absolute change) of each variant, over the additive rows of the given streams
+def largestAdditiveChanges(diff, streams = additiveReleaseStreams, count = 5):
+    rows = [i for i, name in enumerate(diff.species) if name in lowAdditiveFractions]
+    columns = [diff.streams.index(str(stream)) for stream in streams]
+    absolute = diff.absolute[:, rows][:, :, columns]
+    relative = diff.relative[:, rows][:, :, columns]
+    size = np.nan_to_num(np.abs(absolute), nan = -1).reshape(len(diff.names), -1)
+    largest = np.argsort(-size, axis = 1, kind = 'stable')[:, :count]
+    additives, streamPositions = np.unravel_index(largest, absolute.shape[1:])
+    
+    changes = []
+    for variant in range(len(diff.names)):
+        for additive, stream in zip(additives[variant].tolist(), streamPositions[variant].tolist()):
+            changes.append(AdditiveChange(diff.names[variant], diff.species[rows[additive]], streams[stream], 
+                                          float(absolute[variant, additive, stream]), float(relative[variant, additive, stream])))
+    return changes
+
+#Additive release the optimizer minimizes: total additives in the litter, incineration and landfill leak streams
+optimizedReleaseStreams = [9, 25, 29]
+
+def additiveRelease(results):
+    totals = next(row for row in results['streamTRVWLists'] if row[0] == 'Total Additives')
+    return sum(totals[stream] for stream in optimizedReleaseStreams)
+
+def totalGHG(results): #tons CO2-eq over every stream
+    emissions = next(row for row in results['streamTRVWLists'] if row[0] == 'Total Emissions')
+    return sum(value for value in emissions[1:] if isinstance(value, (int, float, np.number, np.ndarray)))
+
+#Conditions for one point of the optimizer's search. Each variable is between 0 and 1 and the proportion checks of
+#inputGroups hold by construction: the plastic recycled fraction and its domestic, exported and re-exported split
+#stay as entered, and incinerationShare of the plastic not recycled is incinerated while the rest is landfilled.
+#The export split is not searched: stream 27 comes from the reported export masses, so moving recycled plastic to
+#export would only take it out of the model and break the collection and sorting mass balance
+def optimizerConditions(conditions, recyclingEfficiency, incinerationShare):
+    conditions = list(conditions)
+    recycled = conditions[2]
+    conditions[4] = recyclingEfficiency
+    conditions[7] = incinerationShare*(1-recycled)
+    conditions[8] = (1-incinerationShare)*(1-recycled)
+    return conditions
+
+#Names of the variables of optimizerConditions, and their values for a set of conditions (its inverse)
+optimizerVariables = ['recyclingEfficiency', 'incinerationShare']
+
+def conditionShares(conditions):
+    recycled = conditions[2]
+    return {'recyclingEfficiency': conditions[4], 'incinerationShare': conditions[7]/(1-recycled) if recycled < 1 else 0}
+
+#Result of optimizeReleases. feasible is False when no point met the GHG limit, the point with the lowest GHG is given then
+OptimizationResult = namedtuple('OptimizationResult', ['inputs', 'results', 'recyclingEfficiency', 'incinerationShare',
+                                                       'release', 'ghg', 'feasible', 'evaluations'])
+
+#Marks in failed the points of a batch run where some value of results is not finite, where a run of that point
+#alone would have divided by zero
+def markFailedPoints(value, failed):
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            markFailedPoints(item, failed)
+    elif isinstance(value, np.ndarray) and value.shape == failed.shape:
+        failed |= ~np.isfinite(value)
+
+#Runs the engine once for a batch of points (rows of recyclingEfficiency, incinerationShare): the searched conditions
+#are given as arrays, and the engine only adds, multiplies and divides them, so every stream holds the values of all
+#the points (those the variables don't reach stay numbers). Returns the additive release and GHG of each point as
+#arrays, infinite where the engine could not run
+def evaluateOptimizerPoints(inputs, points, progress = noProgress):
+    conditions = optimizerConditions(inputs['conditions'], *np.asarray(points, dtype = float).T)
+    try:
+        with np.errstate(divide = 'ignore', invalid = 'ignore'): #some edges of the search box leave a stream the engine divides by empty
+            results = calculateStreams(progress = progress, **dict(inputs, conditions = conditions))
+    except ZeroDivisionError: #a stream empty at every point
+        return np.full(len(points), np.inf), np.full(len(points), np.inf)
+    release = np.broadcast_to(additiveRelease(results), len(points)).astype(float)
+    ghg = np.broadcast_to(totalGHG(results), len(points)).astype(float)
+    failed = np.zeros(len(points), dtype = bool)
+    markFailedPoints(results, failed)
+    release[failed] = ghg[failed] = np.inf
+    release[~np.isfinite(release)] = np.inf
+    ghg[~np.isfinite(ghg)] = np.inf
+    return release, ghg
+
+#Finds the recycling efficiency and incineration/landfill split with the lowest additive release whose total GHG
+#does not exceed ghgLimit. Each round evaluates a gridSize**2 grid over the current search box in one engine run and
+#then halves the box around the best point, so the search needs no gradients from the engine
+def optimizeReleases(inputs, ghgLimit, gridSize = 7, rounds = 5, progress = noProgress):
+    dimensions = len(optimizerVariables)
+    low = np.zeros(dimensions)
+    high = np.ones(dimensions)
+    best = None
+    evaluations = 0
+    for step in range(rounds):
+        axes = [np.linspace(low[i], high[i], gridSize) for i in range(dimensions)]
+        points = np.stack(np.meshgrid(*axes, indexing = 'ij'), axis = -1).reshape(-1, dimensions)
+        release, ghg = evaluateOptimizerPoints(inputs, points, lambda fraction: progress((step+fraction)/rounds))
+        evaluations += len(points)
+        
+        #the lowest release among points meeting the limit, otherwise the point closest to meeting it
+        feasible = ghg <= ghgLimit
+        if feasible.any():
+            choice = np.flatnonzero(feasible)[np.argmin(release[feasible])]
+        else:
+            choice = np.argmin(ghg)
+        rank = (0, release[choice]) if feasible[choice] else (1, ghg[choice])
+        if best is None or rank < best[0]:
+            best = (rank, points[choice], release[choice], ghg[choice], bool(feasible[choice]))
+        
+        width = (high-low)/4
+        low = np.clip(best[1]-width, 0, 1)
+        high = np.clip(best[1]+width, 0, 1)
+    progress(1)
+    
+    rank, point, release, ghg, feasible = best
+    optimizedInputs = dict(inputs, conditions = optimizerConditions(inputs['conditions'], *point))
+    return OptimizationResult(optimizedInputs, calculateStreams(**optimizedInputs), float(point[0]), float(point[1]),
+                              float(release), float(ghg), feasible, evaluations)
+
+#Number carrying its derivatives with respect to every variable of calculateJacobian (forward mode automatic
+#differentiation). The engine only adds, subtracts, multiplies, divides and compares, so running it on Duals gives
+#exact derivatives of every value in the same pass
+class Dual:
+    __slots__ = ('value', 'gradient')
+    __array_ufunc__ = None #numpy scalars defer to the Dual operators instead of building object arrays
+    
+    def __init__(self, value, gradient):
+        self.value = value
+        self.gradient = gradient
+    
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value+other.value, self.gradient+other.gradient)
+        return Dual(self.value+other, self.gradient)
+    __radd__ = __add__
+    
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value-other.value, self.gradient-other.gradient)
+        return Dual(self.value-other, self.gradient)
+    
+    def __rsub__(self, other):
+        return Dual(other-self.value, -self.gradient)
+    
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value*other.value, self.gradient*other.value+other.gradient*self.value)
+        return Dual(self.value*other, self.gradient*other)
+    __rmul__ = __mul__
+    
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value/other.value, (self.gradient*other.value-other.gradient*self.value)/(other.value*other.value))
+        return Dual(self.value/other, self.gradient/other)
+    
+    def __rtruediv__(self, other):
+        return Dual(other/self.value, self.gradient*(-other/(self.value*self.value)))
+    
+    def __pow__(self, exponent):
+        return Dual(self.value**exponent, self.gradient*(exponent*self.value**(exponent-1)))
+    
+    def __neg__(self):
+        return Dual(-self.value, -self.gradient)
+    
+    def __pos__(self):
+        return self
+    
+    def __abs__(self):
+        return -self if self.value < 0 else self
+    
+    def __float__(self):
+        return float(self.value)
+    
+    def __eq__(self, other):
+        return self.value == (other.value if isinstance(other, Dual) else other)
+    
+    def __lt__(self, other):
+        return self.value < (other.value if isinstance(other, Dual) else other)
+    
+    def __le__(self, other):
+        return self.value <= (other.value if isinstance(other, Dual) else other)
+    
+    def __gt__(self, other):
+        return self.value > (other.value if isinstance(other, Dual) else other)
+    
+    def __ge__(self, other):
+        return self.value >= (other.value if isinstance(other, Dual) else other)
+    
+    __hash__ = None
+
+#Constants calculateJacobian differentiates with respect to, besides the inputs
+jacobianConstants = ['assumedValues', 'lowAdditiveFractions', 'polymerWasteDensity', 'incinerationDestructionFractions']
+
+#calculateStreams looking up the module level names in overrides first. Every function of this module is rebound to
+#the new globals, so the helpers the engine calls see the overrides too while other threads keep the real values
+def engineWithGlobals(overrides):
+    engineGlobals = dict(globals(), **overrides)
+    for name, value in engineGlobals.items():
+        if isinstance(value, types.FunctionType) and value.__globals__ is globals():
+            engineGlobals[name] = types.FunctionType(value.__code__, engineGlobals, name, value.__defaults__, value.__closure__)
+    return engineGlobals['calculateStreams']
+
+#Result of calculateJacobian. results are the plain results of calculateStreams. inputNames are (input list, field)
+#pairs and (constant dictionary, key) pairs, outputNames are the keys leading to each number of results, e.g.
+#('streamTRVWLists', 'Total Additives', 9) or ('manufactureDictList', 0, 'PET'). jacobian[i, j] is the derivative of
+#values[i], output i, with respect to variable j
+Jacobian = namedtuple('Jacobian', ['results', 'inputNames', 'outputNames', 'values', 'jacobian'])
+
+#Walks a result of calculateStreams run on Duals. Adds every number to outputs as (name, value, gradient) and
+#returns the same structure holding plain floats. Rows starting with a string are named after it instead of their position
+def collectDuals(value, name, outputs, variableCount):
+    if isinstance(value, dict):
+        return {key: collectDuals(item, name + (key,), outputs, variableCount) for key, item in value.items()}
+    if isinstance(value, list) and value and isinstance(value[0], str):
+        return value[:1] + [collectDuals(item, name + (i,), outputs, variableCount) for i, item in enumerate(value[1:], 1)]
+    if isinstance(value, list):
+        return [collectDuals(item, name + ((item[0],) if isinstance(item, list) and item and isinstance(item[0], str) else (i,)), outputs, variableCount)
+                for i, item in enumerate(value)]
+    if isinstance(value, Dual):
+        outputs.append((name, value.value, value.gradient))
+        return value.value
+    if isinstance(value, (int, float, np.number)) and not isinstance(value, bool):
+        outputs.append((name, float(value), np.zeros(variableCount)))
+    return value
+
+#Exact derivatives of every stream and LCI value with respect to every input and model constant, from one run of
+#calculateStreams. Numbers written into the engine itself (emission factors and the like) are not variables
+def calculateJacobian(inputs, progress = noProgress):
+    inputNames = [(name, field) for name in inputListNames for field in inputGroups[name]['fields']]
+    inputNames += [(name, key) for name in jacobianConstants for key in globals()[name]]
+    seeds = iter(np.eye(len(inputNames)))
+    
+    dualInputs = {name: [Dual(float(value), next(seeds)) for value in inputs[name]] for name in inputListNames}
+    dualConstants = {name: {key: Dual(float(value), next(seeds)) for key, value in globals()[name].items()} for name in jacobianConstants}
+    dualResults = engineWithGlobals(dualConstants)(progress = progress, **dualInputs)
+    
+    outputs = []
+    results = collectDuals(dualResults, (), outputs, len(inputNames))
+    return Jacobian(results, inputNames, [output[0] for output in outputs], np.array([output[1] for output in outputs]),
+                    np.array([output[2] for output in outputs]).reshape(len(outputs), len(inputNames)))
+
+#Mass inputs of MassOperator: the MSW and plastic totals, the totals sent to each MSW fate and the plastic imported,
+#exported and re-exported. Every other input and constant is structure, and the stream masses are linear in these
+#once the structure is fixed
+operatorMassInputs = [('conditions', 0), ('conditions', 1)] + [(name, 0) for name in ['mswRecyc', 'mswIncin', 'mswLand', 'mswCompost']]
+operatorMassInputs += [(name, i) for name in ['repPlasticImport', 'repPlasticsExport', 'repPlasticsReExport'] for i in range(4)]
+
+#Stream summary rows MassOperator leaves out (NaN): stream 3 splits its GHG by the resin shares of stream 1, which
+#makes the emission rows nonlinear in the masses
+nonlinearStreamRows = ['Total Emissions', 'Emissions from plastic']
+
+#Everything but the mass inputs, with the current model constants. Runs with equal keys share one MassOperator
+def operatorStructure(inputs):
+    masses = set(operatorMassInputs)
+    structure = tuple(tuple(float(value) for i, value in enumerate(inputs[name]) if (name, i) not in masses) for name in inputListNames)
+    return structure + tuple(tuple(globals()[name].items()) for name in jacobianConstants)
+
+#The stream summary as a sparse linear map of the mass inputs, compiled from calculateJacobian for one structure.
+#evaluate takes masses ordered like massNames, one scenario or a batch (scenarios x masses), and returns the
+#species x streams array of streamMatrix for each, so a batch costs one sparse matrix product
+class MassOperator:
+    def __init__(self, inputs):
+        self.structure = operatorStructure(inputs)
+        self.massNames = [(name, inputGroups[name]['fields'][i]) for name, i in operatorMassInputs]
+        jacobian = calculateJacobian(inputs)
+        self.species, baseline = streamMatrix(jacobian.results['streamTRVWLists'])
+        self.streams = streamColumnNames
+        
+        columns = [jacobian.inputNames.index(name) for name in self.massNames]
+        rows = [r for r, name in enumerate(jacobian.outputNames) if name[0] == 'streamTRVWLists' and name[1] not in nonlinearStreamRows]
+        cells = [self.species.index(jacobian.outputNames[r][1])*len(self.streams) + jacobian.outputNames[r][2]-1 for r in rows]
+        slopes = np.zeros((len(self.species)*len(self.streams), len(columns)))
+        slopes[cells] = jacobian.jacobian[np.ix_(rows, columns)]
+        from scipy import sparse #only loaded when an operator is compiled, so importing the engine doesn't need it
+        self.matrix = sparse.csr_matrix(slopes)
+        
+        #the masses are linear but the value at zero masses is kept as well, in case a stream has a fixed part
+        self.offset = np.full(len(slopes), np.nan)
+        self.offset[cells] = baseline.ravel()[cells] - slopes[cells] @ self.massVector(inputs)
+    
+    def massVector(self, inputs):
+        return np.array([inputs[name][i] for name, i in operatorMassInputs], dtype = float)
+    
+    def evaluate(self, masses):
+        masses = np.asarray(masses, dtype = float)
+        values = (self.matrix @ masses.reshape(-1, len(self.massNames)).T).T + self.offset
+        return values.reshape(masses.shape[:-1] + (len(self.species), len(self.streams)))
+
+#Compiled MassOperators by structure, the oldest is dropped beyond massOperatorCacheSize
+massOperators = {}
+massOperatorCacheSize = 16
+
+#The MassOperator for the structure of inputs, compiled only when no cached one has the same structure (changing a
+#fraction, efficiency or constant invalidates it, changing a mass input doesn't)
+def massOperator(inputs):
+    structure = operatorStructure(inputs)
+    if structure not in massOperators:
+        if len(massOperators) >= massOperatorCacheSize:
+            massOperators.pop(next(iter(massOperators)))
+        massOperators[structure] = MassOperator(inputs)
+    return massOperators[structure]
+
+#The container and key holding the number outputName of calculateJacobian names in results
+def resultSlot(results, outputName):
+    container = results
+    for key in outputName[:-1]:
+        container = next(row for row in container if row[0] == key) if isinstance(key, str) and isinstance(container, list) else container[key]
+    return container, outputName[-1]
+
+#What live mode shows while the sliders move: calculateStreams of inputs with the variables of optimizerConditions
+#changed, compiled from one calculateJacobian run. Every stream mass is linear in both variables and every LCI value is
+#a linear mass over the input mass of its stage, so both are evaluated exactly from their slopes. Only the stream 3
+#emissions (see nonlinearStreamRows) and the GHG activities behind them are first order, about 1e-4 relative at the
+#far ends of the sliders. The mass inputs are structure here, so MassOperator can't be used for this.
+#update keeps one results and rewrites only the values the variables move (about a quarter of them), in place
+class LivePreview:
+    def __init__(self, inputs):
+        self.inputs = inputs
+        jacobian = calculateJacobian(inputs)
+        self.results = jacobian.results
+        shares = conditionShares(inputs['conditions'])
+        self.shares = np.array([shares[name] for name in optimizerVariables])
+        
+        #slopes of every output along the two variables, from those along conditions 4, 7 and 8
+        fields = inputGroups['conditions']['fields']
+        efficiency, incinerated, landfilled = [jacobian.jacobian[:, jacobian.inputNames.index(('conditions', fields[i]))] for i in (4, 7, 8)]
+        slopes = np.stack([efficiency, (1-inputs['conditions'][2])*(incinerated-landfilled)], axis = 1)
+        
+        #each LCI value times the input mass of its stage, the rest over 1
+        stageRows = {stage: jacobian.outputNames.index(('stageInputMasses', stage)) for stage, dictList in lciStages}
+        stages = {dictList: stage for stage, dictList in lciStages}
+        divisors = [stageRows[stages[name[0]]] if name[0] in stages else None for name in jacobian.outputNames]
+        masses = np.array([1.0 if row is None else jacobian.values[row] for row in divisors])
+        massSlopes = np.array([np.zeros(2) if row is None else slopes[row] for row in divisors])
+        numerators = jacobian.values*masses
+        numeratorSlopes = slopes*masses[:, None] + jacobian.values[:, None]*massSlopes
+        
+        moving = np.flatnonzero(np.any(numeratorSlopes != 0, axis = 1) | np.any(massSlopes != 0, axis = 1))
+        self.outputNames = [jacobian.outputNames[i] for i in moving]
+        self.slots = [resultSlot(self.results, name) for name in self.outputNames]
+        self.numerators, self.numeratorSlopes = numerators[moving], numeratorSlopes[moving]
+        self.masses, self.massSlopes = masses[moving], massSlopes[moving]
+    
+    #The values of the moving outputs at recyclingEfficiency and incinerationShare, in the order of outputNames.
+    #Raises ZeroDivisionError where calculateStreams would, when the input mass of a stage is empty (down to rounding)
+    def values(self, recyclingEfficiency, incinerationShare):
+        step = np.array([recyclingEfficiency, incinerationShare]) - self.shares
+        masses = self.masses + self.massSlopes @ step
+        if np.any(np.abs(masses) <= 1e-12*np.abs(self.masses)):
+            raise ZeroDivisionError('a life cycle stage has no input at these settings')
+        return (self.numerators + self.numeratorSlopes @ step)/masses
+    
+    #results at recyclingEfficiency and incinerationShare, updated in place. Returns it with the conditions of the point
+    def update(self, recyclingEfficiency, incinerationShare):
+        for (container, key), value in zip(self.slots, self.values(recyclingEfficiency, incinerationShare).tolist()):
+            container[key] = value
+        return self.results, optimizerConditions(self.inputs['conditions'], recyclingEfficiency, incinerationShare)
+
+#Streams going into and out of each life cycle stage, releases included, as entries of streamColumnNames. What
+#incineration burns is in the 2018 incineration total, which counts the releases of stream 25 as well. The
+#landfill total is what stays after the leak (stream 29), and it takes in the plastic litter (stream 9) too
+balanceStages = {'Manufacture': ([1, 2, 20], [4]), 'Use': ([4], [5, 6]), 'Collection and Sorting': ([6, 8], [9, 11, 12, 13, 14, 16, 24, 26, 27]),
+                 'Mechanical Recycling': ([16, 19, 21], [18, 20, 22, 23, 28]), 'Incineration': ([11, 23, 24], ['Waste Incinerated 2018']),
+                 'Landfill': ([9, 12, 26, 28], [29, 'Waste Accumulated in Landfill 2018'])}
+
+#Stages checkMassBalance leaves out by default. Collection and sorting never closes per species on the 2018 data: its
+#input is split by the generation composition and each output by the composition reported for that fate (and the
+#reported recycling shares for the resins), and those tables don't agree material by material
+balanceExemptStages = ['Collection and Sorting']
+
+#Stream summary rows that are totals or emissions rather than species, the mass balance skips them
+balanceExcludedRows = ['Total Mass excluding emissions', 'Total Plastics', 'Total Additives', 'Actual mass of emission (Tons):'] + nonlinearStreamRows
+
+#One species of one stage whose inputs and outputs differ. scenario is the position of the run in the batch
+BalanceViolation = namedtuple('BalanceViolation', ['scenario', 'stage', 'species', 'inputs', 'outputs', 'difference'])
+
+#Mass going into and out of every stage of balanceStages for arrays of species x streams (any leading batch
+#dimensions, like MassOperator.evaluate gives). Returns inputs and outputs shaped (..., stages, species)
+def massBalance(values):
+    values = np.nan_to_num(np.asarray(values, dtype = float))
+    totals = [[values[..., [streamColumnNames.index(str(stream)) for stream in streams]].sum(axis = -1) for streams in stage] for stage in balanceStages.values()]
+    return np.stack([into for into, out in totals], axis = -2), np.stack([out for into, out in totals], axis = -2)
+
+#Checks inputs = outputs + releases for every stage and species of a batch of runs. runs is a result of
+#calculateStreams, a list of them, or an array of species x streams values per run with the names of its rows in
+#species. A difference counts when it is more than tolerance times the larger side (or tolerance tons), in any stage
+#but those of exempt. Returns the violations, largest difference first, at most limit of them
+def checkMassBalance(runs, species = None, tolerance = 1e-6, limit = None, exempt = balanceExemptStages):
+    if isinstance(runs, dict):
+        runs = [runs]
+    if species is None:
+        matrices = [streamMatrix(run['streamTRVWLists']) for run in runs]
+        species = matrices[0][0]
+        runs = [values for names, values in matrices]
+    values = np.asarray(runs, dtype = float).reshape(-1, len(species), len(streamColumnNames))
+    checked = [i for i, name in enumerate(species) if name not in balanceExcludedRows]
+    
+    inputs, outputs = massBalance(values[:, checked])
+    difference = inputs - outputs
+    scale = np.maximum(np.maximum(np.abs(inputs), np.abs(outputs)), 1)
+    flagged = np.abs(difference) > tolerance*scale
+    flagged[:, [stage in exempt for stage in balanceStages]] = False
+    flagged = np.flatnonzero(flagged)
+    flagged = flagged[np.argsort(-np.abs(difference.ravel()[flagged]), kind = 'stable')][:limit]
+    
+    stages = list(balanceStages)
+    violations = []
+    for scenario, stage, row in zip(*np.unravel_index(flagged, difference.shape)):
+        violations.append(BalanceViolation(int(scenario), stages[stage], species[checked[row]], float(inputs[scenario, stage, row]),
+                                           float(outputs[scenario, stage, row]), float(difference[scenario, stage, row])))
+    return violations
+
+#One axis of a sweep grid: the values one field of an input list takes, or whole lists for the group when field is
+#None (e.g. a set of MSW compositions)
+SweepAxis = namedtuple('SweepAxis', ['group', 'field', 'values'])
+
+#Results of consecutive points of a sweep. start is the position of the first point in the flattened grid, positions
+#holds the index along every axis of each point, values what summarize returned for each point and valid whether the
+#point passed the input checks and the engine could run it (values are NaN otherwise)
+SweepChunk = namedtuple('SweepChunk', ['start', 'positions', 'values', 'valid'])
+
+def sweepShape(axes):
+    return tuple(len(axis.values) for axis in axes)
+
+#Default summary of a sweep point: the species x streams array of streamMatrix
+def sweepStreams(results):
+    return streamMatrix(results['streamTRVWLists'])[1]
+
+def sweepScenario(inputs, axes, position):
+    scenario = {name: [float(value) for value in inputs[name]] for name in inputListNames}
+    for axis, index in zip(axes, position):
+        if axis.field is None:
+            scenario[axis.group] = [float(value) for value in axis.values[index]]
+        else:
+            scenario[axis.group][inputGroups[axis.group]['fields'].index(axis.field)] = float(axis.values[index])
+    return scenario
+
+#Summary of one sweep point, None when the engine can't run it
+def sweepPointSummary(summarize, scenario):
+    try:
+        return np.asarray(summarize(calculateStreams(**scenario)), dtype = float)
+    except ArithmeticError: #e.g. a stream the engine divides by is empty
+        return None
+
+#Name a cache keeps the summaries of a sweep under: cacheKind when given, else the module and name of summarize and
+#a hash of that module's source, so editing the module starts new entries. Closures, lambdas and partials can't be
+#told apart by name (two closures of one factory share it), so they need a cacheKind
+def sweepCacheKind(summarize, cacheKind = None):
+    if cacheKind is not None:
+        return 'sweep ' + cacheKind
+    module = sys.modules.get(getattr(summarize, '__module__', None))
+    name = getattr(summarize, '__qualname__', '<none>')
+    try:
+        found = functools.reduce(getattr, name.split('.'), module)
+    except AttributeError:
+        found = None
+    if found is not summarize or getattr(module, '__file__', None) is None:
+        raise ValueError('A cached sweep needs a module level summarize function or a cacheKind')
+    with open(module.__file__, 'rb') as file:
+        source = hashlib.sha256(file.read()).hexdigest()[:16]
+    return 'sweep ' + module.__name__ + '.' + name + ' ' + source
+
+#Runs the points start to stop of a sweep, in the calling process or a worker of sweepResults. With a cache (an
+#eolPlastic.resultcache.DiskResultCache) points it holds under kind are read instead of run, and the runs are added
+def evaluateSweepChunk(inputs, axes, start, stop, summarize, shape, cache = None, kind = None):
+    positions = np.stack(np.unravel_index(np.arange(start, stop), sweepShape(axes)), axis = 1)
+    scenarios = [sweepScenario(inputs, axes, position) for position in positions.tolist()]
+    valid = validScenarios({name: np.array([scenario[name] for scenario in scenarios]) for name in inputListNames})
+    values = np.full((len(scenarios),) + shape, np.nan)
+    points = np.flatnonzero(valid)
+    if cache is None:
+        summaries = [sweepPointSummary(summarize, scenarios[i]) for i in points]
+    else:
+        summaries = cache.evaluate(kind, [scenarios[i] for i in points], functools.partial(sweepPointSummary, summarize))
+    for i, summary in zip(points, summaries):
+        if summary is None:
+            valid[i] = False
+        else:
+            values[i] = summary
+    return SweepChunk(start, positions, values, valid)
+
+#Runs every point of the grid spanned by axes around inputs and yields the results as SweepChunks of chunkSize
+#points, in grid order, as they are computed. With workers the chunks run in that many processes (summarize must
+#then be a module level function). At most buffered chunks, and at least one per worker, are computed ahead of the
+#consumer, so a sweep larger than memory streams through as fast as it is consumed; closing the generator stops the
+#workers. A cache (DiskResultCache) keeps the summaries of every point for later sweeps in any process, under
+#sweepCacheKind(summarize, cacheKind)
+def sweepResults(inputs, axes, chunkSize = 1000, buffered = 2, workers = 0, summarize = sweepStreams, cache = None, cacheKind = None):
+    for axis in axes:
+        if axis.group not in inputGroups or (axis.field is not None and axis.field not in inputGroups[axis.group]['fields']):
+            raise ValueError('Unknown sweep axis: ' + str(axis.group) + ' ' + str(axis.field))
+    kind = sweepCacheKind(summarize, cacheKind) if cache is not None else None
+    shape = np.shape(summarize(calculateStreams(**inputs)))
+    total = int(np.prod(sweepShape(axes)))
+    chunks = ((start, min(start+chunkSize, total)) for start in range(0, total, chunkSize))
+    
+    if not workers:
+        for start, stop in chunks:
+            yield evaluateSweepChunk(inputs, axes, start, stop, summarize, shape, cache, kind)
+        return
+    
+    #Spawned rather than forked: a sweep started from the GUI would fork a process running Tk and threads
+    pool = ProcessPoolExecutor(workers, mp_context = multiprocessing.get_context('spawn'))
+    pending = deque()
+    try:
+        for start, stop in itertools.islice(chunks, max(buffered, workers)):
+            pending.append(pool.submit(evaluateSweepChunk, inputs, axes, start, stop, summarize, shape, cache, kind))
+        while pending:
+            chunk = pending.popleft().result()
+            for start, stop in itertools.islice(chunks, 1):
+                pending.append(pool.submit(evaluateSweepChunk, inputs, axes, start, stop, summarize, shape, cache, kind))
+            yield chunk
+    finally:
+        pool.shutdown(cancel_futures = True)
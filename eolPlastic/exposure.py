@@ -0,0 +1,80 @@
+#Worker exposure with uncertain workforces, workdays and doses. The LCI tables take one value of each from
+#workerExposure in eolPlastic.data; here each can be a distribution instead, for any stage (collection and sorting,
+#incineration and landfill as well as mechanical recycling). Draws are made as whole arrays and a stage's exposure per
+#ton input is its exposed mass times a fixed weight per category, so percentiles over millions of draws cost one sort
+#per stage and route however many scenarios are asked about
+import numpy as np
+from collections import namedtuple
+from eolPlastic.data import matFlowAnalSumCategories, workerExposure
+from eolPlastic.engine import workerExposureMass, lciStages
+
+exposureRoutes = ['inhalation', 'dermal']
+exposureParameters = ['workers', 'workdays'] + exposureRoutes
+
+#Normal draws truncated at 0, since a negative count or dose means nothing: negative draws are drawn again. mean and
+#deviation are those of the normal before truncation, so the draws average above mean once deviation is more than
+#about a third of it (by 0.29 deviations when it equals mean). Use a lognormal for spreads that wide
+def truncatedNormal(rng, size, mean, deviation):
+    if mean <= 0:
+        raise ValueError('A normal distribution of a count or dose needs a positive mean')
+    draws = rng.normal(mean, deviation, size)
+    negative = np.flatnonzero(draws < 0)
+    while len(negative): #at most half are drawn again each time
+        draws[negative] = rng.normal(mean, deviation, len(negative))
+        negative = negative[draws[negative] < 0]
+    return draws
+
+#A distribution is a plain number (no uncertainty) or a tuple naming one of these with its parameters, e.g.
+#('triangular', 15000, 21834, 30000) workers or ('lognormal', 105, 2.5) mg a workday (median and geometric standard deviation)
+distributionSamplers = {'constant': lambda rng, size, value: np.full(size, float(value)),
+                        'uniform': lambda rng, size, low, high: rng.uniform(low, high, size),
+                        'triangular': lambda rng, size, low, mode, high: rng.triangular(low, mode, high, size),
+                        'normal': truncatedNormal,
+                        'lognormal': lambda rng, size, median, geometricDeviation: median*np.exp(np.log(geometricDeviation)*rng.standard_normal(size))}
+
+ExposurePercentiles = namedtuple('ExposurePercentiles', ['stage', 'route', 'percentiles', 'mean', 'exposedMass', 'categories', 'perInput'])
+#exposedMass: tons a year taken in by the stage's workers at each percentile
+#perInput: (scenarios, percentiles, categories) tons per ton input, the values of the LCI table's exposure column
+
+def sampleDistribution(distribution, size, rng):
+    if isinstance(distribution, (int, float, np.number)):
+        distribution = ('constant', distribution)
+    name, *parameters = distribution
+    if name not in distributionSamplers:
+        raise ValueError('Unknown distribution ' + repr(name) + ', use one of ' + ', '.join(distributionSamplers))
+    return distributionSamplers[name](rng, size, *parameters)
+
+#Draws of the mass a stage's workers take in a year by each route, tons. Workers and workdays are drawn once and
+#shared by both routes
+def sampleExposedMass(distributions, samples, rng):
+    missing = [parameter for parameter in exposureParameters if parameter not in distributions]
+    if missing:
+        raise ValueError('Exposure distributions need ' + ', '.join(missing))
+    workers = sampleDistribution(distributions['workers'], samples, rng)
+    workdays = sampleDistribution(distributions['workdays'], samples, rng)
+    return {route: workerExposureMass(sampleDistribution(distributions[route], samples, rng), workers, workdays) for route in exposureRoutes}
+
+#Weight of each category of a stage's input: its share of the input over the input mass, so that exposure per ton
+#input is exposed mass times weight, as in stageExposure. (scenarios, categories)
+def exposureWeights(results, stage):
+    if stage not in dict(lciStages):
+        raise ValueError('No LCI stage called ' + repr(stage))
+    dictList = dict(lciStages)[stage]
+    return np.array([[result[dictList][0][category]/result['stageInputMasses'][stage] for category in matFlowAnalSumCategories] for result in results])
+
+#Percentiles of worker exposure for every stage in distributions (default: the single values of workerExposure) and
+#every result of calculateStreams in results, one result or a list of them
+def exposurePercentiles(results, distributions = workerExposure, percentiles = (5, 50, 95), samples = 100000, seed = None):
+    if isinstance(results, dict):
+        results = [results]
+    rng = np.random.default_rng(seed)
+    percentiles = np.asarray(percentiles, dtype = float)
+
+    outcomes = []
+    for stage, stageDistributions in distributions.items():
+        weights = exposureWeights(results, stage)
+        for route, draws in sampleExposedMass(stageDistributions, samples, rng).items():
+            exposedMass = np.percentile(draws, percentiles)
+            outcomes.append(ExposurePercentiles(stage, route, percentiles, draws.mean(), exposedMass, list(matFlowAnalSumCategories),
+                                                weights[:, None, :] * exposedMass[None, :, None]))
+    return outcomes
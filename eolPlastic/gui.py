@@ -0,0 +1,2904 @@
+#The window of the model. Importing this module builds it and main() runs it; eolPlastic.data, eolPlastic.engine and
+#eolPlastic.plotting hold everything that works without Tk
+import PySimpleGUI as sg
+import tkinter as tk
+import matplotlib.pyplot as plt
+import numpy as np
+import networkx as nx
+import threading
+import queue
+import time
+import os
+
+from tkinter import *
+from tkinter import ttk, filedialog, simpledialog, messagebox
+from PIL import ImageTk,Image
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+
+import pandas as pd
+
+
+
+EoLPlasticgui = tk.Tk()
+EoLPlasticgui.title("Generic Scenario of End-of-Life Plastics - Chemical Additives")
+
+my_program= ttk.Notebook(EoLPlasticgui)
+my_program.pack(fill="both",expand=1)
+
+w = 1500 # width for the Tk root
+h = 800 # height for the Tk root
+#get screen width and height
+ws = EoLPlasticgui.winfo_screenwidth() # width of the screen
+hs = EoLPlasticgui.winfo_screenheight() # height of the screen
+#calculate x and y coordinates for the Tk root window
+x = (ws/2) - (w/2)
+y = (hs/2) - (h/2)
+#set the dimensions of the screen  and where it is placed
+EoLPlasticgui.geometry('%dx%d+%d+%d' % (w, h, x, y-25))
+
+    
+#Create frames for GUI
+my_frame1 = Frame(my_program, width=300, height=300, bg="white") #Home frame
+userSpecificationsFrame = Frame(my_program, width = 300, height = 300, bg = 'white') #User specs frame
+userSpecificationsCanvas = Canvas(userSpecificationsFrame, bg = 'white') #Canvas within user specs frame to allow for scrollbar
+my_frame2 = Frame(userSpecificationsCanvas, width=300, height=300, bg="white") #Frame to put widgets on for user specs frame
+my_frame3 = Frame(my_program, width=300, height=300, bg="white") #Material Data tab
+my_frame4 = Frame(my_program, width=300, height=300, bg="white") #Will be for assumptions tab, but for now has been removed until assumptions tab is ready
+my_frame5 = Frame(my_program, width=300, height = 300, bg = 'white') #For LCI Tab
+my_frame6 = Frame(my_program, width = 300, height = 300, bg = 'white', bd=5) #Will be for Chemical Additives Database
+dataAnalysisFrame = Frame(my_program, width = 300, height = 300, bg ='white') #Added to program for canvas on next line
+dataAnalysisCanvas = Canvas(dataAnalysisFrame, bg = 'white') #Added to frame above so a scrollbar can be created
+my_frame7 = Frame(dataAnalysisCanvas, width = 300, height = 300, bg = 'white', bd = 5) #Will contain widgets to display input and graphs
+streamFrame = Frame(my_program, width = 300, height = 300, bg = 'white') #Will be for pop-up
+
+
+#Adds tabs to top
+my_program.add(my_frame1, text="Home")
+my_program.add(userSpecificationsFrame, text="User Specifications")
+my_program.add(streamFrame, text = 'Stream Calculations')
+my_program.add(dataAnalysisFrame, text = 'Material Flow Results')
+my_program.add(my_frame5, text = 'Life Cycle Inventory')
+my_program.add(my_frame3, text="Material Data")
+#my_program.add(my_frame4, text="Assumptions") Removed for now
+my_program.add(my_frame6, text = "Chemical Additives Database")
+
+
+##########################################################################################################
+##########################################################################################################
+#Sensitivity Analysis Sheet
+
+
+#The constants, 2018 data and databases are in eolPlastic.data, the calculations in eolPlastic.engine and the charts in
+#eolPlastic.plotting, all of which can be imported without Tk
+from eolPlastic.data import *
+from eolPlastic.engine import *
+from eolPlastic.plotting import CompositionPie, RecyclingBars
+
+#Creates empty lists that will be filled by user input before calculations are made
+plasticRecycled = 0
+
+conditions = []
+
+mswCompProp = []
+
+mswRecyc = []
+
+mswIncin = []
+
+mswLand = []
+
+mswCompost =[]
+
+repRecPlastics = []
+
+repPlasticImport = []
+
+repPlasticsExport = []
+
+repPlasticsReExport = []
+
+plasticLandFractionsList = []
+
+plasticRecycledFractionsList = []
+
+plasticIncinFractionsList = []
+
+streamTRVWLists = [] #rows of the stream summary table, filled by makeCalculations
+
+
+#Gathers copies of the entered input lists. Returns None (and shows a message) if a list has not been entered yet
+def gatherInputs():
+    inputs = {}
+    for name in inputListNames:
+        if checkEntry(globals()[name]):
+            gapLabel1.config(text = 'Not all data has been input.')
+            return None
+        inputs[name] = list(globals()[name])
+    
+    errors = validateInputs(inputs)
+    if errors:
+        gapLabel1.config(text = inputGroups[errors[0].group]['title'] + ': ' + errors[0].message, fg = 'red')
+        return None
+    return inputs
+
+#Keeps one figure and Tk canvas alive between calculations. Artists handed to animate are redrawn by
+#blitting them over a cached background instead of rendering the whole figure again
+class BlittedChart:
+    def __init__(self, figure, master):
+        self.figure = figure
+        self.canvas = FigureCanvasTkAgg(figure, master = master)
+        self.artists = []
+        self.background = None
+        self.canvas.mpl_connect('draw_event', self.onDraw)
+        
+    def animate(self, artists):
+        for artist in artists:
+            artist.set_animated(True)
+            self.artists.append(artist)
+        self.artists.sort(key = lambda artist: artist.get_zorder())
+        
+    #A full draw leaves the animated artists out, so the background is cached here and they are painted on top
+    def onDraw(self, event):
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.drawArtists()
+        
+    def drawArtists(self):
+        for artist in self.artists:
+            self.figure.draw_artist(artist)
+    
+    #fullRedraw is needed when something outside the animated artists changed, e.g. the axis limits
+    def update(self, fullRedraw = False):
+        if fullRedraw or self.background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self.background)
+        self.drawArtists()
+        self.canvas.blit(self.figure.bbox)
+
+pieChart = None
+barChart = None
+compositionPie = None
+recyclingBars = None
+
+#Creates pie chart for data analysis stream. Shows msw composition
+def drawPieChart(mswComposition):
+    global pieChart, compositionPie
+    if pieChart is None:
+        compositionPie = CompositionPie(mswComposition)
+        pieChart = BlittedChart(compositionPie.figure, plotFrame) # Convert the Figure to the data frame (tab)
+        pieChart.animate(compositionPie.artists())
+        pieChart.canvas.get_tk_widget().grid(column = 0, row = 0) # Show the widget on the screen
+        pieChart.update(fullRedraw = True)
+        return
+    compositionPie.update(mswComposition)
+    pieChart.update()
+
+#Comparison bar graph of the amount of each plastic recycled against the amount collected
+def drawBarChart(barData1, barData2):
+    global barChart, recyclingBars
+    if barChart is None:
+        recyclingBars = RecyclingBars(barData1, barData2)
+        barChart = BlittedChart(recyclingBars.figure, plotFrame) #creates canvas for placement in GUI
+        barChart.animate(recyclingBars.artists())
+        barChart.canvas.get_tk_widget().grid(column = 1, row = 0)
+        barChart.update(fullRedraw = True)
+        return
+    barChart.update(fullRedraw = recyclingBars.update(barData1, barData2))
+
+#Keeps the results the LCI tables and the stream summary are filled from
+def storeResults(results):
+    global manufactureDictList, useDictList, cspDictList, mechRecycDictList, incinDictList, landDictList, streamTRVWLists
+    manufactureDictList = results['manufactureDictList']
+    useDictList = results['useDictList']
+    cspDictList = results['cspDictList']
+    mechRecycDictList = results['mechRecycDictList']
+    incinDictList = results['incinDictList']
+    landDictList = results['landDictList']
+    streamTRVWLists = results['streamTRVWLists']
+
+#Puts the results of calculateStreams on screen. Must be called from the Tk main thread
+def showCalculations(results):
+    storeResults(results)
+    
+    #clears LCI tables if they already had data inside
+    shownLCIRows.clear()
+    matFlowManufactureTRVW.delete(*matFlowManufactureTRVW.get_children())
+    matFlowUseTRVW.delete(*matFlowUseTRVW.get_children())
+    matFlowCSPTRVW.delete(*matFlowCSPTRVW.get_children())
+    matFlowMechRecycTRVW.delete(*matFlowMechRecycTRVW.get_children())
+    matFlowIncinTRVW.delete(*matFlowIncinTRVW.get_children())
+    matFlowLandTRVW.delete(*matFlowLandTRVW.get_children())
+    
+    #Changes text on user specs page to confirm calcualtions are complete
+    gapLabel1.config(text = 'Calculations Complete')
+
+    #Updates the charts on the data analysis tab. They are built on the first calculation and reused afterwards
+    drawPieChart(results['mswCompProp'])
+    drawBarChart(list(results['amountOfPlasticRecycled'].values()), list(results['plasticsMassDict'].values()))
+
+#Runs the calculations on the Tk main thread. calculateWasteProportions does the same work on a worker thread
+def makeCalculations():
+    inputs = gatherEnteredInputs()
+    if inputs is None:
+        return
+    
+    showCalculations(calculateStreams(**inputs))
+    
+    
+    
+
+##################################################################
+#Abstract Tab
+
+#Adding text boxes to Frame 1 
+#note: this information is no longer the abstract but the instructions
+#old widget names remain though sorry bout it
+abstract_frame1 = tk.Text(my_frame1, bd = 0, highlightthickness= 0, bg = "white",  height = 25, width = 90)
+title_frame1 = tk.Text(my_frame1, bd = 0, highlightthickness= 0, bg = "white", height = 4, width = 50)
+subtitle_frame1 = tk.Text(my_frame1, bd = 0, highlightthickness = 0, bg = "white", height = 1, width =50)
+
+#Adding text to instructions textbox (formerly the abstract)
+abstract_frame1.insert(tk.INSERT, "1. Municipal solid waste (MSW) data can be input under the “User Specifications” tab. Click on this tab, then begin\nfilling in the data in the entry boxes provided. To autofill all boxes at once, click the year at the top, then “Select Year.” Alternatively, you can fill each category individually.") #abstract
+abstract_frame1.insert(tk.INSERT, "\n\n2. Once a set of data is input, click “Enter Above Dataset” to submit that data and move on to the next set. At any time, you may return to previously entered data sets by clicking on the appropriate category on the left. Submitting will also\ncheck the data, ensuring all proportions sum to 1 as necessary. At any time, you may check the proportions yourself by clicking “Check Proportions.” This button will NOT submit data.") #abstract
+abstract_frame1.insert(tk.INSERT, "\n\n3. Once all data has been submitted, press “Calculate Streams.” If not all data has been entered, an error message\nwill appear prompting you to go back and check that every box is filled with a number. ") #abstract
+abstract_frame1.insert(tk.INSERT, "\n\n4. At this point, all calculations have been completed and you may analyze the data. In the “Stream Calculations” tab, a flow chart shows the MSW lifecycle and stream numbers and titles for the processes within.") #abstract
+abstract_frame1.insert(tk.INSERT, "\n\n5. On this same page, the mass calculations for each stream are generated by clicking “Show Stream Calculations.”\nThis will generate a spreadsheet of stream data in a pop-up window that can then be exported to an Excel\nspreadsheet by clicking “Export to Excel.” ") #abstract
+abstract_frame1.insert(tk.INSERT, "\n\n6. Under the “Material Flow Results” tab, various plots are shown, and clicking “Display User Input” will show the data\nvalues input by the user.") #abstract
+abstract_frame1.insert(tk.INSERT, "\n\n7. The “LCI” tab shows a lifecycle inventory, giving information about each plastic resin and a lump category of plastic additives in each major step of the plastic lifecycle.") #abstract
+
+
+
+#Add text to title
+title_frame1.insert(tk.INSERT, "\nA Generic Scenario Analysis of End-of-Life Plastic\nManagement: Chemical Additives") #title for frame
+
+#Configure title text boxes, fonts, etc.
+title_frame1.tag_configure("center", justify = 'center') 
+title_frame1.tag_add("center", 1.0, 'end')
+title_frame1.configure(font = ("Helvetica", 24, "bold"))
+subtitle_frame1.insert(tk.INSERT, "Instructions")
+subtitle_frame1.tag_configure("center", justify = "center")
+subtitle_frame1.tag_add("center", 1.0, 'end')
+subtitle_frame1.configure(font = ("Helvetica 20 bold"))
+abstract_frame1.configure(font = ("Helvetica 14"))
+
+#disables editing of text boxes
+title_frame1.config(state="disabled")
+subtitle_frame1.config(state="disabled")
+abstract_frame1.config(state="disabled")
+
+#places text boxes on screen
+title_frame1.pack()
+subtitle_frame1.pack()
+abstract_frame1.pack()
+
+
+########################################################################
+#LCI Tab
+
+#Create and place canvas inside my_frame5 so that a scrollbar can be added
+#Note: material flow is name carried over from older versions. This is all part of LCI Tab
+#note2: material flow is an old name. this now refers to LCI, but names have been preserved
+materialFlowCanvas = Canvas(my_frame5, bg = 'white')
+materialFlowCanvas.pack(side = LEFT, fill = BOTH, expand = 1)
+
+#Create and configure scrollbar
+matFlowScrollbar = Scrollbar(my_frame5, orient = 'vertical', command = materialFlowCanvas.yview)
+matFlowScrollbar.pack(side = 'right', fill = 'y')
+matFlowScrollbar.config(command=materialFlowCanvas.yview)
+materialFlowCanvas.configure(yscrollcommand=matFlowScrollbar.set)
+materialFlowCanvas.bind('<Configure>', lambda e: materialFlowCanvas.configure(scrollregion = materialFlowCanvas.bbox('all')))
+
+
+#Creates frame for tables that will show life cycle inventory tables and places inside canvas
+materialFlowFrame = Frame(materialFlowCanvas, bg = 'white')
+materialFlowCanvas.create_window((0,0), window = materialFlowFrame, anchor = 'nw')
+
+
+#Creates and configures title and subtitle for LCI Frame
+fontChoice = 'Helvetica 12 bold'
+materialFlowTitle = tk.Text(materialFlowFrame, bd = 0, highlightthickness = 0, bg = 'white', height = 2, width = 50)
+materialFlowTitle.insert(tk.INSERT, "\nLife Cycle Inventory")
+materialFlowTitle.tag_configure("center", justify = 'center') 
+materialFlowTitle.tag_add("center", 1.0, 'end')
+materialFlowTitle.configure(font = ("Helvetica 20 bold"))
+materialFlowTitle.config(state = 'disabled')
+
+materialFlowSubtitle = tk.Text(materialFlowFrame, bd = 0, highlightthickness = 0, bg = 'white', height = 1, width = 75)
+materialFlowSubtitle.insert(tk.INSERT, 'Select year or custom in "User Specifications" tab to populate table.')
+materialFlowSubtitle.tag_configure("center", justify = 'center') 
+materialFlowSubtitle.tag_add("center", 1.0, 'end')
+materialFlowSubtitle.configure(font = ("Helvetica 16 bold"))
+materialFlowSubtitle.config(state = 'disabled')
+
+#places title and subtitle
+materialFlowTitle.pack()
+materialFlowSubtitle.pack()
+
+
+#Creates  tables (TRVWs) that will contain LCI information
+matFlowManufactureTRVW = ttk.Treeview(materialFlowFrame)
+matFlowUseTRVW = ttk.Treeview(materialFlowFrame)
+matFlowCSPTRVW = ttk.Treeview(materialFlowFrame)
+matFlowMechRecycTRVW = ttk.Treeview(materialFlowFrame)
+matFlowIncinTRVW = ttk.Treeview(materialFlowFrame)
+matFlowLandTRVW = ttk.Treeview(materialFlowFrame)
+
+#Creates title for each TRVW
+matFlowManufactureText = Text(materialFlowFrame, bd=0, highlightthickness = 0, bg = "white", height = 3, width = 125)
+matFlowUseText = Text(materialFlowFrame, bd=0, highlightthickness = 0, bg = "white", height = 3, width = 125)
+matFlowCSPText = Text(materialFlowFrame, bd=0, highlightthickness = 0, bg = "white", height = 3, width = 125)
+matFlowMechRecycText = Text(materialFlowFrame, bd=0, highlightthickness = 0, bg = "white", height = 3, width = 125)
+matFlowIncinText = Text(materialFlowFrame, bd=0, highlightthickness = 0, bg = "white", height = 3, width = 125)
+matFlowLandText = Text(materialFlowFrame, bd=0, highlightthickness = 0, bg = "white", height = 3, width = 125)
+
+#Creates lists of rows to be added to each LCI table
+matFlowCategories = ['\nManufacture', "\nUse", '\nCollection and Sorting', '\nMechanical Recycling', '\nIncineration', '\nLandfill']
+matFlowTRVWList = [matFlowManufactureText, matFlowManufactureTRVW, matFlowUseText, matFlowUseTRVW, matFlowCSPText, matFlowCSPTRVW, matFlowMechRecycText, 
+                   matFlowMechRecycTRVW, matFlowIncinText, matFlowIncinTRVW, matFlowLandText, matFlowLandTRVW]
+
+
+
+for i in range(len(matFlowTRVWList)):
+    if i%2 == 1:
+        matFlowTRVWList[i]['columns'] = matFlowColumnHeadings #adds headers to tables and packs
+        matFlowTRVWList[i].column('#0', width = 0, stretch = NO)
+        for name in matFlowColumnHeadings:
+            matFlowTRVWList[i].heading(name, text = name)
+        matFlowTRVWList[i].pack(fill = BOTH)
+    if i%2 ==0:
+        matFlowTRVWList[i].insert(tk.INSERT, matFlowCategories[i//2]) #adds in between titles for each trvw
+        matFlowTRVWList[i].tag_configure("center", justify = 'center')
+        matFlowTRVWList[i].tag_add("center", 1.0, 'end')
+        matFlowTRVWList[i].configure(font = ("Helvetica 16 bold"))
+        matFlowTRVWList[i].config(state="disabled")
+        matFlowTRVWList[i].pack()
+    
+def fillMatFlowAnalSumTRVW(): #will be used to fill each LCI trvw table
+    
+    try:
+        manufactureList = trvwListMaker(manufactureDictList) #in case of error won't crash code
+    except: 
+        return
+    
+    #creates list for each trvw and its row
+    useList = trvwListMaker(useDictList)
+    cspList = trvwListMaker(cspDictList)
+    mechRecycList = trvwListMaker(mechRecycDictList)
+    incinList = trvwListMaker(incinDictList)
+    landList = trvwListMaker(landDictList)
+    count = 0
+    
+    #inserts above data into trvw tables
+    for record in manufactureList:
+        matFlowManufactureTRVW.insert(parent ='', index ='end', iid = count, text = '', values = (record[0], record[1], record[2], record[3], record[4], record[5], record[6]))
+        count +=1
+    
+    count = 0
+    for record in useList:
+        matFlowUseTRVW.insert(parent ='', index ='end', iid = count, text = '', values = (record[0], record[1], record[2], record[3], record[4], record[5], record[6]))
+        count +=1
+        
+    count = 0
+    for record in cspList:
+        matFlowCSPTRVW.insert(parent ='', index ='end', iid = count, text = '', values = (record[0], record[1], record[2], record[3], record[4], record[5], record[6]))
+        count +=1
+        
+    count = 0
+    for record in mechRecycList:
+        matFlowMechRecycTRVW.insert(parent ='', index ='end', iid = count, text = '', values = (record[0], record[1], record[2], record[3], record[4], record[5], record[6]))
+        count +=1    
+        
+    count = 0
+    for record in incinList:
+        matFlowIncinTRVW.insert(parent ='', index ='end', iid = count, text = '', values = (record[0], record[1], record[2], record[3], record[4], record[5], record[6]))
+        count +=1    
+        
+    count = 0
+    for record in landList:
+        matFlowLandTRVW.insert(parent ='', index ='end', iid = count, text = '', values = (record[0], record[1], record[2], record[3], record[4], record[5], record[6]))
+        count +=1    
+
+#LCI tables in lciStages order, and the rows updateLCITables last put in each
+lciTables = [matFlowManufactureTRVW, matFlowUseTRVW, matFlowCSPTRVW, matFlowMechRecycTRVW, matFlowIncinTRVW, matFlowLandTRVW]
+shownLCIRows = {}
+
+#Puts new results into the LCI tables changing only the rows whose values changed. Tables that were emptied get every row
+def updateLCITables(results):
+    for table, (stage, dictList) in zip(lciTables, lciStages):
+        rows = [tuple(record[:7]) for record in trvwListMaker(results[dictList])]
+        previous = shownLCIRows.get(table)
+        if previous is None or len(previous) != len(rows) or not table.get_children():
+            table.delete(*table.get_children())
+            for iid, row in enumerate(rows):
+                table.insert(parent = '', index = 'end', iid = iid, text = '', values = row)
+        else:
+            for iid, (row, old) in enumerate(zip(rows, previous)):
+                if row != old:
+                    table.item(iid, values = row)
+        shownLCIRows[table] = rows
+        
+        
+        
+        
+###################################################
+### Entries tab
+
+
+#makes sure that all proportions sum to within 1% of appropriate total. works for every category but conditions
+#Reads a group of entries and checks it with validateInputs. Returns the values, or None after showing the
+#first problem found
+#Check Proportions button of a group of entries
+def checkEnteredGroup(entries):
+    leaveLiveMode()
+    return checkEntries(entries)
+
+def checkEntries(entries):
+    values = []
+    for i in entries:
+        try:
+            values.append(float(i.get())) #makes sure input is numbers only
+        except ValueError:
+            gapLabel1.config(text = 'Error: Please enter a number into each box to continue.', fg = 'red')
+            return None
+    
+    errors = validateInputs({inputGroupOfEntries[str(entries)]: values})
+    if errors:
+        gapLabel1.config(text = errors[0].message, fg = 'red') #indicates failure
+        return None
+    gapLabel1.config(text = 'Check successful.') #indicates success
+    return values
+
+#Packs canvas that will have data input section on it. Canvas allows for scroll bar to be added if necessary
+userSpecificationsCanvas.pack(side = LEFT, fill = BOTH, expand = 1)
+userSpecificationsCanvas.create_window((0,0), window = my_frame2, anchor = 'nw')
+
+
+#Creates scrollbar for above canvas
+userSpecScrollbar = Scrollbar(userSpecificationsFrame, orient = 'vertical', command = userSpecificationsCanvas.yview)
+userSpecScrollbar.config(command=userSpecificationsCanvas.yview)
+
+userSpecificationsCanvas.configure(yscrollcommand=userSpecScrollbar.set)
+
+#Creates and configures title/subtitle for user specs tab
+#Text to frame 2
+title_frame2 = tk.Text(my_frame2, bd=0, highlightthickness = 0, bg = "white", height=1, width=125)
+title_frame2.insert(tk.INSERT,"User Specifications")
+title_frame2.tag_configure("center", justify = 'center')
+title_frame2.tag_add("center", 1.0, 'end')
+title_frame2.configure(font = ("Helvetica 16 bold"))
+title_frame2.config(state="disabled")
+title_frame2.grid(column=0,row=0,columnspan=3)
+
+subtitle_frame2 = tk.Text(my_frame2, bd=0, highlightthickness = 0, bg = "white", height=2, width = 75)
+subtitle_frame2.insert(tk.INSERT,"Please select the simulated year for default MSW composition.\nYou may adjust these values accordingly.") #" #Note: Please fill all boxes, entering 0 where applicable.")
+subtitle_frame2.configure(font = ("Helvetica 10 bold"))
+subtitle_frame2.tag_configure("center", justify="center")
+subtitle_frame2.tag_add('center', 1.0, 'end')
+subtitle_frame2.config(state="disabled")
+subtitle_frame2.grid(column =0, row=1, columnspan=3)
+
+
+
+# Dictionary to create multiple radio buttons
+values = {"2016" : "2016",
+          "2017" : "2017",
+          "2018" : "2018",
+          "2019" : "2019",
+          "Custom" : "Custom"}
+
+#Variable for those radio buttons
+selectYear = StringVar()
+
+ 
+# Loop is used to create multiple RadiobutTons
+# rather than creating each button separately
+fontChoice = 'Helvetica 9 bold' #Assign font choices
+
+frame2Row = 2
+#create radiobuttons and grid them
+for (text, value) in values.items():
+    Radiobutton(my_frame2, text = text, variable = selectYear,
+                value = value, indicator = 0,
+                background = "gray81", font = fontChoice).grid(column = 0, row = frame2Row, columnspan=3, sticky=EW, ipady=5)
+    frame2Row +=1
+    
+#Creates functions associated with radio buttons that will auto fill the entry boxes on the input tab
+def select2018():
+    for i in customEntryList:
+        for b in i:
+            b.delete(0, END)
+    for i in range(10):
+        typesOfWasteEntry[i].insert(END, mswCompProp2018[i])
+    for i in range(11):
+        conditionsentryList[i].insert(END, conditions2018[i])
+    for i in range(11):
+        IncinMSWPropsEntry[i].insert(END, mswIncin2018[i])
+    for i in range(11):
+        recycMSWPropsEntry[i].insert(END, mswRecyc2018[i])
+    for i in range(11):
+        LandMSWPropsEntry[i].insert(END, mswLand2018[i])
+    for i in range(11):
+        CompostMSWPropsEntry[i].insert(END, mswCompost2018[i])
+    for i in range(8):
+        recycPlasticEntry[i].insert(END, plasticRecycledFractionsList2018[i]) 
+    for i in range(8):
+        LandPlasticEntry[i].insert(END, plasticLandFractionsList2018[i])
+    for i in range(8):
+        IncinPlasticEntry[i].insert(END, plasticIncinFractionsList2018[i])
+    for i in range(8):
+        RepRecycPlasticEntry[i].insert(END, repRecPlastics2018[i])
+    for i in range(4):
+        ImportPlasticEntry[i].insert(END, repPlasticImport2018[i])
+    for i in range(4):
+        ExportPlasticEntry[i].insert(END, repPlasticsExport2018[i])
+    for i in range(4):
+        ReExportPlasticEntry[i].insert(END, repPlasticsReExport2018[i])
+    
+#When custom is selected via radio button, the entry boxes will be cleared
+def selectCustom():
+    for i in customEntryList:
+        for b in i:
+            b.delete(0, END)
+
+#When enter button below will autofill data appropriately
+def clicked(value):
+    cancelCalculation()
+    totalMSWEntry.delete(0, END)
+    for i in range(10):
+        typesOfWasteEntry[i].delete(0,END) #Clears entry boxes
+    if value == "2018":
+        select2018()
+    if value == 'Custom':
+        selectCustom()
+    if value == '2016':
+        selectCustom()
+    if value == '2017':
+        selectCustom()
+    if value == '2019':
+        selectCustom()
+
+#Create button to set year and autofill data
+myButtonyear = Button(my_frame2, bg =  "grey", text="Select Year", fg = 'white', font = fontChoice, command=lambda: clicked(selectYear.get()))
+myButtonyear.grid(column=0, row=8, columnspan=3, sticky=EW, ipady=5)
+
+#will enter data currently shown on screen
+def enter(entry, appList, valueLabel, nextLabel, nextEntry, nextCheck, nextAuto, nextEnter):
+    cancelCalculation() #entered data is about to change
+    leaveLiveMode()
+    appList.clear()
+    values = checkEntries(entry) #the whole group is checked at once
+    if values is None:
+        return
+    appList.extend(values)
+    for v in range(len(valueLabel)):
+        valueLabel[v].config(text = str(appList[v]), fg = 'saddlebrown') #will insert data into data analysis tab so user can look at plots and see data input at the same time
+    
+        
+    gapLabel1.config(text = 'Previous data Entered') #will give confirmation message to user that data has been entered
+    
+    try:
+        showSection(nextLabel, nextEntry, nextCheck, nextAuto, nextEnter)
+        gapLabel1.config(text = listOfEntryCategories[str(entry)])
+
+    except:
+        makeCalculations()
+        
+#autofills data for each category as necessary
+def autofill(entry, data):
+    cancelCalculation()
+    for i in range(len(entry)):
+        entry[i].delete(0, END)
+        entry[i].insert(0, data[i])
+
+#section subtitle
+mswLabel = Label(my_frame2, bg = 'white', text = "Municipal Solid Waste Composition in the United States", font = 'Helvetica 12 bold')
+
+#Creating labels for types of waste to go next to entry boxes MJC
+miscInOrgWasteLabel = Label(my_frame2, text = "Misc. Inorganic Waste (Fraction): ", font = fontChoice, bg="white")
+otherWasteLabel = Label(my_frame2, text = "Other (Fraction): ", font = fontChoice, bg="white")
+yardTrimmingsLabel = Label(my_frame2, text = "Yard Trimmings (Fraction): ", font = fontChoice, bg="white")
+foodWasteLabel = Label(my_frame2, text = "Food (Fraction): ", font = fontChoice, bg="white")
+rltWasteLabel = Label(my_frame2, text = "Rubber, Leather, Textiles (Fraction): ", font = fontChoice, bg="white")
+woodWasteLabel = Label(my_frame2, text = "Wood (Fraction): ", font = fontChoice, bg="white")
+metalsWasteLabel = Label(my_frame2, text = "Metals (Fraction): ", font = fontChoice, bg="white")
+glassWasteLabel = Label(my_frame2, text = "Glass (Fraction): ", font = fontChoice, bg="white")
+paperAndBoardLabel = Label(my_frame2, text = "Paper and Paperboard (Fraction): ", font = fontChoice, bg="white")
+plasticsLabel = Label(my_frame2, text = "Plastics (Fraction): ", font = fontChoice, bg="white")
+
+#Creating list of labels MJC
+typesOfWasteLabels = [mswLabel, miscInOrgWasteLabel, otherWasteLabel, yardTrimmingsLabel, foodWasteLabel, rltWasteLabel, woodWasteLabel, metalsWasteLabel, glassWasteLabel, paperAndBoardLabel, plasticsLabel]
+
+#Entry boxes for custom waste stream creation MJC
+miscInOrgWasteEntry = Entry(my_frame2, width=50)
+otherWasteEntry = Entry(my_frame2, width=50)
+yardTrimmingsEntry = Entry(my_frame2, width=50)
+foodWasteEntry = Entry(my_frame2, width=50)
+rltWasteEntry = Entry(my_frame2, width=50)
+woodWasteEntry = Entry(my_frame2, width=50)
+metalsWasteEntry = Entry(my_frame2, width=50)
+glassWasteEntry = Entry(my_frame2, width=50)
+paperAndBoardEntry = Entry(my_frame2, width=50)
+plasticsEntry = Entry(my_frame2, width=50)
+
+
+#Creates buttons using check, enter, and autofill functions
+mswCompButtonCheck = Button(my_frame2, text = ' Check Proportions ', command = lambda:checkEnteredGroup(typesOfWasteEntry))
+mswCompEnter = Button(my_frame2, text = 'Enter Above Dataset', command = lambda: enter(typesOfWasteEntry, mswCompProp, typesOfWasteValueLabels, recycMSWPropsLabels, recycMSWPropsEntry, recycMSWButtonChecker, recycMSWAutoButton, recycMSWEnterButton))
+mswCompAuto = Button(my_frame2, text = ' Autofill 2018 Data', command = lambda: autofill(typesOfWasteEntry, mswCompProp2018))
+
+#Create list of entry boxes to be placed MJC
+typesOfWasteEntry = [miscInOrgWasteEntry, otherWasteEntry, yardTrimmingsEntry, foodWasteEntry, rltWasteEntry, woodWasteEntry, metalsWasteEntry, glassWasteEntry, paperAndBoardEntry, plasticsEntry]
+ 
+
+#Creates conditions labels and entries
+conditionsTitleLabel = Label(my_frame2, text = "Conditions", bg = 'white', font = 'Helvetica 12 bold')
+totalMSWLabel = Label(my_frame2, text = 'Total MSW (Tons):', bg = 'white', font = fontChoice)
+totalPlasticLabel = Label(my_frame2, text = 'Total Plastic Waste (Tons):', bg = 'white', font = fontChoice)
+plasticRecycledPropLabel = Label(my_frame2, text = 'Total Plastic Recycled (Fraction, Domestic and Export):', bg = 'white', font = fontChoice)
+plasticDomesticLabel = Label(my_frame2, text = 'Plastic Recycled Domestically (Fraction):', bg = 'white', font = fontChoice)
+plasticRecycEfficiencyLabel = Label(my_frame2, text = 'Plastic Recycling Efficiency (Fraction):', bg = 'white', font = fontChoice)
+plasticExportPropLabel = Label(my_frame2, text = 'Plastic Export Fraction (Fraction):', bg = 'white', font = fontChoice)
+plasticReExportPropLabel = Label(my_frame2, text = "Plastic Re-Export (Fraction):", bg = 'white', font = fontChoice)
+plasticIncineratedPropLabel = Label(my_frame2, text = 'Plastic Incinerated (Fraction):', bg = 'white', font = fontChoice)
+plasticLandfillPropLabel = Label(my_frame2, text = "Plastic Landfilled (Fraction):", bg = 'white', font = fontChoice)
+wasteFacilityEmissionsLabel = Label(my_frame2, text = 'Waste Facility Emissions (Tons):', bg = 'white', font = fontChoice)
+landfillEmissionsLabel = Label(my_frame2, text = 'Emissions from Landfill (Tons):', bg = 'white', font = fontChoice)
+
+totalMSWEntry = Entry(my_frame2, width = 50)
+totalPlasticEntry = Entry(my_frame2, width = 50)
+plasticRecycledPropEntry = Entry(my_frame2, width = 50)
+plasticDomesticEntry = Entry(my_frame2, width = 50)
+plasticRecycEfficiencyEntry = Entry(my_frame2, width = 50)
+plasticExportPropEntry = Entry(my_frame2, width = 50)
+plasticReExportPropEntry = Entry(my_frame2, width = 50)
+plasticIncineratedPropEntry = Entry(my_frame2, width = 50)
+plasticLandfillPropEntry = Entry(my_frame2, width = 50)
+wasteFacilityEmissionsEntry = Entry(my_frame2, width = 50)
+landfillEmissionsEntry = Entry(my_frame2, width = 50)
+
+
+#creates lists of widgets for placement
+conditionsLabelsListForPlacement = [conditionsTitleLabel, totalMSWLabel, totalPlasticLabel, plasticRecycledPropLabel, plasticDomesticLabel, plasticExportPropLabel, plasticReExportPropLabel,
+                                    plasticRecycEfficiencyLabel, plasticIncineratedPropLabel, plasticLandfillPropLabel, wasteFacilityEmissionsLabel, landfillEmissionsLabel]
+
+conditionsEntryListForPlacement = [totalMSWEntry, totalPlasticEntry, plasticRecycledPropEntry, plasticDomesticEntry, plasticExportPropEntry, plasticReExportPropEntry, 
+                                   plasticRecycEfficiencyEntry, plasticIncineratedPropEntry, plasticLandfillPropEntry, wasteFacilityEmissionsEntry, landfillEmissionsEntry]
+
+conditionsLabelsList = [conditionsTitleLabel, totalMSWLabel, totalPlasticLabel, plasticRecycledPropLabel, plasticDomesticLabel, plasticRecycEfficiencyLabel, plasticExportPropLabel,
+                        plasticReExportPropLabel, plasticIncineratedPropLabel, plasticLandfillPropLabel, wasteFacilityEmissionsLabel, landfillEmissionsLabel]
+
+conditionsentryList = [totalMSWEntry, totalPlasticEntry, plasticRecycledPropEntry, plasticDomesticEntry, plasticRecycEfficiencyEntry, plasticExportPropEntry,
+                       plasticReExportPropEntry, plasticIncineratedPropEntry, plasticLandfillPropEntry, wasteFacilityEmissionsEntry, landfillEmissionsEntry]
+
+
+#Creates buttons for checking, autofilling, and entering
+conditionsButtonChecker = Button(my_frame2, text = ' Check Proportions ', command = lambda:checkEnteredGroup(conditionsentryList))
+conditionsAutoButton = Button(my_frame2, text = ' Autofill 2018 Data', command = lambda: autofill(conditionsentryList, conditions2018))
+conditionsEnterButton = Button(my_frame2, text = 'Enter Above Dataset', command = lambda: enter(conditionsentryList, conditions, conditionsValueValueLabelsList, typesOfWasteLabels, typesOfWasteEntry, mswCompButtonCheck, mswCompAuto, mswCompEnter))
+
+
+
+#Recycling data input labels and entry boxes
+totalRecycLabel = Label(my_frame2, text = "Recycling Data", bg = 'white', font = 'Helvetica 12 bold')
+totalRecycMassLabel = Label(my_frame2, text = "Total Recycled Mass:", bg = 'white', font = fontChoice)
+miscInOrgRecycLabel = Label(my_frame2, text = "Misc. Inorg Waste (Fraction): ", bg = 'white', font = fontChoice)
+otherWasteRecycLabel = Label(my_frame2, text = "Other (Fraction):", bg = 'white', font = fontChoice)
+yardTrimmingsRecycLabel = Label(my_frame2, text = "Yard Trimmings (Fraction):", bg = 'white', font = fontChoice)
+foodRecycLabel = Label(my_frame2, text = "Food (Fraction):", bg = 'white', font = fontChoice)
+rltRecycLabel = Label(my_frame2, text = "Rubber, Leather, Textiles (Fraction):", bg = 'white', font = fontChoice)
+woodRecycLabel = Label(my_frame2, text = "Wood (Fraction):", bg = 'white', font = fontChoice)
+metalRecycLabel = Label(my_frame2, text = "Metals (Fraction):", bg = 'white', font = fontChoice)
+glassRecycLabel = Label(my_frame2, text = "Glass (Fraction):", bg = 'white', font = fontChoice)
+paperRecycLabel = Label(my_frame2, text = "Paper and Paperboard (Fraction):", bg = 'white', font = fontChoice)
+plasticRecycLabel = Label(my_frame2, text = "Plastic (Fraction):", bg = 'white', font = fontChoice)
+
+totalRecycMassEntry = Entry(my_frame2, width = 50)
+miscInOrgRecycEntry = Entry(my_frame2, width = 50)
+otherWasteRecycEntry = Entry(my_frame2, width = 50)
+yardTrimmingsRecycEntry = Entry(my_frame2, width = 50)
+foodRecycEntry = Entry(my_frame2, width = 50)
+rltRecycEntry = Entry(my_frame2, width = 50)
+woodRecycEntry = Entry(my_frame2, width = 50)
+metalRecycEntry = Entry(my_frame2, width = 50)
+glassRecycEntry = Entry(my_frame2, width = 50)
+paperRecycEntry = Entry(my_frame2, width = 50)
+plasticRecycEntry = Entry(my_frame2, width = 50)
+
+#Creates lists of labels and entries for placement 
+recycMSWPropsLabels= [totalRecycLabel, totalRecycMassLabel, miscInOrgRecycLabel, otherWasteRecycLabel, yardTrimmingsRecycLabel, foodRecycLabel,
+                      rltRecycLabel, woodRecycLabel, metalRecycLabel, glassRecycLabel, paperRecycLabel, plasticRecycLabel]
+
+recycMSWPropsEntry = [totalRecycMassEntry, miscInOrgRecycEntry, otherWasteRecycEntry, yardTrimmingsRecycEntry, foodRecycEntry, rltRecycEntry,
+                      woodRecycEntry, metalRecycEntry, glassRecycEntry, paperRecycEntry, plasticRecycEntry]
+
+
+
+#Creates buttons for checking, autofilling, and entering
+recycMSWButtonChecker = Button(my_frame2, text = ' Check Proportions ', command = lambda:checkEnteredGroup(recycMSWPropsEntry))
+recycMSWAutoButton = Button(my_frame2, text = ' Autofill 2018 Data', command = lambda: autofill(recycMSWPropsEntry, mswRecyc2018))
+recycMSWEnterButton = Button(my_frame2, text = 'Enter Above Dataset', command = lambda: enter(recycMSWPropsEntry, mswRecyc, recycMSWPropsValueLabels, IncinMSWPropsLabels, IncinMSWPropsEntry, incinMSWButtonChecker, incinMSWAutoButton, incinMSWEnterButton))
+
+
+
+#Incineration data input labels and entry boxes
+totalIncinLabel = Label(my_frame2, text = "Incineration Data", bg = 'white', font = 'Helvetica 12 bold')
+totalIncinMassLabel = Label(my_frame2, text = "Total Mass Incinerated: ", bg = 'white', font = fontChoice)
+miscInOrgIncinLabel = Label(my_frame2, text = "Misc. Inorganic Wastes (Fraction):", bg = 'white', font = fontChoice)
+otherWasteIncinLabel = Label(my_frame2, text = "Other Wastes (Fraction):", bg = 'white', font = fontChoice)
+yardTrimmingsIncinLabel = Label(my_frame2, text = "Yard Trimmings (Fraction):", bg = 'white', font = fontChoice)
+foodIncinLabel = Label(my_frame2, text = "Food (Fraction):", bg = 'white', font = fontChoice)
+rltIncinLabel = Label(my_frame2, text = "Rubber, Leather, Textiles (Fraction):", bg = 'white', font = fontChoice)
+woodIncinLabel = Label(my_frame2, text = "Wood (Fraction):", bg = 'white', font = fontChoice)
+metalIncinLabel = Label(my_frame2, text = "Metal (Fraction):", bg = 'white', font = fontChoice)
+glassIncinLabel = Label(my_frame2, text = "Glass (Fraction):", bg = 'white', font = fontChoice)
+paperIncinLabel = Label(my_frame2, text = "Paper and Paperboard (Fraction):", bg = 'white', font = fontChoice)
+plasticIncinLabel = Label(my_frame2, text = "Plastic (Fraction):", bg = 'white', font = fontChoice)
+
+totalIncinMassEntry = Entry(my_frame2, width = 50)
+miscInOrgIncinEntry = Entry(my_frame2, width = 50)
+otherWasteIncinEntry = Entry(my_frame2, width = 50)
+yardTrimmingsIncinEntry = Entry(my_frame2, width = 50)
+foodIncinEntry = Entry(my_frame2, width = 50)
+rltIncinEntry = Entry(my_frame2, width = 50)
+woodIncinEntry = Entry(my_frame2, width = 50)
+metalIncinEntry = Entry(my_frame2, width = 50)
+glassIncinEntry = Entry(my_frame2, width = 50)
+paperIncinEntry = Entry(my_frame2, width = 50)
+plasticIncinEntry = Entry(my_frame2, width = 50)
+
+
+#Creates lists for widget placement
+IncinMSWPropsLabels= [totalIncinLabel, totalIncinMassLabel, miscInOrgIncinLabel, otherWasteIncinLabel, yardTrimmingsIncinLabel, foodIncinLabel,
+                      rltIncinLabel, woodIncinLabel, metalIncinLabel, glassIncinLabel, paperIncinLabel, plasticIncinLabel]
+
+IncinMSWPropsEntry = [totalIncinMassEntry, miscInOrgIncinEntry, otherWasteIncinEntry, yardTrimmingsIncinEntry, foodIncinEntry, rltIncinEntry,
+                      woodIncinEntry, metalIncinEntry, glassIncinEntry, paperIncinEntry, plasticIncinEntry]
+
+
+
+#Creates buttons for checking, autofilling, and entering data
+incinMSWButtonChecker = Button(my_frame2, text = ' Check Proportions ', command = lambda:checkEnteredGroup(IncinMSWPropsEntry))
+incinMSWAutoButton = Button(my_frame2, text = ' Autofill 2018 Data', command = lambda: autofill(IncinMSWPropsEntry, mswIncin2018))
+incinMSWEnterButton = Button(my_frame2, text = 'Enter Above Dataset', command = lambda: enter(IncinMSWPropsEntry, mswIncin, IncinMSWPropsValueLabels, LandMSWPropsLabels, LandMSWPropsEntry, landMSWButtonChecker, landMSWAutoButton, landMSWEnterButton))
+
+
+
+#Compost data input labels and entry boxes
+totalCompostLabel = Label(my_frame2, text = "Compost Data", bg = 'white', font = 'Helvetica 12 bold')
+totalCompostMassLabel = Label(my_frame2, text = "Total Mass Compost: ", bg = 'white', font = fontChoice)
+miscInOrgCompostLabel = Label(my_frame2, text = "Misc. Inorganic Wastes (Fraction):", bg = 'white', font = fontChoice)
+otherWasteCompostLabel = Label(my_frame2, text = "Other Wastes (Fraction):", bg = 'white', font = fontChoice)
+yardTrimmingsCompostLabel = Label(my_frame2, text = "Yard Trimmings (Fraction):", bg = 'white', font = fontChoice)
+foodCompostLabel = Label(my_frame2, text = "Food (Fraction):", bg = 'white', font = fontChoice)
+rltCompostLabel = Label(my_frame2, text = "Rubber, Leather, Textiles (Fraction):", bg = 'white', font = fontChoice)
+woodCompostLabel = Label(my_frame2, text = "Wood (Fraction):", bg = 'white', font = fontChoice)
+metalCompostLabel = Label(my_frame2, text = "Metal (Fraction):", bg = 'white', font = fontChoice)
+glassCompostLabel = Label(my_frame2, text = "Glass (Fraction):", bg = 'white', font = fontChoice)
+paperCompostLabel = Label(my_frame2, text = "Paper and Paperboard (Fraction):", bg = 'white', font = fontChoice)
+plasticCompostLabel = Label(my_frame2, text = "Plastic (Fraction):", bg = 'white', font = fontChoice)
+
+totalCompostMassEntry = Entry(my_frame2, width = 50)
+miscInOrgCompostEntry = Entry(my_frame2, width = 50)
+otherWasteCompostEntry = Entry(my_frame2, width = 50)
+yardTrimmingsCompostEntry = Entry(my_frame2, width = 50)
+foodCompostEntry = Entry(my_frame2, width = 50)
+rltCompostEntry = Entry(my_frame2, width = 50)
+woodCompostEntry = Entry(my_frame2, width = 50)
+metalCompostEntry = Entry(my_frame2, width = 50)
+glassCompostEntry = Entry(my_frame2, width = 50)
+paperCompostEntry = Entry(my_frame2, width = 50)
+plasticCompostEntry = Entry(my_frame2, width = 50)
+
+#creates lists for widget placement
+CompostMSWPropsLabels= [totalCompostLabel, totalCompostMassLabel, miscInOrgCompostLabel, otherWasteCompostLabel, yardTrimmingsCompostLabel, foodCompostLabel,
+                      rltCompostLabel, woodCompostLabel, metalCompostLabel, glassCompostLabel, paperCompostLabel, plasticCompostLabel]
+
+CompostMSWPropsEntry = [totalCompostMassEntry, miscInOrgCompostEntry, otherWasteCompostEntry, yardTrimmingsCompostEntry, foodCompostEntry, rltCompostEntry,
+                      woodCompostEntry, metalCompostEntry, glassCompostEntry, paperCompostEntry, plasticCompostEntry]
+
+
+#Creates buttons for checking proportions, autofilling, and entering data
+compostMSWCheckerButton = Button(my_frame2, text = ' Check Proportions ', command = lambda:checkEnteredGroup(CompostMSWPropsEntry))
+compostMSWAutoButton = Button(my_frame2, text = ' Autofill 2018 Data', command = lambda: autofill(CompostMSWPropsEntry, mswCompost2018))
+compostMSWEnterButton = Button(my_frame2, text = 'Enter Above Dataset', command = lambda: enter(CompostMSWPropsEntry, mswCompost, CompostMSWPropsValueLabels, recycPlasticLabels, recycPlasticEntry, plasticRecycButtonChecker, plasticRecycAutoButton, plasticRecycEnterButton))
+
+
+#Landfill Data input labels and entries
+totalLandLabel = Label(my_frame2, text = "Landfill Data", bg = 'white', font = 'Helvetica 12 bold')
+totalLandMassLabel = Label(my_frame2, text = "Total Mass Landfilled: ", bg = 'white', font = fontChoice)
+miscInOrgLandLabel = Label(my_frame2, text = "Misc. Inorganic Wastes (Fraction):", bg = 'white', font = fontChoice)
+otherWasteLandLabel = Label(my_frame2, text = "Other Wastes (Fraction):", bg = 'white', font = fontChoice)
+yardTrimmingsLandLabel = Label(my_frame2, text = "Yard Trimmings (Fraction):", bg = 'white', font = fontChoice)
+foodLandLabel = Label(my_frame2, text = "Food (Fraction):", bg = 'white', font = fontChoice)
+rltLandLabel = Label(my_frame2, text = "Rubber, Leather, Textiles (Fraction):", bg = 'white', font = fontChoice)
+woodLandLabel = Label(my_frame2, text = "Wood (Fraction):", bg = 'white', font = fontChoice)
+metalLandLabel = Label(my_frame2, text = "Metal (Fraction):", bg = 'white', font = fontChoice)
+glassLandLabel = Label(my_frame2, text = "Glass (Fraction):", bg = 'white', font = fontChoice)
+paperLandLabel = Label(my_frame2, text = "Paper and Paperboard (Fraction):", bg = 'white', font = fontChoice)
+plasticLandLabel = Label(my_frame2, text = "Plastic (Fraction):", bg = 'white', font = fontChoice)
+
+totalLandMassEntry = Entry(my_frame2, width = 50)
+miscInOrgLandEntry = Entry(my_frame2, width = 50)
+otherWasteLandEntry = Entry(my_frame2, width = 50)
+yardTrimmingsLandEntry = Entry(my_frame2, width = 50)
+foodLandEntry = Entry(my_frame2, width = 50)
+rltLandEntry = Entry(my_frame2, width = 50)
+woodLandEntry = Entry(my_frame2, width = 50)
+metalLandEntry = Entry(my_frame2, width = 50)
+glassLandEntry = Entry(my_frame2, width = 50)
+paperLandEntry = Entry(my_frame2, width = 50)
+plasticLandEntry = Entry(my_frame2, width = 50)
+
+
+#Creates lists for widget placement
+LandMSWPropsLabels= [totalLandLabel, totalLandMassLabel, miscInOrgLandLabel, otherWasteLandLabel, yardTrimmingsLandLabel, foodLandLabel,
+                      rltLandLabel, woodLandLabel, metalLandLabel, glassLandLabel, paperLandLabel, plasticLandLabel]
+
+LandMSWPropsEntry = [totalLandMassEntry, miscInOrgLandEntry, otherWasteLandEntry, yardTrimmingsLandEntry, foodLandEntry, rltLandEntry,
+                      woodLandEntry, metalLandEntry, glassLandEntry, paperLandEntry, plasticLandEntry]
+
+
+
+#Creates buttons for checking, autofilling, and entering data
+landMSWButtonChecker = Button(my_frame2, text = ' Check Proportions ', command = lambda:checkEnteredGroup(LandMSWPropsEntry))
+landMSWAutoButton = Button(my_frame2, text = ' Autofill 2018 Data', command = lambda: autofill(LandMSWPropsEntry, mswLand2018))
+landMSWEnterButton = Button(my_frame2, text = 'Enter Above Dataset', command = lambda: enter(LandMSWPropsEntry, mswLand, LandMSWPropsValueLabels, CompostMSWPropsLabels, CompostMSWPropsEntry, compostMSWCheckerButton, compostMSWAutoButton, compostMSWEnterButton))
+
+
+
+#Types of plastics entry boxes and labels for recycled list
+plasticRecycProportionsLabel = Label(my_frame2, text = "Plastic Recycled Proportions", bg = 'white', font = 'Helvetica 12 bold')
+
+petRecycLabel = Label(my_frame2, text = "PET Proportion (Fraction):", bg = 'white', font = fontChoice)
+hdpeRecycLabel = Label(my_frame2, text = "HDPE Proportion (Fraction):", bg = 'white', font = fontChoice)
+pvcRecycLabel = Label(my_frame2, text = "PVC Proportion (Fraction):", bg = 'white', font = fontChoice)
+ldpeRecycLabel = Label(my_frame2, text = "LDPE Proportion (Fraction):", bg = 'white', font = fontChoice)
+ppRecycLabel = Label(my_frame2, text = "PP Proportion (Fraction):", bg = 'white', font = fontChoice)
+psRecycLabel = Label(my_frame2, text = "PS Proportion (Fraction):", bg = 'white', font = fontChoice)
+otherRecycPlasticsLabel = Label(my_frame2, text = "Other Plastics Proportion (Fraction):", bg = 'white', font = fontChoice)
+plaRecycLabel = Label(my_frame2, text = "PLA Proportion (Fraction):", bg = 'white', font = fontChoice)
+
+
+petRecycEntry = Entry(my_frame2, width=50)
+hdpeRecycEntry = Entry(my_frame2, width=50)
+pvcRecycEntry = Entry(my_frame2, width=50)
+ldpeRecycEntry = Entry(my_frame2, width=50)
+ppRecycEntry = Entry(my_frame2, width=50)
+psRecycEntry = Entry(my_frame2, width=50)
+otherRecycPlasticsEntry = Entry(my_frame2, width=50)
+plaRecycEntry = Entry(my_frame2, width=50)
+
+
+#Creates lists for widget placement 
+recycPlasticLabels = [plasticRecycProportionsLabel, petRecycLabel, hdpeRecycLabel, pvcRecycLabel, ldpeRecycLabel, plaRecycLabel, ppRecycLabel, psRecycLabel, otherRecycPlasticsLabel]
+recycPlasticEntry = [petRecycEntry, hdpeRecycEntry, pvcRecycEntry, ldpeRecycEntry, plaRecycEntry, ppRecycEntry, psRecycEntry, otherRecycPlasticsEntry]
+
+#Creates buttons for checking, autofilling, and entering data
+plasticRecycButtonChecker = Button(my_frame2, text = ' Check Proportions ', command = lambda:checkEnteredGroup(recycPlasticEntry))
+plasticRecycAutoButton = Button(my_frame2, text = ' Autofill 2018 Data', command = lambda: autofill(recycPlasticEntry, plasticRecycledFractionsList2018))
+plasticRecycEnterButton = Button(my_frame2, text = 'Enter Above Dataset', command = lambda: enter(recycPlasticEntry, plasticRecycledFractionsList, plasticRecycValueLabels, IncinPlasticLabels, IncinPlasticEntry, plasticIncinButtonChecker, plasticIncinAutoButton, plasticIncinEnterButton))
+
+
+
+
+
+
+#Types of plastics entry boxes and labels for landfilled list
+plasticLandProportionsLabel = Label(my_frame2, text = "Plastic Landfilled Proportions", bg = 'white', font = 'Helvetica 12 bold')
+
+petLandLabel = Label(my_frame2, text = "PET Proportion (Fraction):", bg = 'white', font = fontChoice)
+hdpeLandLabel = Label(my_frame2, text = "HDPE Proportion (Fraction):", bg = 'white', font = fontChoice)
+pvcLandLabel = Label(my_frame2, text = "PVC Proportion (Fraction):", bg = 'white', font = fontChoice)
+ldpeLandLabel = Label(my_frame2, text = "LDPE Proportion (Fraction):", bg = 'white', font = fontChoice)
+ppLandLabel = Label(my_frame2, text = "PP Proportion (Fraction):", bg = 'white', font = fontChoice)
+psLandLabel = Label(my_frame2, text = "PS Proportion (Fraction):", bg = 'white', font = fontChoice)
+otherLandPlasticsLabel = Label(my_frame2, text = "Other Plastics Proportion (Fraction):", bg = 'white', font = fontChoice)
+plaLandLabel = Label(my_frame2, text = "PLA Proportion (Fraction):", bg = 'white', font = fontChoice)
+
+
+petLandEntry = Entry(my_frame2, width=50)
+hdpeLandEntry = Entry(my_frame2, width=50)
+pvcLandEntry = Entry(my_frame2, width=50)
+ldpeLandEntry = Entry(my_frame2, width=50)
+ppLandEntry = Entry(my_frame2, width=50)
+psLandEntry = Entry(my_frame2, width=50)
+otherLandPlasticsEntry = Entry(my_frame2, width=50)
+plaLandEntry = Entry(my_frame2, width=50)
+
+
+#Creates lists for widget placement
+LandPlasticLabels = [plasticLandProportionsLabel, petLandLabel, hdpeLandLabel, pvcLandLabel, ldpeLandLabel, plaLandLabel, ppLandLabel, psLandLabel, otherLandPlasticsLabel]
+LandPlasticEntry = [petLandEntry, hdpeLandEntry, pvcLandEntry, ldpeLandEntry, plaLandEntry, ppLandEntry, psLandEntry, otherLandPlasticsEntry]
+
+
+#Creates buttons for checking, autofilling, and entering data
+plasticLandButtonChecker = Button(my_frame2, text = ' Check Proportions ', command = lambda:checkEnteredGroup(LandPlasticEntry))
+plasticLandAutoButton = Button(my_frame2, text = ' Autofill 2018 Data', command = lambda: autofill(LandPlasticEntry, plasticLandFractionsList))
+plasticLandEnterButton = Button(my_frame2, text = 'Enter Above Dataset', command = lambda: enter(LandPlasticEntry, plasticLandFractionsList, LandPlasticValueLabels, RepRecycPlasticLabels, RepRecycPlasticEntry, NONE, plasticRepRecycAutoButton, plasticRepRecycEnterButton))
+
+
+
+
+#Types of plastics entry boxes and labels for Incinerated list
+plasticIncinProportionsLabel = Label(my_frame2, text = "Plastic Incinerated Proportions", bg = 'white', font = 'Helvetica 12 bold')
+
+petIncinLabel = Label(my_frame2, text = "PET Proportion (Fraction):", bg = 'white', font = fontChoice)
+hdpeIncinLabel = Label(my_frame2, text = "HDPE Proportion (Fraction):", bg = 'white', font = fontChoice)
+pvcIncinLabel = Label(my_frame2, text = "PVC Proportion (Fraction):", bg = 'white', font = fontChoice)
+ldpeIncinLabel = Label(my_frame2, text = "LDPE Proportion (Fraction):", bg = 'white', font = fontChoice)
+ppIncinLabel = Label(my_frame2, text = "PP Proportion (Fraction):", bg = 'white', font = fontChoice)
+psIncinLabel = Label(my_frame2, text = "PS Proportion (Fraction):", bg = 'white', font = fontChoice)
+otherIncinPlasticsLabel = Label(my_frame2, text = "Other Plastics Proportion (Fraction):", bg = 'white', font = fontChoice)
+plaIncinLabel = Label(my_frame2, text = "PLA Proportion (Fraction):", bg = 'white', font = fontChoice)
+
+
+petIncinEntry = Entry(my_frame2, width=50)
+hdpeIncinEntry = Entry(my_frame2, width=50)
+pvcIncinEntry = Entry(my_frame2, width=50)
+ldpeIncinEntry = Entry(my_frame2, width=50)
+ppIncinEntry = Entry(my_frame2, width=50)
+psIncinEntry = Entry(my_frame2, width=50)
+otherIncinPlasticsEntry = Entry(my_frame2, width=50)
+plaIncinEntry = Entry(my_frame2, width=50)
+
+
+#Creates lists for placement of widgets
+IncinPlasticLabels = [plasticIncinProportionsLabel, petIncinLabel, hdpeIncinLabel, pvcIncinLabel, ldpeIncinLabel, plaIncinLabel, ppIncinLabel, psIncinLabel, otherIncinPlasticsLabel]
+IncinPlasticEntry = [petIncinEntry, hdpeIncinEntry, pvcIncinEntry, ldpeIncinEntry, plaIncinEntry, ppIncinEntry, psIncinEntry, otherIncinPlasticsEntry]
+
+#Creates buttons for checking, autofilling, and entering data
+plasticIncinButtonChecker = Button(my_frame2, text = ' Check Proportions ', command = lambda:checkEnteredGroup(IncinPlasticEntry))
+plasticIncinAutoButton = Button(my_frame2, text = ' Autofill 2018 Data', command = lambda: autofill(IncinPlasticEntry, plasticIncinFractionsList2018))
+plasticIncinEnterButton = Button(my_frame2, text = 'Enter Above Dataset', command = lambda: enter(IncinPlasticEntry, plasticIncinFractionsList, IncinPlasticValueLabels, LandPlasticLabels, LandPlasticEntry, plasticLandButtonChecker, plasticLandAutoButton, plasticLandEnterButton))
+
+
+#Types of plastics entry boxes and labels for reported recycled list
+plasticRepRecycProportionsLabel = Label(my_frame2, text = "Plastic Reported Recycled Masses", bg = 'white', font = 'Helvetica 12 bold')
+
+petRepRecycLabel = Label(my_frame2, text = "PET Proportion (Tons):", bg = 'white', font = fontChoice)
+hdpeRepRecycLabel = Label(my_frame2, text = "HDPE Proportion (Tons):", bg = 'white', font = fontChoice)
+pvcRepRecycLabel = Label(my_frame2, text = "PVC Proportion (Tons):", bg = 'white', font = fontChoice)
+ldpeRepRecycLabel = Label(my_frame2, text = "LDPE Proportion (Tons):", bg = 'white', font = fontChoice)
+ppRepRecycLabel = Label(my_frame2, text = "PP Proportion (Tons):", bg = 'white', font = fontChoice)
+psRepRecycLabel = Label(my_frame2, text = "PS Proportion (Tons):", bg = 'white', font = fontChoice)
+otherRepRecycPlasticsLabel = Label(my_frame2, text = "Other Plastics Proportion (Tons):", bg = 'white', font = fontChoice)
+plaRepRecycLabel = Label(my_frame2, text = "PLA Proportion (Tons):", bg = 'white', font = fontChoice)
+
+
+petRepRecycEntry = Entry(my_frame2, width=50)
+hdpeRepRecycEntry = Entry(my_frame2, width=50)
+pvcRepRecycEntry = Entry(my_frame2, width=50)
+ldpeRepRecycEntry = Entry(my_frame2, width=50)
+ppRepRecycEntry = Entry(my_frame2, width=50)
+psRepRecycEntry = Entry(my_frame2, width=50)
+otherRepRecycPlasticsEntry = Entry(my_frame2, width=50)
+plaRepRecycEntry = Entry(my_frame2, width=50)
+
+#Creates lists for widget placement
+RepRecycPlasticLabels = [plasticRepRecycProportionsLabel, petRepRecycLabel, hdpeRepRecycLabel, pvcRepRecycLabel, ldpeRepRecycLabel, plaRepRecycLabel, ppRepRecycLabel, psRepRecycLabel, otherRepRecycPlasticsLabel]
+RepRecycPlasticEntry = [petRepRecycEntry, hdpeRepRecycEntry, pvcRepRecycEntry, ldpeRepRecycEntry, plaRepRecycEntry, ppRepRecycEntry, psRepRecycEntry, otherRepRecycPlasticsEntry]
+
+
+#Creates buttons for autofilling and entering the data
+plasticRepRecycAutoButton = Button(my_frame2, text = ' Autofill 2018 Data', command = lambda: autofill(RepRecycPlasticEntry, repRecPlastics2018))
+plasticRepRecycEnterButton = Button(my_frame2, text = 'Enter Above Dataset', command = lambda: enter(RepRecycPlasticEntry, repRecPlastics, RepRecycPlasticValueLabel, ImportPlasticLabels, ImportPlasticEntry, NONE, plasticImportAutoButton, plasticImportEnterButton))
+
+
+
+#Types of plastics entry boxes and labels for import list
+plasticImportProportionsLabel = Label(my_frame2, text = "Plastic Imported Mass", bg = 'white', font = 'Helvetica 12 bold')
+
+ethyleneImportLabel = Label(my_frame2, text = "Ethylene Mass (Tons):", bg = 'white', font = fontChoice)
+vinylChlorideImportLabel = Label(my_frame2, text = "Vinyl Chloride Mass (Tons):", bg = 'white', font = fontChoice)
+styreneImportLabel = Label(my_frame2, text = "Styrene Mass (Tons):", bg = 'white', font = fontChoice)
+otherImportLabel = Label(my_frame2, text = "Other Plastics (Tons):", bg = 'white', font = fontChoice)
+
+
+ethyleneImportEntry = Entry(my_frame2, width=50)
+vinylChlorideImportEntry = Entry(my_frame2, width=50)
+styreneImportEntry = Entry(my_frame2, width=50)
+otherImportEntry = Entry(my_frame2, width=50)
+
+
+#Creates lists for widget placement
+ImportPlasticLabels = [plasticImportProportionsLabel, ethyleneImportLabel, vinylChlorideImportLabel, styreneImportLabel, otherImportLabel]
+ImportPlasticEntry = [ethyleneImportEntry, vinylChlorideImportEntry, styreneImportEntry, otherImportEntry]
+
+#Creates button for autofilling and entering the data
+plasticImportAutoButton = Button(my_frame2, text = ' Autofill 2018 Data', command = lambda: autofill(ImportPlasticEntry, repPlasticImport2018))
+plasticImportEnterButton = Button(my_frame2, text = 'Enter Above Dataset', command = lambda: enter(ImportPlasticEntry, repPlasticImport, ImportPlasticValueLabels, ExportPlasticLabels, ExportPlasticEntry, NONE, plasticExportAutoButton, plasticExportEnterButton))
+
+
+#Types of plastics entry boxes and labels for Export list
+plasticExportProportionsLabel = Label(my_frame2, text = "Plastic Exported Mass", bg = 'white', font = 'Helvetica 12 bold')
+
+ethyleneExportLabel = Label(my_frame2, text = "Ethylene Mass (Tons):", bg = 'white', font = fontChoice)
+vinylChlorideExportLabel = Label(my_frame2, text = "Vinyl Chloride Mass (Tons):", bg = 'white', font = fontChoice)
+styreneExportLabel = Label(my_frame2, text = "Styrene Mass (Tons):", bg = 'white', font = fontChoice)
+otherExportLabel = Label(my_frame2, text = "Other Plastics (Tons):", bg = 'white', font = fontChoice)
+
+
+ethyleneExportEntry = Entry(my_frame2, width=50)
+vinylChlorideExportEntry = Entry(my_frame2, width=50)
+styreneExportEntry = Entry(my_frame2, width=50)
+otherExportEntry = Entry(my_frame2, width=50)
+
+#Creates lists for widget placement
+ExportPlasticLabels = [plasticExportProportionsLabel, ethyleneExportLabel, vinylChlorideExportLabel, styreneExportLabel, otherExportLabel]
+ExportPlasticEntry = [ethyleneExportEntry, vinylChlorideExportEntry, styreneExportEntry, otherExportEntry]
+
+#Creates buttons for autofilling and entering data
+plasticExportAutoButton = Button(my_frame2, text = ' Autofill 2018 Data', command = lambda: autofill(ExportPlasticEntry, repPlasticsExport2018))
+plasticExportEnterButton = Button(my_frame2, text = 'Enter Above Dataset', command = lambda: enter(ExportPlasticEntry, repPlasticsExport, ExportPlasticValueLabels, ReExportPlasticLabels, ReExportPlasticEntry, NONE, plasticReExportAutoButton, plasticReExportEnterButton))
+
+
+#Types of plastics entry boxes and labels for ReExport list
+plasticReExportProportionsLabel = Label(my_frame2, text = "Plastic ReExported Mass", bg = 'white', font = 'Helvetica 12 bold')
+
+ethyleneReExportLabel = Label(my_frame2, text = "Ethylene Mass (Tons):", bg = 'white', font = fontChoice)
+vinylChlorideReExportLabel = Label(my_frame2, text = "Vinyl Chloride Mass (Tons):", bg = 'white', font = fontChoice)
+styreneReExportLabel = Label(my_frame2, text = "Styrene Mass (Tons):", bg = 'white', font = fontChoice)
+otherReExportLabel = Label(my_frame2, text = "Other Plastics (Tons):", bg = 'white', font = fontChoice)
+
+
+ethyleneReExportEntry = Entry(my_frame2, width=50)
+vinylChlorideReExportEntry = Entry(my_frame2, width=50)
+styreneReExportEntry = Entry(my_frame2, width=50)
+otherReExportEntry = Entry(my_frame2, width=50)
+
+#Creates lists for widget placement
+ReExportPlasticLabels = [plasticReExportProportionsLabel, ethyleneReExportLabel, vinylChlorideReExportLabel, styreneReExportLabel, otherReExportLabel]
+ReExportPlasticEntry = [ethyleneReExportEntry, vinylChlorideReExportEntry, styreneReExportEntry, otherReExportEntry]
+
+#Creates buttons for autofilling and entering data
+plasticReExportAutoButton = Button(my_frame2, text = ' Autofill 2018 Data', command = lambda: autofill(ReExportPlasticEntry, repPlasticsReExport2018))
+plasticReExportEnterButton = Button(my_frame2, text = 'Enter Above Dataset', command = lambda: enter(ReExportPlasticEntry, repPlasticsReExport, ReExportPlasticValueLabels, conditionsLabelsListForPlacement, conditionsEntryListForPlacement, conditionsButtonChecker, conditionsAutoButton, conditionsEnterButton))
+
+
+#Creates lists of labels and entries to allow for a loop to place them on screen
+customLabelsList = [conditionsLabelsListForPlacement, typesOfWasteLabels, recycMSWPropsLabels, IncinMSWPropsLabels, LandMSWPropsLabels, 
+                    CompostMSWPropsLabels, recycPlasticLabels, IncinPlasticLabels, LandPlasticLabels, RepRecycPlasticLabels, ImportPlasticLabels, 
+                    ExportPlasticLabels, ReExportPlasticLabels]
+
+
+customEntryList = [conditionsEntryListForPlacement, typesOfWasteEntry, recycMSWPropsEntry, IncinMSWPropsEntry, LandMSWPropsEntry, CompostMSWPropsEntry,
+                   recycPlasticEntry,IncinPlasticEntry, LandPlasticEntry, RepRecycPlasticEntry, ImportPlasticEntry, ExportPlasticEntry,
+                   ReExportPlasticEntry]
+
+#Cancels a running calculation when any entry box is edited
+for i in customEntryList:
+    for b in i:
+        b.bind('<Key>', entryEdited, add = '+')
+
+#Gap labels to appropriately space widgets on screen
+gapLabel1 = Label(my_frame2, bg = 'white')
+gapLabel2 = Label(my_frame2, bg = 'white')
+gapLabel3 = Label(my_frame2, bg = 'white', text = 'Status:', font = fontChoice)
+gapLabel4 = Label(my_frame7, bg = 'white', text = '                     ')
+gapLabel5 = Label(my_frame7, bg = 'white', text = '________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________')
+gapLabel6 = Label(my_frame7, bg = 'white', text = '                     ')
+gapLabel7 = Label(my_frame7, bg = 'white', text = '________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________')
+gapLabel8 = Label(my_frame7, bg = 'white', text = '                     ')
+gapLabel9 = Label(my_frame7, bg = 'white', text = '________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________')
+gapLabel10 = Label(my_frame7, bg = 'white', text = '                     ')
+gapLabel11 = Label(my_frame7, bg = 'white', text = '________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________')
+gapLabel12 = Label(my_frame7, bg = 'white', text = '                     ')
+gapLabel13 = Label(my_frame7, bg = 'white', text = '                     ')
+gapLabel14 = Label(my_frame7, bg = 'white', text = '                     ')
+gapLabel15 = Label(my_frame7, bg = 'white', text = '                     ')
+gapLabel16 = Label(my_frame2, bg = 'white', text = '                     ')
+gapLabel17 = Label(my_frame7, bg = 'white', text = '                     ')
+
+
+innerGap1 = Label(my_frame2, bg = 'white')
+innerGap2 = Label(my_frame2, bg = 'white')
+innerGap3 = Label(my_frame2, bg = 'white')
+innerGap4 = Label(my_frame2, bg = 'white')
+innerGap5 = Label(my_frame2, bg = 'white')
+innerGap6 = Label(my_frame2, bg = 'white')
+innerGap7 = Label(my_frame2, bg = 'white')
+innerGap8 = Label(my_frame2, bg = 'white')
+innerGap9 = Label(my_frame2, bg = 'white')
+innerGap10 = Label(my_frame2, bg = 'white')
+innerGap11 = Label(my_frame2, bg = 'white')
+innerGap12 = Label(my_frame2, bg = 'white')
+innerGap13 = Label(my_frame2, bg = 'white')
+innerGap14 = Label(my_frame2, bg = 'white')
+
+#Creates more lists of widgets for easier placement on screen
+gapLabelsList = [gapLabel4, gapLabel5, gapLabel6, gapLabel7, gapLabel8, gapLabel9, gapLabel10, gapLabel11,
+                 gapLabel12, gapLabel13, gapLabel14, gapLabel15]
+
+innerGapLabelsList = [innerGap1, innerGap2, innerGap3, innerGap4, innerGap5, innerGap6, innerGap7, innerGap8, innerGap9, innerGap10, 
+                      innerGap11, innerGap12, innerGap13, innerGap14]
+
+checkButtonList = [conditionsButtonChecker, mswCompButtonCheck, recycMSWButtonChecker, incinMSWButtonChecker,  landMSWButtonChecker, 
+                   compostMSWCheckerButton, plasticRecycButtonChecker, plasticIncinButtonChecker, plasticLandButtonChecker]
+
+extraButTonsList = [conditionsAutoButton, conditionsEnterButton, mswCompAuto, mswCompEnter, recycMSWAutoButton, recycMSWEnterButton,
+                    incinMSWAutoButton, incinMSWEnterButton, landMSWAutoButton, landMSWEnterButton, compostMSWAutoButton, compostMSWEnterButton,
+                    plasticRecycAutoButton, plasticRecycEnterButton, plasticIncinAutoButton, plasticIncinEnterButton, plasticLandAutoButton,
+                    plasticLandEnterButton, plasticRepRecycAutoButton, plasticRepRecycEnterButton, plasticImportAutoButton, plasticImportEnterButton,
+                    plasticExportAutoButton, plasticExportEnterButton, plasticReExportAutoButton, plasticReExportEnterButton]
+
+# title label and placement
+userSpecificationsLabel = Label(my_frame2, text = "User Specifications", bg = 'white', font = 'Helvetica 14 bold')
+userSpecificationsLabel.grid(column = 1, row = 10, columnspan = 2)
+
+#Progress bar shown in place of the status text (gapLabel1) while a calculation runs
+calculationProgress = ttk.Progressbar(my_frame2, orient = 'horizontal', length = 300, mode = 'determinate', maximum = 1)
+
+#Calculation currently running on a worker thread, None when nothing is running
+currentCalculation = None
+
+#Function connected to calculate button to extract values from entry boxes, append to list
+    # and complete appropriate calculations MJC
+#The calculations run on a worker thread that never touches a widget. Progress and results are passed back through a queue
+#that checkCalculation reads on the Tk main thread
+def calculateWasteProportions():
+    cancelCalculation() #an earlier run is stale now
+    
+    inputs = gatherEnteredInputs()
+    if inputs is None:
+        return
+    runInBackground(lambda progress: calculateStreams(progress = progress, **inputs), showCalculationResults)
+
+def showCalculationResults(results):
+    showCalculations(results)
+    fillMatFlowAnalSumTRVW()
+    
+    violations = checkMassBalance(results)
+    if violations:
+        largest = violations[0]
+        gapLabel1.config(text = 'Calculations Complete. Mass balance off for ' + str(len(violations)) + ' stage/species pairs, most in ' + largest.stage +
+                         ' for ' + largest.species + ' (' + '{:,}'.format(round(largest.difference)) + ' tons)', fg = 'red')
+
+#Runs job(progress) on a worker thread with the progress bar shown, then passes its result to onDone on the Tk thread.
+#progress raises CalculationCancelled once the run has been cancelled, which stops the job
+def runInBackground(job, onDone):
+    global currentCalculation
+    cancelCalculation()
+    calculation = {'cancelled':threading.Event(), 'messages':queue.Queue(), 'onDone':onDone}
+    
+    def progress(fraction): #called on the worker thread by the job
+        if calculation['cancelled'].is_set():
+            raise CalculationCancelled()
+        calculation['messages'].put(('progress', fraction))
+    
+    def work():
+        try:
+            calculation['messages'].put(('done', job(progress)))
+        except CalculationCancelled:
+            pass
+        except Exception as error:
+            calculation['messages'].put(('error', error))
+    
+    currentCalculation = calculation
+    gapLabel1.grid_remove()
+    calculationProgress['value'] = 0
+    calculationProgress.grid(column = 2, row = 12, sticky = W)
+    threading.Thread(target = work, daemon = True).start()
+    EoLPlasticgui.after(20, checkCalculation, calculation)
+
+#Reads progress and results from the worker, rescheduling itself with after() until the calculation is finished
+def checkCalculation(calculation):
+    if calculation is not currentCalculation: #cancelled or replaced by a newer run, results are thrown away
+        return
+    while True:
+        try:
+            kind, value = calculation['messages'].get_nowait()
+        except queue.Empty:
+            break
+        if kind == 'progress':
+            calculationProgress['value'] = value
+        else:
+            finishCalculation()
+            if kind == 'done':
+                calculation['onDone'](value)
+            else:
+                gapLabel1.config(text = 'Error during calculations: ' + str(value), fg = 'red')
+            return
+    EoLPlasticgui.after(20, checkCalculation, calculation)
+
+#Hides the progress bar and brings back the status text
+def finishCalculation():
+    global currentCalculation
+    currentCalculation = None
+    calculationProgress.grid_remove()
+    gapLabel1.grid()
+
+#Stops a running calculation because the inputs it was started with have changed
+def cancelCalculation():
+    if currentCalculation is not None:
+        currentCalculation['cancelled'].set()
+        finishCalculation()
+        gapLabel1.config(text = 'Calculation cancelled, inputs changed.')
+
+#Typing into an entry box makes a running calculation stale, and ends live mode, which works from the inputs it started with
+def entryEdited(event):
+    if event.char or event.keysym in ('BackSpace', 'Delete'):
+        cancelCalculation()
+        leaveLiveMode()
+
+#Create Button that will assign values and make calculations based on input 
+calculateButton = Button(my_frame2, text=" Calculate Streams ", command=calculateWasteProportions)
+
+#Grids conditions widgets at boot up
+conditionsLabelsList[0].grid(column = 1, row = 11, columnspan = 2)
+gapLabel1.grid(column = 2, row = 12, sticky = W)
+gapLabel3.grid(column = 1, row = 12, sticky = E)
+frameRow = 13
+for i in range(len(conditionsLabelsListForPlacement)-1):
+    conditionsLabelsListForPlacement[i+1].grid(column = 1, row = frameRow, sticky = E)
+    conditionsEntryListForPlacement[i].grid(column = 2, row = frameRow, sticky = W)
+    frameRow+=1
+gapLabel2.grid(column = 1, row = frameRow, columnspan = 2)
+frameRow +=1
+conditionsButtonChecker.grid(column = 1, row = frameRow, columnspan = 2)
+frameRow +=1
+conditionsAutoButton.grid(column = 1, row = frameRow, columnspan = 2)
+frameRow +=1
+conditionsEnterButton.grid(column = 1, row = frameRow, columnspan = 2)
+frameRow +=1
+calculateButton.grid(column=1, row=frameRow, columnspan = 2)
+
+
+#Function that will remove category widgets from screen 
+def removeLabels():
+    for i in customLabelsList:
+        for b in i:
+            b.grid_remove()
+    for c in customEntryList:
+        for q in c:
+            q.grid_remove()
+    for v in checkButtonList:
+        v.grid_remove()
+    gapLabel2.grid_remove()
+    calculateButton.grid_remove()
+    for i in extraButTonsList:
+        i.grid_remove()
+            
+#function that will add next set of widgets to stream
+def showSection(label, entry, checkButton, autofill, enter):
+    removeLabels()
+    gapLabel1.config(text = '')
+    frameRow = 13
+    label[0].grid(column = 1, row = 11, columnspan = 2)
+    for i in range(len(label)-1):
+        label[i+1].grid(column = 1, row = frameRow, sticky = E)
+        frameRow += 1
+    frameRow = 13
+    for i in entry:
+        i.grid(column = 2, row = frameRow, sticky = W)
+        frameRow += 1
+    gapLabel2.grid(column = 1, row = frameRow, columnspan = 2)
+    frameRow+=1
+    if checkButton != NONE:
+        checkButton.grid(column = 1, row = frameRow, columnspan = 2)
+        frameRow+=1
+   
+    autofill.grid(column = 1, row = frameRow, columnspan = 2)
+    frameRow+=1
+    enter.grid(column = 1, row = frameRow, columnspan = 2)
+    frameRow+=1
+    calculateButton.grid(column = 1, row = frameRow, columnspan = 2)
+    
+
+#Menu at left of buttons that will change list of available entries
+showConditionsButton = Button(my_frame2, text = 'Conditions', command = lambda:showSection(conditionsLabelsListForPlacement, conditionsEntryListForPlacement, conditionsButtonChecker, conditionsAutoButton, conditionsEnterButton))
+showMSWCompButton = Button(my_frame2, text = 'MSW Composition', command = lambda: showSection(typesOfWasteLabels, typesOfWasteEntry, mswCompButtonCheck, mswCompAuto, mswCompEnter))
+showrecycMSWButton = Button(my_frame2, text = 'MSW Recycling', command = lambda:showSection(recycMSWPropsLabels, recycMSWPropsEntry, recycMSWButtonChecker, recycMSWAutoButton, recycMSWEnterButton))
+showincinMSWButton = Button(my_frame2, text = 'MSW Incineration', command = lambda: showSection(IncinMSWPropsLabels, IncinMSWPropsEntry, incinMSWButtonChecker, incinMSWAutoButton, incinMSWEnterButton))
+showlandMSWButton = Button(my_frame2, text = 'MSW Landfill', command = lambda:showSection(LandMSWPropsLabels, LandMSWPropsEntry, landMSWButtonChecker, landMSWAutoButton, landMSWEnterButton))
+showcompostMSWButton = Button(my_frame2, text = "MSW Compost", command = lambda: showSection(CompostMSWPropsLabels, CompostMSWPropsEntry, compostMSWCheckerButton, compostMSWAutoButton, compostMSWEnterButton))
+showPlasticRecycButton = Button(my_frame2, text = 'Plastic Recycling', command = lambda: showSection(recycPlasticLabels, recycPlasticEntry, plasticRecycButtonChecker, plasticRecycAutoButton, plasticRecycEnterButton))
+showIncinPlasticButton = Button(my_frame2, text = 'Incinerated Plastic', command = lambda: showSection(IncinPlasticLabels, IncinPlasticEntry, plasticIncinButtonChecker, plasticIncinAutoButton, plasticIncinEnterButton))
+showLandPlasticButton = Button(my_frame2, text = 'Landfilled Plastic', command = lambda: showSection(LandPlasticLabels, LandPlasticEntry, plasticLandButtonChecker, plasticLandAutoButton, plasticLandEnterButton))
+showRepRecycButton = Button(my_frame2, text = 'Reported Recycled Masses', command = lambda: showSection(RepRecycPlasticLabels, RepRecycPlasticEntry, NONE, plasticRepRecycAutoButton, plasticRepRecycEnterButton))
+showImportButton = Button(my_frame2, text = 'Imported Plastic', command = lambda: showSection(ImportPlasticLabels, ImportPlasticEntry, NONE, plasticImportAutoButton, plasticImportEnterButton))
+showExportButton = Button(my_frame2, text = 'Exported Plastics', command = lambda: showSection(ExportPlasticLabels, ExportPlasticEntry, NONE, plasticExportAutoButton, plasticExportEnterButton))
+showReExportButton = Button(my_frame2, text = 'Re-Exported Plastics', command = lambda: showSection(ReExportPlasticLabels, ReExportPlasticEntry, NONE, plasticReExportAutoButton, plasticReExportEnterButton))
+
+#Creates list of these buttons above
+showButtonLists = [showConditionsButton, showMSWCompButton, showrecycMSWButton, showincinMSWButton, showlandMSWButton, showcompostMSWButton, 
+                   showPlasticRecycButton, showIncinPlasticButton, showLandPlasticButton, showRepRecycButton, showImportButton, showExportButton,
+                   showReExportButton]
+frameRow =11
+
+#loop that places these buttons
+for i in showButtonLists:
+    i.grid(column = 0, row = frameRow, sticky = EW)
+    frameRow +=1
+
+#List of strings that will be used as confirmation after each set of data is entered
+listOfEntryCategories = {str(conditionsentryList):"Conditions Data Entered", str(typesOfWasteEntry): "Municipal Solid Waste Composition Data Entered", str(recycMSWPropsEntry): "MSW Recycling Data Entered", 
+                         str(LandMSWPropsEntry): "MSW Landfill Data Entered", str(IncinMSWPropsEntry): "MSW Incineration Data Entered", str(CompostMSWPropsEntry): "MSW Compost Data Entered", 
+                         str(recycPlasticEntry): "Plastic Recycled Data Entered", str(IncinPlasticEntry): "Plastic Incinerated Data Entered", str(LandPlasticEntry): "Plastic Landfill Data Entered",
+                         str(RepRecycPlasticEntry): "Reported Recycling Data Entered", str(ImportPlasticEntry): "Import Data Entered", str(ExportPlasticEntry): "Export Data Entered", 
+                         str(ReExportPlasticEntry): "Re-Export Data Entered"}
+
+#Group of entries filling each input list, and the other way round
+entriesOfInputGroup = {'conditions': conditionsentryList, 'mswCompProp': typesOfWasteEntry, 'mswRecyc': recycMSWPropsEntry, 'mswLand': LandMSWPropsEntry,
+                       'mswIncin': IncinMSWPropsEntry, 'mswCompost': CompostMSWPropsEntry, 'plasticRecycledFractionsList': recycPlasticEntry,
+                       'plasticIncinFractionsList': IncinPlasticEntry, 'plasticLandFractionsList': LandPlasticEntry, 'repRecPlastics': RepRecycPlasticEntry,
+                       'repPlasticImport': ImportPlasticEntry, 'repPlasticsExport': ExportPlasticEntry, 'repPlasticsReExport': ReExportPlasticEntry}
+inputGroupOfEntries = {str(entries): group for group, entries in entriesOfInputGroup.items()}
+
+#Reads every group of entry boxes as the user left them into its input list, then gathers the inputs. Unlike the Enter
+#buttons this moves no sections and starts no calculation, so the message about a bad entry stays on screen
+def gatherEnteredInputs():
+    for group, entries in entriesOfInputGroup.items():
+        values = checkEntries(entries)
+        if values is None:
+            gapLabel1.config(text = inputGroups[group]['title'] + ': ' + gapLabel1.cget('text'))
+            return None
+        globals()[group][:] = values
+    return gatherInputs()
+
+
+####################################################
+### Scenario library
+
+#Library kept next to this script unless the user opens another file
+scenarioLibraryPath = os.path.join(dataFolder, 'EoL Plastic Scenarios.npz')
+if os.path.exists(scenarioLibraryPath):
+    scenarioLibrary = ScenarioLibrary.load(scenarioLibraryPath)
+else:
+    scenarioLibrary = ScenarioLibrary()
+
+#Puts a saved scenario into the entry boxes and the input lists, ready to calculate
+def loadScenario():
+    name = scenarioChooser.get()
+    if name not in scenarioLibrary:
+        gapLabel1.config(text = 'Please choose a saved scenario.', fg = 'red')
+        return
+    cancelCalculation()
+    inputs = scenarioLibrary.inputs(name)
+    for group, entries in entriesOfInputGroup.items():
+        autofill(entries, inputs[group])
+        globals()[group][:] = inputs[group]
+    gapLabel1.config(text = 'Scenario ' + name + ' loaded', fg = 'black')
+
+#Checks every group of entries and saves them under a name the user chooses
+def saveScenario():
+    inputs = {}
+    for group, entries in entriesOfInputGroup.items():
+        values = checkEntries(entries)
+        if values is None:
+            return
+        inputs[group] = values
+    name = simpledialog.askstring('Save Scenario', 'Scenario name:', parent = EoLPlasticgui)
+    if not name:
+        return
+    if name in scenarioLibrary and not messagebox.askyesno('Save Scenario', 'Replace the saved scenario ' + name + '?'):
+        return
+    scenarioLibrary.add(name, inputs)
+    scenarioLibrary.save(scenarioLibraryPath)
+    scenarioChooser.config(values = scenarioLibrary.names)
+    scenarioChooser.set(name)
+    gapLabel1.config(text = 'Scenario ' + name + ' saved', fg = 'black')
+
+def openScenarioLibrary():
+    global scenarioLibrary, scenarioLibraryPath
+    path = filedialog.askopenfilename(title = 'Open Scenario Library', filetypes = [('Scenario library', '*.npz')])
+    if not path:
+        return
+    try:
+        scenarioLibrary = ScenarioLibrary.load(path)
+    except (OSError, ValueError, KeyError) as error:
+        gapLabel1.config(text = 'Could not open scenario library: ' + str(error), fg = 'red')
+        return
+    scenarioLibraryPath = path
+    scenarioChooser.config(values = scenarioLibrary.names)
+    scenarioChooser.set('')
+    gapLabel1.config(text = str(len(scenarioLibrary)) + ' scenarios in ' + os.path.basename(path), fg = 'black')
+
+#Scenario widgets go under the category buttons on the left
+scenarioLabel = Label(my_frame2, text = 'Saved Scenarios', bg = 'white', font = fontChoice)
+scenarioChooser = ttk.Combobox(my_frame2, values = scenarioLibrary.names, state = 'readonly')
+loadScenarioButton = Button(my_frame2, text = 'Load Scenario', command = loadScenario)
+saveScenarioButton = Button(my_frame2, text = 'Save Scenario', command = saveScenario)
+openScenarioLibraryButton = Button(my_frame2, text = 'Open Scenario Library', command = openScenarioLibrary)
+
+frameRow = 11 + len(showButtonLists) + 1
+for i in [scenarioLabel, scenarioChooser, loadScenarioButton, saveScenarioButton, openScenarioLibraryButton]:
+    i.grid(column = 0, row = frameRow, sticky = EW)
+    frameRow +=1
+
+
+####################################################
+### Optimizer
+
+#Searches the recycling efficiency and incineration/landfill split for the lowest additive release
+#(streams 9, 25 and 29) with total GHG at or under the limit entered, starting from the entered inputs
+def optimizeEnteredInputs():
+    inputs = gatherEnteredInputs()
+    if inputs is None:
+        return
+    try:
+        ghgLimit = float(ghgLimitEntry.get())
+    except ValueError:
+        gapLabel1.config(text = 'Error: Please enter a number for the GHG limit.', fg = 'red')
+        return
+    runInBackground(lambda progress: optimizeReleases(inputs, ghgLimit, progress = progress), showOptimizationResult)
+
+#Puts the optimized conditions into the entry boxes and shows the streams they give
+def showOptimizationResult(result):
+    autofill(conditionsentryList, result.inputs['conditions'])
+    conditions[:] = result.inputs['conditions']
+    showCalculationResults(result.results)
+    if result.feasible:
+        gapLabel1.config(text = 'Lowest additive release: ' + trvwRounder(result.release) + ' tons with ' + trvwRounder(result.ghg) + 
+                         ' tons CO2-eq. Conditions updated.', fg = 'black')
+    else:
+        gapLabel1.config(text = 'No settings meet the GHG limit, the lowest GHG found is ' + trvwRounder(result.ghg) + ' tons CO2-eq. Conditions updated.', fg = 'red')
+
+optimizerLabel = Label(my_frame2, text = 'GHG Limit (Tons CO2-eq)', bg = 'white', font = fontChoice)
+ghgLimitEntry = Entry(my_frame2)
+optimizeButton = Button(my_frame2, text = 'Minimize Additive Release', command = optimizeEnteredInputs)
+
+frameRow +=1
+for i in [optimizerLabel, ghgLimitEntry, optimizeButton]:
+    i.grid(column = 0, row = frameRow, sticky = EW)
+    frameRow +=1
+
+
+####################################################
+### Live mode
+
+#Sliders for the recycling efficiency and incineration/landfill split (see optimizerConditions) that recalculate the entered
+#inputs as they move. Starting live mode compiles a LivePreview of the entered inputs, and each move only rewrites the
+#values the sliders change from it, on the Tk thread. Slider moves are gathered for liveDelay ms and shown once with the
+#latest values. The preview's stream 3 GHG is first order, so once the sliders rest for liveSettleDelay ms the engine is
+#run once to show the exact results. The charts and LCI tables are updated in place: the pie chart is left alone since the
+#MSW composition can't change, and only LCI rows with new values are rewritten. Editing, entering or checking any entries
+#leaves live mode
+liveDelay = 16
+liveSettleDelay = 300
+livePreview = None #LivePreview of the inputs live mode started from, None when it is off
+liveUpdate = None #after() id of the pending preview
+liveSettle = None #after() id of the pending exact calculation
+liveShares = None #slider values of the results on screen
+
+#Starts or stops live mode. Starting needs a full set of valid inputs, like Calculate Streams
+def toggleLiveMode():
+    global livePreview, liveShares
+    if not liveMode.get():
+        stopLiveMode()
+        return
+    inputs = gatherEnteredInputs()
+    if inputs is None:
+        liveMode.set(False)
+        return
+    cancelCalculation()
+    
+    livePreview = LivePreview(inputs)
+    shares = conditionShares(inputs['conditions'])
+    for slider, name in zip(liveSliders, optimizerVariables):
+        slider.set(shares[name])
+        slider.grid()
+    liveShares = [float(slider.get()) for slider in liveSliders] #as the sliders show them, so setting them doesn't start a recalculation
+    drawPieChart(livePreview.results['mswCompProp'])
+    showLiveResults(livePreview.results)
+    gapLabel1.config(text = 'Live mode on: slider moves update the ' + str(len(livePreview.outputNames)) + ' values they change.', fg = 'black')
+
+#Turns live mode off when the entries are changed another way, so the sliders don't overwrite them
+def leaveLiveMode():
+    if liveMode.get():
+        liveMode.set(False)
+        stopLiveMode()
+
+def stopLiveMode():
+    global livePreview, liveUpdate
+    if liveUpdate is not None:
+        EoLPlasticgui.after_cancel(liveUpdate)
+        liveUpdate = None
+    if liveSettle is not None: #leaves the exact results on screen rather than the preview
+        EoLPlasticgui.after_cancel(liveSettle)
+        settleLive()
+    livePreview = None
+    for slider in liveSliders:
+        slider.grid_remove()
+    gapLabel1.config(text = 'Live mode off.', fg = 'black')
+
+def liveSliderMoved(value):
+    global liveUpdate
+    if livePreview is not None and liveUpdate is None:
+        liveUpdate = EoLPlasticgui.after(liveDelay, recalculateLive)
+
+def recalculateLive():
+    global liveUpdate, liveSettle, liveShares
+    liveUpdate = None
+    shares = [float(slider.get()) for slider in liveSliders]
+    if livePreview is None or shares == liveShares:
+        return
+    if liveSettle is not None:
+        EoLPlasticgui.after_cancel(liveSettle)
+        liveSettle = None
+    started = time.perf_counter()
+    try:
+        results, newConditions = livePreview.update(*shares)
+    except ArithmeticError: #e.g. a stream the engine divides by is empty at the end of a slider
+        gapLabel1.config(text = 'Live mode: the model cannot be calculated at these settings.', fg = 'red')
+        return
+    liveShares = shares
+    conditions[:] = newConditions
+    autofill(conditionsentryList, newConditions)
+    showLiveResults(results)
+    showLiveStatus('Live preview', results, started)
+    liveSettle = EoLPlasticgui.after(liveSettleDelay, settleLive)
+
+#Replaces the preview with an exact run of the engine once the sliders rest
+def settleLive():
+    global liveSettle
+    liveSettle = None
+    if livePreview is None:
+        return
+    started = time.perf_counter()
+    try:
+        results = calculateStreams(**dict(livePreview.inputs, conditions = optimizerConditions(livePreview.inputs['conditions'], *liveShares)))
+    except ArithmeticError:
+        return #the preview already stopped at these settings
+    showLiveResults(results)
+    showLiveStatus('Live (exact)', results, started)
+
+def showLiveStatus(title, results, started):
+    gapLabel1.config(text = title + ': additive release ' + str(trvwRounder(additiveRelease(results))) + ' tons, GHG ' + str(trvwRounder(totalGHG(results))) +
+                     ' tons CO2-eq (' + str(round(1000*(time.perf_counter()-started), 1)) + ' ms)', fg = 'black')
+
+#Shows a live result on the bar chart, the LCI tables and the stream summary if its window is open
+def showLiveResults(results):
+    storeResults(results)
+    drawBarChart(list(results['amountOfPlasticRecycled'].values()), list(results['plasticsMassDict'].values()))
+    updateLCITables(results)
+    if streamSummaryPopup is not None and streamSummaryPopup.winfo_exists() and streamSummaryPopup.winfo_viewable():
+        streamSummaryTable.setRows(list(streamTRVWLists)) #a new list, since the preview changes the rows in place and the table keeps formatted cells of the same rows
+
+liveMode = BooleanVar(value = False)
+liveModeButton = Checkbutton(my_frame2, text = 'Live Mode', variable = liveMode, command = toggleLiveMode, bg = 'white', font = fontChoice)
+liveSliders = [Scale(my_frame2, label = label, from_ = 0, to = 1, resolution = 0, digits = 4, orient = HORIZONTAL, bg = 'white', command = liveSliderMoved)
+               for label in ['Recycling Efficiency', 'Incinerated Share of Unrecycled']]
+
+frameRow +=1
+liveModeButton.grid(column = 0, row = frameRow, sticky = EW)
+for slider in liveSliders:
+    frameRow +=1
+    slider.grid(column = 0, row = frameRow, sticky = EW)
+    slider.grid_remove()
+        
+
+####################################################
+### Stream Summary Tab
+
+#creates and adds canvas that will hold frame for plots (canvas created to allow for scrollbar)
+plotCanvas = Canvas(dataAnalysisFrame, bg = 'white')
+plotFrame = Frame(plotCanvas, bg = 'white')
+plotScrollBar = Scrollbar(dataAnalysisFrame, orient = 'vertical', command = plotCanvas.yview)
+plotScrollBar.pack(side = RIGHT, fill = Y)
+plotCanvas.pack(fill = BOTH, expand = 1)
+
+#creates and configures scrollbar for plot frame
+plotScrollBar.config(command = plotCanvas.yview)
+plotCanvas['yscrollcommand'] = plotScrollBar.set
+plotCanvas.bind('<Configure>', lambda e: plotCanvas.configure(scrollregion = plotCanvas.bbox('all')))
+plotCanvas.create_window((0,0), window = plotFrame, anchor = 'nw')
+
+
+#Function that will be used to display frame that contains labels of user input
+def displayInput():
+    dataAnalysisCanvas.pack(fill = BOTH, expand = 1)
+    my_frame7.pack(side = LEFT, fill = BOTH, expand = 1)
+    dataAnalysisScrollBar.config(command=dataAnalysisCanvas.yview)
+
+    dataAnalysisCanvas['yscrollcommand']=dataAnalysisScrollBar.set
+    
+    dataAnalysisCanvas.bind('<Configure>', lambda e: dataAnalysisCanvas.configure(scrollregion = dataAnalysisCanvas.bbox('all')))
+
+    dataAnalysisCanvas.create_window((0,0), window = my_frame7, anchor = 'nw')
+    my_program.bind_all('<MouseWheel>', lambda event: dataAnalysisCanvas.yview_scroll(int(-1*(event.delta/120)), "units"))
+
+#Function that will be used to hide frame that contains labels of user input
+def hideInput():
+    dataAnalysisCanvas.pack_forget()
+    my_frame7.pack_forget()
+
+#Creates and places buttons for above two functions
+displayInputButton = Button(dataAnalysisFrame, text = 'Display User Input', command = displayInput)
+hideInputButton = Button(dataAnalysisFrame, text = 'Hide User Input', command = hideInput)
+
+displayInputButton.pack()
+hideInputButton.pack()
+
+
+
+#Creates and configures titles for data analysis frames
+dataAnalTitle = tk.Text(my_frame7, bd=0, highlightthickness = 0, bg = "white", height=1, width=125)
+dataAnalTitle.insert(tk.INSERT,"User Specifications")
+dataAnalTitle.tag_configure("center", justify = 'center')
+dataAnalTitle.tag_add("center", 1.0, 'end')
+dataAnalTitle.configure(font = ("Helvetica 16 bold"))
+dataAnalTitle.config(state="disabled")
+dataAnalTitle.grid(column=0,row=0,columnspan=6)
+gapLabel17.grid(column = 0, row = 1, columnspan = 6)
+
+#Creates category titles for each section of data
+mswStreamLabel = Label(my_frame7, text = "MSW Composition", font = 'Helvetica 14 bold', bg = 'white')
+miscInOrgWasteStreamLabel = Label(my_frame7, text = "Misc. Inorganic Waste (Fraction): ", font = fontChoice, bg="white")
+otherWasteStreamLabel = Label(my_frame7, text = "Other (Fraction): ", font = fontChoice, bg="white")
+yardTrimmingsStreamLabel = Label(my_frame7, text = "Yard Trimmings (Fraction): ", font = fontChoice, bg="white")
+foodWasteStreamLabel = Label(my_frame7, text = "Food (Fraction): ", font = fontChoice, bg="white")
+rltWasteStreamLabel = Label(my_frame7, text = "Rubber, Leather, Textiles (Fraction): ", font = fontChoice, bg="white")
+woodWasteStreamLabel = Label(my_frame7, text = "Wood (Fraction): ", font = fontChoice, bg="white")
+metalsWasteStreamLabel = Label(my_frame7, text = "Metals (Fraction): ", font = fontChoice, bg="white")
+glassWasteStreamLabel = Label(my_frame7, text = "Glass (Fraction): ", font = fontChoice, bg="white")
+paperAndBoardStreamLabel = Label(my_frame7, text = "Paper and Paperboard (Fraction): ", font = fontChoice, bg="white")
+plasticsStreamLabel = Label(my_frame7, text = "Plastics (Fraction): ", font = fontChoice, bg="white")
+
+#Creating list of input data labels (not values) MJC
+typesOfWasteStreamStreamLabels = [mswStreamLabel, miscInOrgWasteStreamLabel, otherWasteStreamLabel, yardTrimmingsStreamLabel, foodWasteStreamLabel, rltWasteStreamLabel, woodWasteStreamLabel, metalsWasteStreamLabel, glassWasteStreamLabel, paperAndBoardStreamLabel, plasticsStreamLabel]
+
+
+
+#Creates conditions StreamLabels and entries
+conditionsTitleStreamLabel = Label(my_frame7, text = "Conditions", bg = 'white', font = 'Helvetica 12 bold')
+totalMSWStreamLabel = Label(my_frame7, text = 'Total MSW (Tons):', bg = 'white', font = fontChoice)
+totalPlasticStreamLabel = Label(my_frame7, text = 'Total Plastic Waste (Tons):', bg = 'white', font = fontChoice)
+plasticRecycledPropStreamLabel = Label(my_frame7, text = 'Total Plastic Recycled (Fraction, Domestic and Export):', bg = 'white', font = fontChoice)
+plasticDomesticStreamLabel = Label(my_frame7, text = 'Plastic Recycled Domestically (Fraction):', bg = 'white', font = fontChoice)
+plasticRecycEfficiencyStreamLabel = Label(my_frame7, text = 'Plastic Recycling Efficiency (Fraction):', bg = 'white', font = fontChoice)
+plasticExportPropStreamLabel = Label(my_frame7, text = 'Plastic Export Fraction (Fraction):', bg = 'white', font = fontChoice)
+plasticReExportPropStreamLabel = Label(my_frame7, text = "Plastic Re-Export (Fraction):", bg = 'white', font = fontChoice)
+plasticIncineratedPropStreamLabel = Label(my_frame7, text = 'Plastic Incinerated (Fraction):', bg = 'white', font = fontChoice)
+plasticLandfillPropStreamLabel = Label(my_frame7, text = "Plastic Landfilled (Fraction):", bg = 'white', font = fontChoice)
+wasteFacilityEmissionsStreamLabel = Label(my_frame7, text = 'Waste Facility Emissions (Tons):', bg = 'white', font = fontChoice)
+landfillEmissionsStreamLabel = Label(my_frame7, text = 'Emissions from Landfill (Tons):', bg = 'white', font = fontChoice)
+
+
+
+conditionsStreamStreamLabelsList = [conditionsTitleStreamLabel, totalMSWStreamLabel, totalPlasticStreamLabel, plasticRecycledPropStreamLabel, plasticDomesticStreamLabel, plasticRecycEfficiencyStreamLabel, plasticExportPropStreamLabel,
+                        plasticReExportPropStreamLabel, plasticIncineratedPropStreamLabel, plasticLandfillPropStreamLabel, wasteFacilityEmissionsStreamLabel, landfillEmissionsStreamLabel]
+
+conditionsStreamStreamLabelsListForPlacement = [conditionsTitleStreamLabel, totalMSWStreamLabel, totalPlasticStreamLabel, plasticRecycledPropStreamLabel, plasticDomesticStreamLabel, plasticExportPropStreamLabel, plasticReExportPropStreamLabel,
+                                                plasticRecycEfficiencyStreamLabel, plasticIncineratedPropStreamLabel,  plasticLandfillPropStreamLabel, wasteFacilityEmissionsStreamLabel, landfillEmissionsStreamLabel]
+
+
+
+#Recycling data input StreamLabels and entry boxes
+totalRecycStreamLabel = Label(my_frame7, text = "Recycling Data", bg = 'white', font = 'Helvetica 12 bold')
+totalRecycMassStreamLabel = Label(my_frame7, text = "Total Recycled Mass:", bg = 'white', font = fontChoice)
+miscInOrgRecycStreamLabel = Label(my_frame7, text = "Misc. Inorg Waste (Fraction): ", bg = 'white', font = fontChoice)
+otherWasteRecycStreamLabel = Label(my_frame7, text = "Other (Fraction):", bg = 'white', font = fontChoice)
+yardTrimmingsRecycStreamLabel = Label(my_frame7, text = "Yard Trimmings (Fraction):", bg = 'white', font = fontChoice)
+foodRecycStreamLabel = Label(my_frame7, text = "Food (Fraction):", bg = 'white', font = fontChoice)
+rltRecycStreamLabel = Label(my_frame7, text = "Rubber, Leather, Textiles (Fraction):", bg = 'white', font = fontChoice)
+woodRecycStreamLabel = Label(my_frame7, text = "Wood (Fraction):", bg = 'white', font = fontChoice)
+metalRecycStreamLabel = Label(my_frame7, text = "Metals (Fraction):", bg = 'white', font = fontChoice)
+glassRecycStreamLabel = Label(my_frame7, text = "Glass (Fraction):", bg = 'white', font = fontChoice)
+paperRecycStreamLabel = Label(my_frame7, text = "Paper and Paperboard (Fraction):", bg = 'white', font = fontChoice)
+plasticRecycStreamLabel = Label(my_frame7, text = "Plastic (Fraction):", bg = 'white', font = fontChoice)
+
+
+recycMSWPropsStreamStreamLabels= [totalRecycStreamLabel, totalRecycMassStreamLabel, miscInOrgRecycStreamLabel, otherWasteRecycStreamLabel, yardTrimmingsRecycStreamLabel, foodRecycStreamLabel,
+                      rltRecycStreamLabel, woodRecycStreamLabel, metalRecycStreamLabel, glassRecycStreamLabel, paperRecycStreamLabel, plasticRecycStreamLabel]
+
+
+
+#Incineration data input StreamLabels and entry boxes
+totalIncinStreamLabel = Label(my_frame7, text = "Incineration Data", bg = 'white', font = 'Helvetica 12 bold')
+totalIncinMassStreamLabel = Label(my_frame7, text = "Total Mass Incinerated: ", bg = 'white', font = fontChoice)
+miscInOrgIncinStreamLabel = Label(my_frame7, text = "Misc. Inorganic Wastes (Fraction):", bg = 'white', font = fontChoice)
+otherWasteIncinStreamLabel = Label(my_frame7, text = "Other Wastes (Fraction):", bg = 'white', font = fontChoice)
+yardTrimmingsIncinStreamLabel = Label(my_frame7, text = "Yard Trimmings (Fraction):", bg = 'white', font = fontChoice)
+foodIncinStreamLabel = Label(my_frame7, text = "Food (Fraction):", bg = 'white', font = fontChoice)
+rltIncinStreamLabel = Label(my_frame7, text = "Rubber, Leather, Textiles (Fraction):", bg = 'white', font = fontChoice)
+woodIncinStreamLabel = Label(my_frame7, text = "Wood (Fraction):", bg = 'white', font = fontChoice)
+metalIncinStreamLabel = Label(my_frame7, text = "Metal (Fraction):", bg = 'white', font = fontChoice)
+glassIncinStreamLabel = Label(my_frame7, text = "Glass (Fraction):", bg = 'white', font = fontChoice)
+paperIncinStreamLabel = Label(my_frame7, text = "Paper and Paperboard (Fraction):", bg = 'white', font = fontChoice)
+plasticIncinStreamLabel = Label(my_frame7, text = "Plastic (Fraction):", bg = 'white', font = fontChoice)
+
+
+IncinMSWPropsStreamStreamLabels= [totalIncinStreamLabel, totalIncinMassStreamLabel, miscInOrgIncinStreamLabel, otherWasteIncinStreamLabel, yardTrimmingsIncinStreamLabel, foodIncinStreamLabel,
+                                  rltIncinStreamLabel, woodIncinStreamLabel, metalIncinStreamLabel, glassIncinStreamLabel, paperIncinStreamLabel, plasticIncinStreamLabel]
+
+
+#Compost data input StreamLabels and entry boxes
+totalCompostStreamLabel = Label(my_frame7, text = "Compost Data", bg = 'white', font = 'Helvetica 12 bold')
+totalCompostMassStreamLabel = Label(my_frame7, text = "Total Mass Compost: ", bg = 'white', font = fontChoice)
+miscInOrgCompostStreamLabel = Label(my_frame7, text = "Misc. Inorganic Wastes (Fraction):", bg = 'white', font = fontChoice)
+otherWasteCompostStreamLabel = Label(my_frame7, text = "Other Wastes (Fraction):", bg = 'white', font = fontChoice)
+yardTrimmingsCompostStreamLabel = Label(my_frame7, text = "Yard Trimmings (Fraction):", bg = 'white', font = fontChoice)
+foodCompostStreamLabel = Label(my_frame7, text = "Food (Fraction):", bg = 'white', font = fontChoice)
+rltCompostStreamLabel = Label(my_frame7, text = "Rubber, Leather, Textiles (Fraction):", bg = 'white', font = fontChoice)
+woodCompostStreamLabel = Label(my_frame7, text = "Wood (Fraction):", bg = 'white', font = fontChoice)
+metalCompostStreamLabel = Label(my_frame7, text = "Metal (Fraction):", bg = 'white', font = fontChoice)
+glassCompostStreamLabel = Label(my_frame7, text = "Glass (Fraction):", bg = 'white', font = fontChoice)
+paperCompostStreamLabel = Label(my_frame7, text = "Paper and Paperboard (Fraction):", bg = 'white', font = fontChoice)
+plasticCompostStreamLabel = Label(my_frame7, text = "Plastic (Fraction):", bg = 'white', font = fontChoice)
+
+
+
+CompostMSWPropsStreamStreamLabels= [totalCompostStreamLabel, totalCompostMassStreamLabel, miscInOrgCompostStreamLabel, otherWasteCompostStreamLabel, yardTrimmingsCompostStreamLabel, foodCompostStreamLabel,
+                      rltCompostStreamLabel, woodCompostStreamLabel, metalCompostStreamLabel, glassCompostStreamLabel, paperCompostStreamLabel, plasticCompostStreamLabel]
+
+
+
+#Landfill Data input StreamLabels and entries
+totalLandStreamLabel = Label(my_frame7, text = "Landfill Data", bg = 'white', font = 'Helvetica 12 bold')
+totalLandMassStreamLabel = Label(my_frame7, text = "Total Mass Landfilled: ", bg = 'white', font = fontChoice)
+miscInOrgLandStreamLabel = Label(my_frame7, text = "Misc. Inorganic Wastes (Fraction):", bg = 'white', font = fontChoice)
+otherWasteLandStreamLabel = Label(my_frame7, text = "Other Wastes (Fraction):", bg = 'white', font = fontChoice)
+yardTrimmingsLandStreamLabel = Label(my_frame7, text = "Yard Trimmings (Fraction):", bg = 'white', font = fontChoice)
+foodLandStreamLabel = Label(my_frame7, text = "Food (Fraction):", bg = 'white', font = fontChoice)
+rltLandStreamLabel = Label(my_frame7, text = "Rubber, Leather, Textiles (Fraction):", bg = 'white', font = fontChoice)
+woodLandStreamLabel = Label(my_frame7, text = "Wood (Fraction):", bg = 'white', font = fontChoice)
+metalLandStreamLabel = Label(my_frame7, text = "Metal (Fraction):", bg = 'white', font = fontChoice)
+glassLandStreamLabel = Label(my_frame7, text = "Glass (Fraction):", bg = 'white', font = fontChoice)
+paperLandStreamLabel = Label(my_frame7, text = "Paper and Paperboard (Fraction):", bg = 'white', font = fontChoice)
+plasticLandStreamLabel = Label(my_frame7, text = "Plastic (Fraction):", bg = 'white', font = fontChoice)
+
+
+LandMSWPropsStreamStreamLabels= [totalLandStreamLabel, totalLandMassStreamLabel, miscInOrgLandStreamLabel, otherWasteLandStreamLabel, yardTrimmingsLandStreamLabel, foodLandStreamLabel,
+                      rltLandStreamLabel, woodLandStreamLabel, metalLandStreamLabel, glassLandStreamLabel, paperLandStreamLabel, plasticLandStreamLabel]
+
+
+
+#Types of plastics entry boxes and StreamLabels for recycled list
+plasticRecycProportionsStreamLabel = Label(my_frame7, text = "Plastic Recycled Proportions", bg = 'white', font = 'Helvetica 12 bold')
+
+petRecycStreamLabel = Label(my_frame7, text = "PET Proportion (Fraction):", bg = 'white', font = fontChoice)
+hdpeRecycStreamLabel = Label(my_frame7, text = "HDPE Proportion (Fraction):", bg = 'white', font = fontChoice)
+pvcRecycStreamLabel = Label(my_frame7, text = "PVC Proportion (Fraction):", bg = 'white', font = fontChoice)
+ldpeRecycStreamLabel = Label(my_frame7, text = "LDPE Proportion (Fraction):", bg = 'white', font = fontChoice)
+ppRecycStreamLabel = Label(my_frame7, text = "PP Proportion (Fraction):", bg = 'white', font = fontChoice)
+psRecycStreamLabel = Label(my_frame7, text = "PS Proportion (Fraction):", bg = 'white', font = fontChoice)
+otherRecycPlasticsStreamLabel = Label(my_frame7, text = "Other Plastics Proportion (Fraction):", bg = 'white', font = fontChoice)
+plaRecycStreamLabel = Label(my_frame7, text = "PLA Proportion (Fraction):", bg = 'white', font = fontChoice)
+
+plasticRecycPropsStreamsLabels = [plasticRecycProportionsStreamLabel, petRecycStreamLabel, hdpeRecycStreamLabel, pvcRecycStreamLabel, ldpeRecycStreamLabel, plaRecycStreamLabel, ppRecycStreamLabel, 
+                           psRecycStreamLabel, otherRecycPlasticsStreamLabel]
+
+#Types of plastics entry boxes and StreamLabels for landfilled list
+plasticLandProportionsStreamLabel = Label(my_frame7, text = "Plastic Landfilled Proportions", bg = 'white', font = 'Helvetica 12 bold')
+
+petLandStreamLabel = Label(my_frame7, text = "PET Proportion (Fraction):", bg = 'white', font = fontChoice)
+hdpeLandStreamLabel = Label(my_frame7, text = "HDPE Proportion (Fraction):", bg = 'white', font = fontChoice)
+pvcLandStreamLabel = Label(my_frame7, text = "PVC Proportion (Fraction):", bg = 'white', font = fontChoice)
+ldpeLandStreamLabel = Label(my_frame7, text = "LDPE Proportion (Fraction):", bg = 'white', font = fontChoice)
+ppLandStreamLabel = Label(my_frame7, text = "PP Proportion (Fraction):", bg = 'white', font = fontChoice)
+psLandStreamLabel = Label(my_frame7, text = "PS Proportion (Fraction):", bg = 'white', font = fontChoice)
+otherLandPlasticsStreamLabel = Label(my_frame7, text = "Other Plastics Proportion (Fraction):", bg = 'white', font = fontChoice)
+plaLandStreamLabel = Label(my_frame7, text = "PLA Proportion (Fraction):", bg = 'white', font = fontChoice)
+
+
+
+LandPlasticStreamStreamLabels = [plasticLandProportionsStreamLabel, petLandStreamLabel, hdpeLandStreamLabel, pvcLandStreamLabel, ldpeLandStreamLabel, plaLandStreamLabel, ppLandStreamLabel, psLandStreamLabel, otherLandPlasticsStreamLabel]
+
+
+#Types of plastics entry boxes and StreamLabels for Incinerated list
+plasticIncinProportionsStreamLabel = Label(my_frame7, text = "Plastic Incinerated Proportions", bg = 'white', font = 'Helvetica 12 bold')
+
+petIncinStreamLabel = Label(my_frame7, text = "PET Proportion (Fraction):", bg = 'white', font = fontChoice)
+hdpeIncinStreamLabel = Label(my_frame7, text = "HDPE Proportion (Fraction):", bg = 'white', font = fontChoice)
+pvcIncinStreamLabel = Label(my_frame7, text = "PVC Proportion (Fraction):", bg = 'white', font = fontChoice)
+ldpeIncinStreamLabel = Label(my_frame7, text = "LDPE Proportion (Fraction):", bg = 'white', font = fontChoice)
+ppIncinStreamLabel = Label(my_frame7, text = "PP Proportion (Fraction):", bg = 'white', font = fontChoice)
+psIncinStreamLabel = Label(my_frame7, text = "PS Proportion (Fraction):", bg = 'white', font = fontChoice)
+otherIncinPlasticsStreamLabel = Label(my_frame7, text = "Other Plastics Proportion (Fraction):", bg = 'white', font = fontChoice)
+plaIncinStreamLabel = Label(my_frame7, text = "PLA Proportion (Fraction):", bg = 'white', font = fontChoice)
+
+
+IncinPlasticStreamStreamLabels = [plasticIncinProportionsStreamLabel, petIncinStreamLabel, hdpeIncinStreamLabel, pvcIncinStreamLabel, ldpeIncinStreamLabel, plaIncinStreamLabel, ppIncinStreamLabel, psIncinStreamLabel, otherIncinPlasticsStreamLabel]
+
+#Types of plastics entry boxes and StreamLabels for reported recycled list
+plasticRepRecycProportionsStreamLabel = Label(my_frame7, text = "Plastic Reported Recycled Masses", bg = 'white', font = 'Helvetica 12 bold')
+
+petRepRecycStreamLabel = Label(my_frame7, text = "PET Proportion (Tons):", bg = 'white', font = fontChoice)
+hdpeRepRecycStreamLabel = Label(my_frame7, text = "HDPE Proportion (Tons):", bg = 'white', font = fontChoice)
+pvcRepRecycStreamLabel = Label(my_frame7, text = "PVC Proportion (Tons):", bg = 'white', font = fontChoice)
+ldpeRepRecycStreamLabel = Label(my_frame7, text = "LDPE Proportion (Tons):", bg = 'white', font = fontChoice)
+ppRepRecycStreamLabel = Label(my_frame7, text = "PP Proportion (Tons):", bg = 'white', font = fontChoice)
+psRepRecycStreamLabel = Label(my_frame7, text = "PS Proportion (Tons):", bg = 'white', font = fontChoice)
+otherRepRecycPlasticsStreamLabel = Label(my_frame7, text = "Other Plastics Proportion (Tons):", bg = 'white', font = fontChoice)
+plaRepRecycStreamLabel = Label(my_frame7, text = "PLA Proportion (Tons):", bg = 'white', font = fontChoice)
+
+
+RepRecycPlasticStreamStreamLabels = [plasticRepRecycProportionsStreamLabel, petRepRecycStreamLabel, hdpeRepRecycStreamLabel, pvcRepRecycStreamLabel, ldpeRepRecycStreamLabel, plaRepRecycStreamLabel, ppRepRecycStreamLabel, psRepRecycStreamLabel, otherRepRecycPlasticsStreamLabel]
+
+#Types of plastics entry boxes and StreamLabels for import list
+plasticImportProportionsStreamLabel = Label(my_frame7, text = "Plastic Imported Mass", bg = 'white', font = 'Helvetica 12 bold')
+
+ethyleneImportStreamLabel = Label(my_frame7, text = "Ethylene Mass (Tons):", bg = 'white', font = fontChoice)
+vinylChlorideImportStreamLabel = Label(my_frame7, text = "Vinyl Chloride Mass (Tons):", bg = 'white', font = fontChoice)
+styreneImportStreamLabel = Label(my_frame7, text = "Styrene Mass (Tons):", bg = 'white', font = fontChoice)
+otherImportStreamLabel = Label(my_frame7, text = "Other Plastics (Tons):", bg = 'white', font = fontChoice)
+
+
+
+ImportPlasticStreamStreamLabels = [plasticImportProportionsStreamLabel, ethyleneImportStreamLabel, vinylChlorideImportStreamLabel, styreneImportStreamLabel, otherImportStreamLabel]
+
+
+#Types of plastics entry boxes and StreamLabels for Export list
+plasticExportProportionsStreamLabel = Label(my_frame7, text = "Plastic Exported Mass", bg = 'white', font = 'Helvetica 12 bold')
+
+ethyleneExportStreamLabel = Label(my_frame7, text = "Ethylene Mass (Tons):", bg = 'white', font = fontChoice)
+vinylChlorideExportStreamLabel = Label(my_frame7, text = "Vinyl Chloride Mass (Tons):", bg = 'white', font = fontChoice)
+styreneExportStreamLabel = Label(my_frame7, text = "Styrene Mass (Tons):", bg = 'white', font = fontChoice)
+otherExportStreamLabel = Label(my_frame7, text = "Other Plastics (Tons):", bg = 'white', font = fontChoice)
+
+
+
+ExportPlasticStreamStreamLabels = [plasticExportProportionsStreamLabel, ethyleneExportStreamLabel, vinylChlorideExportStreamLabel, styreneExportStreamLabel, otherExportStreamLabel]
+
+
+#Types of plastics entry boxes and StreamLabels for ReExport list
+plasticReExportProportionsStreamLabel = Label(my_frame7, text = "Plastic ReExported Mass", bg = 'white', font = 'Helvetica 12 bold')
+
+ethyleneReExportStreamLabel = Label(my_frame7, text = "Ethylene Mass (Tons):", bg = 'white', font = fontChoice)
+vinylChlorideReExportStreamLabel = Label(my_frame7, text = "Vinyl Chloride Mass (Tons):", bg = 'white', font = fontChoice)
+styreneReExportStreamLabel = Label(my_frame7, text = "Styrene Mass (Tons):", bg = 'white', font = fontChoice)
+otherReExportStreamLabel = Label(my_frame7, text = "Other Plastics (Tons):", bg = 'white', font = fontChoice)
+
+ReExportPlasticStreamStreamLabels = [plasticReExportProportionsStreamLabel, ethyleneReExportStreamLabel, vinylChlorideReExportStreamLabel, styreneReExportStreamLabel, otherReExportStreamLabel]
+
+#######################################################################################################################################
+#######################################################################################################################################
+#######################################################################################################################################
+#######################################################################################################################################
+##################################################################################################################################################################
+#Labels whose text will show Values
+miscInOrgWasteValueLabel = Label(my_frame7, font = fontChoice, bg="white")
+otherWasteValueLabel = Label(my_frame7, font = fontChoice, bg="white")
+yardTrimmingsValueLabel = Label(my_frame7, font = fontChoice, bg="white")
+foodWasteValueLabel = Label(my_frame7, font = fontChoice, bg="white")
+rltWasteValueLabel = Label(my_frame7, font = fontChoice, bg="white")
+woodWasteValueLabel = Label(my_frame7, font = fontChoice, bg="white")
+metalsWasteValueLabel = Label(my_frame7, font = fontChoice, bg="white")
+glassWasteValueLabel = Label(my_frame7, font = fontChoice, bg="white")
+paperAndBoardValueLabel = Label(my_frame7, font = fontChoice, bg="white")
+plasticsValueLabel = Label(my_frame7, font = fontChoice, bg="white")
+
+
+#Creating list of value labels MJC
+typesOfWasteValueLabels = [miscInOrgWasteValueLabel, otherWasteValueLabel, yardTrimmingsValueLabel, foodWasteValueLabel, rltWasteValueLabel, woodWasteValueLabel, metalsWasteValueLabel, glassWasteValueLabel, paperAndBoardValueLabel, plasticsValueLabel]
+
+
+
+#Creates conditions StreamLabels and entries
+totalMSWValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+totalPlasticValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+plasticRecycledPropValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+plasticDomesticValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+plasticRecycEfficiencyValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+plasticExportPropValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+plasticReExportPropValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+plasticIncineratedPropValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+plasticLandfillPropValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+wasteFacilityEmissionsValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+landfillEmissionsValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+
+
+
+conditionsValueValueLabelsList = [totalMSWValueLabel, totalPlasticValueLabel, plasticRecycledPropValueLabel, plasticDomesticValueLabel, plasticRecycEfficiencyValueLabel, plasticExportPropValueLabel,
+                        plasticReExportPropValueLabel, plasticIncineratedPropValueLabel, plasticLandfillPropValueLabel, wasteFacilityEmissionsValueLabel, landfillEmissionsValueLabel]
+
+conditionsValueValueLabelsListForPlacement = [totalMSWValueLabel, totalPlasticValueLabel, plasticRecycledPropValueLabel, plasticDomesticValueLabel, plasticExportPropValueLabel,
+                                  plasticReExportPropValueLabel, plasticRecycEfficiencyValueLabel, plasticIncineratedPropValueLabel, plasticLandfillPropValueLabel, wasteFacilityEmissionsValueLabel, 
+                                  landfillEmissionsValueLabel]
+
+
+#Recycling data input StreamLabels and entry boxes
+totalRecycMassValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+miscInOrgRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+otherWasteRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+yardTrimmingsRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+foodRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+rltRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+woodRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+metalRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+glassRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+paperRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+plasticRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+
+
+recycMSWPropsValueLabels= [totalRecycMassValueLabel, miscInOrgRecycValueLabel, otherWasteRecycValueLabel, yardTrimmingsRecycValueLabel, foodRecycValueLabel,
+                      rltRecycValueLabel, woodRecycValueLabel, metalRecycValueLabel, glassRecycValueLabel, paperRecycValueLabel, plasticRecycValueLabel]
+
+
+
+#Incineration data input StreamLabels and entry boxes
+totalIncinMassValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+miscInOrgIncinValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+otherWasteIncinValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+yardTrimmingsIncinValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+foodIncinValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+rltIncinValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+woodIncinValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+metalIncinValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+glassIncinValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+paperIncinValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+plasticIncinValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+
+
+IncinMSWPropsValueLabels= [totalIncinMassValueLabel, miscInOrgIncinValueLabel, otherWasteIncinValueLabel, yardTrimmingsIncinValueLabel, foodIncinValueLabel,
+                      rltIncinValueLabel, woodIncinValueLabel, metalIncinValueLabel, glassIncinValueLabel, paperIncinValueLabel, plasticIncinValueLabel]
+
+
+#Compost data input StreamLabels and entry boxes
+totalCompostMassValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+miscInOrgCompostValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+otherWasteCompostValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+yardTrimmingsCompostValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+foodCompostValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+rltCompostValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+woodCompostValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+metalCompostValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+glassCompostValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+paperCompostValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+plasticCompostValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+
+
+
+CompostMSWPropsValueLabels= [totalCompostMassValueLabel, miscInOrgCompostValueLabel, otherWasteCompostValueLabel, yardTrimmingsCompostValueLabel, foodCompostValueLabel,
+                      rltCompostValueLabel, woodCompostValueLabel, metalCompostValueLabel, glassCompostValueLabel, paperCompostValueLabel, plasticCompostValueLabel]
+
+
+
+#Landfill Data input StreamLabels and entries
+totalLandMassValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+miscInOrgLandValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+otherWasteLandValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+yardTrimmingsLandValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+foodLandValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+rltLandValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+woodLandValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+metalLandValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+glassLandValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+paperLandValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+plasticLandValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+
+
+LandMSWPropsValueLabels= [totalLandMassValueLabel, miscInOrgLandValueLabel, otherWasteLandValueLabel, yardTrimmingsLandValueLabel, foodLandValueLabel,
+                      rltLandValueLabel, woodLandValueLabel, metalLandValueLabel, glassLandValueLabel, paperLandValueLabel, plasticLandValueLabel]
+
+
+
+#Types of plastics entry boxes and StreamLabels for recycled list
+petRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+hdpeRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+pvcRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+ldpeRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+ppRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+psRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+otherRecycPlasticsValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+plaRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+
+plasticRecycValueLabels = [petRecycValueLabel, hdpeRecycValueLabel, pvcRecycValueLabel, ldpeRecycValueLabel, plaRecycValueLabel, ppRecycValueLabel, psRecycValueLabel,
+                           otherRecycPlasticsValueLabel]
+
+#Types of plastics entry boxes and StreamLabels for landfilled list
+
+petLandValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+hdpeLandValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+pvcLandValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+ldpeLandValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+ppLandValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+psLandValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+otherLandPlasticsValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+plaLandValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+
+
+
+LandPlasticValueLabels = [petLandValueLabel, hdpeLandValueLabel, pvcLandValueLabel, ldpeLandValueLabel, plaLandValueLabel, ppLandValueLabel, psLandValueLabel, otherLandPlasticsValueLabel]
+
+
+#Types of plastics entry boxes and StreamLabels for Incinerated list
+petIncinValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+hdpeIncinValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+pvcIncinValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+ldpeIncinValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+ppIncinValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+psIncinValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+otherIncinPlasticsValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+plaIncinValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+
+
+IncinPlasticValueLabels = [petIncinValueLabel, hdpeIncinValueLabel, pvcIncinValueLabel, ldpeIncinValueLabel, plaIncinValueLabel, ppIncinValueLabel, psIncinValueLabel, otherIncinPlasticsValueLabel]
+
+#Types of plastics entry boxes and StreamLabels for reported recycled list
+petRepRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+hdpeRepRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+pvcRepRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+ldpeRepRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+ppRepRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+psRepRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+otherRepRecycPlasticsValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+plaRepRecycValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+
+
+RepRecycPlasticValueLabel = [petRepRecycValueLabel, hdpeRepRecycValueLabel, pvcRepRecycValueLabel, ldpeRepRecycValueLabel, plaRepRecycValueLabel, ppRepRecycValueLabel, psRepRecycValueLabel, otherRepRecycPlasticsValueLabel]
+
+#Types of plastics entry boxes and StreamLabels for import list
+ethyleneImportValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+vinylChlorideImportValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+styreneImportValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+otherImportValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+
+
+
+ImportPlasticValueLabels = [ethyleneImportValueLabel, vinylChlorideImportValueLabel, styreneImportValueLabel, otherImportValueLabel]
+
+
+#Types of plastics entry boxes and StreamLabels for Export list
+ethyleneExportValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+vinylChlorideExportValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+styreneExportValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+otherExportValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+
+
+
+ExportPlasticValueLabels = [ethyleneExportValueLabel, vinylChlorideExportValueLabel, styreneExportValueLabel, otherExportValueLabel]
+
+
+#Types of plastics entry boxes and StreamLabels for ReExport list
+ethyleneReExportValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+vinylChlorideReExportValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+styreneReExportValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+otherReExportValueLabel = Label(my_frame7, bg = 'white', font = fontChoice)
+
+ReExportPlasticValueLabels = [ethyleneReExportValueLabel, vinylChlorideReExportValueLabel, styreneReExportValueLabel, otherReExportValueLabel]
+
+
+#list of each row's labels
+rowStream1 = [conditionsStreamStreamLabelsListForPlacement, typesOfWasteStreamStreamLabels, recycMSWPropsStreamStreamLabels]
+
+rowStream2 = [IncinMSWPropsStreamStreamLabels, LandMSWPropsStreamStreamLabels, CompostMSWPropsStreamStreamLabels]
+
+rowStream3 = [plasticRecycPropsStreamsLabels, IncinPlasticStreamStreamLabels, LandPlasticStreamStreamLabels]
+
+rowStream4 = [RepRecycPlasticStreamStreamLabels, ImportPlasticStreamStreamLabels, ExportPlasticStreamStreamLabels]
+
+rowStream5 = [ReExportPlasticStreamStreamLabels]
+
+rowValue1 = [conditionsValueValueLabelsListForPlacement, typesOfWasteValueLabels, recycMSWPropsValueLabels]
+
+rowValue2 = [IncinMSWPropsValueLabels, LandMSWPropsValueLabels, CompostMSWPropsValueLabels]
+
+rowValue3 = [plasticRecycValueLabels, IncinPlasticValueLabels, LandPlasticValueLabels]
+
+rowValue4 = [RepRecycPlasticValueLabel, ImportPlasticValueLabels, ExportPlasticValueLabels]
+
+rowValue5 = [ReExportPlasticValueLabels]
+
+gapLabel13.grid(column = 0, row = 1, columnspan = 6)
+
+#Function that will place each row of labels in the appropriate spot
+def rowStreamPlacer(stream, value, gap, row):
+    col = 0
+    for i in range(len(stream)):
+        frameNum = row
+        for a in range(len(stream[i])):
+            if a == 0:
+                stream[i][a].grid(column = col, row = frameNum, columnspan = 2)
+                frameNum +=1
+
+                if i ==0:
+                    gapLabelsList[gap].grid(column = 0, row = frameNum, columnspan = 6)
+            else:
+                stream[i][a].grid(column = col, row = frameNum, sticky = E)
+                value[i][a-1].grid(column = col +1, row = frameNum, sticky = W)
+            frameNum+=1
+        col +=2
+    
+    
+#places rows and appropriate gap labels
+rowStreamPlacer(rowStream1, rowValue1, 0, 2)
+gapLabelsList[1].grid(column = 0, row =15, columnspan = 6)
+rowStreamPlacer(rowStream2, rowValue2, 2, 16)
+gapLabelsList[3].grid(column = 0, row = 29, columnspan = 6)
+rowStreamPlacer(rowStream3, rowValue3, 4, 30)
+gapLabelsList[5].grid(column = 0, row = 40, columnspan = 6)
+rowStreamPlacer(rowStream4, rowValue4, 6, 41)
+gapLabelsList[7].grid(column = 0, row = 51, columnspan = 6)
+rowStreamPlacer(rowStream5, rowValue5, 8, 52)
+gapLabelsList[9].grid(column = 0, row = 58, columnspan = 6)
+
+            
+
+#Creates scrollbar for input data frame
+dataAnalysisScrollBar = Scrollbar(my_frame7, orient = 'vertical', command = dataAnalysisCanvas.yview)
+dataAnalysisScrollBar.grid(column = 6, row = 0, rowspan = 80, sticky = NS)
+
+
+   
+
+###################################################
+#Creating flow diagram
+
+#Column headings for the stream summary table, its title row is streamTitleRows in eolPlastic.data
+streamSummaryColumns = tuple(['Stream'] + streamColumnNames)
+
+#Table drawn on a canvas that only formats and draws the cells currently scrolled into view.
+#Heading rows and the row name column stay frozen while the body scrolls underneath them
+class VirtualStreamTable:
+    def __init__(self, master, columns, titleRow, rowHeight = 22, columnWidth = 250, formatter = trvwRounder, highlightColumns = ()):
+        self.columns = columns
+        self.titleRow = titleRow
+        self.rows = []
+        self.formatter = formatter #turns a cell value into its text
+        self.highlightColumns = set(highlightColumns) #column numbers drawn with a shaded background
+        self.formattedCells = {} #cache of formatter output for the current result set, key = (row, column)
+        self.rowHeight = rowHeight
+        self.columnWidth = columnWidth
+        self.headerHeight = 3*rowHeight #one row for column names, two for the wrapped stream titles
+        self.xOffset = 0 #scroll position of the body in pixels
+        self.yOffset = 0
+        self.bodyItems = [] #pool of canvas text items reused on every redraw
+        self.frozenItems = []
+        self.cornerItems = []
+        
+        self.canvas = Canvas(master, bg = 'white', highlightthickness = 0)
+        self.xScrollBar = Scrollbar(master, orient = 'horizontal', command = self.xview)
+        self.yScrollBar = Scrollbar(master, orient = 'vertical', command = self.yview)
+        self.canvas.grid(column = 0, row = 0, sticky = NSEW)
+        self.yScrollBar.grid(column = 1, row = 0, sticky = NS)
+        self.xScrollBar.grid(column = 0, row = 1, sticky = EW)
+        master.grid_columnconfigure(0, weight = 1)
+        master.grid_rowconfigure(0, weight = 1)
+        
+        self.canvas.bind('<Configure>', lambda e: self.redraw())
+        self.canvas.bind('<MouseWheel>', lambda e: self.yview('scroll', int(-1*(e.delta/120)), 'units'))
+        self.canvas.bind('<Shift-MouseWheel>', lambda e: self.xview('scroll', int(-1*(e.delta/120)), 'units'))
+        self.canvas.bind('<Button-4>', lambda e: self.yview('scroll', -1, 'units'))
+        self.canvas.bind('<Button-5>', lambda e: self.yview('scroll', 1, 'units'))
+    
+    #Points the table at a new result set. Cached cell text is only thrown away when the rows actually change
+    def setRows(self, rows):
+        if rows is not self.rows:
+            self.rows = rows
+            self.formattedCells = {}
+        self.redraw()
+    
+    #Formats a single cell the first time it is scrolled into view
+    def cellText(self, row, column):
+        key = (row, column)
+        if key not in self.formattedCells:
+            try:
+                self.formattedCells[key] = self.formatter(self.rows[row][column])
+            except IndexError:
+                self.formattedCells[key] = '' #some summary rows are shorter than the column list
+        return self.formattedCells[key]
+    
+    def bodySize(self):
+        return max(self.canvas.winfo_width()-self.columnWidth, 0), max(self.canvas.winfo_height()-self.headerHeight, 0)
+    
+    def totalSize(self):
+        return (len(self.columns)-1)*self.columnWidth, len(self.rows)*self.rowHeight
+    
+    #Scrollbar commands, same arguments as the xview/yview of built in widgets
+    def xview(self, *args):
+        self.xOffset = self.scrolledOffset(self.xOffset, args, self.columnWidth, self.bodySize()[0], self.totalSize()[0])
+        self.redraw()
+    
+    def yview(self, *args):
+        self.yOffset = self.scrolledOffset(self.yOffset, args, self.rowHeight, self.bodySize()[1], self.totalSize()[1])
+        self.redraw()
+    
+    def scrolledOffset(self, offset, args, unit, visible, total):
+        if args[0] == 'moveto':
+            offset = float(args[1])*total
+        elif args[0] == 'scroll':
+            offset += int(args[1])*(unit if args[2] == 'units' else visible)
+        return int(max(0, min(offset, total-visible)))
+    
+    #Places (or reuses) a text item from one of the pools
+    def placeText(self, pool, index, x, y, text, font, tag):
+        if index < len(pool):
+            self.canvas.coords(pool[index], x, y)
+            self.canvas.itemconfigure(pool[index], text = text, font = font, state = 'normal')
+        else:
+            pool.append(self.canvas.create_text(x, y, text = text, font = font, tags = (tag,), width = self.columnWidth-10, justify = CENTER))
+    
+    def redraw(self):
+        bodyWidth, bodyHeight = self.bodySize()
+        totalWidth, totalHeight = self.totalSize()
+        self.xOffset = int(max(0, min(self.xOffset, totalWidth-bodyWidth)))
+        self.yOffset = int(max(0, min(self.yOffset, totalHeight-bodyHeight)))
+        
+        #Range of rows and columns that are at least partially visible (column 0 is the frozen row name column)
+        firstRow = self.yOffset//self.rowHeight
+        lastRow = min(len(self.rows), (self.yOffset+bodyHeight)//self.rowHeight+1)
+        firstColumn = self.xOffset//self.columnWidth+1
+        lastColumn = min(len(self.columns), (self.xOffset+bodyWidth)//self.columnWidth+2)
+        columnCenters = [(c, self.columnWidth*c-self.xOffset+self.columnWidth/2) for c in range(firstColumn, lastColumn)]
+        
+        body = 0
+        for r in range(firstRow, lastRow):
+            rowCenter = self.headerHeight+r*self.rowHeight-self.yOffset+self.rowHeight/2
+            for c, columnCenter in columnCenters:
+                self.placeText(self.bodyItems, body, columnCenter, rowCenter, self.cellText(r, c), 'Helvetica 9', 'body')
+                body += 1
+        
+        frozen = 0
+        for c, columnCenter in columnCenters:
+            self.placeText(self.frozenItems, frozen, columnCenter, self.rowHeight/2, self.columns[c], 'Helvetica 9 bold', 'frozen')
+            self.placeText(self.frozenItems, frozen+1, columnCenter, 2*self.rowHeight, self.titleRow[c], 'Helvetica 9 bold', 'frozen')
+            frozen += 2
+        for r in range(firstRow, lastRow):
+            rowCenter = self.headerHeight+r*self.rowHeight-self.yOffset+self.rowHeight/2
+            self.placeText(self.frozenItems, frozen, self.columnWidth/2, rowCenter, self.cellText(r, 0), 'Helvetica 9 bold', 'frozen')
+            frozen += 1
+        
+        #hides pooled items that were not needed this time
+        for i in self.bodyItems[body:]+self.frozenItems[frozen:]:
+            self.canvas.itemconfigure(i, state = 'hidden')
+        
+        #grid lines, then backgrounds for the frozen areas so body cells scroll underneath them
+        self.canvas.delete('grid')
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        for r in range(firstRow, lastRow+1):
+            lineY = self.headerHeight+r*self.rowHeight-self.yOffset
+            self.canvas.create_line(0, lineY, width, lineY, fill = 'gray85', tags = ('grid',))
+        for c, columnCenter in columnCenters:
+            lineX = columnCenter+self.columnWidth/2
+            self.canvas.create_line(lineX, 0, lineX, height, fill = 'gray85', tags = ('grid',))
+            if c in self.highlightColumns:
+                self.canvas.create_rectangle(lineX-self.columnWidth, self.headerHeight, lineX, height, fill = 'lightyellow', outline = '', tags = ('grid', 'highlight'))
+        self.canvas.create_rectangle(0, 0, width, self.headerHeight, fill = 'gray95', outline = 'gray60', tags = ('grid', 'frozenbg'))
+        self.canvas.create_rectangle(0, 0, self.columnWidth, height, fill = 'gray95', outline = 'gray60', tags = ('grid', 'frozenbg'))
+        self.canvas.create_rectangle(0, 0, self.columnWidth, self.headerHeight, fill = 'gray95', outline = 'gray60', tags = ('grid', 'cornerbg'))
+        self.placeText(self.cornerItems, 0, self.columnWidth/2, self.rowHeight/2, self.columns[0], 'Helvetica 9 bold', 'corner')
+        self.placeText(self.cornerItems, 1, self.columnWidth/2, 2*self.rowHeight, self.titleRow[0], 'Helvetica 9 bold', 'corner')
+        self.canvas.tag_lower('body')
+        self.canvas.tag_lower('highlight')
+        for tag in ['frozenbg', 'frozen', 'cornerbg', 'corner']:
+            self.canvas.tag_raise(tag)
+        
+        #updates scrollbars to reflect visible fraction of the table
+        self.xScrollBar.set(*self.visibleFraction(self.xOffset, bodyWidth, totalWidth))
+        self.yScrollBar.set(*self.visibleFraction(self.yOffset, bodyHeight, totalHeight))
+    
+    def visibleFraction(self, offset, visible, total):
+        if total <= 0:
+            return 0, 1
+        return offset/total, min(1, (offset+visible)/total)
+
+#Pop up window and table are created once and reused, so opening the window again does not rebuild the table
+streamSummaryPopup = None
+streamSummaryTable = None
+
+#function that will open pop up window with stream trvw when button is pressed
+def open_popup():
+    global streamSummaryPopup, streamSummaryTable
+    
+    if streamSummaryPopup is None or not streamSummaryPopup.winfo_exists():
+        #Creates pop up window with title
+        streamSummaryPopup = Toplevel(streamFrame)
+        streamSummaryPopup.geometry('%dx%d+%d+%d' % (w, h, x, y-25))
+        streamSummaryPopup.title("Stream Calculations")
+        streamSummaryPopup.protocol('WM_DELETE_WINDOW', streamSummaryPopup.withdraw) #closing only hides the window so it can be reopened instantly
+        
+        #Creates frame holding the stream summary table and its scrollbars
+        tableFrame = Frame(streamSummaryPopup)
+        tableFrame.pack(padx=5, pady=5, fill='both', expand=True,side='top')
+        streamSummaryTable = VirtualStreamTable(tableFrame, streamSummaryColumns, streamTitleRows)
+        
+        #Creates and packs button that will eventually allow data to be exported to excel
+        exportButton = Button(streamSummaryPopup, text = 'Export to Excel')
+        exportButton.pack()
+    
+    #shows latest results; cells are only reformatted if the calculations have been rerun
+    streamSummaryTable.setRows(streamTRVWLists)
+    streamSummaryPopup.deiconify()
+    streamSummaryPopup.lift()
+
+#Creates buttons that will create pop up buttons
+popUpButton = Button(streamFrame, text = "Show Stream Calculations", command = open_popup)
+popUpButton.pack() #places button
+
+#Text of the cells of the scenario comparison table
+def deltaFormatter(value):
+    if isinstance(value, str):
+        return value
+    if np.isnan(value):
+        return ''
+    if value == 0:
+        return '0'
+    if abs(value) < 1:
+        return '{:+.2g}'.format(value)
+    return '{:+,}'.format(round(value))
+
+def relativeFormatter(value):
+    if isinstance(value, str):
+        return value
+    if np.isnan(value):
+        return ''
+    return '{:+.1%}'.format(value)
+
+#Comparison window is created once, like the stream summary pop up
+comparePopup = None
+compareTable = None
+scenarioDiff = None
+
+#Rows of the comparison table, one per variant and species, holding absolute or relative changes
+def showScenarioDiff():
+    if scenarioDiff is None:
+        return
+    changes = scenarioDiff.relative if compareMode.get() == 'Relative' else scenarioDiff.absolute
+    rows = []
+    for variant, name in enumerate(scenarioDiff.names):
+        for row, species in enumerate(scenarioDiff.species):
+            rows.append([name + ': ' + species] + changes[variant, row].tolist())
+    compareTable.formatter = relativeFormatter if compareMode.get() == 'Relative' else deltaFormatter
+    compareTable.setRows(rows)
+
+#Runs the chosen baseline and variants from the scenario library and compares them
+def compareScenarios():
+    global scenarioDiff
+    baseline = compareBaseline.get()
+    variants = [compareVariants.get(i) for i in compareVariants.curselection()]
+    if baseline not in scenarioLibrary or not variants:
+        compareStatus.config(text = 'Choose a baseline and at least one variant.', fg = 'red')
+        return
+    runs = {name: calculateStreams(**scenarioLibrary.inputs(name))['streamTRVWLists'] for name in variants}
+    scenarioDiff = diffScenarios(calculateStreams(**scenarioLibrary.inputs(baseline))['streamTRVWLists'], runs)
+    showScenarioDiff()
+    
+    compareStatus.config(text = 'Largest additive release changes in streams ' + ', '.join(str(i) for i in additiveReleaseStreams) + ':', fg = 'black')
+    compareChanges.config(state = 'normal')
+    compareChanges.delete(1.0, END)
+    for change in largestAdditiveChanges(scenarioDiff):
+        compareChanges.insert(END, change.name + ', ' + change.additive + ', stream ' + str(change.stream) + ': ' + deltaFormatter(change.absolute) + 
+                              ' tons (' + (relativeFormatter(change.relative) or 'new') + ')\n')
+    compareChanges.config(state = 'disabled')
+
+def open_compare_popup():
+    global comparePopup, compareTable, compareBaseline, compareVariants, compareMode, compareStatus, compareChanges
+    
+    if comparePopup is None or not comparePopup.winfo_exists():
+        comparePopup = Toplevel(streamFrame)
+        comparePopup.geometry('%dx%d+%d+%d' % (w, h, x, y-25))
+        comparePopup.title("Compare Scenarios")
+        comparePopup.protocol('WM_DELETE_WINDOW', comparePopup.withdraw)
+        
+        #Scenario choices on the left, changes on the right
+        choiceFrame = Frame(comparePopup)
+        choiceFrame.pack(padx=5, pady=5, fill='y', side='left')
+        Label(choiceFrame, text = 'Baseline', font = fontChoice).pack(anchor = 'w')
+        compareBaseline = ttk.Combobox(choiceFrame, state = 'readonly')
+        compareBaseline.pack(fill = 'x')
+        Label(choiceFrame, text = 'Variants', font = fontChoice).pack(anchor = 'w')
+        compareVariants = Listbox(choiceFrame, selectmode = 'extended', exportselection = False, height = 15)
+        compareVariants.pack(fill = 'both', expand = True)
+        compareMode = StringVar(value = 'Absolute')
+        for mode in ['Absolute', 'Relative']:
+            Radiobutton(choiceFrame, text = mode + ' change', variable = compareMode, value = mode, command = showScenarioDiff).pack(anchor = 'w')
+        Button(choiceFrame, text = 'Compare', command = compareScenarios).pack(fill = 'x')
+        
+        resultFrame = Frame(comparePopup)
+        resultFrame.pack(padx=5, pady=5, fill='both', expand=True, side='left')
+        compareStatus = Label(resultFrame, text = '', font = fontChoice)
+        compareStatus.pack(anchor = 'w')
+        compareChanges = tk.Text(resultFrame, height = 6, state = 'disabled')
+        compareChanges.pack(fill = 'x')
+        tableFrame = Frame(resultFrame)
+        tableFrame.pack(fill='both', expand=True)
+        compareTable = VirtualStreamTable(tableFrame, streamSummaryColumns, streamTitleRows, formatter = deltaFormatter, 
+                                          highlightColumns = [streamSummaryColumns.index(str(i)) for i in additiveReleaseStreams])
+    
+    #the library may have changed since the window was last opened
+    compareBaseline.config(values = scenarioLibrary.names)
+    compareVariants.delete(0, END)
+    for name in scenarioLibrary.names:
+        compareVariants.insert(END, name)
+    comparePopup.deiconify()
+    comparePopup.lift()
+
+compareButton = Button(streamFrame, text = "Compare Scenarios", command = open_compare_popup)
+compareButton.pack()
+
+#Begins creation of flow diagram
+flow = plt.figure(figsize = (40,45), dpi = 44) #Creates matplot figure
+
+
+#Creates lists that will be used to note connections between nodes
+From = ['Manufacture', "Stream 4:\nManufacture\nto Use",'Use', "Stream 6:\nUse to\nCollection",'Collection'] 
+
+To = ["Stream 4:\nManufacture\nto Use", 'Use', "Stream 6:\nUse to\nCollection", "Collection", 'Stream 10:\nCollection\nto Sort']
+
+
+From1 = ['Stream 10:\nCollection\nto Sort',"Sort", 'Stream 16:\nSort to\nMechanical\nRecycling', 'Sort', 'Stream 11:\nNonrecyclable\nSort to\nIncineration']
+ 
+To1 = ["Sort",'Stream 16:\nSort to\nMechanical\nRecycling','Mechanical\nRecycling','Stream 11:\nNonrecyclable\nSort to\nIncineration', 'Energy\nRecovery\n(Incineration)']
+
+
+From2 = ['Sort', 'Stream 13:\nSort to\nCompost', 'Sort', 'Stream 12:\nSort to\nLandfill','Mechanical\nRecycling', 'Stream 20:\nPlastic\nRecyclate\nto\nManufacture']
+
+To2 = ['Stream 13:\nSort to\nCompost', 'Compost',
+      'Stream 12:\nSort to\nLandfill', 'Landfilling and\nDegradation', 'Stream 20:\nPlastic\nRecyclate\nto\nManufacture', 'Manufacture']
+
+
+From3 = ['Mechanical\nRecycling', 'Stream 23:\nRecycling\nto\nIncineration', 'Stream 1:\nMonomer\n and Raw\nMaterals',
+        'Stream 2:\nAdditives', 'Manufacture']
+
+To3 = ['Stream 23:\nRecycling\nto\nIncineration', 'Energy\nRecovery\n(Incineration)', 'Manufacture', 'Manufacture',
+       "Stream 3:\nGHG\nReleases"]
+
+
+From4 = ["Use", 'Collection', 'Stream 8:\nOther Waste', 'Collection', 'Sort']
+
+To4 = ["Stream 5:\nAdditive\nMigration", 'Stream 7:\nGHG\nReleases', 'Collection', 'Stream 9:\nPlastic\nLitter', 'Stream 14:\nRecyclable\nNonplastics']
+
+
+From5 = ["Sort", "Mechanical\nRecycling", 'Mechanical\nRecycling', "Stream 19:\nAdditive\nContamination", "Stream 21:\nPlastic Import", 
+         "Mechanical\nRecycling", "Sort", "Stream 24:\nPlastic Sort\nto\nIncineration"]
+
+To5 = ["Stream 15:\nGHG\nReleases","Stream 17:\nNet GHG\nReleases", "Stream 18:\nAdditive\nMigration", "Mechanical\nRecycling", "Mechanical\nRecycling",
+       "Stream 22:\nPlastic\nRe-Export", "Stream 24:\nPlastic Sort\nto\nIncineration", 'Energy\nRecovery\n(Incineration)']
+
+
+From6 = ['Energy\nRecovery\n(Incineration)', 'Sort', 'Stream 26:\nPlastic Sort\nto Landfill',
+         'Sort', 'Mechanical\nRecycling', 'Stream 28:\nRecycling\nto Landfill', 'Landfilling and\nDegradation', 'Landfilling and\nDegradation']
+
+To6 = ["Stream 25:\nGHG\nReleases", 'Stream 26:\nPlastic Sort\nto Landfill', 'Landfilling and\nDegradation',
+       'Stream 27:\nPlastic Export', 'Stream 28:\nRecycling\nto Landfill', 'Landfilling and\nDegradation', 'Stream 29:\nPlastic Leak', 
+       'Stream 30:\nGHG\nReleases']
+
+
+#creates full list connecting appropriate nodes
+Froms = [From1, From2, From3, From4, From5, From6]
+Tos = [To1, To2, To3, To4, To5, To6]
+
+for i in Froms:
+    From +=i
+    
+for i in Tos:
+    To +=i
+
+#Creates data frame that shows connection of nodes
+df = pd.DataFrame({ 'from':From,
+                   'to':To})
+
+
+
+# Define Node Positions
+pos = {'Manufacture':(-1,36),
+        'Sort':(47.5,33.5),
+        'Collection':(30,44),
+        'Use':(21.5,36),
+        'Mechanical\nRecycling':(11,28),
+        'Energy\nRecovery\n(Incineration)':(21.5,1),
+        'Compost':(57,23),
+        'Landfilling and\nDegradation': (57,15),
+        'Stream 1:\nMonomer\n and Raw\nMaterals': (-1, 48),
+        'Stream 2:\nAdditives': (5,48),
+        "Stream 4:\nManufacture\nto Use": (11,36),
+        "Stream 3:\nGHG\nReleases": (10,48),
+        "Stream 5:\nAdditive\nMigration": (15,48),
+        "Stream 6:\nUse to\nCollection":(20,48),
+        'Stream 7:\nGHG\nReleases':(40,48),
+        'Stream 8:\nOther Waste':(42,41),
+        'Stream 9:\nPlastic\nLitter':(39, 38),
+        'Stream 10:\nCollection\nto Sort':(34.5, 34.5),
+        'Stream 11:\nNonrecyclable\nSort to\nIncineration': (40,6),
+        'Stream 12:\nSort to\nLandfill':(47,23),
+        'Stream 13:\nSort to\nCompost': (58, 34.5),
+        'Stream 14:\nRecyclable\nNonplastics':(55,48),
+        "Stream 15:\nGHG\nReleases": (58,42),
+        'Stream 16:\nSort to\nMechanical\nRecycling':(21.5,28),
+        "Stream 17:\nNet GHG\nReleases":(-1, 9),
+        "Stream 18:\nAdditive\nMigration":(7,6),
+        "Stream 19:\nAdditive\nContamination":(2, 7.5),
+        'Stream 20:\nPlastic\nRecyclate\nto\nManufacture': (-1,24.5),
+        "Stream 21:\nPlastic Import": (12,7.5),
+        "Stream 22:\nPlastic\nRe-Export": (-1, 16),
+        'Stream 23:\nRecycling\nto\nIncineration': (17,11.5),
+        "Stream 24:\nPlastic Sort\nto\nIncineration":(21.5,12.5),
+        "Stream 25:\nGHG\nReleases":(40,-1),
+        'Stream 26:\nPlastic Sort\nto Landfill': (40,22),
+        'Stream 27:\nPlastic Export':(48, 48),
+        'Stream 28:\nRecycling\nto Landfill': (21.5, 20),
+        'Stream 29:\nPlastic Leak':(53,-1),
+        'Stream 30:\nGHG\nReleases': (57,-1)}
+
+
+Labels = {}
+i = 0
+for a in From:
+    Labels[a]=a
+    i +=1
+    
+
+for i in To:
+    if i not in list(Labels.values()):
+        Labels[i] = i
+
+
+# Build your graph. Note that we use the DiGraph function to create the graph! This adds arrows
+G=nx.from_pandas_edgelist(df, 'from', 'to', create_using=nx.DiGraph() )
+
+# Define the colormap and set nodes to circles, but the last one to a triangle
+Circles = []
+Square = []
+
+for n in G.nodes:
+    if 'Stream' in n:
+        Square.append(n)
+    else:
+        Circles.append(n)
+
+# By making a white node that is larger, I can make the arrow "start" beyond the node
+
+
+nodes = nx.draw_networkx_nodes(G, pos, 
+                       nodelist = Circles,
+                       node_size=8.5e3,
+                       node_shape='o',
+                       node_color= 'seagreen',
+                       edgecolors='black',
+                       alpha=0.5)
+
+nodes = nx.draw_networkx_nodes(G, pos, 
+                       nodelist = Square,
+                       node_size=5.5e3,
+                       node_shape='s',
+                       node_color='white',
+                       edgecolors='black',
+                       alpha=0.5)
+
+
+nx.draw_networkx_labels(G, pos, Labels, font_size=12)
+
+# Again by making the node_size larer, I can have the arrows end before they actually hit the node
+edges = nx.draw_networkx_edges(G, pos, node_size=1e4,
+                               arrowstyle='->',width=2)
+
+
+flowCanvas = FigureCanvasTkAgg(flow, master = streamFrame)
+flowCanvas.draw()
+flowCanvas.get_tk_widget().pack()
+
+
+
+###################################################
+### Material Data tab
+
+
+#Adding Textbox to Material data tab for title, configuring and packing
+text_frame3 = tk.Text(my_frame3, bg = "white", height=2, width=200)
+text_frame3.config(font=("Helvetica 20 bold"))
+text_frame3.insert(tk.INSERT,"\nMaterial Data")
+text_frame3.tag_configure('center', justify = "center")
+text_frame3.tag_add('center', 1.0, 'end')
+text_frame3.config(state="disabled")
+text_frame3.pack()
+
+#Creating and packing table
+trvw= ttk.Treeview(my_frame3,show='headings')
+trvw.pack(padx=5, pady=5, fill='both', expand=True,side='top')
+
+
+
+#Creates scoll bars in (x) directions        
+#Creates scoll bars in (y) directions  
+scrollbary2=ttk.Scrollbar(trvw, orient="vertical", command=trvw.yview) 
+scrollbary2.pack(side="right", fill="y") 
+# assign the scrollbars to the Treeview Widget
+trvw.configure(yscrollcommand=scrollbary2.set) 
+
+column_names2=['Material', 'Primary (virgin)', 'Secondary (mechanically recycled)']  
+
+#assigns and adds columns names to table
+trvw.configure(columns=column_names2)
+for column in trvw["columns"]:
+    trvw.heading(column, text=column)# let the column heading = column name
+
+#inserts data into table, called the first time the tab is opened
+def fillMaterialDataTab():
+    global dataframe2_rows
+    dataframe2_rows = loadMaterialData()
+    for i,row in enumerate(dataframe2_rows):
+        if i%2==0:
+            trvw.insert("", "end", values=row,tags=('oddrow',))
+        else:
+            trvw.insert("", "end", values=row,tags=('evenrow',))
+        
+
+
+
+
+#######################################################
+
+#Assumptions Tab MJC
+
+#Creates and packs canvas to allow for scrollbar to be placed
+assumptionsCanvas = Canvas(my_frame4, bg = 'white')
+assumptionsCanvas.pack()
+
+#Creates and packs frame for assumptions textboxes
+assumptionsFrame = Frame(assumptionsCanvas)
+assumptionsFrame.pack()
+
+#creates and packs scrollbar for assumptions textboxes
+assumpScrollbar = Scrollbar(assumptionsCanvas, orient = 'vertical', command = assumptionsCanvas.yview)
+assumpScrollbar.pack(side = 'right', fill = 'y')
+assumpScrollbar.config(command=assumptionsCanvas.yview)
+
+#creating and placing title and subtitles for tab
+title_frame4 = tk.Text(assumptionsFrame, bd = 0, highlightthickness = 0, bg = "white", height=4, width=100)
+title_frame4.config(font=("Helvetica 20 bold"))
+title_frame4.insert(tk.INSERT,"\nAssumptions and Justifications")
+title_frame4.tag_configure('center', justify = "center")
+title_frame4.tag_add('center', 1.0, 'end')
+title_frame4.config(state="disabled")
+title_frame4.grid(column = 0, row = 0, columnspan = 3)
+
+
+
+#Creates list of textboxes for assumptions (1 assumption per box)
+assumptionText1 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+assumptionText2 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+assumptionText3 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+assumptionText4 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+assumptionText5 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+assumptionText6 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+assumptionText7 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+assumptionText8 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+assumptionText9 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+assumptionText10 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+assumptionText11 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+assumptionText12 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+assumptionText13 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+assumptionText14 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+assumptionText15 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+assumptionText16 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+assumptionText17 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+assumptionText18 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+
+#Creates list of assumptions text boxes
+assumptionTextList = [assumptionText1, assumptionText2, assumptionText3, assumptionText4, assumptionText5, assumptionText6,
+                      assumptionText7, assumptionText8, assumptionText9, assumptionText10, assumptionText11, assumptionText12,
+                      assumptionText13, assumptionText14, assumptionText15, assumptionText16, assumptionText17, assumptionText18]
+
+#creates effect textboxes
+effectText1 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+effectText2 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+effectText3 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+effectText4 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+effectText5 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+effectText6 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+effectText7 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+effectText8 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+effectText9 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+effectText10 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+effectText11 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+effectText12 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+effectText13 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+effectText14 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+effectText15 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+effectText16 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+effectText17 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+effectText18 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+
+#creates list of effect textboxes
+
+effectTextList = [effectText1, effectText2, effectText3, effectText4, effectText5, effectText6,
+                  effectText7, effectText8, effectText9, effectText10, effectText11, effectText12,
+                  effectText13, effectText14, effectText15, effectText16, effectText17, effectText18]
+
+#creates justification textboxes
+
+justificationText1 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+justificationText2 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+justificationText3 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+justificationText4 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+justificationText5 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+justificationText6 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+justificationText7 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+justificationText8 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+justificationText9 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+justificationText10 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+justificationText11 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+justificationText12 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+justificationText13 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+justificationText14 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+justificationText15 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+justificationText16 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+justificationText17 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+justificationText18 = tk.Text(assumptionsFrame, bd = 0, width = 45)
+
+#creates list of justification textboxes
+
+justificationTextList = [justificationText1, justificationText2, justificationText3, justificationText4, justificationText5, justificationText6,
+                         justificationText7, justificationText8, justificationText9, justificationText10, justificationText11, justificationText12,
+                         justificationText13, justificationText14, justificationText15, justificationText16, justificationText17, justificationText18]
+
+#Grids assumption, effect, and justification textboxes
+assumpRow = 1
+for i in range(18):
+    assumptionTextList[i].grid(column = 0, row = assumpRow)
+    assumptionTextList[i].config(font=("Helvetica 14 bold"))
+    assumptionTextList[i].tag_configure('center', justify = "center")
+    
+    effectTextList[i].grid(column = 1, row = assumpRow)
+    effectTextList[i].config(font=("Helvetica 14 bold"))
+    effectTextList[i].tag_configure('center', justify = "center")
+    
+    justificationTextList[i].grid(column = 2, row = assumpRow)
+    justificationTextList[i].config(font=("Helvetica 14 bold"))
+    justificationTextList[i].tag_configure('center', justify = "center")
+    
+    assumpRow+=1
+    
+allAssumpTexts = justificationTextList + assumptionTextList + effectTextList
+
+#Configures textboxes to prevent editing
+for i in allAssumpTexts:
+    i.config(state = 'disabled')
+
+#inserts the assumptions into the textboxes, called the first time the tab is opened
+def fillAssumptionsTab():
+    global assumptions
+    assumptions = loadAssumptions()
+    for i in range(min(len(assumptions), len(assumptionTextList))):
+        for column, textList in enumerate([assumptionTextList, effectTextList, justificationTextList]):
+            textList[i].config(state = 'normal')
+            textList[i].insert(tk.INSERT, assumptions[i][column])
+            textList[i].tag_add('center', 1.0, 'end')
+            textList[i].config(state = 'disabled')
+    
+##### Chemical Additives data base
+
+#Creates and configures title text box
+chemicalAdditivesTitle = tk.Text(my_frame6, bd = 0, width = 45, height = 3)
+chemicalAdditivesTitle.config(font = ('Helvetica 20 bold'))
+chemicalAdditivesTitle.tag_configure('center', justify = CENTER)
+chemicalAdditivesTitle.tag_add('center', 1.0, 'end')
+chemicalAdditivesTitle.pack()
+chemicalAdditivesTitle.insert(tk.INSERT, "Chemical Additives Database")
+chemicalAdditivesTitle.config(state = 'disabled')
+
+
+#Inverted index of the one, two and three byte pieces of the searchable columns of a table. Every word of a
+#query is looked up by its pieces, the row lists are intersected from the rarest up and only the few rows left
+#get a substring check, so typing never has to scan the whole table
+class TrigramIndex:
+    def __init__(self, rows, columns):
+        self.rows = rows
+        self.texts = [' | '.join(row[column] for column in columns).lower().replace('\n', ' ') for row in rows]
+        self.grams = {}
+        self.lastTerms = []
+        self.lastMatches = np.arange(len(rows), dtype = np.int32)
+        if not rows:
+            return
+        
+        #the pieces are cut from the utf-8 bytes of all rows at once, each row owns the separator after it
+        encoded = [text.encode() for text in self.texts]
+        data = np.frombuffer(b'\n'.join(encoded) + b'\n', dtype = np.uint8).astype(np.int64)
+        rowOf = np.repeat(np.arange(len(rows), dtype = np.int64), [len(text) + 1 for text in encoded])
+        for size in (1, 2, 3):
+            count = len(data) - size + 1
+            if count <= 0:
+                continue
+            keys = np.full(count, size << 24, dtype = np.int64)
+            for offset in range(size):
+                keys |= data[offset:offset + count] << (8 * (size - 1 - offset))
+            sameRow = rowOf[:count] == rowOf[size - 1:]
+            pairs = np.sort(keys[sameRow] * len(rows) + rowOf[:count][sameRow])
+            pairs = pairs[np.concatenate(([True], np.diff(pairs) != 0))]
+            pairKeys = pairs // len(rows)
+            bounds = np.flatnonzero(np.diff(pairKeys)) + 1
+            postings = np.split((pairs % len(rows)).astype(np.int32), bounds)
+            self.grams.update(zip(pairKeys[np.concatenate(([0], bounds))].tolist(), postings))
+    
+    @staticmethod
+    def gramKey(piece):
+        return (len(piece) << 24) | int.from_bytes(piece, 'big')
+    
+    #keeps the rows of the sorted array rows that also appear in the sorted array others
+    @staticmethod
+    def intersect(rows, others):
+        if len(others) == 0:
+            return others
+        positions = np.minimum(np.searchsorted(others, rows), len(others) - 1)
+        return rows[others[positions] == rows]
+    
+    #returns the numbers of the rows containing every word of the query, in table order
+    def search(self, query):
+        terms = query.lower().split()
+        postings = []
+        for term in terms:
+            encodedTerm = term.encode()
+            size = min(3, len(encodedTerm))
+            for start in range(len(encodedTerm) - size + 1):
+                postings.append(self.grams.get(self.gramKey(encodedTerm[start:start + size]), self.lastMatches[:0]))
+        
+        #while the user keeps typing, only rows that matched the previous query can still match
+        if self.lastTerms and all(any(old in term for term in terms) for old in self.lastTerms):
+            postings.append(self.lastMatches)
+        
+        postings.sort(key = len)
+        matches = postings[0] if postings else np.arange(len(self.rows), dtype = np.int32)
+        for posting in postings[1:]:
+            matches = self.intersect(matches, posting)
+        
+        #words longer than one piece can have all their pieces in a row without being in it
+        longTerms = [term for term in terms if len(term.encode()) > 3]
+        if longTerms:
+            texts = self.texts
+            matches = np.array([rowNumber for rowNumber in matches.tolist() if all(term in texts[rowNumber] for term in longTerms)], dtype = np.int32)
+        self.lastTerms = terms
+        self.lastMatches = matches
+        return matches
+
+chemicalAdditivesIndex = None #built with the table the first time the tab is opened
+additiveDisplayLimit = 1000 #the table only shows this many matches at once, the label reports the rest
+
+#Creates search bar above the table, it filters the table as the user types
+additiveSearchFrame = Frame(my_frame6, bg = 'white')
+additiveSearchFrame.pack(padx=5, fill='x', side='top')
+additiveSearchLabel = Label(additiveSearchFrame, text = 'Search:', bg = 'white')
+additiveSearchLabel.pack(side = 'left')
+additiveSearchText = StringVar()
+additiveSearchEntry = Entry(additiveSearchFrame, textvariable = additiveSearchText, width = 50)
+additiveSearchEntry.pack(side = 'left', padx = 5)
+additiveMatchLabel = Label(additiveSearchFrame, text = '', bg = 'white')
+additiveMatchLabel.pack(side = 'left')
+
+def showAdditiveMatches(*args):
+    matches = chemicalAdditivesIndex.search(additiveSearchText.get())
+    chemicalAdditivesTRVW.delete(*chemicalAdditivesTRVW.get_children())
+    for rowNumber in matches[:additiveDisplayLimit].tolist():
+        chemicalAdditivesTRVW.insert(parent ='', index ='end', iid = rowNumber, text = '', values = tuple(chemicalAdditivesList[rowNumber]))
+    if len(matches) > additiveDisplayLimit:
+        additiveMatchLabel.config(text = 'Showing ' + str(additiveDisplayLimit) + ' of ' + str(len(matches)) + ' matches')
+    else:
+        additiveMatchLabel.config(text = str(len(matches)) + ' matches')
+
+#Creates and packs table that will contain additives
+chemicalAdditivesTRVW = ttk.Treeview(my_frame6)
+chemicalAdditivesTRVW.pack(padx=5, pady=5, fill='both', expand=True,side='top')
+
+#creates columns for table
+chemicalAdditiveColumns = ['#', 'Name', 'Alternate Name', 'Type', 'Molecular Weight', 'State']
+chemicalAdditivesTRVW.configure(columns=chemicalAdditiveColumns)
+
+#gets rid of dummy first column
+chemicalAdditivesTRVW.column('#0', width = 0, stretch = NO)
+
+#adds headings for each column
+for column in chemicalAdditivesTRVW["columns"]:
+    chemicalAdditivesTRVW.heading(column, text=column)# let the column heading = column name
+
+#inserts data into table and refilters it whenever the search text changes, called the first time the tab is opened
+def fillChemicalAdditivesTab():
+    global chemicalAdditivesList, chemicalAdditivesIndex
+    chemicalAdditivesList = loadChemicalAdditives()
+    chemicalAdditivesIndex = TrigramIndex(chemicalAdditivesList, [1, 2, 3]) #Name, Alternate Name and Type columns are searchable
+    showAdditiveMatches()
+    additiveSearchText.trace_add('write', showAdditiveMatches)
+       
+#Creates scoll bars in (y) direction 
+additivesScrollbar=ttk.Scrollbar(chemicalAdditivesTRVW, orient="vertical", command=chemicalAdditivesTRVW.yview) 
+additivesScrollbar.pack(side="right", fill="y") 
+# assign the scrollbars to the Treeview Widget
+chemicalAdditivesTRVW.configure(yscrollcommand=additivesScrollbar.set)
+
+#Fills each database tab the first time it is opened
+databaseTabFillers = {str(my_frame3): fillMaterialDataTab, str(my_frame4): fillAssumptionsTab, str(my_frame6): fillChemicalAdditivesTab}
+
+def databaseTabOpened(event):
+    filler = databaseTabFillers.pop(my_program.select(), None)
+    if filler is not None:
+        filler()
+
+my_program.bind('<<NotebookTabChanged>>', databaseTabOpened)
+
+#xoxo, MJC
+def main():
+    EoLPlasticgui.mainloop()
+
+if __name__ == '__main__':
+    main()
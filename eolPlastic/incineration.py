@@ -0,0 +1,41 @@
+#Additive releases from incineration by compartment. calculateStreams puts what each additive category leaves undestroyed
+#in stream 25 and splits it between bottom ash, fly ash and stack gas with incinerationDestructionFractions and
+#incinerationResidueShares in eolPlastic.data. Here the same data is a transfer matrix (additives, compartments), the
+#fraction of each additive fed in that leaves in each compartment, and any number of matrices are applied to any number
+#of results in one product, so other destruction efficiencies and partition coefficients need no new runs
+import numpy as np
+from eolPlastic.data import otherResinAdditives, incinerationCompartments, incinerationDestructionFractions, incinerationResidueShares
+
+#Transfer matrix from destruction fractions and residue shares laid out like the defaults. Shares of each additive must sum to 1
+def transferMatrix(destruction = incinerationDestructionFractions, shares = incinerationResidueShares):
+    destroyed = np.array([destruction[i] for i in otherResinAdditives], dtype = float)
+    shareArray = np.array([shares[i] for i in otherResinAdditives], dtype = float)
+    if shareArray.shape != (len(otherResinAdditives), len(incinerationCompartments)):
+        raise ValueError('Residue shares need one value for each of ' + ', '.join(incinerationCompartments))
+    badDestruction = [i for i, value in zip(otherResinAdditives, destroyed) if not 0 <= value <= 1]
+    if badDestruction:
+        raise ValueError('Destruction fractions must be between 0 and 1: ' + ', '.join(badDestruction))
+    badShares = [i for i, row in zip(otherResinAdditives, shareArray) if abs(row.sum() - 1) > 1e-9 or row.min() < 0]
+    if badShares:
+        raise ValueError('Residue shares must be at least 0 and sum to 1: ' + ', '.join(badShares))
+    return (1 - destroyed)[:, None]*shareArray
+
+def matrixStack(matrices):
+    if matrices is None:
+        matrices = transferMatrix()
+    return np.asarray(matrices, dtype = float).reshape(-1, len(otherResinAdditives), len(incinerationCompartments))
+
+#Tons of each additive fed to incineration (streams 23 and 24) in every result (one result or a list of them), (results, additives)
+def incineratedAdditiveArray(results):
+    if isinstance(results, dict):
+        results = [results]
+    return np.array([[result['incineratedAdditives'][i] for i in otherResinAdditives] for result in results], dtype = float).reshape(len(results), len(otherResinAdditives))
+
+#Tons of each additive released to each compartment for every result under every transfer matrix, one matrix
+#(additives, compartments) or a stack of them (matrices, additives, compartments). Shape (results, matrices, additives, compartments)
+def compartmentReleases(results, matrices = None):
+    return np.einsum('sa,pac->spac', incineratedAdditiveArray(results), matrixStack(matrices))
+
+#Release totals of each compartment, (results, matrices, compartments)
+def compartmentTotals(results, matrices = None):
+    return np.einsum('sa,pac->spc', incineratedAdditiveArray(results), matrixStack(matrices))
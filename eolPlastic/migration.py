@@ -0,0 +1,94 @@
+#Additive migration by diffusion, per resin and additive category, over any residence time and temperature. The engine
+#takes a constant fraction of the additives of streams 4 and 16 as migrating (streams 5 and 18); here each resin and
+#additive gets its own fraction from the Piringer upper-bound diffusion coefficient and Crank's solution for a plane
+#sheet releasing through both faces. Both are closed forms, so fractions for every species over a whole grid of times
+#and temperatures are a few array operations. Each stage's sheet thickness is fitted so that its reference time and
+#temperature (migrationReference in eolPlastic.data) give the engine's constant fraction on the 2018 additive masses.
+#Polymer migration (stream 5 resin) stays a constant fraction.
+#The fractions go to calculateStreams as migrationFractions, or migratedMasses applies them to many results at once
+import numpy as np
+from eolPlastic.data import typesOfPlasticDomestic, otherResinAdditives, additiveMolecularWeights, piringerConstants, migrationReference
+
+migrationStages = list(migrationReference)
+secondsPerDay = 86400
+
+#Terms of the long-time series, and the dimensionless time D*t/L^2 below which the short-time form is used instead.
+#Between them both are exact to rounding
+seriesTerms = 12
+shortTimeLimit = 0.01
+
+#Diffusion coefficient (cm2/s) of each additive in each resin at temperature (deg C, any shape), shape
+#(..., resins, additives). 0 for additives that are particles
+def diffusionCoefficients(temperature):
+    kelvin = np.asarray(temperature, dtype = float)[..., None, None] + 273.15
+    constants = np.array([piringerConstants[resin] for resin in typesOfPlasticDomestic], dtype = float)
+    polymerConstant = constants[:, 0, None] - constants[:, 1, None]/kelvin
+    molecularWeight = np.array([np.nan if additiveMolecularWeights[i] is None else additiveMolecularWeights[i] for i in otherResinAdditives])
+    coefficients = 1e4*np.exp(polymerConstant - 0.1351*molecularWeight**(2/3) + 0.003*molecularWeight - 10454/kelvin)
+    return np.nan_to_num(coefficients, nan = 0.0)
+
+#Fraction of the additive released from a sheet at dimensionless time D*t/L^2, L being the sheet thickness
+def releasedFraction(dimensionlessTime):
+    dimensionlessTime = np.asarray(dimensionlessTime, dtype = float)
+    remaining = np.zeros(dimensionlessTime.shape)
+    for n in range(seriesTerms):
+        rate = ((2*n + 1)*np.pi)**2
+        remaining += 8/rate*np.exp(-rate*dimensionlessTime)
+    return np.where(dimensionlessTime < shortTimeLimit, 4*np.sqrt(dimensionlessTime/np.pi), 1 - remaining)
+
+#Migrated fraction of each additive in each resin after days at temperature (deg C) from a sheet thickness (cm) thick.
+#days and temperature broadcast together, thickness is one value or one per resin. Shape (..., resins, additives)
+def migrationFractions(days, temperature, thickness):
+    days = np.asarray(days, dtype = float)[..., None, None]
+    thickness = np.asarray(thickness, dtype = float)
+    if thickness.ndim:
+        thickness = thickness[:, None]
+    return releasedFraction(diffusionCoefficients(temperature)*days*secondsPerDay/thickness**2)
+
+#Additive masses of each resin in a stage of every result (one result or a list of them), tons, shape (results, resins, additives)
+def additiveMassArray(results, stage):
+    if isinstance(results, dict):
+        results = [results]
+    if stage not in migrationStages:
+        raise ValueError('No migration stage called ' + repr(stage) + ', use one of ' + ', '.join(migrationStages))
+    return np.array([[[result['migratingAdditives'][stage][resin].get(i, 0) for i in otherResinAdditives] for resin in typesOfPlasticDomestic]
+                     for result in results], dtype = float).reshape(len(results), len(typesOfPlasticDomestic), len(otherResinAdditives))
+
+#Thickness (cm) at which a stage's reference days and temperature release the stage's constant fraction of the additives
+#in result, found by bisection on its logarithm (the released fraction falls as the thickness grows)
+def calibrateThickness(result, stage, iterations = 100):
+    reference = migrationReference[stage]
+    masses = additiveMassArray(result, stage)[0]
+    coefficients = diffusionCoefficients(reference['temperature'])
+
+    def released(logThickness):
+        return (masses*releasedFraction(coefficients*reference['days']*secondsPerDay/10**(2*logThickness))).sum()/masses.sum()
+
+    low, high = -6.0, 6.0
+    if not released(high) < reference['fraction'] < released(low):
+        raise ValueError('No thickness between 1e-6 and 1e6 cm gives ' + stage + ' a migration fraction of ' + str(reference['fraction']))
+    for iteration in range(iterations):
+        middle = (low + high)/2
+        if released(middle) > reference['fraction']:
+            low = middle
+        else:
+            high = middle
+    return 10**((low + high)/2)
+
+#Fitted thickness of every stage, from a result of the 2018 data
+def calibratedThicknesses(result):
+    return {stage: calibrateThickness(result, stage) for stage in migrationStages}
+
+#(resins, additives) fractions as calculateStreams takes them for one stage, {resin: {additive: fraction}}
+def fractionDicts(fractions):
+    return {resin: dict(zip(otherResinAdditives, row)) for resin, row in zip(typesOfPlasticDomestic, np.asarray(fractions, dtype = float).tolist())}
+
+#migrationFractions for calculateStreams from {stage: (days, temperature)}, with the fitted thicknesses
+def stageMigrationFractions(conditions, thicknesses):
+    return {stage: fractionDicts(migrationFractions(days, temperature, thicknesses[stage])) for stage, (days, temperature) in conditions.items()}
+
+#Tons of each additive migrating out of a stage of every result over every time and temperature, shape
+#(results, ..., additives) where ... is the shape of days and temperature broadcast together. Only the migrating masses:
+#the streams downstream of the stage need calculateStreams
+def migratedMasses(results, stage, days, temperature, thickness):
+    return np.einsum('sra,...ra->s...a', additiveMassArray(results, stage), migrationFractions(days, temperature, thickness))
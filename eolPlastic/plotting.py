@@ -0,0 +1,82 @@
+#Charts of the results drawn on plain matplotlib Figures, without pyplot or Tk. The GUI puts them on its canvases and
+#other programs can render them with any backend. Each chart is built once and then updated in place
+import numpy as np
+from matplotlib.figure import Figure
+from eolPlastic.data import typesOfWastes, typesOfPlasticDomestic
+
+plasticexplode = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0.5] #make the plastic section wedge out from the center of the pie.
+
+def compositionFractions(mswComposition):
+    fractions = np.array(mswComposition, dtype = float)
+    return fractions / fractions.sum()
+
+#Pie chart of the msw composition
+class CompositionPie:
+    def __init__(self, mswComposition, figure = None):
+        self.figure = figure if figure is not None else Figure(figsize = (10, 7)) #adjusts the whitespace to show the entirety of the figure
+        self.axes = self.figure.add_subplot()
+        self.wedges, self.labels, self.percents = self.axes.pie(compositionFractions(mswComposition), labels=typesOfWastes, explode=plasticexplode, autopct='%1.1f%%',
+                                                                pctdistance=0.9, labeldistance=1.05, shadow=True, startangle=180)
+        self.axes.set_title('MSW Composition', fontsize=18) #adjust the title of the figure. pad = distance from the figure
+        self.axes.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle.
+    
+    #Everything update changes: wedges, their shadows, labels and percentages
+    def artists(self):
+        return list(self.axes.patches) + list(self.axes.texts)
+    
+    #Moves the existing wedges and their text the same way ax.pie lays them out
+    def update(self, mswComposition):
+        theta1 = 180 / 360
+        for wedge, label, percent, fraction, explode in zip(self.wedges, self.labels, self.percents, compositionFractions(mswComposition), plasticexplode):
+            theta2 = theta1 + fraction
+            thetam = np.pi * (theta1 + theta2)
+            x = explode * np.cos(thetam)
+            y = explode * np.sin(thetam)
+            wedge.set_center((x, y))
+            wedge.set_theta1(360 * theta1)
+            wedge.set_theta2(360 * theta2)
+            
+            labelX = x + 1.05 * np.cos(thetam)
+            label.set_position((labelX, y + 1.05 * np.sin(thetam)))
+            label.set_horizontalalignment('left' if labelX > 0 else 'right')
+            percent.set_position((x + 0.9 * np.cos(thetam), y + 0.9 * np.sin(thetam)))
+            percent.set_text('%1.1f%%' % (100 * fraction))
+            theta1 = theta2
+
+#Comparison bar graph of the amount of each plastic recycled against the amount collected
+class RecyclingBars:
+    def __init__(self, recycled, collected, figure = None):
+        index = np.arange(len(typesOfPlasticDomestic)) #Creates x-axis categories
+        bar_width = 0.35 #width of each bar
+        
+        self.figure = figure if figure is not None else Figure(figsize = (10, 7)) #defines graph
+        self.axes = self.figure.add_subplot()
+        self.recycledBars = self.axes.bar(index, recycled, bar_width, label = "Amount Of Plastic Recycled") #creates data one data set for graph
+        self.collectedBars = self.axes.bar(index+bar_width, collected, bar_width, label = "Amount of Plastic Collected") #creates second data set for graph
+        
+        #Creates labels for axes and graph
+        self.axes.set_xlabel("Type Of Plastic")
+        self.axes.set_ylabel("Amount (tons)")
+        self.axes.set_title("Amount of Plastic Collected and Recycled")
+        self.axes.set_xticks(index+bar_width/2)
+        self.axes.set_xticklabels(typesOfPlasticDomestic)
+        self.axes.set_ylim(0, self.top(recycled, collected))
+        self.axes.legend()
+    
+    def top(self, recycled, collected):
+        return max(max(recycled), max(collected)) * 1.05 or 1 #leaves the same headroom as the default axis margins
+    
+    def artists(self):
+        return list(self.recycledBars) + list(self.collectedBars)
+    
+    #Returns True when the axis changed as well as the bars. It only changes when the bars outgrow it or shrink
+    #well below it, so most updates can be blitted
+    def update(self, recycled, collected):
+        for bar, height in zip(self.artists(), list(recycled) + list(collected)):
+            bar.set_height(height)
+        top = self.top(recycled, collected)
+        currentTop = self.axes.get_ylim()[1]
+        if top > currentTop or top < currentTop / 2:
+            self.axes.set_ylim(0, top)
+            return True
+        return False
@@ -0,0 +1,271 @@
+#Headless reports of scenarios: the MSW pie chart, the bar chart of plastic collected and recycled, the LCI tables and
+#the stream summary the GUI shows, written as self-contained HTML files (figures embedded) or as PDFs. Run it with
+#    python -m eolPlastic.reports "EoL Plastic Scenarios.npz" reports --format pdf --workers 4
+#Reports are written by a pool of worker processes that draw on the Agg canvas. Every figure is kept in
+#figureCacheFolder under a hash of the numbers it shows, so scenarios sharing a composition or a recycling result
+#reuse the image instead of drawing it again, across workers and across runs
+import argparse
+import base64
+import hashlib
+import html
+import io
+import os
+import re
+import textwrap
+from collections import namedtuple, Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.image import imread, BboxImage
+from matplotlib.transforms import Bbox, TransformedBbox
+from matplotlib.lines import Line2D
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from eolPlastic.data import dataFolder, matFlowColumnHeadings, streamTitleRows
+from eolPlastic.engine import validateInputs, calculateStreams, trvwListMaker, trvwRounder, streamColumnNames, lciStages, noProgress, ScenarioLibrary
+from eolPlastic.plotting import CompositionPie, RecyclingBars
+
+figureCacheFolder = os.path.join(dataFolder, 'Report Figure Cache')
+figureDPI = 80
+figureVersion = 1 #part of every cache key, raise it when the charts are drawn differently
+
+#Chart of each kind of figure, built from the numbers the figure shows
+figureCharts = {'composition': CompositionPie, 'recycling': RecyclingBars}
+
+pdfPageSize = (11.69, 8.27) #A4 landscape, inches
+pdfStreamColumns = 8 #streams on each page of the stream summary
+#Text in the built-in PDF Helvetica instead of embedded fonts, several times faster to write
+pdfStyle = {'pdf.use14corefonts': True, 'font.weight': 'medium', 'figure.titleweight': 'medium'}
+
+ReportOutcome = namedtuple('ReportOutcome', ['name', 'path', 'error'])
+
+def figureKey(kind, data):
+    digest = hashlib.sha256((kind + ' ' + str(figureVersion) + ' ' + str(figureDPI)).encode())
+    for values in data:
+        digest.update(np.asarray(values, dtype = float).tobytes())
+    return kind + '-' + digest.hexdigest()[:32]
+
+#PNG of a figure, read from the cache when it has been drawn before. cacheFolder None draws it without caching
+def figurePNG(kind, data, cacheFolder = figureCacheFolder):
+    path = None
+    if cacheFolder is not None:
+        path = os.path.join(cacheFolder, figureKey(kind, data) + '.png')
+        try:
+            with open(path, 'rb') as file:
+                return file.read()
+        except FileNotFoundError:
+            pass
+
+    chart = figureCharts[kind](*data)
+    FigureCanvasAgg(chart.figure)
+    buffer = io.BytesIO()
+    chart.figure.savefig(buffer, format = 'png', dpi = figureDPI)
+    png = buffer.getvalue()
+
+    if path is not None:
+        os.makedirs(cacheFolder, exist_ok = True)
+        temporaryPath = path + '.' + str(os.getpid()) + '.tmp' #each process writes its own file, so two drawing the same figure can't mix
+        with open(temporaryPath, 'wb') as file:
+            file.write(png)
+        os.replace(temporaryPath, path)
+    return png
+
+def reportFigures(results, cacheFolder = figureCacheFolder):
+    recycled = list(results['amountOfPlasticRecycled'].values())
+    collected = list(results['plasticsMassDict'].values())
+    return [figurePNG('composition', [results['mswCompProp']], cacheFolder), figurePNG('recycling', [recycled, collected], cacheFolder)]
+
+#Rows of one LCI table as the GUI shows them
+def lciRows(results, key):
+    return [row[:len(matFlowColumnHeadings)] for row in trvwListMaker(results[key])]
+
+#Rows of the stream summary as the GUI shows them, the title row first. Short rows are filled with blanks like the GUI table does
+def streamSummaryRows(results):
+    width = len(streamColumnNames) + 1
+    return [streamTitleRows] + [[trvwRounder(value) for value in row] + ['']*(width - len(row)) for row in results['streamTRVWLists']]
+
+###################################################
+#HTML
+
+reportStyle = ('body{font-family:sans-serif;margin:2em} img{width:49%} .wide{overflow-x:auto} '
+               'table{border-collapse:collapse;font-size:12px;margin-bottom:1.5em} th,td{border:1px solid #bbb;padding:2px 6px;white-space:nowrap} '
+               'th{background:#e8e8e8} td{text-align:right} td:first-child,tr.title td{text-align:left}')
+
+def htmlTable(headings, rows, titleRow = False):
+    lines = ['<table>', '<tr>' + ''.join('<th>' + html.escape(str(heading)) + '</th>' for heading in headings) + '</tr>']
+    for number, row in enumerate(rows):
+        rowClass = ' class="title"' if titleRow and number == 0 else ''
+        lines.append('<tr' + rowClass + '>' + ''.join('<td>' + html.escape(str(value)) + '</td>' for value in row) + '</tr>')
+    lines.append('</table>')
+    return '\n'.join(lines)
+
+def htmlReport(name, results, figures):
+    parts = ['<!DOCTYPE html>', '<html><head><meta charset="utf-8"><title>' + html.escape(name) + '</title>',
+             '<style>' + reportStyle + '</style></head><body>', '<h1>' + html.escape(name) + '</h1>']
+    for png in figures:
+        parts.append('<img src="data:image/png;base64,' + base64.b64encode(png).decode('ascii') + '">')
+
+    parts.append('<h2>Life Cycle Inventory</h2>')
+    for stage, key in lciStages:
+        parts.append('<h3>' + stage + '</h3>')
+        parts.append(htmlTable(matFlowColumnHeadings, lciRows(results, key)))
+
+    parts.append('<h2>Stream Summary</h2><div class="wide">')
+    parts.append(htmlTable(['Stream'] + streamColumnNames, streamSummaryRows(results), titleRow = True))
+    parts.append('</div></body></html>')
+    return '\n'.join(parts)
+
+###################################################
+#PDF
+
+#Draws a table on a page, the rule under its headings at height top and its left edge at left, in fractions of the
+#page. Cells are plain texts placed on a fixed grid, several times faster to write than matplotlib's Table
+def pdfTable(figure, left, top, headings, rows, fontSize, headingWidth = 18, maxWidth = 0.96):
+    pageWidth, pageHeight = figure.get_size_inches()
+    headings = [textwrap.fill(str(heading), headingWidth) for heading in headings]
+    columns = [[str(value) for value in column] for column in zip(*rows)]
+    characters = [max([0.65 * len(line) for line in heading.split('\n')] + [0.55 * len(value) for value in column]) for heading, column in zip(headings, columns)]
+    widths = np.array(characters) * fontSize / 72 / pageWidth + 0.01 #character widths of bold headings and of digits, plus a gap
+    widths *= min(1, maxWidth / widths.sum())
+    lineHeight = 1.25 * fontSize / 72 / pageHeight
+
+    edges = left + np.concatenate([[0], np.cumsum(widths)])
+    for number, (heading, column) in enumerate(zip(headings, columns)):
+        x, alignment = (edges[number], 'left') if number == 0 else (edges[number + 1] - 0.005, 'right')
+        figure.text(x, top + lineHeight / 4, heading, fontsize = fontSize, fontweight = 'bold', ha = alignment, va = 'bottom', multialignment = alignment)
+        for row, value in enumerate(column):
+            figure.text(x, top - (row + 1) * lineHeight, value, fontsize = fontSize, ha = alignment, va = 'baseline')
+    bottom = top - (len(rows) + 0.5) * lineHeight
+    for y in [top, bottom]:
+        figure.add_artist(Line2D([edges[0], edges[-1]], [y, y], transform = figure.transFigure, color = 'black', linewidth = 0.6))
+
+#Puts a PNG on a page, width wide and centred vertically, without an axes around it
+def pdfImage(figure, left, width, png):
+    pageWidth, pageHeight = figure.get_size_inches()
+    pixels = imread(io.BytesIO(png), format = 'png')
+    height = width * pageWidth * pixels.shape[0] / pixels.shape[1] / pageHeight
+    image = BboxImage(TransformedBbox(Bbox.from_bounds(left, (1 - height) / 2, width, height), figure.transFigure))
+    image.set_data(pixels)
+    figure.add_artist(image)
+
+def pdfReport(name, results, figures, path):
+    with matplotlib.rc_context(pdfStyle), PdfPages(path) as pdf:
+        figure = Figure(figsize = pdfPageSize)
+        figure.suptitle(name, fontsize = 16)
+        for position, png in enumerate(figures):
+            pdfImage(figure, 0.02 + 0.49*position, 0.47, png)
+        pdf.savefig(figure)
+
+        for first in range(0, len(lciStages), 3): #three LCI tables a page
+            figure = Figure(figsize = pdfPageSize)
+            figure.suptitle('Life Cycle Inventory', fontsize = 14)
+            for position, (stage, key) in enumerate(lciStages[first:first + 3]):
+                top = 0.9 - 0.29*position
+                figure.text(0.04, top, stage, fontsize = 11, va = 'top')
+                pdfTable(figure, 0.04, top - 0.09, matFlowColumnHeadings, lciRows(results, key), 8, 22)
+            pdf.savefig(figure)
+
+        #The stream titles go in the headings, so the body only holds numbers
+        titleRow, *rows = streamSummaryRows(results)
+        pages = range(0, len(streamColumnNames), pdfStreamColumns)
+        for page, first in enumerate(pages):
+            columns = slice(first + 1, first + 1 + pdfStreamColumns) #row names are column 0
+            headings = ['Stream'] + [stream + ': ' + title for stream, title in zip(streamColumnNames[columns.start - 1:columns.stop - 1], titleRow[columns])]
+            figure = Figure(figsize = pdfPageSize)
+            figure.suptitle('Stream Summary (' + str(page + 1) + ' of ' + str(len(pages)) + ')', fontsize = 14)
+            pdfTable(figure, 0.02, 0.84, headings, [[row[0]] + row[columns] for row in rows], 7, 16)
+            pdf.savefig(figure)
+
+###################################################
+#Batches
+
+#File name for a scenario name, keeping letters, digits, spaces, dots and dashes
+def reportFileName(name):
+    return re.sub(r'[^\w .-]', '_', name).strip() or 'scenario'
+
+#File names for a batch of scenario names, {name: file name}. Names giving the same file name (ignoring case, as
+#Windows and macOS do) get a suffix from a hash of the scenario name, so no report overwrites another
+def reportFileNames(names):
+    stems = [reportFileName(name) for name in names]
+    counts = Counter(stem.lower() for stem in stems)
+    return {name: stem if counts[stem.lower()] == 1 else stem + '-' + hashlib.sha256(name.encode()).hexdigest()[:8] for name, stem in zip(names, stems)}
+
+#Runs in the worker processes. Writes one report per (name, inputs) pair and returns a ReportOutcome for each.
+#fileNames gives the file name of each scenario, reportFileNames of these scenarios when left out
+def writeReports(scenarios, folder, reportFormat = 'html', cacheFolder = figureCacheFolder, fileNames = None):
+    if fileNames is None:
+        fileNames = reportFileNames([name for name, inputs in scenarios])
+    outcomes = []
+    for name, inputs in scenarios:
+        errors = validateInputs(inputs)
+        if errors:
+            outcomes.append(ReportOutcome(name, None, '; '.join(error.group + ': ' + error.message for error in errors)))
+            continue
+        try:
+            results = calculateStreams(**inputs)
+        except ArithmeticError as error: #e.g. every reported recycling mass 0
+            outcomes.append(ReportOutcome(name, None, 'Calculation failed: ' + str(error)))
+            continue
+
+        path = os.path.join(folder, fileNames[name] + '.' + reportFormat)
+        figures = reportFigures(results, cacheFolder)
+        if reportFormat == 'html':
+            with open(path, 'w', encoding = 'utf-8') as file:
+                file.write(htmlReport(name, results, figures))
+        else:
+            pdfReport(name, results, figures, path)
+        outcomes.append(ReportOutcome(name, path, None))
+    return outcomes
+
+#Writes a report for every scenario of a dict of name: inputs into folder, spread over worker processes in chunks of
+#chunkSize scenarios. workers 0 writes them in this process. Returns a ReportOutcome per scenario in the order given
+def generateReports(scenarios, folder, reportFormat = 'html', workers = None, chunkSize = 8, cacheFolder = figureCacheFolder, progress = noProgress):
+    if reportFormat not in ('html', 'pdf'):
+        raise ValueError('Reports are written as html or pdf, not ' + str(reportFormat))
+    os.makedirs(folder, exist_ok = True)
+    items = list(scenarios.items())
+    fileNames = reportFileNames(list(scenarios)) #for the whole batch, since equal file names can fall in different chunks
+    chunks = [items[start:start + chunkSize] for start in range(0, len(items), chunkSize)]
+    outcomes = {}
+
+    if workers == 0:
+        for chunk in chunks:
+            for outcome in writeReports(chunk, folder, reportFormat, cacheFolder, fileNames):
+                outcomes[outcome.name] = outcome
+            progress(len(outcomes) / len(items))
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            futures = [pool.submit(writeReports, chunk, folder, reportFormat, cacheFolder, fileNames) for chunk in chunks]
+            try:
+                for future in as_completed(futures):
+                    for outcome in future.result():
+                        outcomes[outcome.name] = outcome
+                    progress(len(outcomes) / len(items))
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+    return [outcomes[name] for name, inputs in items]
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Write a report for every scenario of a scenario library.')
+    parser.add_argument('library', help = 'scenario library (.npz) saved from the GUI')
+    parser.add_argument('folder', help = 'folder the reports are written to')
+    parser.add_argument('--format', choices = ['html', 'pdf'], default = 'html')
+    parser.add_argument('--workers', type = int, default = None, help = 'worker processes (default: one per CPU, 0 for none)')
+    parser.add_argument('--no-figure-cache', action = 'store_true', help = 'draw every figure instead of reusing ' + figureCacheFolder)
+    arguments = parser.parse_args()
+
+    library = ScenarioLibrary.load(arguments.library)
+    scenarios = {name: library.inputs(name) for name in library.names}
+    cacheFolder = None if arguments.no_figure_cache else figureCacheFolder
+    outcomes = generateReports(scenarios, arguments.folder, arguments.format, arguments.workers, cacheFolder = cacheFolder)
+
+    failed = [outcome for outcome in outcomes if outcome.error is not None]
+    print('Wrote ' + str(len(outcomes) - len(failed)) + ' reports to ' + arguments.folder)
+    for outcome in failed:
+        print(outcome.name + ': ' + outcome.error)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+#Results of engine runs kept on disk between sessions and shared by every process on the machine (service workers,
+#sweep workers, batch jobs). A cache is one SQLite file in WAL mode, so readers never wait for a writer and writers
+#from many processes take turns. An entry is keyed by the model version (a hash of the sources of the model modules,
+#so editing the model never returns old results), a kind naming what was stored (a sweep summary function with a hash
+#of its module, the service's result fields) and scenarioHash of the inputs. Arrays are stored as compressed .npy bytes and other results as
+#compressed JSON. When the stored bytes pass maxBytes the least recently used entries are deleted; SQLite reuses
+#their pages, so the file stays about that size
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import time
+import zlib
+import numpy as np
+from contextlib import contextmanager
+from eolPlastic.data import dataFolder
+from eolPlastic.engine import scenarioHash
+
+resultCacheVersion = 1 #part of the model version, raise it when entries are stored differently
+resultCachePath = os.path.join(dataFolder, 'EoL Plastic Result Cache.sqlite')
+resultCacheSize = 2*1024**3 #bytes of stored results
+evictionMargin = 0.9 #eviction goes down to this share of maxBytes, so a full cache doesn't evict on every write
+#Modules whose results can be cached: calculateStreams and the modules summarizing its results
+modelModules = ['data.py', 'engine.py', 'emissions.py', 'exposure.py', 'incineration.py', 'migration.py', 'sampling.py', 'surrogate.py', 'trade.py']
+
+#Hash of everything cached results depend on
+def modelVersion():
+    digest = hashlib.sha256(str(resultCacheVersion).encode())
+    folder = os.path.dirname(os.path.abspath(__file__))
+    for name in modelModules:
+        with open(os.path.join(folder, name), 'rb') as file:
+            digest.update(file.read())
+    return digest.hexdigest()[:32]
+
+currentModelVersion = modelVersion()
+
+def encodeValue(value):
+    if isinstance(value, np.ndarray):
+        buffer = io.BytesIO()
+        np.save(buffer, value, allow_pickle = False)
+        return 'npy', zlib.compress(buffer.getvalue())
+    return 'json', zlib.compress(json.dumps(value).encode())
+
+def decodeValue(encoding, blob):
+    data = zlib.decompress(blob)
+    if encoding == 'npy':
+        return np.load(io.BytesIO(data), allow_pickle = False)
+    return json.loads(data)
+
+#Write transaction taking the lock at the start, so two processes can't both read the stored size and then evict
+@contextmanager
+def writeTransaction(connection):
+    connection.execute('BEGIN IMMEDIATE')
+    try:
+        yield connection
+    except BaseException:
+        connection.execute('ROLLBACK')
+        raise
+    connection.execute('COMMIT')
+
+class DiskResultCache:
+    def __init__(self, path = resultCachePath, maxBytes = resultCacheSize, timeout = 60):
+        self.path = path
+        self.maxBytes = maxBytes
+        self.timeout = timeout #seconds to wait for another process's write
+        self.connection = None
+        self.processID = None
+        self.hits = 0
+        self.misses = 0
+
+    #Connections can't cross a fork, so each process opens its own
+    def connect(self):
+        if self.connection is None or self.processID != os.getpid():
+            connection = sqlite3.connect(self.path, timeout = self.timeout, isolation_level = None)
+            connection.execute('PRAGMA journal_mode = WAL')
+            connection.execute('PRAGMA synchronous = NORMAL') #a power cut can lose the last writes, never corrupt the file
+            connection.execute('CREATE TABLE IF NOT EXISTS results (model TEXT, kind TEXT, scenario TEXT, encoding TEXT, value BLOB, '
+                               'size INTEGER, used REAL, UNIQUE (model, kind, scenario))')
+            #Sizes and use times are summed and sorted from this index alone, without reading the values
+            connection.execute('CREATE INDEX IF NOT EXISTS resultsUsed ON results (used, size)')
+            self.connection, self.processID = connection, os.getpid()
+        return self.connection
+
+    def __getstate__(self): #sent to worker processes without the connection
+        return {'path': self.path, 'maxBytes': self.maxBytes, 'timeout': self.timeout}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    #Stored values of kind for a list of scenario hashes, None for those not stored. Hits are marked as used now
+    def getMany(self, kind, keys):
+        connection = self.connect()
+        found = {}
+        for start in range(0, len(keys), 500): #SQLite takes at most 999 parameters
+            chunk = keys[start:start+500]
+            rows = connection.execute('SELECT scenario, encoding, value FROM results WHERE model = ? AND kind = ? AND scenario IN (' +
+                                      ','.join('?'*len(chunk)) + ')', [currentModelVersion, kind] + chunk)
+            found.update((scenario, (encoding, value)) for scenario, encoding, value in rows)
+        if found:
+            now = time.time()
+            with writeTransaction(connection):
+                connection.executemany('UPDATE results SET used = ? WHERE model = ? AND kind = ? AND scenario = ?',
+                                       [(now, currentModelVersion, kind, scenario) for scenario in found])
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return [decodeValue(*found[key]) if key in found else None for key in keys]
+
+    def get(self, kind, key):
+        return self.getMany(kind, [key])[0]
+
+    #Stores {scenario hash: value} under kind, then evicts if the cache is over maxBytes
+    def putMany(self, kind, values):
+        if not values:
+            return
+        connection = self.connect()
+        now = time.time()
+        rows = []
+        for key, value in values.items():
+            encoding, blob = encodeValue(value)
+            rows.append((currentModelVersion, kind, key, encoding, blob, len(blob), now))
+        with writeTransaction(connection):
+            connection.executemany('INSERT OR REPLACE INTO results (model, kind, scenario, encoding, value, size, used) VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+            self.evict(connection)
+
+    def put(self, kind, key, value):
+        self.putMany(kind, {key: value})
+
+    #Values of kind for every scenario, from the cache or else from evaluate(inputs), which returns None for a scenario
+    #it can't run (nothing is stored for it). The new values are stored together
+    def evaluate(self, kind, scenarios, evaluate):
+        keys = [scenarioHash(inputs) for inputs in scenarios]
+        values = self.getMany(kind, keys)
+        newValues = {}
+        for i, value in enumerate(values):
+            if value is None:
+                values[i] = evaluate(scenarios[i])
+                if values[i] is not None:
+                    newValues[keys[i]] = values[i]
+        self.putMany(kind, newValues)
+        return values
+
+    #Deletes the least recently used entries (those of other model versions are never used again) down to evictionMargin
+    def evict(self, connection):
+        stored = self.storedBytes()
+        if stored <= self.maxBytes:
+            return
+        excess = stored - evictionMargin*self.maxBytes
+        oldest = []
+        for row, size in connection.execute('SELECT rowid, size FROM results ORDER BY used'):
+            oldest.append((row,))
+            excess -= size
+            if excess <= 0:
+                break
+        connection.executemany('DELETE FROM results WHERE rowid = ?', oldest)
+
+    def __len__(self):
+        return self.connect().execute('SELECT COUNT(*) FROM results INDEXED BY resultsUsed').fetchone()[0]
+
+    def storedBytes(self):
+        return self.connect().execute('SELECT COALESCE(SUM(size), 0) FROM results INDEXED BY resultsUsed').fetchone()[0]
+
+    def clear(self):
+        connection = self.connect()
+        connection.execute('DELETE FROM results')
+        connection.execute('VACUUM')
+
+    def close(self):
+        if self.connection is not None and self.processID == os.getpid():
+            self.connection.close()
+        self.connection = None
@@ -0,0 +1,72 @@
+#Monte Carlo batches of scenarios that keep the fraction inputs compositional. Every group of fields that inputGroups says
+#must sum to 1 (or to another field) is drawn as one composition, from a Dirichlet or a logistic-normal distribution
+#centred on the base scenario, so each draw sums exactly to its target and no draw is rejected. Fields that are 0 in the
+#base stay 0. Groups are drawn in the order of inputGroups, so conditions draws the recycled, incinerated and landfilled
+#split first and then splits the drawn recycled fraction into domestic, exported and re-exported
+import numpy as np
+from eolPlastic.engine import inputGroups, inputListNames, scenarioGroupOffsets
+
+#A group's distribution is a tuple naming one of these with its spread, e.g. ('dirichlet', 200) or ('logisticNormal', 0.1).
+#The Dirichlet concentration is the sum of its parameters: the larger, the tighter. The logistic-normal spread is the
+#standard deviation of each log-ratio to the last nonzero field, or their covariance matrix
+defaultComposition = ('dirichlet', 200)
+
+#(samples, parts) compositions with mean composition, from normalized gamma draws
+def sampleDirichlet(rng, samples, composition, concentration):
+    draws = rng.standard_gamma(composition*concentration, (samples, len(composition)))
+    return draws/draws.sum(axis = 1, keepdims = True)
+
+#(samples, parts) compositions centred on composition in log-ratios: normal additive log-ratios, closed again with a softmax
+def sampleLogisticNormal(rng, samples, composition, spread):
+    center = np.log(composition[:-1]/composition[-1])
+    spread = np.asarray(spread, dtype = float)
+    if spread.ndim == 2:
+        ratios = rng.multivariate_normal(center, spread, samples, method = 'cholesky')
+    else:
+        ratios = center + spread*rng.standard_normal((samples, len(center)))
+    ratios = np.concatenate([ratios, np.zeros((samples, 1))], axis = 1)
+    ratios -= ratios.max(axis = 1, keepdims = True)
+    parts = np.exp(ratios)
+    return parts/parts.sum(axis = 1, keepdims = True)
+
+compositionSamplers = {'dirichlet': sampleDirichlet, 'logisticNormal': sampleLogisticNormal}
+
+#Every group of fields drawn as a composition: (input list, fields summed, field they sum to or None for 1)
+compositionalGroups = [(group, summed, target) for group in inputListNames for summed, target, message in inputGroups[group]['sums']]
+
+def sampleComposition(distribution, composition, samples, rng):
+    name, *parameters = distribution
+    if name not in compositionSamplers:
+        raise ValueError('Unknown composition distribution ' + repr(name) + ', use one of ' + ', '.join(compositionSamplers))
+    composition = np.asarray(composition, dtype = float)
+    if not (composition >= 0).all() or composition.sum() <= 0:
+        raise ValueError('A composition needs values of at least 0 that are not all 0')
+    composition = composition/composition.sum()
+    nonzero = np.flatnonzero(composition)
+    draws = np.zeros((samples, len(composition)))
+    if len(nonzero) == 1:
+        draws[:, nonzero] = 1
+    else:
+        draws[:, nonzero] = compositionSamplers[name](rng, samples, composition[nonzero], *parameters)
+    return draws
+
+#Batch of samples scenarios around base (one scenario as calculateStreams takes it), in the form validateInputs takes.
+#distributions gives the distribution of some input lists, used for all of their groups; the others get
+#defaultComposition. Fields outside the groups keep their base values. Each draw is a composition of the base's
+#normalized values times the target's drawn value, so the sums hold exactly
+def sampleScenarios(base, samples, distributions = None, seed = None):
+    distributions = distributions or {}
+    unknown = [group for group in distributions if group not in inputGroups]
+    if unknown:
+        raise ValueError('No input list called ' + ', '.join(unknown))
+    rng = np.random.default_rng(seed)
+    batch = {name: np.tile(np.asarray(base[name], dtype = float), (samples, 1)) for name in inputListNames}
+    for group, summed, target in compositionalGroups:
+        scale = 1 if target is None else batch[group][:, target, None]
+        batch[group][:, summed] = scale*sampleComposition(distributions.get(group, defaultComposition), batch[group][0, summed], samples, rng)
+    return batch
+
+#(samples, values) rows of a batch, each one the inputs of a scenario laid out like ScenarioLibrary rows (unpackScenario reads them)
+def batchRows(batch):
+    return np.concatenate([np.asarray(batch[name], dtype = float).reshape(-1, stop - start) for name, start, stop in
+                           zip(inputListNames, scenarioGroupOffsets, scenarioGroupOffsets[1:])], axis = 1)
@@ -0,0 +1,323 @@
+#Local HTTP/JSON service running the engine for notebooks and dashboards, without Tk. Start it with
+#    python -m eolPlastic.service --port 8150 --workers 4
+#A scenario is a JSON object mapping every name of inputListNames to its list of numbers (GET /scenarios/2018 gives one).
+#    GET  /health            status, workers and cache use
+#    GET  /scenarios/2018    the 2018 inputs
+#    POST /validate          {"inputs": scenario} -> {"errors": [...]}
+#    POST /calculate         {"inputs": scenario, "fields": [...]} -> {"results": {...}}
+#    POST /batch             {"scenarios": [scenario, ...], "fields": [...]} -> {"results": [{...} or {"errors": [...]}, ...]}
+#fields picks the results of calculateStreams to send back, all of them when left out. Requests are read and answered
+#on one asyncio loop and the engine runs in a pool of worker processes, with results kept in a ResultCache. With
+#--result-cache the workers also keep them on disk in a DiskResultCache, shared with other services and later runs
+import asyncio
+import argparse
+import functools
+import json
+import math
+import multiprocessing
+import numbers
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from eolPlastic import engine
+from eolPlastic.engine import inputListNames, inputGroups, validateInputs, packScenario, calculateStreams
+from eolPlastic.resultcache import DiskResultCache, resultCachePath, resultCacheSize
+
+serviceVersion = 1
+maxRequestSize = 64*1024*1024 #bytes of one request body
+resultFields = ['streamTRVWLists', 'manufactureDictList', 'useDictList', 'cspDictList', 'mechRecycDictList', 'incinDictList', 'landDictList',
+                'mswCompProp', 'amountOfPlasticRecycled', 'plasticsMassDict', 'stageInputMasses']
+
+statusTexts = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+#Problem with a request, answered with status and a JSON body holding message and the per-field errors
+class ServiceError(Exception):
+    def __init__(self, status, message, errors = ()):
+        super().__init__(message)
+        self.status = status
+        self.errors = list(errors)
+
+#Results of calculateStreams by packed scenario. The least recently used are dropped beyond size
+class ResultCache:
+    def __init__(self, size = 10000):
+        self.size = size
+        self.results = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key):
+        if key not in self.results:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.results.move_to_end(key)
+        return self.results[key]
+    
+    def put(self, key, outcome):
+        self.results[key] = outcome
+        self.results.move_to_end(key)
+        while len(self.results) > self.size:
+            self.results.popitem(last = False)
+
+def scenarioOutcome(inputs):
+    try:
+        return True, calculateStreams(**inputs)
+    except ArithmeticError as error: #e.g. every reported recycling mass 0
+        return False, 'Calculation failed: ' + str(error)
+
+#Runs in the worker processes. Returns (True, results) or (False, message) for each scenario. Scenarios in diskCache
+#are read from it with the resultFields alone, the others run and their resultFields are stored
+def evaluateScenarios(scenarios, diskCache = None):
+    if diskCache is None:
+        return [scenarioOutcome(inputs) for inputs in scenarios]
+    failures = []
+    def storedResults(inputs):
+        ok, value = scenarioOutcome(inputs)
+        if ok:
+            return {field: value[field] for field in resultFields}
+        failures.append(value)
+    values = diskCache.evaluate('service results', scenarios, storedResults)
+    messages = iter(failures) #failed scenarios are run in order, so their messages are too
+    return [(True, value) if value is not None else (False, next(messages)) for value in values]
+
+#Checks that data holds every input list with the right number of finite numbers, returns them as lists of floats
+def scenarioInputs(data):
+    if not isinstance(data, dict):
+        raise ServiceError(400, 'A scenario must be an object of input lists.')
+    inputs = {}
+    for name in inputListNames:
+        values = data.get(name)
+        length = len(inputGroups[name]['fields'])
+        if not isinstance(values, list) or len(values) != length:
+            raise ServiceError(400, name + ' must be a list of ' + str(length) + ' numbers.')
+        if not all(isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value) for value in values):
+            raise ServiceError(400, name + ' must only hold finite numbers.')
+        inputs[name] = [float(value) for value in values]
+    return inputs
+
+def fieldErrors(inputs):
+    return [{'group': error.group, 'fields': error.fields, 'message': error.message} for error in validateInputs(inputs)]
+
+def selectedFields(request):
+    fields = request.get('fields', resultFields)
+    if not isinstance(fields, list) or not set(fields) <= set(resultFields):
+        raise ServiceError(400, 'fields must be a list of: ' + ', '.join(resultFields))
+    return fields
+
+#payload with plain ints and floats for every number, and None for the non-finite ones, which JSON can't hold
+def jsonSafe(value):
+    if isinstance(value, dict):
+        return {key: jsonSafe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [jsonSafe(item) for item in value]
+    if isinstance(value, bool) or not isinstance(value, numbers.Real):
+        return value
+    if isinstance(value, numbers.Integral):
+        return int(value)
+    return float(value) if math.isfinite(value) else None
+
+def responseBody(payload):
+    return json.dumps(jsonSafe(payload), allow_nan = False).encode()
+
+def requestObject(body):
+    try:
+        request = json.loads(body or b'{}')
+    except ValueError as error:
+        raise ServiceError(400, 'Body is not JSON: ' + str(error))
+    if not isinstance(request, dict):
+        raise ServiceError(400, 'Body must be a JSON object.')
+    return request
+
+class ScenarioService:
+    def __init__(self, workers = None, cacheSize = 10000, chunkSize = 16, diskCache = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = self.startPool()
+        self.cache = ResultCache(cacheSize)
+        self.diskCache = diskCache #DiskResultCache the workers read and add to, or None
+        self.chunkSize = chunkSize #scenarios sent to a worker at once
+        self.running = {} #futures of scenarios being calculated, so equal scenarios in flight run only once
+        self.routes = {'/health': ('GET', self.health), '/scenarios/2018': ('GET', self.scenario2018), '/validate': ('POST', self.validate),
+                       '/calculate': ('POST', self.calculate), '/batch': ('POST', self.batch)}
+    
+    #Spawned rather than forked: the workers start on the first request, after the server is listening, and a forked
+    #worker would hold copies of the listening socket and of open connections, so a closed connection never ended
+    def startPool(self):
+        return ProcessPoolExecutor(self.workers, mp_context = multiprocessing.get_context('spawn'))
+    
+    #A pool whose worker died takes no more jobs, so it is replaced once (by whichever of its jobs notices first)
+    def replacePool(self, pool):
+        if pool is self.pool:
+            self.pool = self.startPool()
+            pool.shutdown(wait = False, cancel_futures = True)
+    
+    #Outcomes of calculateStreams for valid scenarios, from the cache, a run in flight or new runs in the pool
+    async def evaluate(self, scenarios):
+        loop = asyncio.get_running_loop()
+        outcomes = []
+        newRuns = []
+        for inputs in scenarios:
+            key = packScenario(inputs).tobytes()
+            outcome = self.cache.get(key)
+            if outcome is None:
+                if key not in self.running:
+                    self.running[key] = loop.create_future()
+                    newRuns.append((key, inputs))
+                outcome = self.running[key]
+            outcomes.append(outcome)
+        
+        for start in range(0, len(newRuns), self.chunkSize):
+            self.submitChunk(loop, newRuns[start:start+self.chunkSize])
+        return [await outcome if isinstance(outcome, asyncio.Future) else outcome for outcome in outcomes]
+    
+    def submitChunk(self, loop, chunk):
+        pool = self.pool
+        try:
+            job = loop.run_in_executor(pool, evaluateScenarios, [inputs for key, inputs in chunk], self.diskCache)
+        except BrokenProcessPool: #a worker died since the last job finished
+            self.replacePool(pool)
+            pool = self.pool
+            job = loop.run_in_executor(pool, evaluateScenarios, [inputs for key, inputs in chunk], self.diskCache)
+        job.add_done_callback(functools.partial(self.finishChunk, pool, chunk))
+    
+    def finishChunk(self, pool, chunk, job):
+        error = None if job.cancelled() else job.exception()
+        if job.cancelled() or error is not None: #nothing is cached
+            if isinstance(error, BrokenProcessPool):
+                self.replacePool(pool)
+            outcomes = [(False, 'Calculation failed: ' + (str(error) if error is not None else 'cancelled'))]*len(chunk)
+        else:
+            outcomes = job.result()
+            for (key, inputs), outcome in zip(chunk, outcomes):
+                self.cache.put(key, outcome)
+        for (key, inputs), outcome in zip(chunk, outcomes):
+            self.running.pop(key).set_result(outcome)
+    
+    async def health(self, request):
+        return {'status': 'ok', 'version': serviceVersion, 'workers': self.workers, 'running': len(self.running),
+                'cached': len(self.cache.results), 'cacheHits': self.cache.hits, 'cacheMisses': self.cache.misses,
+                'diskCache': self.diskCache.path if self.diskCache is not None else None}
+    
+    async def scenario2018(self, request):
+        return {'inputs': {name: list(getattr(engine, name + '2018')) for name in inputListNames}}
+    
+    async def validate(self, request):
+        return {'errors': fieldErrors(scenarioInputs(request.get('inputs')))}
+    
+    async def calculate(self, request):
+        inputs = scenarioInputs(request.get('inputs'))
+        fields = selectedFields(request)
+        errors = fieldErrors(inputs)
+        if errors:
+            raise ServiceError(400, 'The scenario is not valid.', errors)
+        [(ok, value)] = await self.evaluate([inputs])
+        if not ok:
+            raise ServiceError(400, value)
+        return {'results': {field: value[field] for field in fields}}
+    
+    #Invalid scenarios get their errors in place of results, the others are calculated together
+    async def batch(self, request):
+        scenarios = request.get('scenarios')
+        if not isinstance(scenarios, list):
+            raise ServiceError(400, 'scenarios must be a list of scenarios.')
+        fields = selectedFields(request)
+        answers = [None]*len(scenarios)
+        valid = []
+        for i, data in enumerate(scenarios):
+            try:
+                inputs = scenarioInputs(data)
+            except ServiceError as error:
+                answers[i] = {'errors': [{'group': None, 'fields': [], 'message': str(error)}]}
+                continue
+            errors = fieldErrors(inputs)
+            if errors:
+                answers[i] = {'errors': errors}
+            else:
+                valid.append((i, inputs))
+        
+        outcomes = await self.evaluate([inputs for i, inputs in valid])
+        for (i, inputs), (ok, value) in zip(valid, outcomes):
+            answers[i] = {field: value[field] for field in fields} if ok else {'errors': [{'group': None, 'fields': [], 'message': value}]}
+        return {'results': answers}
+    
+    async def respond(self, method, path, body):
+        try:
+            if path.split('?')[0] not in self.routes:
+                raise ServiceError(404, 'No such endpoint: ' + path)
+            allowed, handler = self.routes[path.split('?')[0]]
+            if method != allowed:
+                raise ServiceError(405, path + ' only takes ' + allowed + ' requests.')
+            return 200, await handler(requestObject(body) if method == 'POST' else {})
+        except ServiceError as error:
+            return error.status, {'error': str(error), 'errors': error.errors}
+        except Exception as error:
+            return 500, {'error': 'Internal error: ' + repr(error), 'errors': []}
+    
+    #Answers the HTTP/1.1 requests of one connection, keeping it open between requests unless asked not to
+    async def handleConnection(self, reader, writer):
+        try:
+            while True:
+                requestLine = await reader.readline()
+                if not requestLine.strip():
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if not line.strip():
+                        break
+                    name, separator, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                
+                parts = requestLine.decode('latin-1').split()
+                length = int(headers.get('content-length', '0')) if headers.get('content-length', '0').isdigit() else -1
+                if len(parts) != 3 or length < 0:
+                    status, payload, keepAlive = 400, {'error': 'Malformed request.', 'errors': []}, False
+                elif length > maxRequestSize:
+                    status, payload, keepAlive = 413, {'error': 'Request body is too large.', 'errors': []}, False
+                else:
+                    method, path, version = parts
+                    status, payload = await self.respond(method, path, await reader.readexactly(length))
+                    keepAlive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                
+                data = responseBody(payload)
+                writer.write(('HTTP/1.1 ' + str(status) + ' ' + statusTexts[status] + '\r\nContent-Type: application/json\r\nContent-Length: ' +
+                              str(len(data)) + '\r\nConnection: ' + ('keep-alive' if keepAlive else 'close') + '\r\n\r\n').encode() + data)
+                await writer.drain()
+                if not keepAlive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+    
+    async def serve(self, host = '127.0.0.1', port = 8150):
+        server = await asyncio.start_server(self.handleConnection, host, port, backlog = 1024)
+        async with server:
+            await server.serve_forever()
+    
+    def close(self):
+        self.pool.shutdown(cancel_futures = True)
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Serve the end-of-life plastic additive model over HTTP on this machine.')
+    parser.add_argument('--host', default = '127.0.0.1')
+    parser.add_argument('--port', type = int, default = 8150)
+    parser.add_argument('--workers', type = int, default = None, help = 'worker processes (default: one per CPU)')
+    parser.add_argument('--cache-size', type = int, default = 10000, help = 'results kept in memory')
+    parser.add_argument('--result-cache', nargs = '?', const = resultCachePath, default = None,
+                        help = 'also keep results in this SQLite file (default ' + resultCachePath + ')')
+    parser.add_argument('--result-cache-size', type = float, default = resultCacheSize/1024**2, help = 'megabytes of results kept in the file')
+    arguments = parser.parse_args()
+    
+    diskCache = None if arguments.result_cache is None else DiskResultCache(arguments.result_cache, int(arguments.result_cache_size*1024**2))
+    service = ScenarioService(arguments.workers, arguments.cache_size, diskCache = diskCache)
+    print('Serving on http://' + arguments.host + ':' + str(arguments.port))
+    try:
+        asyncio.run(service.serve(arguments.host, arguments.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+#Polynomial chaos surrogate of the engine for interactive use. A surrogate is trained offline on a batch of engine runs
+#over a box of a few inputs around a base scenario: Legendre polynomials of total degree up to degree in the inputs,
+#fitted by least squares to Latin hypercube points. Held-out runs give its approximation error. It then answers the
+#additive releases and GHG of each stage for a point of the box in microseconds, and evaluate(point, exact = True), or
+#any point outside the box, runs the engine instead. Saved surrogates are compressed numpy archives like scenario libraries.
+#Inputs are the optimizer's recyclingEfficiency and incinerationShare (see optimizerConditions), or any
+#mass field, named 'group:field' (e.g. 'conditions:Total Plastic')
+import os
+import itertools
+import numpy as np
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from eolPlastic.engine import (calculateStreams, optimizerConditions, optimizerVariables, conditionShares, additiveRelease, additiveReleaseStreams,
+                               inputGroups, inputListNames, packScenario, unpackScenario)
+
+surrogateFormatVersion = 2
+
+#Stream summary columns whose emissions belong to each stage; transport of recycling residues goes with mechanical recycling
+ghgStageColumns = {'Manufacture': [3], 'Collection and Sorting': [7, 15], 'Mechanical Recycling': [17, 20, 23, 28], 'Incineration': [25],
+                   'Landfill': [29, 30], 'Export': [27]}
+
+surrogateOutputs = ['Total Additive Release'] + ['Additives Stream ' + str(stream) for stream in additiveReleaseStreams]
+surrogateOutputs += ['GHG ' + stage for stage in ghgStageColumns] + ['Total GHG']
+
+#One input of a surrogate and the range it was trained over
+SurrogateParameter = namedtuple('SurrogateParameter', ['name', 'low', 'high'])
+
+#Answer of Surrogate.evaluate. error: the held-out RMS error of each output, 0 when exact (the engine ran)
+SurrogateAnswer = namedtuple('SurrogateAnswer', ['values', 'error', 'exact'])
+
+def checkParameterName(name):
+    if name in optimizerVariables:
+        return
+    group, _, field = name.partition(':')
+    if group not in inputGroups or field not in inputGroups[group]['fields'] or inputGroups[group]['fields'].index(field) not in inputGroups[group]['masses']:
+        raise ValueError('Surrogate inputs are ' + ', '.join(optimizerVariables) + " or a mass field as 'group:field', not " + repr(name))
+
+#Inputs of calculateStreams for a point (one value per name) around base
+def surrogateInputs(base, names, point):
+    inputs = {name: [float(value) for value in base[name]] for name in inputListNames}
+    shares = conditionShares(inputs['conditions'])
+    for name, value in zip(names, point):
+        if name in optimizerVariables:
+            shares[name] = float(value)
+        else:
+            group, _, field = name.partition(':')
+            inputs[group][inputGroups[group]['fields'].index(field)] = float(value)
+    inputs['conditions'] = optimizerConditions(inputs['conditions'], *[shares[name] for name in optimizerVariables])
+    return inputs
+
+def surrogateValues(results):
+    rows = {row[0]: row for row in results['streamTRVWLists']}
+    additives = [rows['Total Additives'][stream] for stream in additiveReleaseStreams]
+    ghg = [sum(rows['Total Emissions'][column] for column in columns) for columns in ghgStageColumns.values()]
+    return np.array([additiveRelease(results)] + additives + ghg + [sum(ghg)], dtype = float)
+
+#Engine outputs for rows of points, NaN where the engine could not run. Module level so worker processes can run it
+def evaluateSurrogatePoints(base, names, points):
+    values = np.full((len(points), len(surrogateOutputs)), np.nan)
+    for i, point in enumerate(np.asarray(points).tolist()):
+        try:
+            values[i] = surrogateValues(calculateStreams(**surrogateInputs(base, names, point)))
+        except ArithmeticError: #e.g. a stream the engine divides by is empty
+            pass
+    return values
+
+#Exponents of every polynomial term in each input, total degree up to degree
+def polynomialTerms(dimensions, degree):
+    return np.array([term for term in itertools.product(range(degree + 1), repeat = dimensions) if sum(term) <= degree], dtype = int).reshape(-1, dimensions)
+
+#(points, terms) Legendre products of points scaled to [-1, 1]
+def legendreBasis(scaled, terms):
+    degree = int(terms.max()) if terms.size else 0
+    values = np.empty(scaled.shape + (degree + 1,))
+    values[..., 0] = 1
+    if degree:
+        values[..., 1] = scaled
+    for n in range(1, degree):
+        values[..., n + 1] = ((2*n + 1)*scaled*values[..., n] - n*values[..., n - 1])/(n + 1)
+    return np.prod(values[:, np.arange(scaled.shape[1]), terms], axis = -1)
+
+#(points, dimensions) Latin hypercube over the box
+def latinHypercube(rng, points, low, high):
+    strata = np.argsort(rng.random((points, len(low))), axis = 0)
+    return low + (strata + rng.random((points, len(low))))/points*(high - low)
+
+class Surrogate:
+    def __init__(self, base, parameters, terms, coefficients, error, maximumError):
+        self.base = {name: [float(value) for value in base[name]] for name in inputListNames}
+        self.parameters = [SurrogateParameter(*parameter) for parameter in parameters]
+        self.names = [parameter.name for parameter in self.parameters]
+        self.low = np.array([parameter.low for parameter in self.parameters], dtype = float)
+        self.high = np.array([parameter.high for parameter in self.parameters], dtype = float)
+        self.terms = np.asarray(terms, dtype = int)
+        self.coefficients = np.asarray(coefficients, dtype = float)
+        self.error = dict(zip(surrogateOutputs, np.asarray(error, dtype = float).tolist()))
+        self.maximumError = dict(zip(surrogateOutputs, np.asarray(maximumError, dtype = float).tolist()))
+        self.errorArray = np.asarray(error, dtype = float)
+
+    def inside(self, points):
+        points = np.atleast_2d(points)
+        return ((points >= self.low) & (points <= self.high)).all(axis = 1)
+
+    #(points, outputs) surrogate values for rows of points, without checking that they are in the box
+    def predict(self, points):
+        points = np.atleast_2d(np.asarray(points, dtype = float))
+        return legendreBasis((2*points - self.low - self.high)/(self.high - self.low), self.terms) @ self.coefficients
+
+    #Outputs for one point, from the engine when exact or when the point is outside the box the surrogate knows
+    def evaluate(self, point, exact = False):
+        point = np.asarray(point, dtype = float)
+        if exact or not self.inside(point)[0]:
+            values = surrogateValues(calculateStreams(**surrogateInputs(self.base, self.names, point)))
+            return SurrogateAnswer(dict(zip(surrogateOutputs, values.tolist())), dict.fromkeys(surrogateOutputs, 0.0), True)
+        return SurrogateAnswer(dict(zip(surrogateOutputs, self.predict(point)[0].tolist())), self.error, False)
+
+    def save(self, path):
+        temporaryPath = path + '.tmp'
+        with open(temporaryPath, 'wb') as file: #written beside the old surrogate first so a failed save can't corrupt it
+            np.savez_compressed(file, version = np.array(surrogateFormatVersion), base = packScenario(self.base), names = np.array(self.names),
+                                low = self.low, high = self.high, outputs = np.array(surrogateOutputs), terms = self.terms,
+                                coefficients = self.coefficients, error = self.errorArray,
+                                maximumError = np.array([self.maximumError[name] for name in surrogateOutputs]))
+        os.replace(temporaryPath, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle = False) as data:
+            if int(data['version']) != surrogateFormatVersion or data['outputs'].tolist() != surrogateOutputs:
+                raise ValueError(path + ' is a surrogate of another model version, train it again')
+            return cls(unpackScenario(data['base']), zip(data['names'].tolist(), data['low'].tolist(), data['high'].tolist()),
+                       data['terms'], data['coefficients'], data['error'], data['maximumError'])
+
+#Box of the optimizer variables and 20% either way of the total plastic, around base
+def defaultSurrogateParameters(base):
+    totalPlastic = float(base['conditions'][1])
+    return [SurrogateParameter('recyclingEfficiency', 0.3, 1.0), SurrogateParameter('incinerationShare', 0.0, 1.0),
+            SurrogateParameter('conditions:Total Plastic', 0.8*totalPlastic, 1.2*totalPlastic)]
+
+#Trains a surrogate on runs engine runs (testFraction of them held out to measure the error) in workers processes
+def trainSurrogate(base, parameters = None, degree = 3, runs = 400, testFraction = 0.2, workers = 0, chunkSize = 50, seed = None):
+    parameters = [SurrogateParameter(*parameter) for parameter in (parameters or defaultSurrogateParameters(base))]
+    for parameter in parameters:
+        checkParameterName(parameter.name)
+        if not parameter.low < parameter.high:
+            raise ValueError(parameter.name + ' needs a low value below its high value')
+    names = [parameter.name for parameter in parameters]
+    low = np.array([parameter.low for parameter in parameters], dtype = float)
+    high = np.array([parameter.high for parameter in parameters], dtype = float)
+    terms = polynomialTerms(len(parameters), degree)
+    testRuns = int(runs*testFraction)
+    if runs - testRuns < 2*len(terms):
+        raise ValueError(str(runs - testRuns) + ' training runs are too few for ' + str(len(terms)) + ' terms, use at least ' + str(2*len(terms)))
+
+    rng = np.random.default_rng(seed)
+    points = latinHypercube(rng, runs, low, high)
+    chunks = [points[start:start + chunkSize] for start in range(0, runs, chunkSize)]
+    if workers:
+        with ProcessPoolExecutor(workers) as pool:
+            values = np.concatenate(list(pool.map(evaluateSurrogatePoints, itertools.repeat(base), itertools.repeat(names), chunks)))
+    else:
+        values = np.concatenate([evaluateSurrogatePoints(base, names, chunk) for chunk in chunks])
+
+    ran = np.isfinite(values).all(axis = 1)
+    test = np.zeros(runs, dtype = bool)
+    test[rng.permutation(runs)[:testRuns]] = True
+    train = ran & ~test
+    test &= ran
+    scaled = (2*points - low - high)/(high - low)
+    coefficients = np.linalg.lstsq(legendreBasis(scaled[train], terms), values[train], rcond = None)[0]
+    residuals = legendreBasis(scaled[test], terms) @ coefficients - values[test]
+    error = np.sqrt((residuals**2).mean(axis = 0)) if test.any() else np.full(len(surrogateOutputs), np.nan)
+    maximumError = np.abs(residuals).max(axis = 0) if test.any() else np.full(len(surrogateOutputs), np.nan)
+    return Surrogate(base, parameters, terms, coefficients, error, maximumError)
@@ -0,0 +1,91 @@
+#Trade in plastic waste by partner country. Streams 21, 22 and 27 split four reported categories between the resins
+#with internationalResinSplits; a trade matrix gives the mass of each resin traded with each partner in each year instead.
+#It is read from a CSV file with a header and one row per value:
+#    year, flow, partner, category, tons
+#flow is Import, Export or Re-Export, and category is a resin of typesOfPlasticDomestic or a reported category of
+#typesOfPlasticsInternational, which is split between the resins like the streams do. The file becomes one array
+#(years, flows, partners, resins), so flows and their additive content for every partner and year are matrix products
+import csv
+import numpy as np
+from collections import namedtuple
+from eolPlastic.data import (typesOfPlasticDomestic, typesOfPlasticsInternational, internationalResinSplits, tradeFlows, lowAdditiveFractions,
+                             otherResinAdditives, PETadditiveTypes, HDPEadditiveTypes, PVCadditiveTypes, LDPEadditiveTypes, PLAadditiveTypes,
+                             PPadditiveTypes, PSadditiveTypes)
+
+tradeCategories = typesOfPlasticDomestic + typesOfPlasticsInternational
+tradeFileColumns = ['year', 'flow', 'partner', 'category', 'tons']
+
+#Additives in each type of plastic, as the streams add them
+resinAdditiveTypes = dict(zip(typesOfPlasticDomestic, [PETadditiveTypes, HDPEadditiveTypes, PVCadditiveTypes, LDPEadditiveTypes, PLAadditiveTypes,
+                                                       PPadditiveTypes, PSadditiveTypes, otherResinAdditives]))
+
+#(categories, resins) share of each category's bulk mass in each resin: a resin is itself, a reported category is split
+def categoryResinMatrix():
+    matrix = np.zeros((len(tradeCategories), len(typesOfPlasticDomestic)))
+    matrix[:len(typesOfPlasticDomestic)] = np.eye(len(typesOfPlasticDomestic))
+    for column, resin in enumerate(typesOfPlasticDomestic):
+        for category, share in internationalResinSplits[resin].items():
+            matrix[tradeCategories.index(category), column] = share
+    return matrix
+
+#(resins, additives) fraction of each resin's bulk mass that is each additive, as additiveMassCalculator uses
+def additiveFractionMatrix():
+    return np.array([[lowAdditiveFractions[i] if i in resinAdditiveTypes[resin] else 0 for i in otherResinAdditives] for resin in typesOfPlasticDomestic])
+
+TradeFlows = namedtuple('TradeFlows', ['flow', 'years', 'partners', 'bulk', 'resin', 'additives'])
+#bulk: (years, partners, resins) tons of plastic traded with each partner, resin: the same without its additives
+#additives: (years, partners, additives) tons of each additive in it
+
+class TradeMatrix:
+    def __init__(self, years, partners, masses): #masses: (years, flows, partners, resins) bulk tons
+        self.years = list(years)
+        self.partners = list(partners)
+        self.masses = np.asarray(masses, dtype = float).reshape(len(self.years), len(tradeFlows), len(self.partners), len(typesOfPlasticDomestic))
+        self.yearIndex = {year: row for row, year in enumerate(self.years)}
+
+    def yearRow(self, year):
+        if year not in self.yearIndex:
+            raise KeyError('No trade data for ' + str(year) + ', the matrix has ' + ', '.join(str(y) for y in self.years))
+        return self.yearIndex[year]
+
+    #Bulk mass of each resin in each flow of a year over all partners, {flow: {resin: tons}}: the tradeResinMasses of calculateStreams
+    def resinMasses(self, year):
+        totals = self.masses[self.yearRow(year)].sum(axis = 1)
+        return {flow: dict(zip(typesOfPlasticDomestic, row)) for flow, row in zip(tradeFlows, totals.tolist())}
+
+    #Flow by partner (destination of exports and re-exports, origin of imports) with its additive content, for the given
+    #years, every year by default
+    def flows(self, flow = 'Export', years = None):
+        if flow not in tradeFlows:
+            raise ValueError('No trade flow called ' + repr(flow) + ', use one of ' + ', '.join(tradeFlows))
+        years = self.years if years is None else list(years)
+        bulk = self.masses[[self.yearRow(year) for year in years], tradeFlows.index(flow)]
+        fractions = additiveFractionMatrix()
+        return TradeFlows(flow, years, self.partners, bulk, bulk*(1 - fractions.sum(axis = 1)), bulk @ fractions)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, newline = '') as file:
+            reader = csv.DictReader(file)
+            missing = [column for column in tradeFileColumns if column not in (reader.fieldnames or [])]
+            if missing:
+                raise ValueError(path + ' has no ' + ', '.join(missing) + ' column')
+            rows = list(reader)
+
+        years = sorted({int(row['year']) for row in rows})
+        partners = list(dict.fromkeys(row['partner'].strip() for row in rows))
+        yearRows = {year: row for row, year in enumerate(years)}
+        partnerRows = {partner: row for row, partner in enumerate(partners)}
+        index = np.zeros((4, len(rows)), dtype = int)
+        tons = np.zeros(len(rows))
+        for number, row in enumerate(rows):
+            flow, category = row['flow'].strip(), row['category'].strip()
+            if flow not in tradeFlows or category not in tradeCategories:
+                raise ValueError('Line ' + str(number + 2) + ' of ' + path + ': flow must be one of ' + ', '.join(tradeFlows) +
+                                 ' and category one of ' + ', '.join(tradeCategories))
+            index[:, number] = (yearRows[int(row['year'])], tradeFlows.index(flow), partnerRows[row['partner'].strip()], tradeCategories.index(category))
+            tons[number] = float(row['tons'])
+
+        reported = np.zeros((len(years), len(tradeFlows), len(partners), len(tradeCategories)))
+        np.add.at(reported, tuple(index), tons)
+        return cls(years, partners, reported @ categoryResinMatrix())
@@ -0,0 +1,14 @@
+#Shared fixtures of the tests: the package folder on the path and the 2018 inputs. Run the tests from the folder
+#holding eolPlastic with
+#    python -m pytest tests
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from eolPlastic import engine
+
+#One scenario as calculateStreams takes it, the 2018 data
+@pytest.fixture
+def base():
+    return {name: [float(value) for value in getattr(engine, name + '2018')] for name in engine.inputListNames}
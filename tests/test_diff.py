@@ -0,0 +1,48 @@
+#Scenario comparison (diffScenarios, largestAdditiveChanges)
+import numpy as np
+from eolPlastic.engine import diffScenarios, largestAdditiveChanges, calculateStreams, streamColumnNames, additiveReleaseStreams
+
+def testAScenarioAgainstItselfIsAllZeros(base):
+    results = calculateStreams(**base)
+    diff = diffScenarios(results, {'Same': results})
+    assert diff.names == ['Same'] and diff.absolute.shape == (1, len(diff.species), len(streamColumnNames))
+    numbers = np.isfinite(diff.baseline) #cells holding text, like '-', are NaN
+    assert (diff.absolute[0][numbers] == 0).all() and np.isnan(diff.absolute[0][~numbers]).all()
+    nonzero = numbers & (diff.baseline != 0)
+    assert (diff.relative[0][nonzero] == 0).all() and np.isnan(diff.relative[0][~nonzero]).all()
+    assert all(change.absolute == 0 for change in largestAdditiveChanges(diff))
+
+def testOneChangedValueIsTheOnlyDifference(base):
+    rows = calculateStreams(**base)['streamTRVWLists']
+    changed = [list(row) for row in rows]
+    plasticizer = next(row for row in changed if row[0] == 'Plasticizer')
+    baselineValue = plasticizer[25]
+    plasticizer[25] += 5 #stream 25
+    diff = diffScenarios(rows, [changed])
+    assert diff.names == ['Variant 1']
+    nonzero = np.argwhere(np.nan_to_num(diff.absolute[0]) != 0).tolist()
+    assert nonzero == [[diff.species.index('Plasticizer'), streamColumnNames.index('25')]]
+    assert np.nansum(diff.absolute[0]) == 5
+    assert np.isclose(diff.relative[0][tuple(nonzero[0])], 5/abs(baselineValue))
+    
+    [largest] = largestAdditiveChanges(diff, count = 1)
+    assert (largest.name, largest.additive, largest.stream, largest.absolute) == ('Variant 1', 'Plasticizer', 25, 5)
+
+def testSpeciesMissingFromARunCountAsZero(base):
+    rows = calculateStreams(**base)['streamTRVWLists']
+    withoutPlasticizer = [row for row in rows if row[0] != 'Plasticizer']
+    diff = diffScenarios(rows, [withoutPlasticizer])
+    row = diff.species.index('Plasticizer')
+    np.testing.assert_array_equal(diff.variants[0, row], 0)
+    np.testing.assert_array_equal(diff.absolute[0, row], -diff.baseline[row])
+
+def testLargestChangesComeFirst(base):
+    variant = dict(base, conditions = list(base['conditions']))
+    variant['conditions'][4] = 0.9
+    diff = diffScenarios(calculateStreams(**base), {'Efficient': calculateStreams(**variant)})
+    changes = largestAdditiveChanges(diff, count = 4)
+    sizes = [abs(change.absolute) for change in changes]
+    assert len(changes) == 4 and sizes == sorted(sizes, reverse = True) and sizes[0] > 0
+    assert all(change.stream in additiveReleaseStreams for change in changes)
+    for change in changes:
+        assert change.absolute == diff.absolute[0, diff.species.index(change.additive), streamColumnNames.index(str(change.stream))]
@@ -0,0 +1,46 @@
+#Emission factor library and batched GHG (eolPlastic.emissions)
+import numpy as np
+import pytest
+from eolPlastic.data import defaultEmissionFactors, defaultEmissionFactorSet
+from eolPlastic.engine import calculateStreams, totalGHG, streamColumnNames
+from eolPlastic.emissions import EmissionFactorLibrary, emissionFactorLibrary, factorVector, factorSetFromVector, batchGHG
+
+def scaledFactors(scale):
+    return factorVector(defaultEmissionFactors)*scale
+
+def testBatchGHGEqualsTotalGHG(base):
+    variant = dict(base, conditions = list(base['conditions']))
+    variant['conditions'][4] = 0.9
+    runs = [calculateStreams(**base), calculateStreams(**variant)]
+    matrix = np.array([factorVector(defaultEmissionFactors), scaledFactors(1.5)])
+    ghg = batchGHG(runs, matrix)
+    assert ghg.shape == (2, 2, len(streamColumnNames))
+    for scenario, inputs in enumerate([base, variant]):
+        assert ghg[scenario, 0].sum() == pytest.approx(totalGHG(runs[scenario]), rel = 1e-12)
+        rerun = calculateStreams(factorSet = factorSetFromVector(matrix[1]), **inputs)
+        assert ghg[scenario, 1].sum() == pytest.approx(totalGHG(rerun), rel = 1e-12)
+
+def testVersionsAreRespected(base):
+    library = EmissionFactorLibrary([('WARM', 1, scaledFactors(1)), ('WARM', 2, scaledFactors(2)), ('Grid', 1, scaledFactors(3))])
+    assert library.versions('WARM') == [1, 2]
+    np.testing.assert_array_equal(library.select(['WARM', ('WARM', 1), 'Grid']), [scaledFactors(2), scaledFactors(1), scaledFactors(3)])
+    assert library.factorSet('WARM', 1) == defaultEmissionFactors
+    with pytest.raises(KeyError):
+        library.row('WARM', 3)
+    with pytest.raises(KeyError):
+        library.row('Other')
+    results = calculateStreams(**base)
+    latest = batchGHG(results, library.select(['WARM']))[0, 0].sum()
+    assert latest == pytest.approx(totalGHG(calculateStreams(factorSet = library.factorSet('WARM'), **base)), rel = 1e-12)
+
+def testTheFileHoldsTheDefaultSet():
+    library = emissionFactorLibrary()
+    np.testing.assert_array_equal(library.matrix[library.row(defaultEmissionFactorSet, 1)], factorVector(defaultEmissionFactors))
+
+def testTotalEmissionsOfStreams25To30(base):
+    #each stream's emissions under its own column; before the factor library they sat one column to the left from stream 26 on
+    rows = {row[0]: row[1:] for row in calculateStreams(**base)['streamTRVWLists']}
+    np.testing.assert_allclose(rows['Total Emissions'][24:30], [38869605.67913541, 0, 71849.8003872, 10054.105555154953, 148753.61426586707, 95692812.63074322],
+                               rtol = 1e-12)
+    assert len(rows['Total Emissions']) == len(rows['Emissions from plastic']) == len(streamColumnNames)
+    np.testing.assert_allclose(rows['Total Emissions'][25:29], rows['Emissions from plastic'][25:29], rtol = 1e-12)
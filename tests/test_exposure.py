@@ -0,0 +1,30 @@
+#Sampled worker exposure (eolPlastic.exposure)
+import numpy as np
+import pytest
+from eolPlastic.engine import calculateStreams
+from eolPlastic.exposure import exposurePercentiles, sampleDistribution
+
+def testTightSpreadsGiveTheLCIValues(base):
+    results = calculateStreams(**base)
+    tight = {'Mechanical Recycling': {'workers': ('normal', 21834, 20), 'workdays': ('triangular', 249, 250, 251),
+                                      'inhalation': ('lognormal', 105, 1.001), 'dermal': ('uniform', 2169, 2171)}}
+    outcomes = exposurePercentiles([results, results], tight, samples = 20000, seed = 1)
+    assert [(outcome.stage, outcome.route) for outcome in outcomes] == [('Mechanical Recycling', 'inhalation'), ('Mechanical Recycling', 'dermal')]
+    for outcome, row in zip(outcomes, results['mechRecycDictList'][3:5]): #the LCI table's inhalation and dermal rows
+        lci = np.array([row[category] for category in outcome.categories])
+        assert outcome.perInput.shape == (2, 3, len(lci))
+        np.testing.assert_allclose(outcome.perInput[:, 1], [lci, lci], rtol = 2e-3)
+        weights = outcome.perInput[0, 1]/outcome.exposedMass[1]
+        np.testing.assert_allclose(outcome.mean*weights, lci, rtol = 2e-3)
+
+def testSingleValuesAreExact(base):
+    results = calculateStreams(**base)
+    for outcome, row in zip(exposurePercentiles(results, samples = 10), results['mechRecycDictList'][3:5]):
+        np.testing.assert_allclose(outcome.perInput[0], [[row[category] for category in outcome.categories]]*3, rtol = 1e-12)
+
+def testNormalDrawsAreTruncatedAtZero():
+    draws = sampleDistribution(('normal', 1, 1), 200000, np.random.default_rng(0))
+    assert draws.min() >= 0 and (draws == 0).sum() == 0
+    assert draws.mean() == pytest.approx(1.2876, abs = 0.01) #mean of the normal truncated at 0, not 1.0833 as cut at 0
+    with pytest.raises(ValueError):
+        sampleDistribution(('normal', -1, 1), 10, np.random.default_rng(0))
@@ -0,0 +1,30 @@
+#Incineration releases by compartment (eolPlastic.incineration)
+import numpy as np
+import pytest
+from eolPlastic.data import otherResinAdditives, incinerationDestructionFractions
+from eolPlastic.engine import calculateStreams, streamMatrix, streamColumnNames
+from eolPlastic.incineration import transferMatrix, compartmentReleases, compartmentTotals, incineratedAdditiveArray
+
+def additiveStream(results, stream):
+    names, values = streamMatrix(results['streamTRVWLists'])
+    return values[[names.index(i) for i in otherResinAdditives], streamColumnNames.index(str(stream))]
+
+def testCompartmentsSumToTheIncineratedAdditives(base):
+    results = calculateStreams(**base)
+    fed = additiveStream(results, 23) + additiveStream(results, 24)
+    np.testing.assert_allclose(incineratedAdditiveArray(results)[0], fed, rtol = 1e-12)
+    nothingDestroyed = transferMatrix(dict.fromkeys(otherResinAdditives, 0))
+    releases = compartmentReleases(results, [nothingDestroyed, transferMatrix()])
+    assert releases.shape == (1, 2, len(otherResinAdditives), 3)
+    np.testing.assert_allclose(releases[0, 0].sum(axis = -1), fed, rtol = 1e-12)
+    #with the default destruction, what is left is stream 25
+    destroyed = np.array([incinerationDestructionFractions[i] for i in otherResinAdditives])
+    np.testing.assert_allclose(releases[0, 1].sum(axis = -1), (1 - destroyed)*fed, rtol = 1e-12)
+    np.testing.assert_allclose(releases[0, 1].sum(axis = -1), additiveStream(results, 25), rtol = 1e-9)
+    np.testing.assert_allclose(compartmentTotals(results, [nothingDestroyed, transferMatrix()])[0], releases[0].sum(axis = 1), rtol = 1e-12)
+
+def testBadSharesAreRejected():
+    with pytest.raises(ValueError):
+        transferMatrix(shares = dict.fromkeys(otherResinAdditives, (0.5, 0.5, 0.5)))
+    with pytest.raises(ValueError):
+        transferMatrix(dict.fromkeys(otherResinAdditives, 1.5))
@@ -0,0 +1,53 @@
+#Derivatives of calculateJacobian against central finite differences of calculateStreams
+import numpy as np
+import pytest
+from eolPlastic import engine
+from eolPlastic.engine import calculateJacobian, calculateStreams, engineWithGlobals, streamMatrix, streamColumnNames
+
+#Stream summary outputs of a Jacobian as an array laid out like streamMatrix, for column j of the jacobian
+def streamDerivatives(jacobian, species, j):
+    derivatives = np.full((len(species), len(streamColumnNames)), np.nan)
+    for r, name in enumerate(jacobian.outputNames):
+        if name[0] == 'streamTRVWLists' and name[1] in species and 1 <= name[2] <= len(streamColumnNames):
+            derivatives[species.index(name[1]), name[2]-1] = jacobian.jacobian[r, j]
+    return derivatives
+
+@pytest.fixture(scope = 'module')
+def jacobian():
+    return calculateJacobian({name: [float(value) for value in getattr(engine, name + '2018')] for name in engine.inputListNames})
+
+def testValuesAreThePlainResults(base, jacobian):
+    assert jacobian.results['streamTRVWLists'] == calculateStreams(**base)['streamTRVWLists']
+
+@pytest.mark.parametrize('variable', [('conditions', 'Total Plastic'), ('conditions', 'Recycling Efficiency'), ('conditions', 'Plastic Incinerated'),
+                                      ('mswCompProp', 'Food'), ('repPlasticsExport', 'Ethylene')])
+def testInputDerivativesMatchFiniteDifferences(base, jacobian, variable):
+    group, field = variable
+    position = engine.inputGroups[group]['fields'].index(field)
+    step = 1e-6*max(abs(base[group][position]), 1e-3)
+    species, values = [], []
+    for sign in (1, -1):
+        inputs = {name: list(fields) for name, fields in base.items()}
+        inputs[group][position] += sign*step
+        species, matrix = streamMatrix(calculateStreams(**inputs)['streamTRVWLists'])
+        values.append(matrix)
+    differences = (values[0] - values[1])/(2*step)
+    derivatives = streamDerivatives(jacobian, species, jacobian.inputNames.index(variable))
+    checked = np.isfinite(derivatives) & np.isfinite(differences)
+    assert np.abs(differences[checked]).max() > 0
+    np.testing.assert_allclose(derivatives[checked], differences[checked], rtol = 1e-4, atol = 1e-4*np.abs(differences[checked]).max())
+
+def testConstantDerivativesMatchFiniteDifferences(base, jacobian):
+    key = 'Additive migration Fraction'
+    step = 1e-6
+    values = []
+    for sign in (1, -1):
+        constants = dict(engine.assumedValues)
+        constants[key] += sign*step
+        species, matrix = streamMatrix(engineWithGlobals({'assumedValues': constants})(**base)['streamTRVWLists'])
+        values.append(matrix)
+    differences = (values[0] - values[1])/(2*step)
+    derivatives = streamDerivatives(jacobian, species, jacobian.inputNames.index(('assumedValues', key)))
+    checked = np.isfinite(derivatives) & np.isfinite(differences)
+    assert np.abs(differences[checked]).max() > 0
+    np.testing.assert_allclose(derivatives[checked], differences[checked], rtol = 1e-4, atol = 1e-4*np.abs(differences[checked]).max())
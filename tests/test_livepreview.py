@@ -0,0 +1,45 @@
+#LivePreview, what live mode shows while its sliders move, against calculateStreams
+import numpy as np
+import pytest
+from eolPlastic.engine import LivePreview, calculateStreams, collectDuals, optimizerConditions, nonlinearStreamRows
+
+#Every number of results as (name, value) pairs, named like the outputs of calculateJacobian
+def resultNumbers(results):
+    outputs = []
+    collectDuals(results, (), outputs, 0)
+    return [output[0] for output in outputs], np.array([output[1] for output in outputs])
+
+#The stream 3 GHG, which the preview only gets to first order
+def firstOrder(name):
+    return name[:2] == ('ghgActivities', 3) or (name[0] == 'streamTRVWLists' and name[1] in nonlinearStreamRows and name[2] == 3)
+
+def testPreviewMatchesTheEngine(base):
+    preview = LivePreview(base)
+    for shares in [(0.3, 0.6), (0.99, 0.01), (0.05, 0.95), (0.0, 0.0), (1.0, 0.5)]:
+        results, conditions = preview.update(*shares)
+        assert conditions == optimizerConditions(base['conditions'], *shares)
+        names, values = resultNumbers(results)
+        engineNames, engineValues = resultNumbers(calculateStreams(**dict(base, conditions = conditions)))
+        assert names == engineNames
+        approximate = np.array([firstOrder(name) for name in names])
+        assert 0 < approximate.sum() < 25
+        np.testing.assert_allclose(values[~approximate], engineValues[~approximate], rtol = 1e-9, atol = 1e-6)
+        np.testing.assert_allclose(values[approximate], engineValues[approximate], rtol = 1e-3)
+
+def testOnlyMovingValuesAreWritten(base):
+    preview = LivePreview(base)
+    names, values = resultNumbers(preview.results)
+    assert 0 < len(preview.outputNames) < len(names)/2
+    results = preview.results
+    assert preview.update(0.2, 0.2)[0] is results
+    moved = resultNumbers(results)[1] != values
+    assert {name for name, changed in zip(names, moved) if changed} <= set(preview.outputNames)
+    preview.update(*[preview.shares[0], preview.shares[1]])
+    np.testing.assert_allclose(resultNumbers(results)[1], values, rtol = 1e-9, atol = 1e-6)
+
+def testEmptyStageFailsLikeTheEngine(base):
+    preview = LivePreview(base)
+    with pytest.raises(ZeroDivisionError):
+        calculateStreams(**dict(base, conditions = optimizerConditions(base['conditions'], 1.0, 1.0)))
+    with pytest.raises(ZeroDivisionError):
+        preview.update(1.0, 1.0)
@@ -0,0 +1,40 @@
+#Mass balance of the life cycle stages (massBalance, checkMassBalance)
+import numpy as np
+from eolPlastic.engine import checkMassBalance, massBalance, calculateStreams, streamMatrix, streamColumnNames, balanceStages
+
+species = ['PET', 'Plasticizer']
+
+def streamValues(masses):
+    values = np.zeros((len(species), len(streamColumnNames)))
+    for (row, stream), mass in masses.items():
+        values[species.index(row), streamColumnNames.index(str(stream))] = mass
+    return values
+
+def testBalancedStagesPass():
+    #5 tons of PET made from virgin resin and used up: through manufacture and use, then all of it landfilled
+    values = streamValues({('PET', 1): 5, ('PET', 4): 5, ('PET', 6): 5, ('PET', 26): 5, ('PET', 29): 5})
+    assert checkMassBalance([values], species) == []
+
+def testViolationsAreFoundAndSorted():
+    values = streamValues({('PET', 1): 5, ('Plasticizer', 4): 2, ('Plasticizer', 6): 2})
+    violations = checkMassBalance([values, 2*values], species, exempt = ())
+    #largest difference first, ties in batch order
+    assert [(v.scenario, v.stage, v.species, v.difference) for v in violations] == [
+        (1, 'Manufacture', 'PET', 10), (0, 'Manufacture', 'PET', 5), (1, 'Manufacture', 'Plasticizer', -4),
+        (1, 'Collection and Sorting', 'Plasticizer', 4), (0, 'Manufacture', 'Plasticizer', -2), (0, 'Collection and Sorting', 'Plasticizer', 2)]
+    assert len(checkMassBalance([values, 2*values], species, limit = 1)) == 1
+    assert all(violation.stage != 'Collection and Sorting' for violation in checkMassBalance([values], species))
+
+def testOnlyTheExemptStageIsOffIn2018(base):
+    results = calculateStreams(**base)
+    assert checkMassBalance(results) == []
+    assert {violation.stage for violation in checkMassBalance(results, exempt = ())} == {'Collection and Sorting'}
+
+def testBatchShapes():
+    inputs, outputs = massBalance(np.zeros((3, 4, len(species), len(streamColumnNames))))
+    assert inputs.shape == outputs.shape == (3, 4, len(balanceStages), len(species))
+
+def testResultsAndArraysAgree(base):
+    results = calculateStreams(**base)
+    names, values = streamMatrix(results['streamTRVWLists'])
+    assert checkMassBalance(results) == checkMassBalance([values], names)
@@ -0,0 +1,41 @@
+#The compiled MassOperator against calculateStreams
+import numpy as np
+from eolPlastic.engine import massOperator, calculateStreams, streamMatrix, operatorMassInputs
+
+def scaledMasses(base, factors):
+    inputs = {name: list(values) for name, values in base.items()}
+    for (name, i), factor in zip(operatorMassInputs, factors):
+        inputs[name][i] *= factor
+    return inputs
+
+def testBatchMatchesTheEngine(base):
+    operator = massOperator(base)
+    rng = np.random.default_rng(1)
+    scenarios = [scaledMasses(base, rng.uniform(0.5, 1.5, len(operatorMassInputs))) for run in range(5)]
+    values = operator.evaluate([operator.massVector(inputs) for inputs in scenarios])
+    for inputs, operatorValues in zip(scenarios, values):
+        species, engineValues = streamMatrix(calculateStreams(**inputs)['streamTRVWLists'])
+        assert species == operator.species
+        checked = np.isfinite(operatorValues)
+        assert checked.any()
+        np.testing.assert_allclose(operatorValues[checked], np.nan_to_num(engineValues[checked]), rtol = 1e-9, atol = 1e-6)
+
+def testImportsAreMasses(base):
+    operator = massOperator(base)
+    imports = [k for k, (name, i) in enumerate(operatorMassInputs) if name == 'repPlasticImport']
+    assert len(imports) == 4
+    for factors in ([0.0]*4, [3.0, 0.5, 1.0, 2.0]):
+        allFactors = np.ones(len(operatorMassInputs))
+        allFactors[imports] = factors
+        inputs = scaledMasses(base, allFactors)
+        assert massOperator(inputs) is operator
+        operatorValues = operator.evaluate(operator.massVector(inputs))
+        engineValues = streamMatrix(calculateStreams(**inputs)['streamTRVWLists'])[1]
+        checked = np.isfinite(operatorValues)
+        np.testing.assert_allclose(operatorValues[checked], np.nan_to_num(engineValues[checked]), rtol = 1e-9, atol = 1e-6)
+
+def testOperatorsAreSharedByStructure(base):
+    operator = massOperator(base)
+    assert massOperator(scaledMasses(base, [2]*len(operatorMassInputs))) is operator
+    base['conditions'][4] = 0.5 #recycling efficiency is structure
+    assert massOperator(base) is not operator
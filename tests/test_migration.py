@@ -0,0 +1,27 @@
+#Diffusion-based additive migration (eolPlastic.migration)
+import numpy as np
+from eolPlastic.data import migrationReference
+from eolPlastic.engine import calculateStreams, streamMatrix, streamColumnNames
+from eolPlastic.migration import calibratedThicknesses, stageMigrationFractions, migratedMasses, additiveMassArray, releasedFraction
+
+def additiveTotals(results, streams):
+    names, values = streamMatrix(results['streamTRVWLists'])
+    return values[names.index('Total Additives'), [streamColumnNames.index(str(stream)) for stream in streams]]
+
+def testReferenceConditionsGiveTheConstantFractions(base):
+    results = calculateStreams(**base)
+    thicknesses = calibratedThicknesses(results)
+    reference = {stage: (values['days'], values['temperature']) for stage, values in migrationReference.items()}
+    kinetic = calculateStreams(migrationFractions = stageMigrationFractions(reference, thicknesses), **base)
+    np.testing.assert_allclose(additiveTotals(kinetic, [5, 18]), additiveTotals(results, [5, 18]), rtol = 1e-9)
+    for stage, (days, temperature) in reference.items():
+        migrated = migratedMasses(results, stage, days, temperature, thicknesses[stage]).sum()
+        assert np.isclose(migrated, migrationReference[stage]['fraction']*additiveMassArray(results, stage).sum(), rtol = 1e-9)
+
+def testMigrationGrowsWithTimeAndTemperature(base):
+    results = calculateStreams(**base)
+    thickness = calibratedThicknesses(results)['Use']
+    days, temperature = np.meshgrid([30, 365, 3650], [10, 23, 40], indexing = 'ij')
+    migrated = migratedMasses(results, 'Use', days, temperature, thickness).sum(axis = -1)[0]
+    assert (np.diff(migrated, axis = 0) > 0).all() and (np.diff(migrated, axis = 1) > 0).all()
+    assert np.isclose(releasedFraction(0.01 - 1e-12), releasedFraction(0.01 + 1e-12), rtol = 1e-6) #the two forms meet
@@ -0,0 +1,32 @@
+#Release optimizer (optimizeReleases) on the 2018 data
+import numpy as np
+from eolPlastic.engine import (optimizeReleases, evaluateOptimizerPoints, optimizerConditions, validScenarios, calculateStreams,
+                               additiveRelease, totalGHG)
+
+def testBatchesMatchSingleRuns(base):
+    axis = np.linspace(0, 1, 5)
+    points = np.stack(np.meshgrid(axis, axis, indexing = 'ij'), axis = -1).reshape(-1, 2)
+    release, ghg = evaluateOptimizerPoints(base, points)
+    for point, pointRelease, pointGHG in zip(points.tolist(), release, ghg):
+        try:
+            results = calculateStreams(**dict(base, conditions = optimizerConditions(base['conditions'], *point)))
+        except ZeroDivisionError: #e.g. nothing incinerated
+            assert pointRelease == pointGHG == np.inf
+            continue
+        assert np.isclose(pointRelease, additiveRelease(results), rtol = 1e-12)
+        assert np.isclose(pointGHG, totalGHG(results), rtol = 1e-12)
+    assert np.isinf(release).sum() == 2
+
+def testOptimumBeatsTheEnteredPoint(base):
+    entered = calculateStreams(**base)
+    for ghgLimit in (totalGHG(entered), 0.98*totalGHG(entered)):
+        result = optimizeReleases(base, ghgLimit)
+        assert result.feasible and result.ghg <= ghgLimit
+        assert result.release < additiveRelease(entered)
+        assert validScenarios({name: np.array([values]) for name, values in result.inputs.items()}).all()
+        assert np.isclose(additiveRelease(result.results), result.release) and np.isclose(totalGHG(result.results), result.ghg)
+
+def testUnreachableLimitGivesTheLowestGHG(base):
+    result = optimizeReleases(base, 0)
+    assert not result.feasible
+    assert result.ghg <= totalGHG(calculateStreams(**base))
@@ -0,0 +1,29 @@
+#Batch reports (eolPlastic.reports)
+import html
+import os
+from eolPlastic.reports import generateReports, reportFileNames
+
+def testCollidingNamesGetTheirOwnFiles():
+    fileNames = reportFileNames(['Base', 'base', 'a/b', 'a?b', 'Other'])
+    assert fileNames['Other'] == 'Other'
+    assert fileNames['Base'].startswith('Base-') and fileNames['base'].startswith('base-')
+    assert fileNames['a/b'].startswith('a_b-') and fileNames['a?b'].startswith('a_b-')
+    assert len({name.lower() for name in fileNames.values()}) == 5
+    assert reportFileNames(['Base', 'base']) == {name: fileNames[name] for name in ['Base', 'base']} #the same names every time
+
+def testParallelBatchWritesOneFilePerScenario(base, tmp_path):
+    broken = dict(base, conditions = list(base['conditions']))
+    broken['conditions'][4] = 1.5 #recycling efficiency above 1
+    scenarios = {'Base': base, 'base': base, 'a/b': base, 'a?b': base, 'Broken': broken}
+    folder = str(tmp_path / 'reports')
+    outcomes = generateReports(scenarios, folder, workers = 2, chunkSize = 2, cacheFolder = str(tmp_path / 'figures'))
+    
+    assert [outcome.name for outcome in outcomes] == list(scenarios)
+    written = [outcome for outcome in outcomes if outcome.error is None]
+    assert [outcome.name for outcome in written] == ['Base', 'base', 'a/b', 'a?b']
+    assert outcomes[-1].path is None and outcomes[-1].error == 'conditions: Recycling Efficiency must be between 0 and 1.'
+    assert sorted(os.listdir(folder)) == sorted(os.path.basename(outcome.path) for outcome in written)
+    for outcome in written:
+        with open(outcome.path, encoding = 'utf-8') as file:
+            report = file.read()
+        assert '<h1>' + html.escape(outcome.name) + '</h1>' in report and 'data:image/png;base64,' in report
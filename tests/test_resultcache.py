@@ -0,0 +1,84 @@
+#On-disk result cache (eolPlastic.resultcache)
+import functools
+import numpy as np
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from eolPlastic import resultcache
+from eolPlastic.engine import sweepResults, SweepAxis, sweepStreams, sweepCacheKind
+from eolPlastic.resultcache import DiskResultCache
+
+axes = [SweepAxis('conditions', 'Recycling Efficiency', [0.4, 0.7, 1.2]), SweepAxis('conditions', 'Total Plastic', [3e7, 4e7])]
+
+def sweepArrays(chunks):
+    chunks = list(chunks)
+    return np.concatenate([chunk.values for chunk in chunks]), np.concatenate([chunk.valid for chunk in chunks])
+
+def testCachedSweepsEqualUncachedOnes(base, tmp_path):
+    cache = DiskResultCache(str(tmp_path / 'cache.sqlite'))
+    values, valid = sweepArrays(sweepResults(base, axes, chunkSize = 4))
+    for workers in (2, 0): #the workers fill the cache, the second sweep reads it
+        cachedValues, cachedValid = sweepArrays(sweepResults(base, axes, chunkSize = 4, workers = workers, cache = cache))
+        np.testing.assert_array_equal(cachedValues, values)
+        np.testing.assert_array_equal(cachedValid, valid)
+    assert len(cache) == valid.sum()
+    assert cache.hits == valid.sum() and cache.misses == 0
+
+def scaledSummary(factor):
+    def summarize(results):
+        return factor*sweepStreams(results)
+    return summarize
+
+def testClosuresNeedTheirOwnKinds(base, tmp_path):
+    cache = DiskResultCache(str(tmp_path / 'cache.sqlite'))
+    with pytest.raises(ValueError):
+        next(sweepResults(base, axes, cache = cache, summarize = scaledSummary(1)))
+    with pytest.raises(ValueError):
+        next(sweepResults(base, axes, cache = cache, summarize = functools.partial(scaledSummary(1))))
+    once, valid = sweepArrays(sweepResults(base, axes, cache = cache, summarize = scaledSummary(1), cacheKind = 'once'))
+    twice, valid = sweepArrays(sweepResults(base, axes, cache = cache, summarize = scaledSummary(2), cacheKind = 'twice'))
+    np.testing.assert_array_equal(twice[valid], 2*once[valid])
+
+def testKindsHoldTheSummaryModuleSource():
+    kind = sweepCacheKind(sweepStreams)
+    assert kind.startswith('sweep eolPlastic.engine.sweepStreams ') and len(kind.split()[-1]) == 16
+    assert sweepCacheKind(sweepStreams, 'mine') == 'sweep mine'
+
+def testValuesRoundTrip(tmp_path):
+    cache = DiskResultCache(str(tmp_path / 'cache.sqlite'))
+    cache.put('array', 'a', np.arange(6.0).reshape(2, 3))
+    cache.put('json', 'a', {'PET': [1.5, 2], 'name': 'x'})
+    np.testing.assert_array_equal(cache.get('array', 'a'), np.arange(6.0).reshape(2, 3))
+    assert cache.get('json', 'a') == {'PET': [1.5, 2], 'name': 'x'}
+    assert cache.get('array', 'b') is None
+
+def testAnotherModelVersionMisses(tmp_path, monkeypatch):
+    cache = DiskResultCache(str(tmp_path / 'cache.sqlite'))
+    cache.put('array', 'a', np.ones(3))
+    monkeypatch.setattr(resultcache, 'currentModelVersion', 'edited model')
+    assert cache.get('array', 'a') is None
+
+def testLeastRecentlyUsedAreEvicted(tmp_path):
+    cache = DiskResultCache(str(tmp_path / 'cache.sqlite'), maxBytes = 100000)
+    rng = np.random.default_rng(0)
+    for key in range(20):
+        cache.put('array', str(key), rng.random(2000)) #about 15 kB each, random so they don't compress
+        cache.get('array', '0') #kept in use
+    assert cache.storedBytes() <= cache.maxBytes
+    assert cache.get('array', '0') is not None and cache.get('array', '19') is not None
+    assert cache.get('array', '1') is None
+
+def readAndWrite(cache, seed):
+    rng = np.random.default_rng(seed)
+    wrong = 0
+    for step in range(40):
+        keys = [str(key) for key in rng.integers(0, 100, 10)]
+        values = cache.getMany('array', keys)
+        wrong += sum(value is not None and value[0] != int(key) for key, value in zip(keys, values))
+        cache.putMany('array', {key: np.full(500, float(key)) for key, value in zip(keys, values) if value is None})
+    return wrong
+
+def testProcessesShareOneFile(tmp_path):
+    cache = DiskResultCache(str(tmp_path / 'cache.sqlite'))
+    with ProcessPoolExecutor(4) as pool:
+        assert list(pool.map(readAndWrite, [cache]*4, range(4))) == [0]*4
+    assert 0 < len(cache) <= 100
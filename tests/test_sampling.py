@@ -0,0 +1,32 @@
+#Compositional sampling of scenarios (eolPlastic.sampling)
+import numpy as np
+import pytest
+from eolPlastic.engine import validScenarios, inputListNames, unpackScenario
+from eolPlastic.sampling import sampleScenarios, sampleComposition, compositionalGroups, batchRows
+
+@pytest.mark.parametrize('distribution', [('dirichlet', 200), ('logisticNormal', 0.1)])
+def testEveryGroupKeepsItsSum(base, distribution):
+    batch = sampleScenarios(base, 500, {name: distribution for name in inputListNames}, seed = 3)
+    for group, summed, target in compositionalGroups:
+        totals = batch[group][:, summed].sum(axis = 1)
+        expected = 1 if target is None else batch[group][:, target]
+        np.testing.assert_allclose(totals, expected, rtol = 1e-12)
+        assert (batch[group][:, summed] >= 0).all()
+    assert validScenarios(batch).all()
+
+def testZerosStayZeroAndTheMeanIsTheBase():
+    composition = np.array([0.5, 0.0, 0.3, 0.2])
+    draws = sampleComposition(('dirichlet', 400), composition, 20000, np.random.default_rng(0))
+    assert (draws[:, 1] == 0).all()
+    np.testing.assert_allclose(draws.mean(axis = 0), composition, atol = 0.005)
+
+def testDrawsRepeatWithASeed(base):
+    first = batchRows(sampleScenarios(base, 10, seed = 7))
+    np.testing.assert_array_equal(first, batchRows(sampleScenarios(base, 10, seed = 7)))
+    assert unpackScenario(first[0]).keys() == base.keys()
+
+def testUnknownDistributionsAreRejected(base):
+    with pytest.raises(ValueError):
+        sampleScenarios(base, 5, {'conditions': ('uniform', 1)})
+    with pytest.raises(ValueError):
+        sampleScenarios(base, 5, {'nothing': ('dirichlet', 1)})
@@ -0,0 +1,46 @@
+#Scenario libraries saved to one file (ScenarioLibrary)
+import numpy as np
+import pytest
+from eolPlastic.engine import ScenarioLibrary, packScenario, scenarioFormatVersion, inputListNames, scenarioGroupLengths
+
+def variant(base, total):
+    inputs = {name: list(values) for name, values in base.items()}
+    inputs['conditions'][1] = total
+    return inputs
+
+def testSaveAndLoadRoundTrip(base, tmp_path):
+    library = ScenarioLibrary()
+    library.add('2018', base)
+    library.add('More plastic', variant(base, 4e7))
+    library.add('Less plastic', variant(base, 3e7))
+    library.add('More plastic', variant(base, 4.5e7)) #replaces the scenario of that name
+    library.remove('Less plastic')
+    path = str(tmp_path / 'scenarios.npz')
+    library.save(path)
+    
+    loaded = ScenarioLibrary.load(path)
+    assert loaded.names == ['2018', 'More plastic'] and len(loaded) == 2 and 'Less plastic' not in loaded
+    assert loaded.inputs('2018') == base
+    assert loaded.inputs('More plastic') == variant(base, 4.5e7)
+    assert loaded.batch()['conditions'].shape == (2, len(base['conditions']))
+    loaded.add('2018', variant(base, 1e7)) #names still replace after loading
+    assert loaded.names == ['2018', 'More plastic'] and loaded.inputs('2018')['conditions'][1] == 1e7
+
+def testEmptyLibraryRoundTrip(tmp_path):
+    path = str(tmp_path / 'empty.npz')
+    ScenarioLibrary().save(path)
+    assert len(ScenarioLibrary.load(path)) == 0
+
+def writeArchive(path, base, version = scenarioFormatVersion, lengths = scenarioGroupLengths):
+    np.savez_compressed(path, version = np.array(version), groups = np.array(inputListNames), lengths = np.array(lengths),
+                        names = np.array(['2018']), values = packScenario(base)[None])
+    return path
+
+def testNewerFormatsAndOtherLayoutsAreRejected(base, tmp_path):
+    assert ScenarioLibrary.load(writeArchive(str(tmp_path / 'same.npz'), base)).inputs('2018') == base
+    with pytest.raises(ValueError, match = 'scenario format'):
+        ScenarioLibrary.load(writeArchive(str(tmp_path / 'newer.npz'), base, version = scenarioFormatVersion + 1))
+    with pytest.raises(ValueError, match = 'does not hold'):
+        ScenarioLibrary.load(writeArchive(str(tmp_path / 'layout.npz'), base, lengths = [length + 1 for length in scenarioGroupLengths]))
+    with pytest.raises(ValueError):
+        ScenarioLibrary().add('short', dict(base, conditions = base['conditions'][:3]))
@@ -0,0 +1,83 @@
+#HTTP scenario service (eolPlastic.service), on a free local port with two worker processes
+import asyncio
+import json
+import os
+import numpy as np
+import pytest
+from concurrent.futures.process import BrokenProcessPool
+from eolPlastic.service import ScenarioService, responseBody
+
+#Sends one request on a new connection and returns the status and JSON body
+async def request(port, method, path, payload = None, close = True):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    body = json.dumps(payload).encode() if payload is not None else b''
+    writer.write((method + ' ' + path + ' HTTP/1.1\r\nHost: test\r\nContent-Length: ' + str(len(body)) + '\r\n' +
+                  ('Connection: close\r\n' if close else '') + '\r\n').encode() + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = (await reader.readline()).decode().strip()
+        if not line:
+            break
+        name, separator, value = line.partition(':')
+        headers[name.lower()] = value.strip()
+    data = json.loads(await reader.readexactly(int(headers['content-length'])))
+    if close: #the server must end the connection itself, which a worker holding a copy of the socket would prevent
+        assert await asyncio.wait_for(reader.read(), 30) == b''
+    writer.close()
+    return status, data
+
+def runService(test):
+    async def main():
+        service = ScenarioService(workers = 2)
+        server = await asyncio.start_server(service.handleConnection, '127.0.0.1', 0)
+        try:
+            return await test(server.sockets[0].getsockname()[1], service)
+        finally:
+            server.close()
+            service.close()
+    return asyncio.run(main())
+
+def testConcurrentRequestsAllSucceed():
+    async def test(port, service):
+        status, data = await request(port, 'GET', '/scenarios/2018')
+        scenario = data['inputs']
+        scenarios = []
+        for i in range(24):
+            variant = {name: list(values) for name, values in scenario.items()}
+            variant['conditions'][1] *= 1 + (i % 6)/10 #repeats share runs
+            scenarios.append(variant)
+        answers = await asyncio.gather(*[request(port, 'POST', '/calculate', {'inputs': variant, 'fields': ['plasticsMassDict']}) for variant in scenarios])
+        assert [status for status, data in answers] == [200]*len(scenarios)
+        totals = [sum(data['results']['plasticsMassDict'].values()) for status, data in answers]
+        assert [total/totals[0] for total in totals] == pytest.approx([variant['conditions'][1]/scenario['conditions'][1] for variant in scenarios])
+        
+        bad = dict(scenario, conditions = scenario['conditions'][:3])
+        status, data = await request(port, 'POST', '/batch', {'scenarios': [scenario, bad], 'fields': ['mswCompProp']})
+        assert status == 200 and 'mswCompProp' in data['results'][0] and data['results'][1]['errors']
+        status, data = await request(port, 'GET', '/health')
+        assert status == 200 and data['cached'] == 6 and data['running'] == 0
+    runService(test)
+
+def testACrashedWorkerIsReplaced():
+    async def test(port, service):
+        status, data = await request(port, 'GET', '/scenarios/2018')
+        scenario = data['inputs']
+        status, data = await request(port, 'POST', '/calculate', {'inputs': scenario, 'fields': ['mswCompProp']})
+        assert status == 200
+        brokenPool = service.pool
+        with pytest.raises(BrokenProcessPool): #a worker dies
+            await asyncio.wrap_future(brokenPool.submit(os._exit, 1))
+        for factor in (1.1, 1.2): #later requests run in a new pool
+            variant = dict(scenario, conditions = list(scenario['conditions']))
+            variant['conditions'][1] *= factor
+            status, data = await request(port, 'POST', '/calculate', {'inputs': variant, 'fields': ['mswCompProp']})
+            assert status == 200
+        assert service.pool is not brokenPool
+    runService(test)
+
+def testNonFiniteNumbersAreNull():
+    body = responseBody({'results': {'a': [float('nan'), np.float64('inf'), -np.inf, 1.5, np.float32(0.5), np.int64(2), True, None, 'x']}})
+    assert json.loads(body) == {'results': {'a': [None, None, None, 1.5, 0.5, 2, True, None, 'x']}}
+    assert b'NaN' not in body and b'Infinity' not in body
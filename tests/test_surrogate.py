@@ -0,0 +1,43 @@
+#Polynomial chaos surrogate (eolPlastic.surrogate)
+import numpy as np
+import pytest
+from eolPlastic.engine import calculateStreams
+from eolPlastic.surrogate import trainSurrogate, Surrogate, surrogateInputs, surrogateValues, surrogateOutputs, SurrogateParameter
+
+@pytest.fixture(scope = 'module')
+def surrogate():
+    from eolPlastic import engine
+    base = {name: [float(value) for value in getattr(engine, name + '2018')] for name in engine.inputListNames}
+    return trainSurrogate(base, runs = 200, seed = 5)
+
+def testPredictionsAreCloseToTheEngine(surrogate):
+    rng = np.random.default_rng(11)
+    points = surrogate.low + rng.random((20, len(surrogate.names)))*(surrogate.high - surrogate.low)
+    exact = np.array([surrogateValues(calculateStreams(**surrogateInputs(surrogate.base, surrogate.names, point))) for point in points])
+    scale = np.abs(exact).max(axis = 0) + 1
+    assert (np.abs(surrogate.predict(points) - exact)/scale).max() < 1e-3
+    assert np.isfinite(surrogate.errorArray).all()
+
+def testPointsOutsideTheBoxRunTheEngine(surrogate):
+    point = surrogate.high*1.05
+    answer = surrogate.evaluate(point)
+    assert answer.exact
+    expected = surrogateValues(calculateStreams(**surrogateInputs(surrogate.base, surrogate.names, point)))
+    assert [answer.values[name] for name in surrogateOutputs] == expected.tolist()
+    assert not surrogate.evaluate((surrogate.low + surrogate.high)/2).exact
+
+def testSaveAndLoad(surrogate, tmp_path):
+    path = str(tmp_path / 'surrogate.npz')
+    surrogate.save(path)
+    loaded = Surrogate.load(path)
+    points = (surrogate.low + surrogate.high)/2 + np.zeros((3, 1))
+    np.testing.assert_array_equal(loaded.predict(points), surrogate.predict(points))
+    assert loaded.names == surrogate.names and loaded.error == surrogate.error
+
+def testBadParametersAreRejected(base):
+    with pytest.raises(ValueError):
+        trainSurrogate(base, [SurrogateParameter('exportShare', 0, 1)])
+    with pytest.raises(ValueError):
+        trainSurrogate(base, [SurrogateParameter('recyclingEfficiency', 1, 0.5)])
+    with pytest.raises(ValueError):
+        trainSurrogate(base, runs = 20)
@@ -0,0 +1,51 @@
+#Chunked grid sweeps (sweepResults)
+import os
+import time
+import numpy as np
+from eolPlastic.engine import sweepResults, SweepAxis, sweepScenario, sweepStreams, calculateStreams
+
+axes = [SweepAxis('conditions', 'Recycling Efficiency', [0.4, 0.7, 1.2]), SweepAxis('conditions', 'Total Plastic', [3e7, 3.5e7, 4e7, 4.5e7])]
+
+def collect(chunks):
+    chunks = list(chunks)
+    return (np.concatenate([chunk.positions for chunk in chunks]), np.concatenate([chunk.values for chunk in chunks]),
+            np.concatenate([chunk.valid for chunk in chunks]), [chunk.start for chunk in chunks])
+
+def testPointsComeInGridOrderAndMatchTheEngine(base):
+    positions, values, valid, starts = collect(sweepResults(base, axes, chunkSize = 5))
+    assert starts == [0, 5, 10]
+    assert positions.tolist() == [[i, j] for i in range(3) for j in range(4)]
+    for position, value, ok in zip(positions.tolist(), values, valid):
+        if position[0] == 2: #recycling efficiency above 1 fails the input checks
+            assert not ok and np.isnan(value).all()
+        else:
+            assert ok
+            np.testing.assert_array_equal(value, sweepStreams(calculateStreams(**sweepScenario(base, axes, position))))
+
+def testWorkersGiveTheSameResults(base):
+    positions, values, valid, starts = collect(sweepResults(base, axes, chunkSize = 5))
+    workerPositions, workerValues, workerValid, workerStarts = collect(sweepResults(base, axes, chunkSize = 5, workers = 2))
+    assert workerStarts == starts
+    np.testing.assert_array_equal(workerValid, valid)
+    np.testing.assert_array_equal(workerValues, values)
+
+#Summary that marks its process in the folder in EOL_TEST_FOLDER and waits (up to 20 s) for 3 processes to be
+#summarizing at once. Returns how many it saw
+def meetingSummary(results):
+    folder = os.environ['EOL_TEST_FOLDER']
+    if os.getpid() == int(os.environ['EOL_TEST_PARENT']): #the run sweepResults makes for the shape of the summaries
+        return [0.0]
+    open(os.path.join(folder, str(os.getpid())), 'w').close()
+    deadline = time.monotonic() + 20
+    while len(os.listdir(folder)) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return [float(len(os.listdir(folder)))]
+
+def testEveryWorkerGetsAChunk(base, tmp_path, monkeypatch):
+    monkeypatch.setenv('EOL_TEST_FOLDER', str(tmp_path))
+    monkeypatch.setenv('EOL_TEST_PARENT', str(os.getpid()))
+    axis = SweepAxis('conditions', 'Total Plastic', [3e7, 3.2e7, 3.4e7])
+    start = time.monotonic()
+    values = [chunk.values for chunk in sweepResults(base, [axis], chunkSize = 1, buffered = 1, workers = 3, summarize = meetingSummary)]
+    assert time.monotonic() - start < 20
+    assert np.concatenate(values).ravel().tolist() == [3.0, 3.0, 3.0]
@@ -0,0 +1,49 @@
+#Trade matrix by partner country (eolPlastic.trade)
+import numpy as np
+import pytest
+from eolPlastic.engine import calculateStreams, streamMatrix, streamColumnNames
+from eolPlastic.data import typesOfPlasticsInternational, typesOfPlasticDomestic, otherResinAdditives
+from eolPlastic.trade import TradeMatrix
+
+flowInputs = {'Import': 'repPlasticImport', 'Export': 'repPlasticsExport', 'Re-Export': 'repPlasticsReExport'}
+
+#The reported 2018 categories split between two partners, 30% and 70%
+def writeTradeFile(path, base):
+    lines = ['year,flow,partner,category,tons']
+    for flow, name in flowInputs.items():
+        for category, tons in zip(typesOfPlasticsInternational, base[name]):
+            lines += ['2018,' + flow + ',Canada,' + category + ',' + repr(0.3*tons), '2018,' + flow + ',Malaysia,' + category + ',' + repr(0.7*tons)]
+    path.write_text('\n'.join(lines) + '\n')
+    return str(path)
+
+def testDefaultSplitsReproduceTheStreams(base, tmp_path):
+    matrix = TradeMatrix.load(writeTradeFile(tmp_path / 'trade.csv', base))
+    assert matrix.partners == ['Canada', 'Malaysia']
+    species, expected = streamMatrix(calculateStreams(**base)['streamTRVWLists'])
+    species, values = streamMatrix(calculateStreams(tradeResinMasses = matrix.resinMasses(2018), **base)['streamTRVWLists'])
+    np.testing.assert_allclose(values, expected, rtol = 1e-8, equal_nan = True)
+
+def testFlowsAddUp(base, tmp_path):
+    matrix = TradeMatrix.load(writeTradeFile(tmp_path / 'trade.csv', base))
+    flows = matrix.flows('Export')
+    totals = matrix.resinMasses(2018)['Export']
+    np.testing.assert_allclose(flows.bulk.sum(axis = 1)[0], [totals[resin] for resin in typesOfPlasticDomestic])
+    np.testing.assert_allclose(flows.bulk[0, 1], flows.bulk[0, 0]*0.7/0.3)
+    np.testing.assert_allclose(flows.resin.sum() + flows.additives.sum(), flows.bulk.sum())
+    with pytest.raises(KeyError):
+        matrix.resinMasses(2019)
+
+def testFlowContentMatchesTheStreams(base, tmp_path):
+    matrix = TradeMatrix.load(writeTradeFile(tmp_path / 'trade.csv', base))
+    species, values = streamMatrix(calculateStreams(**base)['streamTRVWLists'])
+    for flow, stream in [('Import', 21), ('Re-Export', 22), ('Export', 27)]:
+        flows = matrix.flows(flow)
+        column = values[:, streamColumnNames.index(str(stream))]
+        np.testing.assert_allclose(flows.resin.sum(axis = 1)[0], column[[species.index(resin) for resin in typesOfPlasticDomestic]], rtol = 1e-9)
+        np.testing.assert_allclose(flows.additives.sum(axis = 1)[0], column[[species.index(i) for i in otherResinAdditives]], rtol = 1e-9, atol = 1e-9)
+
+def testUnknownFlowsAreRejected(tmp_path):
+    path = tmp_path / 'trade.csv'
+    path.write_text('year,flow,partner,category,tons\n2018,Smuggled,Canada,PET,5\n')
+    with pytest.raises(ValueError):
+        TradeMatrix.load(str(path))
@@ -0,0 +1,20 @@
+#Vectorized input checks (validateInputs, validScenarios)
+import numpy as np
+from eolPlastic.engine import validateInputs, validScenarios, inputListNames
+
+def testTheTwoThousandEighteenDataIsValid(base):
+    assert validateInputs(base) == []
+
+def testEachBrokenCheckIsReported(base):
+    base['conditions'][1] = -1
+    base['mswCompProp'][0] += 0.5
+    errors = validateInputs(base)
+    assert {(error.group, error.message) for error in errors} == {('conditions', 'Total Plastic cannot be negative.'),
+                                                                  ('mswCompProp', 'Proportions do not sum to 1.')}
+
+def testBatchChecksMatchSingleChecks(base):
+    batch = {name: np.tile(base[name], (4, 1)) for name in inputListNames}
+    batch['conditions'][1, 4] = 1.5 #recycling efficiency above 1
+    batch['repRecPlastics'][3, 0] = np.nan
+    assert validScenarios(batch).tolist() == [True, False, True, False]
+    assert [error.scenario for error in validateInputs(batch)] == [1, 3]